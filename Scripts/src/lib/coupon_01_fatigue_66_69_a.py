@@ -29,16 +29,10 @@ class coupon_01_fatigue_66_69_a(coupon_generic):
         self.rad2 = self.geometry['rad2']
         self.len1 = self.geometry['len1']
         self.len2 = self.geometry['len2']
-        self.seedSizeArcOuter = self.seedSize['arcOuter']
-        self.seedSizeLong1 = self.seedSize['long1']
-        self.seedSizeLong2 = self.seedSize['long2']
-        self.seedSizeLong3 = self.seedSize['long3']
         ## derived quantities
         self.partitionRadialFraction = 0.67
         self.partitionRadius = self.partitionRadialFraction*self.phi1/2
         self.endStress = -self.stepLoad*(self.phi1/self.phi3)**2
-        self.seedSizeOuterRadialMin = self.seedSizeArcOuter*self.partitionRadialFraction
-        self.seedSizeInnerRadial = self.seedSizeArcOuter*self.partitionRadialFraction
         ## create coupon
         self.createModel()
         self.createProfileSketch()
@@ -168,7 +162,7 @@ class coupon_01_fatigue_66_69_a(coupon_generic):
             self.partitionSketch.unsetPrimaryObject()
             self.part[0].PartitionFaceBySketch(sketchUpEdge=self.sketchEdge[0], faces=self.sketchFace[0], sketch=self.partitionSketch)
             edgesTemp = self.part[0].edges.getByBoundingCylinder((-self.lenTol, 0, 0), (self.lenTol, 0, 0), (self.partitionRadius+self.lenTol))
-            self.edgesArcForPartition = self.getArcEdge(edgesTemp)
+            self.edgesArcForPartition = self.getArcEdge(edgesTemp, self.part[0])
             self.sweepEdges = self.part[0].edges.getByBoundingCylinder((-self.lenTol, 0, 0), (self.xE+self.lenTol, 0, 0), (self.partitionRadius-self.lenTol))
             self.part[0].PartitionCellBySweepEdge(sweepPath=self.sweepEdges[0], cells=self.part[0].cells, edges=self.edgesArcForPartition)
         def createPartitionLong(offsetDistance):
@@ -179,6 +173,14 @@ class coupon_01_fatigue_66_69_a(coupon_generic):
         createPartitionLong(self.xB)
         createPartitionLong(self.xC)
     def createLocalSeed(self):
+        ## element sizes ==>> read from the coupon data on every call, so that coupon_generic.scaleSeedSize can scale
+        ## Element_Size and apply the local seeds again
+        self.seedSizeArcOuter = self.seedSize['arcOuter']
+        self.seedSizeLong1 = self.seedSize['long1']
+        self.seedSizeLong2 = self.seedSize['long2']
+        self.seedSizeLong3 = self.seedSize['long3']
+        self.seedSizeOuterRadialMin = self.seedSizeArcOuter*self.partitionRadialFraction
+        self.seedSizeInnerRadial = self.seedSizeArcOuter*self.partitionRadialFraction
         def seedOuterRadial(pointOnRadius, **kwargs):
             ## method to seed the outer radial edge at sections through A and B
             edgesOuterRadial = self.part[0].edges.findAt((pointOnRadius, ))  
@@ -199,9 +201,9 @@ class coupon_01_fatigue_66_69_a(coupon_generic):
         def seedLongEdges(xLeft, xRight, seedSize):
             ## method to seed the longitudinal edges
             edgesInnerArcLong = self.part[0].edges.getByBoundingCylinder((xLeft-self.lenTol, 0, 0), (xRight+self.lenTol, 0, 0), (self.yD+self.lenTol))
-            edgesInnerArc = self.getArcEdge(edgesInnerArcLong)
+            edgesInnerArc = self.getArcEdge(edgesInnerArcLong, self.part[0])
             edgesStraight = self.getByDifference(edgesInnerArcLong, edgesInnerArc)
-            edgesLong = self.getEdgeByLength(edgesStraight, abs(xRight-xLeft))
+            edgesLong = self.getEdgeByLength(edgesStraight, abs(xRight-xLeft), self.part[0])
             self.part[0].seedEdgeBySize(edges=edgesLong, size=seedSize, deviationFactor=0.1, constraint=FINER)
         def setInnerCylSweepPath(xLeft, xRight):
             ## method to set the sweep path for the inner cylindrical mesh
@@ -211,7 +213,7 @@ class coupon_01_fatigue_66_69_a(coupon_generic):
             self.part[0].setSweepPath(region=cellsInnerCyl[0], edge=edgesSweepPath[0], sense=FORWARD)
         ## seed ==>> outer arc edge AA'
         self.edgesOuterCyl = self.getByCylinderDifference(self.part[0].edges, (self.xA-self.lenTol, 0, 0), (self.xA+self.lenTol, 0, 0), (self.yA+self.lenTol), (self.partitionRadius+self.lenTol))
-        self.edgesOuterArc = self.getArcEdge(self.edgesOuterCyl)
+        self.edgesOuterArc = self.getArcEdge(self.edgesOuterCyl, self.part[0])
         self.part[0].seedEdgeBySize(edges=self.edgesOuterArc, size=self.seedSizeArcOuter, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> outer radial edges
         self.edgesOuterRadial = self.getByDifference(self.edgesOuterCyl, self.edgesOuterArc)
@@ -219,7 +221,7 @@ class coupon_01_fatigue_66_69_a(coupon_generic):
         seedOuterRadial((0.0, 0.0, -(self.partitionRadius+self.lenTol)), minSize=self.seedSizeOuterRadialMin, maxSize=self.seedSizeArcOuter)
         ## seed ==>> edge Bb ==>> not applied; seeding with increase the element size at the surface by small amount
         self.edgesOuterCylAtB = self.getByCylinderDifference(self.part[0].edges, (self.xB-self.lenTol, 0, 0), (self.xB+self.lenTol, 0, 0), (self.yB+self.lenTol), (self.partitionRadius+self.lenTol))
-        self.edgesOuterArcAtB = self.getArcEdge(self.edgesOuterCylAtB)
+        self.edgesOuterArcAtB = self.getArcEdge(self.edgesOuterCylAtB, self.part[0])
         self.edgesOuterRadialAtB = self.getByDifference(self.edgesOuterCylAtB, self.edgesOuterArcAtB)
         ratioBias = self.part[0].getEdgeSeeds(self.edgesOuterRadial[0], attribute=BIAS_RATIO)
         elemNum = self.part[0].getEdgeSeeds(self.edgesOuterRadial[0], attribute=NUMBER)
@@ -231,7 +233,7 @@ class coupon_01_fatigue_66_69_a(coupon_generic):
         seedLongEdges(self.xC, self.xD, self.seedSizeLong3)
         ## seed ==>> inner radial edges
         self.edgesInnerCyl = self.part[0].edges.getByBoundingCylinder((self.xA-self.lenTol, 0, 0), (self.xB-self.lenTol, 0, 0), (self.partitionRadius+self.lenTol))
-        self.edgesInnerArc = self.getArcEdge(self.edgesInnerCyl)
+        self.edgesInnerArc = self.getArcEdge(self.edgesInnerCyl, self.part[0])
         self.edgesInnerRadial = self.getByDifference(self.edgesInnerCyl, self.edgesInnerArc)
         self.part[0].seedEdgeBySize(edges=self.edgesInnerRadial, size=self.seedSizeInnerRadial, deviationFactor=0.1, constraint=FINER)
         ## sweep path ==>> inner cylinder
@@ -243,20 +245,20 @@ class coupon_01_fatigue_66_69_a(coupon_generic):
         self.couponData['Step'].update({'End_Pressure':self.endStress})
         for i in range(len(self.part)):
             ## create BC at negY face
-            nodesNegY = self.part[i].nodes.getByBoundingBox(xMin=self.xO-self.lenTol, yMin=-self.lenTol, zMin=-self.yD-self.lenTol, xMax=self.xE+self.lenTol, yMax=self.lenTol, zMax=self.lenTol)
+            nodesNegY = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xO-self.lenTol, yMin=-self.lenTol, zMin=-self.yD-self.lenTol, xMax=self.xE+self.lenTol, yMax=self.lenTol, zMax=self.lenTol)
             nsetNameNegY = 'Nset_BC_NegY_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesNegY, name=nsetNameNegY)
             region = self.instance[i].sets[nsetNameNegY]
             self.model.DisplacementBC(name='BC_NegY_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=SET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             ## create BC at posZ face
-            nodesPosZ = self.part[i].nodes.getByBoundingBox(xMin=self.xO-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xE+self.lenTol, yMax=self.yD+self.lenTol, zMax=self.lenTol)
+            nodesPosZ = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xO-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xE+self.lenTol, yMax=self.yD+self.lenTol, zMax=self.lenTol)
             nsetNamePosZ = 'Nset_BC_PosZ_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesPosZ, name=nsetNamePosZ)
             region = self.instance[i].sets[nsetNamePosZ]
             self.model.DisplacementBC(name='BC_PosZ_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=UNSET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             if i==0:
                 ## create BC at negX face
-                nodesNegX = self.part[i].nodes.getByBoundingCylinder((self.xO-self.lenTol, 0, 0), (self.xO+self.lenTol, 0, 0), (self.yA+self.lenTol))
+                nodesNegX = self.getByBoundingCylinder(self.part[i], 'nodes', (self.xO-self.lenTol, 0, 0), (self.xO+self.lenTol, 0, 0), (self.yA+self.lenTol))
                 nsetNameNegX = 'Nset_BC_NegX_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegX , name=nsetNameNegX)
                 region = self.instance[i].sets[nsetNameNegX]
@@ -31,13 +31,6 @@ class coupon_02_fatigue_66_69_bj(coupon_generic):
         self.len1 = self.geometry['len1']
         self.len2 = self.geometry['len2']
         self.thetaDeg = self.geometry['thetaDeg']
-        self.seedSizePart2 = self.seedSize['part2']
-        self.seedSizeArcOuter = self.seedSize['arcOuter']
-        self.seedRadialOuter = self.seedSize['radialOuter']
-        self.seedRadialMiddle = self.seedSize['radialMiddle']
-        self.seedRadialInner = self.seedSize['radialInner']
-        self.seedSizeLong1 = self.seedSize['long1']
-        self.seedSizeLong2 = self.seedSize['long2']
         ## derived quantities
         self.partitionRadialFraction = 0.67
         self.alphaDeg = 90.0-self.thetaDeg/2.0
@@ -230,7 +223,7 @@ class coupon_02_fatigue_66_69_bj(coupon_generic):
             self.part[0].PartitionFaceBySketch(sketchUpEdge=sketchUpEdge[0], faces=sketchPlane[0], sketch=self.partitionSketch1)
             ## partition solid ==>> sweep
             edges = self.getByCylinderDifference(self.part[0].edges, (self.xA-self.lenTol, 0, 0), (self.xA+self.lenTol, 0, 0), (self.yA+self.lenTol), (self.yA-self.lenTol))
-            sweepPath1 = self.getArcEdge(edges)
+            sweepPath1 = self.getArcEdge(edges, self.part[0])
             edgesTemp = self.part[0].edges
             edgesForPartition =(edgesTemp[0], edgesTemp[1], edgesTemp[2]) ## hard-coded ==>> directly taken from macro; no easy logic to find coordinate
             self.part[0].PartitionCellBySweepEdge(sweepPath=sweepPath1[0], cells=self.part[0].cells, edges=edgesForPartition)
@@ -255,7 +248,7 @@ class coupon_02_fatigue_66_69_bj(coupon_generic):
             ## partition solid ==>> sweep
             sweepPath2 = self.part[0].edges.getByBoundingCylinder((self.xA-self.lenTol, 0, 0), (xRight+self.lenTol, 0, 0), (self.partitionRadius-self.lenTol))
             edgesTemp = self.part[0].edges.getByBoundingCylinder((self.xA-self.lenTol, 0, 0), (self.xA+self.lenTol, 0, 0), (self.partitionRadius+self.lenTol))
-            edgeArcForPartition = self.getArcEdge(edgesTemp)
+            edgeArcForPartition = self.getArcEdge(edgesTemp, self.part[0])
             self.part[0].PartitionCellBySweepEdge(sweepPath=sweepPath2[0], cells=self.part[0].cells, edges=edgeArcForPartition)
         def createPartitionLong(offsetDistance):
             ## partition by YZ plane
@@ -267,14 +260,23 @@ class coupon_02_fatigue_66_69_bj(coupon_generic):
         createPartitionLong(self.xB)
         createPartitionLong(self.xC)
     def createLocalSeed(self):
+        ## element sizes ==>> read from the coupon data on every call, so that coupon_generic.scaleSeedSize can scale
+        ## Element_Size and apply the local seeds again
+        self.seedSizePart2 = self.seedSize['part2']
+        self.seedSizeArcOuter = self.seedSize['arcOuter']
+        self.seedRadialOuter = self.seedSize['radialOuter']
+        self.seedRadialMiddle = self.seedSize['radialMiddle']
+        self.seedRadialInner = self.seedSize['radialInner']
+        self.seedSizeLong1 = self.seedSize['long1']
+        self.seedSizeLong2 = self.seedSize['long2']
         def seedRadial(radiusOuter, radiusInner, seedSize, **kwargs):
             edgesOuterCyl = self.getByCylinderDifference(self.part[0].edges, (self.xA-self.lenTol, 0, 0), (self.xA+self.lenTol, 0, 0), radiusOuter, radiusInner)
-            edgesOuterArc = self.getArcEdge(edgesOuterCyl)
+            edgesOuterArc = self.getArcEdge(edgesOuterCyl, self.part[0])
             edgesOuterRadial = self.getByDifference(edgesOuterCyl, edgesOuterArc)
             self.part[0].seedEdgeBySize(edges=edgesOuterRadial, size=seedSize, deviationFactor=0.1, **kwargs)
         def seedLong(xLeft, xRight, **kwargs):
             pickedEdges = self.part[0].edges.getByBoundingCylinder((xLeft-self.lenTol, 0, 0), (xRight+self.lenTol, 0, 0), (self.yF+self.lenTol))
-            edgesLong = self.getEdgeByLength(pickedEdges, abs(xRight-xLeft))
+            edgesLong = self.getEdgeByLength(pickedEdges, abs(xRight-xLeft), self.part[0])
             self.seedEdge(self.part[0], 0, xLeft, edgesLong, **kwargs)
         def seedInnerCyl(xLeft, xRight):
             cellsInnerCyl = self.part[0].cells.getByBoundingCylinder((xLeft-self.lenTol, 0, 0), (xRight+self.lenTol, 0, 0), (self.partitionRadius+self.lenTol))
@@ -285,13 +287,13 @@ class coupon_02_fatigue_66_69_bj(coupon_generic):
             cellsRight = self.part[1].cells.getByBoundingCylinder((self.xD-self.lenTol, 0, 0), (self.xF+self.lenTol, 0, 0), (self.yF+self.lenTol))
             self.part[1].setMeshControls(regions=cellsRight, elemShape=TET, technique=FREE, allowMapped=False, sizeGrowthRate=1.05)
             edgesPicked = self.part[1].edges.getByBoundingCylinder((self.xD-self.lenTol, 0, 0), (self.xD+self.lenTol, 0, 0), (self.yF+self.lenTol))
-            arcEdges = self.getArcEdge(edgesPicked)
+            arcEdges = self.getArcEdge(edgesPicked, self.part[1])
             self.part[1].seedEdgeBySize(edges=arcEdges, size=self.seedSizePart2/self.phi3*self.phi2, deviationFactor=0.1, constraint=FINER)
             remainingEdges = self.getByDifference(self.part[1].edges, arcEdges)
             self.part[1].seedEdgeBySize(edges=remainingEdges, size=self.seedSizePart2, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> outer arc edge AA'
         edgesOuterCyl = self.getByCylinderDifference(self.part[0].edges, (self.xA-self.lenTol, 0, 0), (self.xA+self.lenTol, 0, 0), (self.yA+self.lenTol), (self.partitionRadius+self.yOffset+self.lenTol))
-        edgesOuterArc = self.getArcEdge(edgesOuterCyl)
+        edgesOuterArc = self.getArcEdge(edgesOuterCyl, self.part[0])
         self.part[0].seedEdgeBySize(edges=edgesOuterArc, size=self.seedSizeArcOuter, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> outer arc edge BB'
         elemNum = self.part[0].getEdgeSeeds(edgesOuterArc[0], attribute=NUMBER)
@@ -324,20 +326,20 @@ class coupon_02_fatigue_66_69_bj(coupon_generic):
         self.couponData['Step'].update({'End_Pressure':self.endStress})
         for i in range(len(self.part)):
             ## create BC at negY face
-            nodesNegY = self.part[i].nodes.getByBoundingBox(xMin=self.xO-self.lenTol, yMin=-self.lenTol, zMin=-self.yF-self.lenTol, xMax=self.xG+self.lenTol, yMax=self.lenTol, zMax=self.lenTol)
+            nodesNegY = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xO-self.lenTol, yMin=-self.lenTol, zMin=-self.yF-self.lenTol, xMax=self.xG+self.lenTol, yMax=self.lenTol, zMax=self.lenTol)
             nsetNameNegY = 'Nset_BC_NegY_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesNegY, name=nsetNameNegY)
             region = self.instance[i].sets[nsetNameNegY]
             self.model.DisplacementBC(name='BC_NegY_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=SET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             ## create BC at posZ face
-            nodesPosZ = self.part[i].nodes.getByBoundingBox(xMin=self.xO-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xG+self.lenTol, yMax=self.yF+self.lenTol, zMax=self.lenTol)
+            nodesPosZ = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xO-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xG+self.lenTol, yMax=self.yF+self.lenTol, zMax=self.lenTol)
             nsetNamePosZ = 'Nset_BC_PosZ_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesPosZ, name=nsetNamePosZ)
             region = self.instance[i].sets[nsetNamePosZ]
             self.model.DisplacementBC(name='BC_PosZ_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=UNSET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             if i==0:
                 ## create BC at negX face of Part 1
-                nodesNegX = self.part[i].nodes.getByBoundingCylinder((self.xO-self.lenTol, 0, 0), (self.xO+self.lenTol, 0, 0), (self.yA+self.lenTol))
+                nodesNegX = self.getByBoundingCylinder(self.part[i], 'nodes', (self.xO-self.lenTol, 0, 0), (self.xO+self.lenTol, 0, 0), (self.yA+self.lenTol))
                 nsetNameNegX = 'Nset_BC_NegX_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegX , name=nsetNameNegX)
                 region = self.instance[i].sets[nsetNameNegX]
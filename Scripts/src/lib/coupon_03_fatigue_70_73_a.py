@@ -27,11 +27,6 @@ class coupon_03_fatigue_70_73_a(coupon_generic):
         self.rad1 = self.geometry['rad1']
         self.len1 = self.geometry['len1']
         self.thickness = self.geometry['thickness']
-        self.seedSizeThickness = self.seedSize['thickness']
-        self.seedSizeVertical = self.seedSize['vertical']
-        self.seedSizeLong1 = self.seedSize['long1']
-        self.seedSizeLong2 = self.seedSize['long2']
-        self.seedSizeLong3 = self.seedSize['long3']
         ## derived quantities
         self.endStress = -self.stepLoad*self.h1/self.h2
         ## create coupon
@@ -133,21 +128,28 @@ class coupon_03_fatigue_70_73_a(coupon_generic):
         createPartitionLong(self.xB)
     def createLocalSeed(self):
         ## seed ==>> thickness direction
+        ## element sizes ==>> read from the coupon data on every call, so that coupon_generic.scaleSeedSize can scale
+        ## Element_Size and apply the local seeds again
+        self.seedSizeThickness = self.seedSize['thickness']
+        self.seedSizeVertical = self.seedSize['vertical']
+        self.seedSizeLong1 = self.seedSize['long1']
+        self.seedSizeLong2 = self.seedSize['long2']
+        self.seedSizeLong3 = self.seedSize['long3']
         edgesThickness = self.part[0].edges.findAt(((0, 0, self.thickness/2),))
         self.part[0].seedEdgeBySize(edges=edgesThickness, size=self.seedSizeThickness, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> long edges along AB
         pickedEdges1 = self.part[0].edges.getByBoundingBox(xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xB+self.lenTol, yMax=self.lenTol, zMax=self.thickness+self.lenTol)
-        edgesLong1 = self.getEdgeByLength(pickedEdges1, abs(self.xB-self.xA))
+        edgesLong1 = self.getEdgeByLength(pickedEdges1, abs(self.xB-self.xA), self.part[0])
         self.seedEdge(self.part[0], 0, self.xA, edgesLong1, minSize=self.seedSizeLong1, maxSize=self.seedSizeLong2)
         ## seed ==>> arc along AB
         pickedEdges2 = self.part[0].edges
-        edgesLong2 = self.getArcEdge(pickedEdges2)
+        edgesLong2 = self.getArcEdge(pickedEdges2, self.part[0])
         biasRatio = self.part[0].getEdgeSeeds(edgesLong1[0], attribute=BIAS_RATIO)
         elemNum = self.part[0].getEdgeSeeds(edgesLong1[0], attribute=NUMBER)
         self.seedEdge(self.part[0], 0, self.xA, edgesLong2, ratio=biasRatio, number=elemNum)
         ## seed ==>> long edges along BC
         pickedEdges3 = self.part[0].edges.getByBoundingBox(xMin=self.xB-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xC+self.lenTol, yMax=self.yC+self.lenTol, zMax=self.thickness+self.lenTol)
-        edgesLong3 = self.getEdgeByLength(pickedEdges3, abs(self.xC-self.xB))
+        edgesLong3 = self.getEdgeByLength(pickedEdges3, abs(self.xC-self.xB), self.part[0])
         self.seedEdge(self.part[0], 0, self.xB, edgesLong3, minSize=self.seedSizeLong2, maxSize=self.seedSizeLong3)
         ## seed ==>> vertical edge
         edgesVertical1 = self.part[0].edges.findAt(((self.xO, self.yA/2, 0),))
@@ -157,20 +159,20 @@ class coupon_03_fatigue_70_73_a(coupon_generic):
         self.couponData['Step'].update({'End_Pressure':self.endStress})
         for i in range(len(self.part)):
             ## create BC at negY face
-            nodesNegY = self.part[i].nodes.getByBoundingBox(xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xC+self.lenTol, yMax=self.lenTol, zMax=self.thickness+self.lenTol)
+            nodesNegY = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xC+self.lenTol, yMax=self.lenTol, zMax=self.thickness+self.lenTol)
             nsetNameNegY = 'Nset_BC_NegY_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesNegY, name=nsetNameNegY)
             region = self.instance[i].sets[nsetNameNegY]
             self.model.DisplacementBC(name='BC_NegY_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=SET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             ## create BC at negZ face
-            nodesNegZ = self.part[i].nodes.getByBoundingBox(xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xC+self.lenTol, yMax=self.yC+self.lenTol, zMax=self.lenTol)
+            nodesNegZ = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xC+self.lenTol, yMax=self.yC+self.lenTol, zMax=self.lenTol)
             nsetNameNegZ = 'Nset_BC_NegZ_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesNegZ, name=nsetNameNegZ)
             region = self.instance[i].sets[nsetNameNegZ]
             self.model.DisplacementBC(name='BC_NegZ_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=UNSET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             if i==0:
                 ## create BC at negX face
-                nodesNegX = self.part[i].nodes.getByBoundingBox(xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xA+self.lenTol, yMax=self.yA+self.yC+self.lenTol, zMax=self.thickness+self.lenTol)
+                nodesNegX = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xA+self.lenTol, yMax=self.yA+self.yC+self.lenTol, zMax=self.thickness+self.lenTol)
                 nsetNameNegX = 'Nset_BC_NegX_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegX , name=nsetNameNegX)
                 region = self.instance[i].sets[nsetNameNegX]
@@ -32,16 +32,6 @@ class coupon_04_fatigue_70_73_be(coupon_generic):
         self.len2 = self.geometry['len2']
         self.thetaDeg = self.geometry['thetaDeg']
         self.thickness = self.geometry['thickness']
-        self.seedSizeThickness1 = self.seedSize['thickness1']
-        self.seedSizeThickness2 = self.seedSize['thickness2']
-        self.seedSizeVerticalOuter = self.seedSize['verticalOuter']
-        self.seedSizeVerticalMiddle = self.seedSize['verticalMiddle']
-        self.seedSizeVerticalInner = self.seedSize['verticalInner']
-        self.seedSizeVertical2 = self.seedSize['vertical2']
-        self.seedSizeLong1 = self.seedSize['long1']
-        self.seedSizeLong2 = self.seedSize['long2']
-        self.seedSizeLong3 = self.seedSize['long3']
-        self.seedSizeLong4 = self.seedSize['long4']
         ## derived quantities
         self.partitionVerticalFraction = 0.67
         self.alphaDeg = 90.0-self.thetaDeg/2.0
@@ -268,6 +258,18 @@ class coupon_04_fatigue_70_73_be(coupon_generic):
         createPartitionLong(self.part[0], self.xC)
         createPartitionLong(self.part[1], self.xE)
     def createLocalSeed(self):
+        ## element sizes ==>> read from the coupon data on every call, so that coupon_generic.scaleSeedSize can scale
+        ## Element_Size and apply the local seeds again
+        self.seedSizeThickness1 = self.seedSize['thickness1']
+        self.seedSizeThickness2 = self.seedSize['thickness2']
+        self.seedSizeVerticalOuter = self.seedSize['verticalOuter']
+        self.seedSizeVerticalMiddle = self.seedSize['verticalMiddle']
+        self.seedSizeVerticalInner = self.seedSize['verticalInner']
+        self.seedSizeVertical2 = self.seedSize['vertical2']
+        self.seedSizeLong1 = self.seedSize['long1']
+        self.seedSizeLong2 = self.seedSize['long2']
+        self.seedSizeLong3 = self.seedSize['long3']
+        self.seedSizeLong4 = self.seedSize['long4']
         edgesThickness1 = self.part[0].edges.findAt(((0, 0, self.lenTol),))
         self.part[0].seedEdgeBySize(edges=edgesThickness1, size=self.seedSizeThickness1, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> outer vertical edge
@@ -287,19 +289,19 @@ class coupon_04_fatigue_70_73_be(coupon_generic):
         self.part[0].seedEdgeBySize(edges=edgesLongBC, size=self.seedSizeLong1, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> long edges along CD
         pickedEdges1 = self.part[0].edges
-        edgesLongCD = self.getEdgeByLength(pickedEdges1, abs(self.xD-self.xC))
+        edgesLongCD = self.getEdgeByLength(pickedEdges1, abs(self.xD-self.xC), self.part[0])
         self.seedEdge(self.part[0], 0, self.xC, edgesLongCD, minSize=self.seedSizeLong1, maxSize=self.seedSizeLong2)
         ## seed ==>> arc along DE
         pickedEdges2 = self.part[1].edges
-        edgesArcDE = self.getArcEdge(pickedEdges2)
+        edgesArcDE = self.getArcEdge(pickedEdges2, self.part[1])
         self.seedEdge(self.part[1], 0, self.xD, edgesArcDE, minSize=self.seedSizeLong2, maxSize=self.seedSizeLong3)
         # ## seed ==>> long edge along DE
-        edgesLongDE = self.getEdgeByLength(pickedEdges2, abs(self.xE-self.xD))
+        edgesLongDE = self.getEdgeByLength(pickedEdges2, abs(self.xE-self.xD), self.part[1])
         biasRatio = self.part[1].getEdgeSeeds(edgesArcDE[0], attribute=BIAS_RATIO)
         elemNum = self.part[1].getEdgeSeeds(edgesArcDE[0], attribute=NUMBER)
         self.seedEdge(self.part[1], 0, self.xD, edgesLongDE, ratio=biasRatio, number=elemNum)
         ## seed ==>> long edges along EF
-        edgesLong3 = self.getEdgeByLength(pickedEdges2, abs(self.xF-self.xE))
+        edgesLong3 = self.getEdgeByLength(pickedEdges2, abs(self.xF-self.xE), self.part[1])
         self.seedEdge(self.part[1], 0, self.xE, edgesLong3, minSize=self.seedSizeLong3, maxSize=self.seedSizeLong4)
         ## seed ==>> thickness 2
         edgesThickness2 = self.part[1].edges.findAt(coordinates=((self.xD, 0, self.lenTol), ))
@@ -320,20 +322,20 @@ class coupon_04_fatigue_70_73_be(coupon_generic):
         self.couponData['Step'].update({'End_Pressure':self.endStress})
         for i in range(len(self.part)):
             ## create BC at negY face
-            nodesNegY = self.part[i].nodes.getByBoundingBox(xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xF+self.lenTol, yMax=self.lenTol, zMax=self.thickness+self.lenTol)
+            nodesNegY = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xF+self.lenTol, yMax=self.lenTol, zMax=self.thickness+self.lenTol)
             nsetNameNegY = 'Nset_BC_NegY_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesNegY, name=nsetNameNegY)
             region = self.instance[i].sets[nsetNameNegY]
             self.model.DisplacementBC(name='BC_NegY_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=SET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             ## create BC at negZ face
-            nodesNegZ = self.part[i].nodes.getByBoundingBox(xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xF+self.lenTol, yMax=self.yF+self.lenTol, zMax=self.lenTol)
+            nodesNegZ = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xF+self.lenTol, yMax=self.yF+self.lenTol, zMax=self.lenTol)
             nsetNameNegZ = 'Nset_BC_NegZ_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesNegZ, name=nsetNameNegZ)
             region = self.instance[i].sets[nsetNameNegZ]
             self.model.DisplacementBC(name='BC_NegZ_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=UNSET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             if i==0:
                 ## create BC at negX face of Part 1
-                nodesNegX = self.part[i].nodes.getByBoundingBox(xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xA+self.lenTol, yMax=self.yA+self.yC+self.lenTol, zMax=self.thickness+self.lenTol)
+                nodesNegX = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xA+self.lenTol, yMax=self.yA+self.yC+self.lenTol, zMax=self.thickness+self.lenTol)
                 nsetNameNegX = 'Nset_BC_NegX_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegX , name=nsetNameNegX)
                 region = self.instance[i].sets[nsetNameNegX]
@@ -30,14 +30,6 @@ class coupon_05_fatigue_74_75(coupon_generic):
         self.chamferAngle = self.geometry['chamferAngle']
         self.thickness = self.geometry['thickness']
         self.isChamfer = self.geometry['isChamfer']
-        self.seedSizeThickness1 = self.seedSize['thickness1']
-        self.seedSizeThickness2 = self.seedSize['thickness2']
-        self.seedSizeWidth = self.seedSize['width']
-        self.seedSizeArc = self.seedSize['arc']
-        self.seedSizeLong1 = self.seedSize['long1']
-        self.seedSizeLong2 = self.seedSize['long2']
-        self.seedSizeLong3 = self.seedSize['long3']
-        self.seedSizeLong4 = self.seedSize['long4']
         ## derived quantities
         self.thetaRad = math.pi/180*self.chamferAngle
         self.tieDistance = 2.0*self.phi
@@ -224,7 +216,7 @@ class coupon_05_fatigue_74_75(coupon_generic):
         ## partition solid ==>> sweep 1
         sweepPath1 = self.part[0].edges.findAt(coordinates=(self.width/2.0, 0, self.lenTol))
         edgesForPartitionTemp1 = self.getByCylinderDifference(self.part[0].edges, (0, 0, -self.lenTol), (0, 0, self.lenTol), ((self.phi+self.width)/4.0+self.lenTol), ((self.phi+self.width)/4.0-self.lenTol))
-        edgesForPartition1 = self.getArcEdge(edgesForPartitionTemp1)
+        edgesForPartition1 = self.getArcEdge(edgesForPartitionTemp1, self.part[0])
         self.part[0].PartitionCellBySweepEdge(sweepPath=sweepPath1, cells=self.part[0].cells, edges=edgesForPartition1)
         ## partition solid ==>> sweep 2
         sweepPath2 = self.part[0].edges.findAt(coordinates=(self.width/2.0, 0, self.lenTol))
@@ -238,9 +230,19 @@ class coupon_05_fatigue_74_75(coupon_generic):
         if self.provideChamfer==True:
             sweepPath4 = self.part[0].edges.findAt(coordinates=(self.width/2.0, 0, self.lenTol))
             edgesForPartitionTemp4 = self.getByCylinderDifference(self.part[0].edges, (0, 0, self.thickness/2-self.lenTol), (0, 0, self.thickness/2+self.lenTol), (self.phi/2+self.chamferEdgeLength+self.lenTol), (self.phi/2+self.chamferEdgeLength-self.lenTol))
-            edgesForPartition4 = self.getArcEdge(edgesForPartitionTemp4)
+            edgesForPartition4 = self.getArcEdge(edgesForPartitionTemp4, self.part[0])
             self.part[0].PartitionCellBySweepEdge(sweepPath=sweepPath4, cells=self.part[0].cells, edges=edgesForPartition4)
     def createLocalSeed(self):
+        ## element sizes ==>> read from the coupon data on every call, so that coupon_generic.scaleSeedSize can scale
+        ## Element_Size and apply the local seeds again
+        self.seedSizeThickness1 = self.seedSize['thickness1']
+        self.seedSizeThickness2 = self.seedSize['thickness2']
+        self.seedSizeWidth = self.seedSize['width']
+        self.seedSizeArc = self.seedSize['arc']
+        self.seedSizeLong1 = self.seedSize['long1']
+        self.seedSizeLong2 = self.seedSize['long2']
+        self.seedSizeLong3 = self.seedSize['long3']
+        self.seedSizeLong4 = self.seedSize['long4']
         if self.provideChamfer==True:
             self.chamferOffset = self.chamferEdgeLength
         elif self.provideChamfer==False:
@@ -257,16 +259,16 @@ class coupon_05_fatigue_74_75(coupon_generic):
             self.part[0].seedEdgeBySize(edges=edgesLong1, size=self.seedSizeLong1, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> long edges along B'B''
         pickedEdges1 = self.part[0].edges.getByBoundingCylinder((0, 0, -self.lenTol), (0, 0, self.thickness/2+self.lenTol), ((self.phi+self.width)/4.0+self.lenTol))
-        pickedEdgesArc = self.getArcEdge(pickedEdges1)
+        pickedEdgesArc = self.getArcEdge(pickedEdges1, self.part[0])
         pickedEdgesStraight = self.getByDifference(pickedEdges1, pickedEdgesArc)
-        edgesLong2 = self.getEdgeByLength(pickedEdgesStraight, abs((self.width-self.phi)/4-self.chamferOffset))
+        edgesLong2 = self.getEdgeByLength(pickedEdgesStraight, abs((self.width-self.phi)/4-self.chamferOffset), self.part[0])
         self.seedEdge(self.part[0], 0, (self.phi/2+self.chamferOffset), edgesLong2, minSize=self.seedSizeLong1, maxSize=self.seedSizeLong2)
         self.seedEdge(self.part[0], 1, (self.phi/2+self.chamferOffset), edgesLong2, minSize=self.seedSizeLong1, maxSize=self.seedSizeLong2)
         self.seedEdge(self.part[0], 0, (self.phi/2+self.chamferOffset)*math.cos(math.pi/4), edgesLong2, minSize=self.seedSizeLong1, maxSize=self.seedSizeLong2)
         ## seed ==>> long edges B''C'
         pickedEdges2 = self.part[0].edges.getByBoundingBox(xMin=-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.width/2+self.lenTol, yMax=self.width/2+self.lenTol, zMax=self.thickness/2+self.lenTol)
         edgesLongTemp1 = self.getByDifference(pickedEdges2, pickedEdges1)
-        edgesLongTemp2 = self.getEdgeByLength(edgesLongTemp1, self.thickness/2)
+        edgesLongTemp2 = self.getEdgeByLength(edgesLongTemp1, self.thickness/2, self.part[0])
         edgesLong3 = self.getByDifference(edgesLongTemp1, edgesLongTemp2)
         self.part[0].seedEdgeBySize(edges=edgesLong3, size=self.seedSizeLong2, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> long edge along C'D
@@ -294,20 +296,20 @@ class coupon_05_fatigue_74_75(coupon_generic):
         self.couponData['Step'].update({'End_Pressure':self.endStress})
         for i in range(len(self.part)):
             ## create BC at negY face
-            nodesNegY = self.part[i].nodes.getByBoundingBox(xMin=-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xG+self.lenTol, yMax=self.lenTol, zMax=self.thickness/2+self.lenTol)
+            nodesNegY = self.getByBoundingBox(self.part[i], 'nodes', xMin=-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xG+self.lenTol, yMax=self.lenTol, zMax=self.thickness/2+self.lenTol)
             nsetNameNegY = 'Nset_BC_NegY_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesNegY, name=nsetNameNegY)
             region = self.instance[i].sets[nsetNameNegY]
             self.model.DisplacementBC(name='BC_NegY_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=SET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             ## create BC at negZ face
-            nodesPosZ = self.part[i].nodes.getByBoundingBox(xMin=-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xG+self.lenTol, yMax=self.yG+self.lenTol, zMax=self.lenTol)
+            nodesPosZ = self.getByBoundingBox(self.part[i], 'nodes', xMin=-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xG+self.lenTol, yMax=self.yG+self.lenTol, zMax=self.lenTol)
             nsetNamePosZ = 'Nset_BC_NegZ_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesPosZ, name=nsetNamePosZ)
             region = self.instance[i].sets[nsetNamePosZ]
             self.model.DisplacementBC(name='BC_NegZ_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=UNSET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             if i==0:
                 ## create BC at negX face of Part 1
-                nodesNegX = self.part[i].nodes.getByBoundingBox(xMin=-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.lenTol, yMax=self.yC+self.lenTol, zMax=self.thickness/2+self.lenTol)
+                nodesNegX = self.getByBoundingBox(self.part[i], 'nodes', xMin=-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.lenTol, yMax=self.yC+self.lenTol, zMax=self.thickness/2+self.lenTol)
                 nsetNameNegX = 'Nset_BC_NegX_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegX , name=nsetNameNegX)
                 region = self.instance[i].sets[nsetNameNegX]
@@ -28,12 +28,6 @@ class coupon_06a_static_1_symm(coupon_generic):
         self.R = self.geometry['R']
         self.C = self.geometry['C']
         self.lc = self.geometry['lc']
-        self.seedSizeArcOuter = self.seedSize['arcOuter']
-        self.seedSizeRadialOuter = self.seedSize['radialOuter']
-        self.seedSizeRadialInner = self.seedSize['radialInner']
-        self.seedSizeLong1 = self.seedSize['long1']
-        self.seedSizeLong2 = self.seedSize['long2']
-        self.seedSizeLong3 = self.seedSize['long3']
         ## derived quantities
         self.partitionRadialFraction = 0.67
         self.partitionRadius = self.partitionRadialFraction*self.d/2
@@ -161,7 +155,7 @@ class coupon_06a_static_1_symm(coupon_generic):
             self.partitionSketch.unsetPrimaryObject()
             self.part[0].PartitionFaceBySketch(sketchUpEdge=self.sketchEdge[0], faces=self.sketchFace[0], sketch=self.partitionSketch)
             edgesTemp = self.part[0].edges.getByBoundingCylinder((-self.lenTol, 0, 0), (self.lenTol, 0, 0), (self.partitionRadius+self.lenTol))
-            self.edgesArcForPartition = self.getArcEdge(edgesTemp)
+            self.edgesArcForPartition = self.getArcEdge(edgesTemp, self.part[0])
             self.sweepEdges = self.part[0].edges.getByBoundingCylinder((-self.lenTol, 0, 0), (self.xE+self.lenTol, 0, 0), (self.partitionRadius-self.lenTol))
             self.part[0].PartitionCellBySweepEdge(sweepPath=self.sweepEdges[0], cells=self.part[0].cells, edges=self.edgesArcForPartition)
         def createPartitionLong(offsetDistance):
@@ -172,9 +166,17 @@ class coupon_06a_static_1_symm(coupon_generic):
         createPartitionLong(self.xB)
         createPartitionLong(self.xC)
     def createLocalSeed(self):
+        ## element sizes ==>> read from the coupon data on every call, so that coupon_generic.scaleSeedSize can scale
+        ## Element_Size and apply the local seeds again
+        self.seedSizeArcOuter = self.seedSize['arcOuter']
+        self.seedSizeRadialOuter = self.seedSize['radialOuter']
+        self.seedSizeRadialInner = self.seedSize['radialInner']
+        self.seedSizeLong1 = self.seedSize['long1']
+        self.seedSizeLong2 = self.seedSize['long2']
+        self.seedSizeLong3 = self.seedSize['long3']
         def seedLong(part, xLeft, xRight, yMax, **kwargs):
             pickedEdges = part.edges.getByBoundingCylinder((xLeft-self.lenTol, 0, 0), (xRight+self.lenTol, 0, 0), (yMax+self.lenTol))
-            edgesLong = self.getEdgeByLength(pickedEdges, abs(xRight-xLeft))
+            edgesLong = self.getEdgeByLength(pickedEdges, abs(xRight-xLeft), part)
             self.seedEdge(part, 0, xLeft, edgesLong, **kwargs)
         def seedInnerCyl(part, xLeft, xRight):
             cellsInnerCyl = part.cells.getByBoundingCylinder((xLeft-self.lenTol, 0, 0), (xRight+self.lenTol, 0, 0), (self.partitionRadius+self.lenTol))
@@ -183,7 +185,7 @@ class coupon_06a_static_1_symm(coupon_generic):
             part.setSweepPath(region=cellsInnerCyl[0], edge=edgesSweepPath[0], sense=FORWARD)
         ## seed ==>> outer arc edge AA'
         self.edgesOuterCyl = self.getByCylinderDifference(self.part[0].edges, (-self.lenTol, 0, 0), (self.lenTol, 0, 0), (self.yA+self.lenTol), (self.partitionRadius+self.lenTol))
-        self.edgesOuterArc = self.getArcEdge(self.edgesOuterCyl)
+        self.edgesOuterArc = self.getArcEdge(self.edgesOuterCyl, self.part[0])
         self.part[0].seedEdgeBySize(edges=self.edgesOuterArc, size=self.seedSizeArcOuter, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> outer radial edges
         edgesRadial1 = self.part[0].edges.findAt(coordinates=((0, (self.partitionRadius+self.lenTol), 0), (0, 0, -(self.partitionRadius+self.lenTol))))
@@ -206,27 +208,27 @@ class coupon_06a_static_1_symm(coupon_generic):
         ratioBias = self.part[0].getEdgeSeeds(edgesTemp[0], attribute=BIAS_RATIO)
         elemNum = self.part[0].getEdgeSeeds(edgesTemp[0], attribute=NUMBER)
         edgesTemp2 = self.part[0].edges.getByBoundingCylinder((self.xB-self.lenTol, 0, 0), (self.xC+self.lenTol, 0, 0), (self.yC+self.lenTol))
-        edgesArc = self.getArcEdge(edgesTemp2)
+        edgesArc = self.getArcEdge(edgesTemp2, self.part[0])
         self.seedEdge(self.part[0], 0, self.xB, edgesArc, ratio=ratioBias, number=elemNum)
     def createLoadBC(self):
         ## create load and boundary conditions
         self.couponData['Step'].update({'End_Pressure':self.endStress})
         for i in range(len(self.part)):
             ## create BC at negY face
-            nodesNegY = self.part[i].nodes.getByBoundingBox(xMin=-self.lenTol, yMin=-self.lenTol, zMin=-self.yD-self.lenTol, xMax=self.xD+self.lenTol, yMax=self.lenTol, zMax=self.lenTol)
+            nodesNegY = self.getByBoundingBox(self.part[i], 'nodes', xMin=-self.lenTol, yMin=-self.lenTol, zMin=-self.yD-self.lenTol, xMax=self.xD+self.lenTol, yMax=self.lenTol, zMax=self.lenTol)
             nsetNameNegY = 'Nset_BC_NegY_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesNegY, name=nsetNameNegY)
             region = self.instance[i].sets[nsetNameNegY]
             self.model.DisplacementBC(name='BC_NegY_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=SET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             ## create BC at posZ face
-            nodesPosZ = self.part[i].nodes.getByBoundingBox(xMin=-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xD+self.lenTol, yMax=self.yD+self.lenTol, zMax=self.lenTol)
+            nodesPosZ = self.getByBoundingBox(self.part[i], 'nodes', xMin=-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xD+self.lenTol, yMax=self.yD+self.lenTol, zMax=self.lenTol)
             nsetNamePosZ = 'Nset_BC_PosZ_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesPosZ, name=nsetNamePosZ)
             region = self.instance[i].sets[nsetNamePosZ]
             self.model.DisplacementBC(name='BC_PosZ_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=UNSET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             if i==0:
                 ## create BC at negX face of Part 1
-                nodesNegX = self.part[i].nodes.getByBoundingCylinder((-self.lenTol, 0, 0), (self.lenTol, 0, 0), (self.yA+self.lenTol))
+                nodesNegX = self.getByBoundingCylinder(self.part[i], 'nodes', (-self.lenTol, 0, 0), (self.lenTol, 0, 0), (self.yA+self.lenTol))
                 nsetNameNegX = 'Nset_BC_NegX_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegX , name=nsetNameNegX)
                 region = self.instance[i].sets[nsetNameNegX]
@@ -28,12 +28,6 @@ class coupon_06b_static_1_full(coupon_generic):
         self.R = self.geometry['R']
         self.C = self.geometry['C']
         self.lc = self.geometry['lc']
-        self.seedSizeArcOuter = self.seedSize['arcOuter']
-        self.seedSizeRadialOuter = self.seedSize['radialOuter']
-        self.seedSizeRadialInner = self.seedSize['radialInner']
-        self.seedSizeLong1 = self.seedSize['long1']
-        self.seedSizeLong2 = self.seedSize['long2']
-        self.seedSizeLong3 = self.seedSize['long3']
         ## derived quantities
         self.partitionRadialFraction = 0.67
         self.partitionRadius = self.partitionRadialFraction*self.d/2
@@ -191,9 +185,17 @@ class coupon_06b_static_1_full(coupon_generic):
         self.datumPlaneXZ_ID = self.part[0].DatumPlaneByPrincipalPlane(principalPlane=XZPLANE, offset=0).id
         self.part[0].PartitionCellByDatumPlane(datumPlane=self.part[0].datums[self.datumPlaneXZ_ID], cells=self.part[0].cells)
     def createLocalSeed(self):
+        ## element sizes ==>> read from the coupon data on every call, so that coupon_generic.scaleSeedSize can scale
+        ## Element_Size and apply the local seeds again
+        self.seedSizeArcOuter = self.seedSize['arcOuter']
+        self.seedSizeRadialOuter = self.seedSize['radialOuter']
+        self.seedSizeRadialInner = self.seedSize['radialInner']
+        self.seedSizeLong1 = self.seedSize['long1']
+        self.seedSizeLong2 = self.seedSize['long2']
+        self.seedSizeLong3 = self.seedSize['long3']
         def seedLong(part, xLeft, xRight, xPoint, yMax, **kwargs):
             pickedEdges = part.edges.getByBoundingCylinder((xLeft-self.lenTol, 0, 0), (xRight+self.lenTol, 0, 0), (yMax+self.lenTol))
-            edgesLong = self.getEdgeByLength(pickedEdges, abs(xRight-xLeft))
+            edgesLong = self.getEdgeByLength(pickedEdges, abs(xRight-xLeft), part)
             self.seedEdge(part, 0, xPoint, edgesLong, **kwargs)
         def seedInnerCyl(part, xLeft, xRight):
             cellsInnerCyl = part.cells.getByBoundingCylinder((xLeft-self.lenTol, 0, 0), (xRight+self.lenTol, 0, 0), (self.partitionRadius+self.lenTol))
@@ -202,7 +204,7 @@ class coupon_06b_static_1_full(coupon_generic):
             part.setSweepPath(region=cellsInnerCyl[0], edge=edgesSweepPath[0], sense=FORWARD)
         ## seed ==>> outer arc edge AA'
         edgesOuterCyl = self.getByCylinderDifference(self.part[0].edges, (self.xO-self.lenTol, 0, 0), (self.xO+self.lenTol, 0, 0), (self.yA+self.lenTol), (self.partitionRadius+self.lenTol))
-        edgesOuterArc = self.getArcEdge(edgesOuterCyl)
+        edgesOuterArc = self.getArcEdge(edgesOuterCyl, self.part[0])
         self.part[0].seedEdgeBySize(edges=edgesOuterArc, size=self.seedSizeArcOuter, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> outer radial edges
         edgesRadial1 = self.part[0].edges.findAt(coordinates=((self.xO, (self.partitionRadius+self.lenTol), 0), (self.xO, -(self.partitionRadius+self.lenTol), 0), 
@@ -235,14 +237,14 @@ class coupon_06b_static_1_full(coupon_generic):
         ratioBias1 = self.part[0].getEdgeSeeds(edgesTemp1[0], attribute=BIAS_RATIO)
         elemNum1 = self.part[0].getEdgeSeeds(edgesTemp1[0], attribute=NUMBER)
         edgesTemp2 = self.part[0].edges.getByBoundingCylinder((self.xB-self.lenTol, 0, 0), (self.xC+self.lenTol, 0, 0), (self.yC+self.lenTol))
-        edgesArc2 = self.getArcEdge(edgesTemp2)
+        edgesArc2 = self.getArcEdge(edgesTemp2, self.part[0])
         self.seedEdge(self.part[0], 0, self.xB, edgesArc2, ratio=ratioBias1, number=elemNum1)
         ## seed ==>> arc AH
         edgesTemp3 = self.part[0].edges.findAt(coordinates=((self.xA-self.lenTol, 0, 0), ))
         ratioBias2 = self.part[0].getEdgeSeeds(edgesTemp3[0], attribute=BIAS_RATIO)
         elemNum2 = self.part[0].getEdgeSeeds(edgesTemp3[0], attribute=NUMBER)
         edgesTemp4 = self.part[0].edges.getByBoundingCylinder((self.xH-self.lenTol, 0, 0), (self.xA+self.lenTol, 0, 0), (self.yH+self.lenTol))
-        edgesArc4 = self.getArcEdge(edgesTemp4)
+        edgesArc4 = self.getArcEdge(edgesTemp4, self.part[0])
         self.seedEdge(self.part[0], 0, self.xA, edgesArc4, ratio=ratioBias2, number=elemNum2)
     def createLoadBC(self):
         ## create load and boundary conditions
@@ -250,13 +252,13 @@ class coupon_06b_static_1_full(coupon_generic):
         for i in range(len(self.part)):
             if i==0:
                 ## create BC at negX face of Part 1
-                nodesNegX = self.part[i].nodes.getByBoundingCylinder((self.xG-self.lenTol, 0, 0), (self.xG+self.lenTol, 0, 0), (self.yG+self.lenTol))
+                nodesNegX = self.getByBoundingCylinder(self.part[i], 'nodes', (self.xG-self.lenTol, 0, 0), (self.xG+self.lenTol, 0, 0), (self.yG+self.lenTol))
                 nsetNameNegX = 'Nset_BC_NegX_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegX , name=nsetNameNegX)
                 region = self.instance[i].sets[nsetNameNegX]
                 self.model.DisplacementBC(name='BC_NegX_Instance_'+str(i+1), createStepName='Load', region=region, u1=SET, u2=UNSET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
                 ## create BC at negX face of Part 1 at Y=0, Z=0
-                nodesNegXYZ = self.part[i].nodes.getByBoundingCylinder((self.xF-self.lenTol, 0, 0), (self.xF+self.lenTol, 0, 0), self.lenTol)
+                nodesNegXYZ = self.getByBoundingCylinder(self.part[i], 'nodes', (self.xF-self.lenTol, 0, 0), (self.xF+self.lenTol, 0, 0), self.lenTol)
                 nsetNameNegXYZ = 'Nset_BC_NegXYZ_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegXYZ , name=nsetNameNegXYZ)
                 region = self.instance[i].sets[nsetNameNegXYZ]
@@ -29,12 +29,6 @@ class coupon_07a_static_2_symm(coupon_generic):
         self.C = self.geometry['C']
         self.lc = self.geometry['lc']
         self.thickness = self.geometry['thickness']
-        self.seedSizeThickness = self.seedSize['thickness']
-        self.seedSizeVertical = self.seedSize['vertical']
-        self.seedSizeLong1 = self.seedSize['long1']
-        self.seedSizeLong2 = self.seedSize['long2']
-        self.seedSizeLong3 = self.seedSize['long3']
-        self.seedSizeLong4 = self.seedSize['long4']
         ## derived quantities
         self.endStress = -self.stepLoad*(self.b/self.B)
         ## create coupon
@@ -148,6 +142,14 @@ class coupon_07a_static_2_symm(coupon_generic):
         createPartitionLong(self.xC)
     def createLocalSeed(self):
         ## seed ==>> thickness direction
+        ## element sizes ==>> read from the coupon data on every call, so that coupon_generic.scaleSeedSize can scale
+        ## Element_Size and apply the local seeds again
+        self.seedSizeThickness = self.seedSize['thickness']
+        self.seedSizeVertical = self.seedSize['vertical']
+        self.seedSizeLong1 = self.seedSize['long1']
+        self.seedSizeLong2 = self.seedSize['long2']
+        self.seedSizeLong3 = self.seedSize['long3']
+        self.seedSizeLong4 = self.seedSize['long4']
         edgesThickness = self.part[0].edges.findAt(coordinates=((0, 0, self.lenTol), ))
         self.part[0].seedEdgeBySize(edges=edgesThickness, size=self.seedSizeThickness, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> vertical direction
@@ -155,42 +157,42 @@ class coupon_07a_static_2_symm(coupon_generic):
         self.part[0].seedEdgeBySize(edges=edgesVertical, size=self.seedSizeVertical, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> long edges along AB
         pickedEdges3 = self.part[0].edges.getByBoundingBox(xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xB+self.lenTol, yMax=self.yB+self.lenTol, zMax=self.thickness/2.0+self.lenTol)
-        edgesLong3 = self.getEdgeByLength(pickedEdges3, abs(self.xB-self.xA))
+        edgesLong3 = self.getEdgeByLength(pickedEdges3, abs(self.xB-self.xA), self.part[0])
         self.seedEdge(self.part[0], 0, self.xA, edgesLong3, minSize=self.seedSizeLong1, maxSize=self.seedSizeLong2)
         ## seed ==>> long edges along BC
         pickedEdges1 = self.part[0].edges.getByBoundingBox(xMin=self.xB-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xC+self.lenTol, yMax=self.lenTol, zMax=self.thickness/2.0+self.lenTol)
-        edgesLong1 = self.getEdgeByLength(pickedEdges1, abs(self.xC-self.xB))
+        edgesLong1 = self.getEdgeByLength(pickedEdges1, abs(self.xC-self.xB), self.part[0])
         self.seedEdge(self.part[0], 0, self.xB, edgesLong1, minSize=self.seedSizeLong2, maxSize=self.seedSizeLong3)
         ## seed ==>> arc BC
         edgesTemp = self.part[0].edges.findAt(coordinates=((self.xB+self.lenTol, 0, 0), ))
         ratioBias = self.part[0].getEdgeSeeds(edgesTemp[0], attribute=BIAS_RATIO)
         elemNum = self.part[0].getEdgeSeeds(edgesTemp[0], attribute=NUMBER)
         edgesTemp2 = self.part[0].edges.getByBoundingBox(xMin=self.xB-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xC+self.lenTol, yMax=self.yC+self.lenTol, zMax=self.thickness/2.0+self.lenTol)
-        edgesArc = self.getArcEdge(edgesTemp2)
+        edgesArc = self.getArcEdge(edgesTemp2, self.part[0])
         self.seedEdge(self.part[0], 0, self.xB, edgesArc, ratio=ratioBias, number=elemNum)
         ## seed ==>> long edges along CD
         pickedEdges3 = self.part[0].edges.getByBoundingBox(xMin=self.xC-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xD+self.lenTol, yMax=self.yD+self.lenTol, zMax=self.thickness/2.0+self.lenTol)
-        edgesLong3 = self.getEdgeByLength(pickedEdges3, abs(self.xD-self.xC))
+        edgesLong3 = self.getEdgeByLength(pickedEdges3, abs(self.xD-self.xC), self.part[0])
         self.seedEdge(self.part[0], 0, self.xC, edgesLong3, minSize=self.seedSizeLong3, maxSize=self.seedSizeLong4)
     def createLoadBC(self):
         ## create load and boundary conditions
         self.couponData['Step'].update({'End_Pressure':self.endStress})
         for i in range(len(self.part)):
             ## create BC at negY face
-            nodesNegY = self.part[i].nodes.getByBoundingBox(xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xD+self.lenTol, yMax=self.lenTol, zMax=self.thickness/2.0+self.lenTol)
+            nodesNegY = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xD+self.lenTol, yMax=self.lenTol, zMax=self.thickness/2.0+self.lenTol)
             nsetNameNegY = 'Nset_BC_NegY_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesNegY, name=nsetNameNegY)
             region = self.instance[i].sets[nsetNameNegY]
             self.model.DisplacementBC(name='BC_NegY_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=SET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             ## create BC at negZ face
-            nodesNegZ = self.part[i].nodes.getByBoundingBox(xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xD+self.lenTol, yMax=self.yD+self.lenTol, zMax=self.lenTol)
+            nodesNegZ = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xD+self.lenTol, yMax=self.yD+self.lenTol, zMax=self.lenTol)
             nsetNameNegZ = 'Nset_BC_NegZ_Part_'+str(i+1)
             self.part[i].Set(nodes=nodesNegZ, name=nsetNameNegZ)
             region = self.instance[i].sets[nsetNameNegZ]
             self.model.DisplacementBC(name='BC_NegZ_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=UNSET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             if i==0:
                 ## create BC at negX face
-                nodesNegX = self.part[i].nodes.getByBoundingBox(xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xA+self.lenTol, yMax=self.yA+self.yC+self.lenTol, zMax=self.thickness/2.0+self.lenTol)
+                nodesNegX = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xA-self.lenTol, yMin=-self.lenTol, zMin=-self.lenTol, xMax=self.xA+self.lenTol, yMax=self.yA+self.yC+self.lenTol, zMax=self.thickness/2.0+self.lenTol)
                 nsetNameNegX = 'Nset_BC_NegX_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegX , name=nsetNameNegX)
                 region = self.instance[i].sets[nsetNameNegX]
@@ -30,12 +30,6 @@ class coupon_07b_static_2_full(coupon_generic):
         self.C = self.geometry['C']
         self.lc = self.geometry['lc']
         self.thickness = self.geometry['thickness']
-        self.seedSizeThickness = self.seedSize['thickness']
-        self.seedSizeVertical = self.seedSize['vertical']
-        self.seedSizeLong1 = self.seedSize['long1']
-        self.seedSizeLong2 = self.seedSize['long2']
-        self.seedSizeLong3 = self.seedSize['long3']
-        self.seedSizeLong4 = self.seedSize['long4']
         ## derived quantities
         self.endStress = -self.stepLoad*(self.b/self.B)
         ## create coupon
@@ -215,6 +209,14 @@ class coupon_07b_static_2_full(coupon_generic):
         self.part[0].PartitionCellByDatumPlane(datumPlane=self.part[0].datums[self.datumPlaneXZ_ID], cells=self.part[0].cells)
     def createLocalSeed(self):
         ## seed ==>> thickness direction
+        ## element sizes ==>> read from the coupon data on every call, so that coupon_generic.scaleSeedSize can scale
+        ## Element_Size and apply the local seeds again
+        self.seedSizeThickness = self.seedSize['thickness']
+        self.seedSizeVertical = self.seedSize['vertical']
+        self.seedSizeLong1 = self.seedSize['long1']
+        self.seedSizeLong2 = self.seedSize['long2']
+        self.seedSizeLong3 = self.seedSize['long3']
+        self.seedSizeLong4 = self.seedSize['long4']
         numThicknessElem = math.ceil(self.thickness/self.seedSizeThickness)
         if (numThicknessElem%2)!=0:
             numThicknessElem = numThicknessElem+1
@@ -227,7 +229,7 @@ class coupon_07b_static_2_full(coupon_generic):
         self.part[0].seedEdgeBySize(edges=edgesVertical2, size=self.seedSizeVertical, deviationFactor=0.1, constraint=FINER)
         ## seed ==>> long edges along AB
         pickedEdges1 = self.part[0].edges.getByBoundingBox(xMin=self.xH-self.lenTol, yMin=self.yH-self.lenTol, zMin=-self.lenTol, xMax=self.xB+self.lenTol, yMax=self.yB+self.lenTol, zMax=self.thickness+self.lenTol)
-        edgesLong1 = self.getEdgeByLength(pickedEdges1, abs(self.xB-self.xO))
+        edgesLong1 = self.getEdgeByLength(pickedEdges1, abs(self.xB-self.xO), self.part[0])
         self.seedEdge(self.part[0], 0, self.xO, edgesLong1, minSize=self.seedSizeLong1, maxSize=self.seedSizeLong2)
         ## seed ==>> long edges along BC
         edgesLong1 = self.part[0].edges.findAt(coordinates=((self.xB+self.lenTol, 0, 0), (self.xB+self.lenTol, 0, self.thickness), 
@@ -239,14 +241,14 @@ class coupon_07b_static_2_full(coupon_generic):
         ratioBias = self.part[0].getEdgeSeeds(edgesTemp1[0], attribute=BIAS_RATIO)
         elemNum = self.part[0].getEdgeSeeds(edgesTemp1[0], attribute=NUMBER)
         edgesTemp2 = self.part[0].edges.getByBoundingBox(xMin=self.xG-self.lenTol, yMin=self.yF-self.lenTol, zMin=-self.lenTol, xMax=self.xC+self.lenTol, yMax=self.yC+self.lenTol, zMax=self.thickness+self.lenTol)
-        edgesArc1 = self.getArcEdge(edgesTemp2)
+        edgesArc1 = self.getArcEdge(edgesTemp2, self.part[0])
         self.seedEdge(self.part[0], 0, self.xB, edgesArc1, ratio=ratioBias, number=elemNum)
         ## seed ==>> arc AL
         edgesTemp3 = self.part[0].edges.findAt(coordinates=((self.xA-self.lenTol, 0, 0), ))
         ratioBias = self.part[0].getEdgeSeeds(edgesTemp3[0], attribute=BIAS_RATIO)
         elemNum = self.part[0].getEdgeSeeds(edgesTemp3[0], attribute=NUMBER)
         edgesTemp4 = self.part[0].edges.getByBoundingBox(xMin=self.xI-self.lenTol, yMin=self.yI-self.lenTol, zMin=-self.lenTol, xMax=self.xA+self.lenTol, yMax=self.yL+self.lenTol, zMax=self.thickness+self.lenTol)
-        edgesArc2 = self.getArcEdge(edgesTemp4)
+        edgesArc2 = self.getArcEdge(edgesTemp4, self.part[0])
         self.seedEdge(self.part[0], 0, self.xA, edgesArc2, ratio=ratioBias, number=elemNum)
         ## seed ==>> long edges along CD
         edgesLong3 = self.part[0].edges.findAt(coordinates=((self.xC+self.lenTol, self.yC, 0), (self.xC+self.lenTol, self.yC, self.thickness), 
@@ -263,19 +265,19 @@ class coupon_07b_static_2_full(coupon_generic):
         for i in range(len(self.part)):
             if i==0:
                 ## create BC at negX face
-                nodesNegX = self.part[i].nodes.getByBoundingBox(xMin=self.xJ-self.lenTol, yMin=self.yJ-self.lenTol, zMin=-self.lenTol, xMax=self.xK+self.lenTol, yMax=self.yK+self.lenTol, zMax=self.thickness+self.lenTol)
+                nodesNegX = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xJ-self.lenTol, yMin=self.yJ-self.lenTol, zMin=-self.lenTol, xMax=self.xK+self.lenTol, yMax=self.yK+self.lenTol, zMax=self.thickness+self.lenTol)
                 nsetNameNegX = 'Nset_BC_NegX_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegX , name=nsetNameNegX)
                 region = self.instance[i].sets[nsetNameNegX]
                 self.model.DisplacementBC(name='BC_NegX_Instance_'+str(i+1), createStepName='Load', region=region, u1=SET, u2=UNSET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, fixed=OFF, distributionType=UNIFORM, fieldName='', localCsys=None)
                 ## create BC at negX face at Y=0, Z=0
-                nodesNegX_YZ_1 = self.part[i].nodes.getByBoundingSphere((self.xK, self.yK, 0), self.lenTol)
-                nodesNegX_YZ_2 = self.part[i].nodes.getByBoundingSphere((self.xK, self.yK, self.thickness), self.lenTol)
-                nodesNegX_YZ_3 = self.part[i].nodes.getByBoundingSphere((self.xJ, self.yJ, 0), self.lenTol)
-                nodesNegX_YZ_4 = self.part[i].nodes.getByBoundingSphere((self.xJ, self.yJ, self.thickness), self.lenTol)
+                nodesNegX_YZ_1 = self.getByBoundingSphere(self.part[i], 'nodes', (self.xK, self.yK, 0), self.lenTol)
+                nodesNegX_YZ_2 = self.getByBoundingSphere(self.part[i], 'nodes', (self.xK, self.yK, self.thickness), self.lenTol)
+                nodesNegX_YZ_3 = self.getByBoundingSphere(self.part[i], 'nodes', (self.xJ, self.yJ, 0), self.lenTol)
+                nodesNegX_YZ_4 = self.getByBoundingSphere(self.part[i], 'nodes', (self.xJ, self.yJ, self.thickness), self.lenTol)
                 nodesNegX_YZ = [nodesNegX_YZ_1, nodesNegX_YZ_2, nodesNegX_YZ_3, nodesNegX_YZ_4]
                 nsetNameNegX_YZ = 'Nset_BC_NegX_YZ_Part_'+str(i+1)
-                self.part[i].Set(nodes=nodesNegX_YZ , name=nsetNameNegX_YZ)
+                self.getNsetFromNodes(self.part[i], nodesNegX_YZ, nsetNameNegX_YZ)
                 region = self.instance[i].sets[nsetNameNegX_YZ]
                 self.model.DisplacementBC(name='BC_NegX_YZ_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=SET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, fixed=OFF, distributionType=UNIFORM, fieldName='', localCsys=None)
                 ## create pressure load on posX face
@@ -159,7 +159,7 @@ class coupon_08_static_18_21(coupon_generic):
             s1.unsetPrimaryObject()
             ## circular partition
             edgesTemp1= self.getByCylinderDifference(self.part[0].edges, (self.xC1, self.yC1, -self.lenTol), (self.xC1, self.yC1, self.lenTol), (self.partitionRadius+self.lenTol), (self.phi1/2.0+self.lenTol))
-            edgesForPartition1 = self.getArcEdge(edgesTemp1)
+            edgesForPartition1 = self.getArcEdge(edgesTemp1, self.part[0])
             sweepPath1 = self.part[0].edges.findAt(coordinates=(self.xA, self.xC1, self.lenTol))
             self.part[0].PartitionCellBySweepEdge(sweepPath=sweepPath1, cells=self.part[0].cells, edges=edgesForPartition1)
             ## diagonal partition
@@ -187,10 +187,10 @@ class coupon_08_static_18_21(coupon_generic):
         ## seed ==>> outer arc
         elemNum = self.part[0].getEdgeSeeds(edgesInnerArc[0], attribute=NUMBER)
         edgesTemp1 = self.getByCylinderDifference(self.part[0].edges, (self.xC1, self.yC1, self.thickness-self.lenTol), (self.xC1, self.yC1, self.thickness+self.lenTol), (self.partitionRadius+self.lenTol), (self.phi1/2.0+self.lenTol))
-        edgesOuterArc1 = self.getArcEdge(edgesTemp1)
+        edgesOuterArc1 = self.getArcEdge(edgesTemp1, self.part[0])
         self.part[0].seedEdgeByNumber(edges=edgesOuterArc1, number=elemNum, constraint=FIXED)
         edgesTemp2 = self.getByCylinderDifference(self.part[0].edges, (self.xC1, self.yC1, -self.lenTol), (self.xC1, self.yC1, self.lenTol), (self.partitionRadius+self.lenTol), (self.phi1/2.0+self.lenTol))
-        edgesOuterArc2 = self.getArcEdge(edgesTemp2)
+        edgesOuterArc2 = self.getArcEdge(edgesTemp2, self.part[0])
         self.part[0].seedEdgeByNumber(edges=edgesOuterArc2, number=elemNum, constraint=FIXED)
         ## seed ==>> inner radial
         edgesInnerRadial1 = self.getByDifference(edgesTemp1, edgesOuterArc1)
@@ -233,7 +233,7 @@ class coupon_08_static_18_21(coupon_generic):
                                                             (self.xC+self.lenTol, self.yC, 0), (self.xC+self.lenTol, self.yC, self.thickness)))
         self.seedEdge(self.part[1], 0, self.xB, edgesLong2, minSize=self.seedSize['Long_2'], maxSize=self.seedSize['Long_3'])
         ## seed ==>> pin circumference portion
-        self.part[2].seedEdgeBySize(edges=self.getArcEdge(self.part[2].edges), size=self.seedSize['Pin_Diameter'], deviationFactor=0.1, constraint=FINER)
+        self.part[2].seedEdgeBySize(edges=self.getArcEdge(self.part[2].edges, self.part[2]), size=self.seedSize['Pin_Diameter'], deviationFactor=0.1, constraint=FINER)
         ## seed ==>> pin diameter portion
         diaEdges = self.part[2].edges.findAt(coordinates=((self.xC1, 0, 0), (self.xC1, 0, self.pinExtension), (self.xC1, 0, self.pinExtension+self.thickness), (self.xC1, 0, 2*self.pinExtension+self.thickness)))
         numDiaElem = math.ceil(self.phi1/self.seedSize['Pin_Diameter'])
@@ -249,18 +249,18 @@ class coupon_08_static_18_21(coupon_generic):
         ## create equation
         i=2
         ## equation 1
-        nodesEqnPosY = self.part[i].nodes.getByBoundingSphere((self.xC1, self.phi1/2, 0), self.lenTol)
+        nodesEqnPosY = self.getByBoundingSphere(self.part[i], 'nodes', (self.xC1, self.phi1/2, 0), self.lenTol)
         nsetNameEqnPosY = 'Nset_Eqn_1_PosY_Part_'+str(i+1)
         self.part[i].Set(nodes=nodesEqnPosY, name=nsetNameEqnPosY)
-        nodesEqnNegY = self.part[i].nodes.getByBoundingSphere((self.xC1, -self.phi1/2, 0), self.lenTol)
+        nodesEqnNegY = self.getByBoundingSphere(self.part[i], 'nodes', (self.xC1, -self.phi1/2, 0), self.lenTol)
         nsetNameEqnNegY = 'Nset_Eqn_1_NegY_Part_'+str(i+1)
         self.part[i].Set(nodes=nodesEqnNegY, name=nsetNameEqnNegY)
         self.model.Equation(name=self.couponName+'_Equation_1', terms=((1.0, self.instance[i].name+'.'+nsetNameEqnPosY, 1), (-1.0, self.instance[i].name+'.'+nsetNameEqnNegY, 1)))
         ## equation 2
-        nodesEqnPosY = self.part[i].nodes.getByBoundingSphere((self.xC1, self.phi1/2, 2*self.pinExtension+self.thickness), self.lenTol)
+        nodesEqnPosY = self.getByBoundingSphere(self.part[i], 'nodes', (self.xC1, self.phi1/2, 2*self.pinExtension+self.thickness), self.lenTol)
         nsetNameEqnPosY = 'Nset_Eqn_2_PosY_Part_'+str(i+1)
         self.part[i].Set(nodes=nodesEqnPosY, name=nsetNameEqnPosY)
-        nodesEqnNegY = self.part[i].nodes.getByBoundingSphere((self.xC1, -self.phi1/2, 2*self.pinExtension+self.thickness), self.lenTol)
+        nodesEqnNegY = self.getByBoundingSphere(self.part[i], 'nodes', (self.xC1, -self.phi1/2, 2*self.pinExtension+self.thickness), self.lenTol)
         nsetNameEqnNegY = 'Nset_Eqn_2_NegY_Part_'+str(i+1)
         self.part[i].Set(nodes=nodesEqnNegY, name=nsetNameEqnNegY)
         self.model.Equation(name=self.couponName+'_Equation_2', terms=((1.0, self.instance[i].name+'.'+nsetNameEqnPosY, 1), (-1.0, self.instance[i].name+'.'+nsetNameEqnNegY, 1)))
@@ -297,20 +297,20 @@ class coupon_08_static_18_21(coupon_generic):
         for i in range(len(self.part)):
             if i==1:
                 ## create BC at posX face
-                nodesPosX = self.part[i].nodes.getByBoundingBox(xMin=self.xF-self.lenTol, yMin=self.yF-self.lenTol, zMin=-self.lenTol, xMax=self.xE+self.lenTol, yMax=self.yE+self.lenTol, zMax=self.thickness+self.lenTol)
+                nodesPosX = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xF-self.lenTol, yMin=self.yF-self.lenTol, zMin=-self.lenTol, xMax=self.xE+self.lenTol, yMax=self.yE+self.lenTol, zMax=self.thickness+self.lenTol)
                 nsetNamePosX = 'Nset_BC_PosX_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesPosX, name=nsetNamePosX)
                 region = self.instance[i].sets[nsetNamePosX]
                 self.model.DisplacementBC(name='BC_PosX_Instance_'+str(i+1), createStepName='Load', region=region, u1=SET, u2=SET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             if i==2:
                 ## create BC at negZ face of Part 3
-                nodesNegZ = self.part[i].nodes.getByBoundingSphere((self.xC1, 0, 0), self.lenTol)
+                nodesNegZ = self.getByBoundingSphere(self.part[i], 'nodes', (self.xC1, 0, 0), self.lenTol)
                 nsetNameNegZ = 'Nset_BC_NegZ_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegZ , name=nsetNameNegZ)
                 region = self.instance[i].sets[nsetNameNegZ]
                 self.model.DisplacementBC(name='BC_NegZ_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=UNSET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
                 ## create BC at posZ face of Part 3
-                nodesPosZ = self.part[i].nodes.getByBoundingSphere((self.xC1, 0, self.thickness+2*self.pinExtension), self.lenTol)
+                nodesPosZ = self.getByBoundingSphere(self.part[i], 'nodes', (self.xC1, 0, self.thickness+2*self.pinExtension), self.lenTol)
                 nsetNamePosZ = 'Nset_BC_PosZ_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesPosZ , name=nsetNamePosZ)
                 region = self.instance[i].sets[nsetNamePosZ]
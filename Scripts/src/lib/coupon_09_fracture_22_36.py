@@ -230,7 +230,7 @@ class coupon_09_fracture_22_36(coupon_generic):
                                                             (-(self.xE+self.lenTol*math.sin(self.notchTipAngleRad/2.0)), self.yE+self.lenTol*math.cos(self.notchTipAngleRad/2.0), self.thickness), ))
         self.part[0].seedEdgeBySize(edges=edgesNotch, size=self.seedSize['Notch'], deviationFactor=0.1, constraint=FINER)
         ## seed ==>> pin circumference portion
-        self.part[1].seedEdgeBySize(edges=self.getArcEdge(self.part[1].edges), size=self.seedSize['Pin_Dia'], deviationFactor=0.1, constraint=FINER)
+        self.part[1].seedEdgeBySize(edges=self.getArcEdge(self.part[1].edges, self.part[1]), size=self.seedSize['Pin_Dia'], deviationFactor=0.1, constraint=FINER)
         ## seed ==>> pin length portion
         edgesPin1 = self.part[1].edges.getByBoundingCylinder((self.xO, self.yO, -self.lenTol), (self.xO, self.yO, self.lenTol), (self.phi/2.0+self.lenTol))
         edgesPin2 = self.part[1].edges.getByBoundingCylinder((self.xO, self.yO, self.pinLenFactor/2.0*self.thickness+self.lenTol-self.lenTol), (self.xO, self.yO, self.pinLenFactor/2.0*self.thickness+self.lenTol), (self.phi/2.0+self.lenTol))
@@ -251,10 +251,10 @@ class coupon_09_fracture_22_36(coupon_generic):
     def createEquation(self):
         ## create equation
         i=1
-        nodesEqnPosY = self.part[i].nodes.getByBoundingSphere((self.xO, self.phi/2.0, 0), self.lenTol)
+        nodesEqnPosY = self.getByBoundingSphere(self.part[i], 'nodes', (self.xO, self.phi/2.0, 0), self.lenTol)
         nsetNameEqnPosY = 'Nset_Eqn_Part_'+str(i+1)+'_PosY'
         self.part[i].Set(nodes=nodesEqnPosY, name=nsetNameEqnPosY)
-        nodesEqnNegY = self.part[i].nodes.getByBoundingSphere((self.xO, -self.phi/2.0, 0), self.lenTol)
+        nodesEqnNegY = self.getByBoundingSphere(self.part[i], 'nodes', (self.xO, -self.phi/2.0, 0), self.lenTol)
         nsetNameEqnNegY = 'Nset_Eqn_Part_'+str(i+1)+'_NegY'
         self.part[i].Set(nodes=nodesEqnNegY, name=nsetNameEqnNegY)
         self.model.Equation(name=self.couponName+'_Equation_1', terms=((1.0, self.instance[1].name+'.'+nsetNameEqnPosY, 1), (-1.0, self.instance[1].name+'.'+nsetNameEqnNegY, 1)))
@@ -290,28 +290,28 @@ class coupon_09_fracture_22_36(coupon_generic):
         for i in range(len(self.part)):
             if i==0:
                 ## BC ==> Z
-                nodePlateBCNegX = self.part[i].nodes.getByBoundingSphere((self.xG, self.yG, self.thickness/2.0), self.lenTol)
-                nodePlateBCPosX = self.part[i].nodes.getByBoundingSphere((-self.xG, self.yG, self.thickness/2.0), self.lenTol)
+                nodePlateBCNegX = self.getByBoundingSphere(self.part[i], 'nodes', (self.xG, self.yG, self.thickness/2.0), self.lenTol)
+                nodePlateBCPosX = self.getByBoundingSphere(self.part[i], 'nodes', (-self.xG, self.yG, self.thickness/2.0), self.lenTol)
                 nodePlateBC_Z = [nodePlateBCNegX, nodePlateBCPosX]
                 nsetNamePlateBC_Z = 'Nset_BC_Z_Part_'+str(i+1)
-                self.part[i].Set(nodes=nodePlateBC_Z , name=nsetNamePlateBC_Z)
+                self.getNsetFromNodes(self.part[i], nodePlateBC_Z, nsetNamePlateBC_Z)
                 regionPlateBC_Z = self.instance[0].sets[nsetNamePlateBC_Z]
                 self.model.DisplacementBC(name='BC_Z_Instance_'+str(1), createStepName='Load', region=regionPlateBC_Z, u1=UNSET, u2=UNSET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
                 ## BC ==> X
-                nodePlateBCNegZ = self.part[i].nodes.getByBoundingSphere((self.xH, self.yH, 0), self.lenTol)
-                nodePlateBCPosZ = self.part[i].nodes.getByBoundingSphere((self.xH, self.yH, self.thickness), self.lenTol)
+                nodePlateBCNegZ = self.getByBoundingSphere(self.part[i], 'nodes', (self.xH, self.yH, 0), self.lenTol)
+                nodePlateBCPosZ = self.getByBoundingSphere(self.part[i], 'nodes', (self.xH, self.yH, self.thickness), self.lenTol)
                 nodePlateBC_X = [nodePlateBCNegZ, nodePlateBCPosZ]
                 nsetNamePlateBC_X = 'Nset_BC_X_Part_'+str(i+1)
-                self.part[i].Set(nodes=nodePlateBC_X , name=nsetNamePlateBC_X)
+                self.getNsetFromNodes(self.part[i], nodePlateBC_X, nsetNamePlateBC_X)
                 regionPlateBC_X = self.instance[0].sets[nsetNamePlateBC_X]
                 self.model.DisplacementBC(name='BC_X_Instance_'+str(1), createStepName='Load', region=regionPlateBC_X, u1=SET, u2=UNSET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
             if i==1:
                 ## pin ==> BC_Z
-                nodesNegZ = self.part[i].nodes.getByBoundingSphere((self.xO, self.yO, 0), self.lenTol)
-                nodesPosZ = self.part[i].nodes.getByBoundingSphere((self.xO, self.yO, (1+self.pinLenFactor)*self.thickness), self.lenTol)
+                nodesNegZ = self.getByBoundingSphere(self.part[i], 'nodes', (self.xO, self.yO, 0), self.lenTol)
+                nodesPosZ = self.getByBoundingSphere(self.part[i], 'nodes', (self.xO, self.yO, (1+self.pinLenFactor)*self.thickness), self.lenTol)
                 nodesPinBC_Z = [nodesNegZ, nodesPosZ]
                 nsetNamePinBC_Z = 'Nset_BC_Z_Part_'+str(i+1)
-                self.part[i].Set(nodes=nodesPinBC_Z , name=nsetNamePinBC_Z)
+                self.getNsetFromNodes(self.part[i], nodesPinBC_Z, nsetNamePinBC_Z)
                 regionPin1BC_Z = self.instance[1].sets[nsetNamePinBC_Z]
                 self.model.DisplacementBC(name='BC_Z_Instance_'+str(2), createStepName='Load', region=regionPin1BC_Z, u1=UNSET, u2=SET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
                 regionPin2BC_Z = self.instance[2].sets[nsetNamePinBC_Z]
@@ -285,25 +285,25 @@ class coupon_10_crack_44_50(coupon_generic):
                 self.model.Pressure(name='Load_PosY_Pressure_Instance_'+str(i+1), createStepName='Load', region=regionPlateLoad, distributionType=UNIFORM, field='', magnitude=-self.stepLoad, amplitude=UNSET)
             if i==2:
                 ## BC ==> plate NegY
-                nodesNegY = self.part[i].nodes.getByBoundingBox(xMin=self.xCC-self.lenTol, xMax=self.xDD+self.lenTol, yMin=self.yCC-self.lenTol, yMax=self.yDD+self.lenTol, zMin=-self.lenTol, zMax=self.thickness+self.lenTol)
+                nodesNegY = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xCC-self.lenTol, xMax=self.xDD+self.lenTol, yMin=self.yCC-self.lenTol, yMax=self.yDD+self.lenTol, zMin=-self.lenTol, zMax=self.thickness+self.lenTol)
                 nameNsetPlateBC = 'Nset_NegY_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegY, name=nameNsetPlateBC)
                 regionPlateBC = self.instance[i].sets[nameNsetPlateBC]
                 self.model.DisplacementBC(name='BC_NegY_Instance_'+str(i+1), createStepName='Load', region=regionPlateBC, u1=UNSET, u2=SET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=SET, distributionType=UNIFORM, fieldName='', localCsys=None)
                 ## BC ==> sphere
-                nodePlateBC_X_1 = self.part[i].nodes.getByBoundingSphere((0, self.yDD, 0), self.lenTol)
-                nodePlateBC_X_2 = self.part[i].nodes.getByBoundingSphere((0, self.yDD, self.thickness), self.lenTol)
+                nodePlateBC_X_1 = self.getByBoundingSphere(self.part[i], 'nodes', (0, self.yDD, 0), self.lenTol)
+                nodePlateBC_X_2 = self.getByBoundingSphere(self.part[i], 'nodes', (0, self.yDD, self.thickness), self.lenTol)
                 nodePlateBC_X = [nodePlateBC_X_1, nodePlateBC_X_2]
                 nsetNamePlateBC_X = 'Nset_BC_X_Part_'+str(i+1)
-                self.part[i].Set(nodes=nodePlateBC_X , name=nsetNamePlateBC_X)
+                self.getNsetFromNodes(self.part[i], nodePlateBC_X, nsetNamePlateBC_X)
                 regionPlateBC_X = self.instance[i].sets[nsetNamePlateBC_X]
                 self.model.DisplacementBC(name='BC_X_Instance_'+str(i+1), createStepName='Load', region=regionPlateBC_X, u1=SET, u2=UNSET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
                 ## BC ==> sphere
-                nodePlateBC_Z_1 = self.part[i].nodes.getByBoundingSphere((self.xDD, self.yDD, 0.5*self.thickness), self.lenTol)
-                nodePlateBC_Z_2 = self.part[i].nodes.getByBoundingSphere((self.xCC, self.yCC, 0.5*self.thickness), self.lenTol)
+                nodePlateBC_Z_1 = self.getByBoundingSphere(self.part[i], 'nodes', (self.xDD, self.yDD, 0.5*self.thickness), self.lenTol)
+                nodePlateBC_Z_2 = self.getByBoundingSphere(self.part[i], 'nodes', (self.xCC, self.yCC, 0.5*self.thickness), self.lenTol)
                 nodePlateBC_Z = [nodePlateBC_Z_1, nodePlateBC_Z_2]
                 nsetNamePlateBC_Z = 'Nset_BC_Z_Part_'+str(i+1)
-                self.part[i].Set(nodes=nodePlateBC_Z , name=nsetNamePlateBC_Z)
+                self.getNsetFromNodes(self.part[i], nodePlateBC_Z, nsetNamePlateBC_Z)
                 regionPlateBC_Z = self.instance[i].sets[nsetNamePlateBC_Z]
                 self.model.DisplacementBC(name='BC_Z_Instance_'+str(i+1), createStepName='Load', region=regionPlateBC_Z, u1=UNSET, u2=UNSET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, distributionType=UNIFORM, fieldName='', localCsys=None)
 
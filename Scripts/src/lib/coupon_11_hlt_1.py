@@ -266,7 +266,7 @@ class coupon_11_hlt_1(coupon_generic):
                     s1.unsetPrimaryObject()
                     ## circular partition
                     edgesTemp1= self.part[i].edges.getByBoundingCylinder((-2*self.phi+j*4*self.phi, 0, -self.lenTol), (-2*self.phi+j*4*self.phi, 0, self.lenTol), (self.maxDia/2.0+self.lenTol))
-                    edgesForPartition1 = self.getArcEdge(edgesTemp1)
+                    edgesForPartition1 = self.getArcEdge(edgesTemp1, self.part[i])
                     sweepPath1 = self.part[i].edges.findAt(coordinates=(self.xB+j*4*self.phi, self.yB, self.lenTol))
                     self.part[i].PartitionCellBySweepEdge(sweepPath=sweepPath1, cells=self.part[i].cells, edges=(edgesForPartition1[0],))
                     ## diagonal partition
@@ -286,7 +286,7 @@ class coupon_11_hlt_1(coupon_generic):
             # d = self.part[3].datums
             edgesTemp2= self.part[3].edges.getByBoundingCylinder((0, 0, self.fastHeadHeight-self.lenTol), (0, 0, self.fastHeadHeight+self.lenTol), (self.phi/2.0+self.lenTol))
             # self.part[3].PartitionCellByExtrudeEdge(line=d[3], cells=self.part[3].cells, edges=edgesTemp2, sense=FORWARD)
-            edgesForPartition2 = self.getArcEdge(edgesTemp2)
+            edgesForPartition2 = self.getArcEdge(edgesTemp2, self.part[3])
             sweepPath2 = self.part[3].edges.findAt(coordinates=(0, 0, self.lenTol))
             cellsTemp2 = self.part[3].cells.getByBoundingCylinder((0, 0, -self.lenTol), (0, 0, self.fastHeadHeight+self.lenTol), (self.fastHeadDia/2.0+self.lenTol))
             self.part[3].PartitionCellBySweepEdge(sweepPath=sweepPath2, cells=cellsTemp2, edges=(edgesForPartition2[0],edgesForPartition2[1],edgesForPartition2[2],edgesForPartition2[3],)) 
@@ -365,10 +365,10 @@ class coupon_11_hlt_1(coupon_generic):
         self.part[4].seedEdgeBySize(edges=edgesDiaNut, size=self.seedSize['DiaFast'], deviationFactor=0.1, constraint=FINER)
         ## seed ==>> arc diameter
         edgesArcFastTemp= self.part[3].edges.getByBoundingCylinder((0, 0, -self.lenTol), (0, 0, self.lenTol), (self.phi/2.0+self.lenTol))
-        edgesArcFast = self.getArcEdge(edgesArcFastTemp)
+        edgesArcFast = self.getArcEdge(edgesArcFastTemp, self.part[3])
         self.part[3].seedEdgeBySize(edges=edgesArcFast, size=self.seedSize['ArcFast'], deviationFactor=0.1, constraint=FINER)
         edgesArcNutTemp= self.part[4].edges.getByBoundingCylinder((0, 0, -self.lenTol), (0, 0, self.lenTol), (self.phi/2.0+self.lenTol))
-        edgesArcNut = self.getArcEdge(edgesArcNutTemp)
+        edgesArcNut = self.getArcEdge(edgesArcNutTemp, self.part[4])
         self.part[4].seedEdgeBySize(edges=edgesArcNut, size=self.seedSize['ArcFast'], deviationFactor=0.1, constraint=FINER)
         # edgesTemp3 = self.part[0].edges.findAt(coordinates=((self.xA-self.lenTol, 0, 0), ))
         # ratioBias = self.part[0].getEdgeSeeds(edgesTemp3[0], attribute=BIAS_RATIO)
@@ -430,19 +430,19 @@ class coupon_11_hlt_1(coupon_generic):
         for i in range(len(self.part)):
             if i==0:
                 ## create BC at negX face
-                nodesNegX = self.part[i].nodes.getByBoundingBox(xMin=self.xJ-self.lenTol, yMin=self.yJ-self.lenTol, zMin=-self.lenTol, xMax=self.xK+self.lenTol, yMax=self.yK+self.lenTol, zMax=self.thickness+self.lenTol)
+                nodesNegX = self.getByBoundingBox(self.part[i], 'nodes', xMin=self.xJ-self.lenTol, yMin=self.yJ-self.lenTol, zMin=-self.lenTol, xMax=self.xK+self.lenTol, yMax=self.yK+self.lenTol, zMax=self.thickness+self.lenTol)
                 nsetNameNegX = 'Nset_BC_NegX_Part_'+str(i+1)
                 self.part[i].Set(nodes=nodesNegX , name=nsetNameNegX)
                 region = self.instance[i].sets[nsetNameNegX]
                 self.model.DisplacementBC(name='BC_NegX_Instance_'+str(i+1), createStepName='Load', region=region, u1=SET, u2=UNSET, u3=UNSET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, fixed=OFF, distributionType=UNIFORM, fieldName='', localCsys=None)
                 ## create BC at negX face at Y=0, Z=0
-                nodesNegX_YZ_1 = self.part[i].nodes.getByBoundingSphere((self.xK, self.yK, 0), self.lenTol)
-                nodesNegX_YZ_2 = self.part[i].nodes.getByBoundingSphere((self.xK, self.yK, self.thickness), self.lenTol)
-                nodesNegX_YZ_3 = self.part[i].nodes.getByBoundingSphere((self.xJ, self.yJ, 0), self.lenTol)
-                nodesNegX_YZ_4 = self.part[i].nodes.getByBoundingSphere((self.xJ, self.yJ, self.thickness), self.lenTol)
+                nodesNegX_YZ_1 = self.getByBoundingSphere(self.part[i], 'nodes', (self.xK, self.yK, 0), self.lenTol)
+                nodesNegX_YZ_2 = self.getByBoundingSphere(self.part[i], 'nodes', (self.xK, self.yK, self.thickness), self.lenTol)
+                nodesNegX_YZ_3 = self.getByBoundingSphere(self.part[i], 'nodes', (self.xJ, self.yJ, 0), self.lenTol)
+                nodesNegX_YZ_4 = self.getByBoundingSphere(self.part[i], 'nodes', (self.xJ, self.yJ, self.thickness), self.lenTol)
                 nodesNegX_YZ = [nodesNegX_YZ_1, nodesNegX_YZ_2, nodesNegX_YZ_3, nodesNegX_YZ_4]
                 nsetNameNegX_YZ = 'Nset_BC_NegX_YZ_Part_'+str(i+1)
-                self.part[i].Set(nodes=nodesNegX_YZ , name=nsetNameNegX_YZ)
+                self.getNsetFromNodes(self.part[i], nodesNegX_YZ, nsetNameNegX_YZ)
                 region = self.instance[i].sets[nsetNameNegX_YZ]
                 self.model.DisplacementBC(name='BC_NegX_YZ_Instance_'+str(i+1), createStepName='Load', region=region, u1=UNSET, u2=SET, u3=SET, ur1=UNSET, ur2=UNSET, ur3=UNSET, amplitude=UNSET, fixed=OFF, distributionType=UNIFORM, fieldName='', localCsys=None)
                 ## create pressure load on posX face
@@ -14,9 +14,89 @@
 #################################################################################################################
 
 
-import json, os, re
+import json, os, re, math, mmap, stat, gzip, hashlib, shutil, time, cProfile
+## numpy is optional ==>> without numpy the bounding box, cylinder and sphere queries of coupon_generic are passed to abaqus
+try:
+    import numpy
+except ImportError:
+    numpy = None
+## zstandard is optional ==>> without zstandard the inp files are compressed with gzip, see compressInpFiles
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 class coupon_generic(object):
+    ## input sections of the coupon data used by each stage of the pipeline
+    stageInputs = {'createProfileSketch':['Geometry'],
+                   'createPart':['Geometry'],
+                   'createAssembly':['Geometry'],
+                   'createPartition':['Geometry'],
+                   'createLocalSeed':['Geometry', 'Element_Size', 'Mesh_Target'],
+                   'createMesh':['Element_Size', 'Element_Type', 'Mesh_Target'],
+                   'createMaterial':['Material'],
+                   'createSection':['Section', 'Material.Name'],
+                   'createTie':['Geometry'],
+                   'createContact':['Geometry'],
+                   'createEquation':['Geometry'],
+                   'createStep':['Step.NLGEOM', 'Step.Initial_Increment'],
+                   'createLoadBC':['Geometry', 'Step.Load'],
+                   'createJob':['Coupon_Name', 'Length_Tolerance']}
+    ## stages whose output can be rewritten in the inp include files without abaqus cae
+    inpStages = {'createMaterial':'Materials', 'createStep':'Step', 'createLoadBC':'Step'}
+    ## stages timed for the status json, in pipeline order
+    pipelineStages = ['createModel', 'createProfileSketch', 'createPart', 'createAssembly', 'createPartition', 'createLocalSeed', 'createMesh',
+                      'createMaterial', 'createSection', 'createTie', 'createContact', 'createEquation', 'createStep', 'createLoadBC', 'createJob']
+    ## opt-in profiling of all create* methods and the helpers below ==>> set coupon_generic.profileMode = True before
+    ## creating the coupon, or the environment variable COUPON_PROFILE=1 before starting abaqus; the method named in
+    ## profileStage (environment variable COUPON_PROFILE_STAGE) is also run under cProfile
+    profileMode = os.environ.get('COUPON_PROFILE', '0')=='1'
+    profileStage = os.environ.get('COUPON_PROFILE_STAGE') or None
+    profiledHelpers = ['seedEdge', 'getElemSurfFromCellFace', 'getNsetFromCellFace', 'getNsetFromNodes', 'getByCylinderDifference', 'getByDifference',
+                       'getArcEdge', 'getEdgeByLength', 'inpFileSplitter', 'inpFileSplitterMmap', 'inpPartDeduplicator', 'inpPartDecomposer', 'compressInpFiles', 'storeInpFiles']
+    ## parts of the parts inp file with the same mesh up to a translation are written once, see inpPartDeduplicator ==>>
+    ## set the environment variable COUPON_INP_PART_DEDUP=0 to write every part
+    inpPartDedup = os.environ.get('COUPON_INP_PART_DEDUP', '1')=='1'
+    ## include files of inpFileSplitter and comment lines switching back to the job file
+    inpFileID = {0:'Job', 
+                 1:'Parts', 
+                 2:'Materials', 
+                 3:'Step'}
+    inpEliminationList = ['** ASSEMBLY','** INTERACTION PROPERTIES', '** INTERACTIONS']
+    ## block size of inpFileSplitter in characters, also the buffer size of the inp files
+    inpBufferSize = 16*1024*1024
+    ## inpFileSplitter reads the job inp file in blocks ('BLOCK') or memory-maps it ('MMAP', environment variable
+    ## COUPON_INP_SPLIT_MODE), see inpFileSplitterMmap
+    inpSplitMode = os.environ.get('COUPON_INP_SPLIT_MODE', 'BLOCK').upper()
+    ## nodes, elements, sets and surfaces of every part are written to include files of the part with an index json,
+    ## see inpPartDecomposer ==>> set the environment variable COUPON_INP_DECOMPOSE=1
+    inpPartDecompose = os.environ.get('COUPON_INP_DECOMPOSE', '0')=='1'
+    ## include files of the inp folder are written once into a shared include store named by their content hash and
+    ## linked into the inp folder of every version, see storeInpFiles ==>> set the environment variable
+    ## COUPON_INP_STORE to the store folder
+    inpStorePath = os.environ.get('COUPON_INP_STORE') or None
+    ## mesh include files are written compressed, see compressInpFiles ==>> set the environment variable
+    ## COUPON_INP_COMPRESSION to 'GZIP' or 'ZSTD' and COUPON_INP_COMPRESSION_LEVEL to the compression level
+    inpCompression = os.environ.get('COUPON_INP_COMPRESSION', 'NONE').upper()
+    inpCompressionLevel = int(os.environ.get('COUPON_INP_COMPRESSION_LEVEL', '3'))
+    inpCompressionExt = {'GZIP':'.gz', 
+                         'ZSTD':'.zst'}
+    ## element budget of the coupon ==>> the element number of all parts is predicted from the seeds before meshing and
+    ## compared with meshBudget (environment variable COUPON_MESH_BUDGET, no check when 0); meshBudgetAction 'ABORT'
+    ## (environment variable COUPON_MESH_BUDGET_ACTION) stops the coupon before meshing, 'WARN' only reports the excess;
+    ## the prediction runs only with a budget, a 'Mesh_Target' of the coupon data or profileMode
+    meshBudget = int(os.environ.get('COUPON_MESH_BUDGET', '0'))
+    meshBudgetAction = os.environ.get('COUPON_MESH_BUDGET_ACTION', 'ABORT').upper()
+    ## calibration of the mesh prediction ==>> ratio of actual to predicted number of every template, read from
+    ## 'Mesh_Prediction_Factor' of the template in db/coupon_master.json and set from the predicted and actual numbers
+    ## recorded in the status json; without it the raw prediction of the seeds is used (factor 1.0)
+    meshPredictionFactor = {'Element_Number':1.0, 'Node_Number':1.0}
+    ## scaling of the element sizes to the optional 'Mesh_Target' of the coupon data ==>> maximum number of iterations of
+    ## the mesh prediction and relative tolerance of the predicted number, see scaleSeedSize; relative tolerance of the
+    ## number of the generated mesh, see checkMeshTarget
+    seedScaleIterations = 6
+    seedScaleTolerance = 0.05
+    meshTargetTolerance = 0.25
     def __init__(self, couponData):
         self.couponData = couponData
         self.couponName = self.couponData['Coupon_Name']
@@ -27,18 +107,38 @@ class coupon_generic(object):
         self.stepLoad = self.couponData['Step']['Load']
         self.outputFieldVariables = ('S', 'U', 'RF', 'CF')
         self.isContactEnforced = False
+        ## edge properties of every part, see getEdgeCache
+        self.edgeCache = dict()
+        ## bucket of the element faces FACE1 ... FACE6 and element surfaces of every part and face set, see
+        ## getElemSurfFromCellFace; the buckets are built on first use, as the symbolic constants exist only in abaqus
+        self.elemFaceBucket = None
+        self.elemSurfCache = dict()
+        ## spatial index of the nodes and geometric entities of every part, see getSpatialIndex
+        self.spatialIndex = dict()
+        ## hash of the include files linked to the include store before storeInpFiles, see copyInpFile
+        self.inpStoreHashes = dict()
+        self.couponData.update({'Input_Hash':self.getInputHash(self.couponData)})
+        ## wrap the stage methods of this instance with timers
+        self.stageTimes = []
+        for thisStage in self.pipelineStages:
+            if hasattr(self, thisStage):
+                setattr(self, thisStage, self.timeStage(thisStage, getattr(self, thisStage)))
+        self.profileData = dict()
+        if self.profileMode:
+            for thisName in dir(self):
+                if (thisName.startswith('create') or thisName in self.profiledHelpers) and callable(getattr(self, thisName)):
+                    setattr(self, thisName, self.profileMethod(thisName, getattr(self, thisName)))
     def createModel(self):
         ## define model
         session.journalOptions.setValues(replayGeometry=COORDINATE, recoverGeometry=COORDINATE)
         self.model = mdb.Model(name=self.couponName+'_Model')
     def createMesh(self):
         ## seed ==>> global
-        self.maxSeedSize = 0
-        for seedValue in self.seedSize.values():
-            if seedValue>self.maxSeedSize:
-                self.maxSeedSize = seedValue
-        for i in range(len(self.part)):
-            self.part[i].seedPart(size=self.maxSeedSize, deviationFactor=0.1, minSizeFactor=0.1)
+        self.seedGlobal()
+        ## scale seeds ==>> element number or dof of the target
+        self.seedScale = 1.0
+        if self.couponData.get('Mesh_Target'):
+            self.scaleSeedSize(self.couponData['Mesh_Target'])
         ## set element types
         for thisPart, thisElemType in self.couponData['Element_Type'].items():
             thisPartElemTypes = ()
@@ -49,11 +149,15 @@ class coupon_generic(object):
             for i in partID:
                 tempID = tempID+i
             self.part[int(tempID)-1].setElementType(regions=(self.part[int(tempID)-1].cells,), elemTypes=thisPartElemTypes)
+        ## predict mesh ==>> checked against the element budget before the mesh is generated
+        self.meshPrediction, self.meshBudgetStatus = dict(), None
+        if self.meshBudget > 0 or self.couponData.get('Mesh_Target') or self.profileMode:
+            self.checkMeshBudget()
         ## generate mesh
-        self.couponData.update({'Element_Number':dict()})
-        for i in range(len(self.part)):
-            self.part[i].generateMesh()
-            self.couponData['Element_Number'].update({'Part_'+str(i+1):len(self.part[i].elements)})
+        self.generatePartMesh()
+        ## check mesh ==>> element number or dof of the target
+        if self.couponData.get('Mesh_Target'):
+            self.checkMeshTarget(self.couponData['Mesh_Target'])
     def createMaterial(self):
         ## define material
         self.material = dict()
@@ -102,24 +206,55 @@ class coupon_generic(object):
                 geomFile.write(str(thisList[i])+'\t')
             geomFile.write('\n')
         geomFile.close()
+        ## stored files of a previous run ==>> removed before the inp files are written again
+        self.removeInpStoreLinks(self.couponName+'_InpFolder'+self.version)
+        self.removeCompressedInpFiles(self.couponName+'_InpFolder'+self.version)
         ## creating separate inp files
         self.inpFileSplitter()
+        ## parts with the same mesh ==>> written once and instanced with translation
+        if self.inpPartDedup:
+            self.inpPartDeduplicator()
+        ## nodes, elements, sets and surfaces ==>> include files of every part
+        if self.inpPartDecompose:
+            self.inpPartDecomposer()
+        ## mesh include files ==>> compressed
+        if self.inpCompression in self.inpCompressionExt:
+            self.compressInpFiles()
+        ## include files ==>> include store
+        if self.inpStorePath:
+            self.storeInpFiles()
     def getByDifference(self, listA, listB):
-        ## method to return list with elements of difference of two lists
-        differenceList = []
-        for thisItem in listA:
-            if thisItem not in listB:
-                differenceList.append(thisItem)
+        ## method to return list with elements of difference of two lists of the same part; the entities are compared
+        ## by index, so that the lookup is a set membership instead of a comparison with every entity of listB
+        indexB = set([thisItem.index for thisItem in listB])
+        differenceList = [thisItem for thisItem in listA if thisItem.index not in indexB]
         return differenceList
     def getByCylinderDifference(self, feature, center1, center2, outerRadius, innerRadius):
-        ## method to return list with geometric features by subtraction of two bounding cylinders
+        ## method to return sequence with geometric features by subtraction of two bounding cylinders
         featureOuter = feature.getByBoundingCylinder(center1, center2, outerRadius)
         featureInner = feature.getByBoundingCylinder(center1, center2, innerRadius)
-        pickedFeatures = self.getByDifference(featureOuter, featureInner)
+        pickedIndex = [thisItem.index for thisItem in self.getByDifference(featureOuter, featureInner)]
+        if len(pickedIndex) == 0:
+            return []
+        pickedFeatures = feature.getSequenceFromMask(mask=self.getIndexMask(pickedIndex))
         return pickedFeatures
-    def getArcEdge(self, edgeList):
-        ## method to return edge list containing only arc edges from a given edge list
+    def getIndexMask(self, indexList):
+        ## method to return the mask of abaqus for a list of entity indices ==>> one hex word per 32 indices, lowest
+        ## indices first, e.g. ('[#5 ]', ) for the indices 0 and 2
+        words = [0]*(max(indexList)//32+1)
+        for thisIndex in indexList:
+            words[thisIndex//32] |= 1<<(thisIndex%32)
+        return ('[#'+' #'.join(['%x' % thisWord for thisWord in words])+' ]', )
+    def getArcEdge(self, edgeList, part=None):
+        ## method to return edge list containing only arc edges from a given edge list; the edge properties are taken
+        ## from the edge cache when the part of the edges is given
         arcEdge = []
+        if part is not None:
+            edgeCache = self.getEdgeCache(part)
+            for thisEdge in edgeList:
+                if self.getEdgeData(part, edgeCache, thisEdge)['Radius'] is not None:
+                    arcEdge.append(thisEdge)
+            return arcEdge
         for thisEdge in edgeList:
             try:
                 thisEdge.getRadius()
@@ -127,58 +262,185 @@ class coupon_generic(object):
             except:
                 pass
         return arcEdge
-    def getEdgeByLength(self, edgeList, length):
-        ## method to return edge list of a desired length from a given edge list
+    def getEdgeByLength(self, edgeList, length, part=None):
+        ## method to return edge list of a desired length from a given edge list; the edge properties are taken from
+        ## the edge cache when the part of the edges is given
         pickedEdges = []
+        if part is not None:
+            edgeCache = self.getEdgeCache(part)
+            for thisEdge in edgeList:
+                if abs(self.getEdgeData(part, edgeCache, thisEdge)['Length']-length) < self.lenTol:
+                    pickedEdges.append(thisEdge)
+            return pickedEdges
         for thisEdge in edgeList:
             if abs(thisEdge.getSize(0)-length) < self.lenTol:
                 pickedEdges.append(thisEdge)
         return pickedEdges
+    def getEdgeCache(self, part):
+        ## method to return the edge properties of a part keyed by edge index; the cache is cleared when a feature is
+        ## added to the part (partition, cut, ...), since the edges are numbered again
+        cacheKey = (len(part.features), len(part.edges))
+        if part.name not in self.edgeCache or self.edgeCache[part.name]['Key'] != cacheKey:
+            self.edgeCache[part.name] = {'Key':cacheKey, 'Edges':dict()}
+        return self.edgeCache[part.name]['Edges']
+    def getEdgeData(self, part, edgeCache, thisEdge):
+        ## method to return the cached properties of an edge ==>> curve type, radius (None for a line), length, vertex
+        ## indices and vertex coordinates; the properties are read from abaqus once per edge
+        if thisEdge.index not in edgeCache:
+            try:
+                radius = thisEdge.getRadius()
+            except:
+                radius = None
+            edgeVertices = thisEdge.getVertices()
+            edgeCache[thisEdge.index] = {'Type':'LINE' if radius is None else 'ARC',
+                                         'Radius':radius,
+                                         'Length':thisEdge.getSize(0),
+                                         'Vertices':tuple(edgeVertices),
+                                         'Coords':tuple([part.vertices[thisVertexID].pointOn[0] for thisVertexID in edgeVertices])}
+        return edgeCache[thisEdge.index]
+    def getByBoundingBox(self, part, kind, xMin=-1.0e20, yMin=-1.0e20, zMin=-1.0e20, xMax=1.0e20, yMax=1.0e20, zMax=1.0e20):
+        ## method to return the nodes, vertices, edges, faces or cells (kind) of a part inside a bounding box by the
+        ## spatial index of the part; an entity is inside when its bounding box is inside
+        if numpy is None:
+            return getattr(part, kind).getByBoundingBox(xMin=xMin, yMin=yMin, zMin=zMin, xMax=xMax, yMax=yMax, zMax=zMax)
+        thisIndex = self.getSpatialIndex(part, kind)
+        pickedIndex = self.getIndexCandidates(thisIndex, (xMin, yMin, zMin), (xMax, yMax, zMax))
+        return self.getSequenceFromIndex(getattr(part, kind), pickedIndex)
+    def getByBoundingCylinder(self, part, kind, center1, center2, radius):
+        ## method to return the nodes, vertices, edges, faces or cells (kind) of a part inside a bounding cylinder; the
+        ## nodes are picked by the spatial index, the entities inside the bounding box of the cylinder are passed to
+        ## abaqus
+        if numpy is None:
+            return getattr(part, kind).getByBoundingCylinder(center1, center2, radius)
+        thisIndex = self.getSpatialIndex(part, kind)
+        point1, point2 = numpy.array(center1, dtype=float), numpy.array(center2, dtype=float)
+        length = numpy.linalg.norm(point2-point1)
+        axis = (point2-point1)/length
+        extent = radius*numpy.sqrt(numpy.clip(1.0-axis*axis, 0.0, 1.0))
+        pickedIndex = self.getIndexCandidates(thisIndex, numpy.minimum(point1, point2)-extent, numpy.maximum(point1, point2)+extent)
+        if kind != 'nodes':
+            candidates = self.getSequenceFromIndex(getattr(part, kind), pickedIndex)
+            return candidates.getByBoundingCylinder(center1, center2, radius) if len(candidates) > 0 else candidates
+        pointDist = thisIndex['Min'][pickedIndex]-point1
+        axialDist = pointDist.dot(axis)
+        radialDist = pointDist-numpy.outer(axialDist, axis)
+        isInside = (axialDist >= 0.0) & (axialDist <= length) & ((radialDist*radialDist).sum(axis=1) <= radius*radius)
+        return self.getSequenceFromIndex(part.nodes, pickedIndex[isInside])
+    def getByBoundingSphere(self, part, kind, center, radius):
+        ## method to return the nodes, vertices, edges, faces or cells (kind) of a part inside a bounding sphere; the
+        ## nodes are picked by the spatial index, the entities inside the bounding box of the sphere are passed to abaqus
+        if numpy is None:
+            return getattr(part, kind).getByBoundingSphere(center, radius)
+        thisIndex = self.getSpatialIndex(part, kind)
+        point = numpy.array(center, dtype=float)
+        pickedIndex = self.getIndexCandidates(thisIndex, point-radius, point+radius)
+        if kind != 'nodes':
+            candidates = self.getSequenceFromIndex(getattr(part, kind), pickedIndex)
+            return candidates.getByBoundingSphere(center, radius) if len(candidates) > 0 else candidates
+        pointDist = thisIndex['Min'][pickedIndex]-point
+        isInside = (pointDist*pointDist).sum(axis=1) <= radius*radius
+        return self.getSequenceFromIndex(part.nodes, pickedIndex[isInside])
+    def getSpatialIndex(self, part, kind):
+        ## method to return the spatial index of the nodes or geometric entities of a part ==>> lower and upper corners
+        ## of the bounding boxes (node coordinates for nodes) and the entity order sorted along every axis; the index is
+        ## built again when a feature is added to the part or the number of entities changes
+        repository = getattr(part, kind)
+        cacheKey = (len(part.features), len(repository))
+        indexKey = (part.name, kind)
+        if indexKey not in self.spatialIndex or self.spatialIndex[indexKey]['Key'] != cacheKey:
+            if kind == 'nodes':
+                boxMin = numpy.array([thisNode.coordinates for thisNode in repository], dtype=float).reshape(-1, 3)
+                boxMax = boxMin
+            else:
+                boxes = [repository[i:i+1].getBoundingBox() for i in range(len(repository))]
+                boxMin = numpy.array([thisBox['low'] for thisBox in boxes], dtype=float).reshape(-1, 3)
+                boxMax = numpy.array([thisBox['high'] for thisBox in boxes], dtype=float).reshape(-1, 3)
+            sortedOrder = [numpy.argsort(boxMin[:, k], kind='mergesort') for k in range(3)]
+            sortedMin = [boxMin[sortedOrder[k], k] for k in range(3)]
+            self.spatialIndex[indexKey] = {'Key':cacheKey, 'Min':boxMin, 'Max':boxMax, 'Order':sortedOrder, 'Sorted_Min':sortedMin}
+        return self.spatialIndex[indexKey]
+    def getIndexCandidates(self, thisIndex, lowCorner, highCorner):
+        ## method to return the sorted indices of the entities whose bounding box is inside a box; the axis with the
+        ## narrowest window is searched in the sorted order, the remaining axes are checked on the candidates only
+        lowCorner, highCorner = numpy.array(lowCorner, dtype=float), numpy.array(highCorner, dtype=float)
+        k = int(numpy.argmin(highCorner-lowCorner))
+        first = numpy.searchsorted(thisIndex['Sorted_Min'][k], lowCorner[k], side='left')
+        last = numpy.searchsorted(thisIndex['Sorted_Min'][k], highCorner[k], side='right')
+        candidates = numpy.sort(thisIndex['Order'][k][first:last])
+        isInside = numpy.all(thisIndex['Min'][candidates] >= lowCorner, axis=1) & numpy.all(thisIndex['Max'][candidates] <= highCorner, axis=1)
+        return candidates[isInside]
+    def getSequenceFromIndex(self, repository, pickedIndex):
+        ## method to return the entities of a repository at the given indices as abaqus sequence
+        if len(pickedIndex) == 0:
+            return repository[0:0]
+        return repository.getSequenceFromMask(mask=self.getIndexMask([int(thisIndex) for thisIndex in pickedIndex]))
     def seedEdge(self, part, index, distance, edges, **kwargs):
-            for thisEdge in edges:
-                edgeVertices = thisEdge.getVertices()
-                for thisVertexID in edgeVertices:
-                    vertexCoord = part.vertices[thisVertexID].pointOn
-                    if abs(vertexCoord[0][index]-distance) < self.lenTol:
-                        if edgeVertices.index(thisVertexID) == 0:
-                            part.seedEdgeByBias(biasMethod=SINGLE, end1Edges=(thisEdge,), constraint=FINER, **kwargs)
-                        elif edgeVertices.index(thisVertexID) == 1:
-                            part.seedEdgeByBias(biasMethod=SINGLE, end2Edges=(thisEdge,), constraint=FINER, **kwargs)
+        ## method to seed edges biased towards the vertex at the given distance along the given axis; the edges are
+        ## collected by end in one pass over the cached vertex coordinates and seeded with one seedEdgeByBias call, since
+        ## every call updates the part; an edge with both vertices at the distance is biased towards the second vertex
+        end1Edges, end2Edges = [], []
+        edgeCache = self.getEdgeCache(part)
+        for thisEdge in edges:
+            vertexCoords = self.getEdgeData(part, edgeCache, thisEdge)['Coords']
+            if len(vertexCoords) > 1 and abs(vertexCoords[1][index]-distance) < self.lenTol:
+                end2Edges.append(thisEdge)
+            elif abs(vertexCoords[0][index]-distance) < self.lenTol:
+                end1Edges.append(thisEdge)
+        endEdges = dict()
+        if len(end1Edges) > 0:
+            endEdges.update({'end1Edges':end1Edges})
+        if len(end2Edges) > 0:
+            endEdges.update({'end2Edges':end2Edges})
+        if len(endEdges) > 0:
+            part.seedEdgeByBias(biasMethod=SINGLE, constraint=FINER, **dict(endEdges, **kwargs))
     def getElemSurfFromCellFace(self, part, cellFaceArr, surfName):
-        ## method to create element based surface from cell face
-        elemWithFace = [[], [], [], [], [], []]
+        ## method to create element based surface from cell face; a cell face given more than once is used once, and
+        ## the element faces of a face set are collected once per mesh, so that tie and contact surfaces on the same
+        ## cell faces reuse them
+        cellFaces, faceIndex = [], set()
         for thisCellFace in cellFaceArr:
-            elemFaceArr = thisCellFace.getElementFaces()   
-            for thisElem in elemFaceArr:
-                for thisfaceID in range(6):
-                    if thisElem.face == SymbolicConstant('FACE'+str(thisfaceID+1)):
-                        elemWithFace[thisfaceID].append(thisElem)
-                        break
+            if thisCellFace.index not in faceIndex:
+                faceIndex.add(thisCellFace.index)
+                cellFaces.append(thisCellFace)
+        cacheKey = (part.name, len(part.elements), tuple(sorted(faceIndex)))
+        if self.elemFaceBucket is None:
+            self.elemFaceBucket = dict([(SymbolicConstant('FACE'+str(thisfaceID+1)), thisfaceID) for thisfaceID in range(6)])
+        if cacheKey not in self.elemSurfCache:
+            elemWithFace = [[], [], [], [], [], []]
+            for thisCellFace in cellFaces:
+                for thisElem in thisCellFace.getElementFaces():
+                    elemWithFace[self.elemFaceBucket[thisElem.face]].append(thisElem)
+            surfFaces = dict()
+            for thisfaceID in range(6):
+                if len(elemWithFace[thisfaceID]) > 0:
+                    surfFaces.update({'face'+str(thisfaceID+1)+'Elements':mesh.MeshFaceArray(elemWithFace[thisfaceID])})
+            self.elemSurfCache[cacheKey] = surfFaces
         surfDict = {'name':surfName}
-        for thisfaceID in range(6):
-            if len(elemWithFace[thisfaceID]) > 0:
-                elemWithFace[thisfaceID] = mesh.MeshFaceArray(elemWithFace[thisfaceID])
-                surfDict.update({'face'+str(thisfaceID+1)+'Elements':elemWithFace[thisfaceID]})
+        surfDict.update(self.elemSurfCache[cacheKey])
         part.Surface(**surfDict)
     def getNsetFromCellFace(self, part, cellFaceArr, nsetName):
         ## method to extract node set from cell face
-        nodes = []
-        for thisCellFace in cellFaceArr:
-            nodeArray = thisCellFace.getNodes()
-            for thisNode in nodeArray:
-                nodes.append(thisNode)
-        nodes = mesh.MeshNodeArray(nodes)
-        part.Set(nodes=nodes, name=nsetName)
+        self.getNsetFromNodes(part, [thisCellFace.getNodes() for thisCellFace in cellFaceArr], nsetName)
+    def getNsetFromNodes(self, part, nodeArrays, nsetName):
+        ## method to create node set from a sequence of node arrays (e.g. results of getByBoundingBox); the unique node
+        ## labels are collected, so that nodes shared by the arrays are added once and no node list is built
+        nodeLabels = set()
+        for thisNodeArray in nodeArrays:
+            for thisNode in thisNodeArray:
+                nodeLabels.add(thisNode.label)
+        part.SetFromNodeLabels(name=nsetName, nodeLabels=tuple(sorted(nodeLabels)))
     def inpFileSplitter(self):
-        dictFileID = {0:'Job', 
-                      1:'Parts', 
-                      2:'Materials', 
-                      3:'Step'}
-        eliminationList = ['** ASSEMBLY','** INTERACTION PROPERTIES', '** INTERACTIONS']
+        ## method to split the job inp file into the job file and the include files of inpFileID; a line starting with
+        ## '**' and containing the title-cased file ID switches the output file, a line of inpEliminationList switches
+        ## back to the job file. The file is read in blocks of inpBufferSize characters and only the '**' lines are
+        ## examined, the lines between them are written in one call; see inpFileSplitterMmap for inpSplitMode 'MMAP'
+        if self.inpSplitMode=='MMAP':
+            return self.inpFileSplitterMmap()
+        dictFileID = self.inpFileID
         oldJobFileName = self.job.name+'.inp'
         newJobFileName = self.couponName+'_Job_Temp'+self.version+'.inp'
         os.rename(oldJobFileName, newJobFileName)
-        fileTemp = open(newJobFileName, 'r')
+        fileTemp = open(newJobFileName, 'r', self.inpBufferSize)
         InpFolderName = self.couponName+'_InpFolder'+self.version
         try:
             os.mkdir(InpFolderName)
@@ -187,34 +449,1001 @@ class coupon_generic(object):
         file = len(dictFileID)*[None] 
         for key, val in dictFileID.items():
             if key==0:
-                file[key] = open(self.couponName+'_'+val+self.version+'.inp', 'w')
+                file[key] = open(self.couponName+'_'+val+self.version+'.inp', 'w', self.inpBufferSize)
             else:
-                file[key] = open(InpFolderName+'/'+self.couponName+'_'+val+self.version+'.inp', 'w')
-        prevFile = 0
-        currentFile = 0
-        lineCount = len(dictFileID)*[0]
-        for thisLine in fileTemp:
-            lineCount[currentFile] = lineCount[currentFile]+1
-            for key in range(len(file)):
-                if re.search("^\*\*.*"+dictFileID[key], thisLine.title()):
-                    prevFile = currentFile
-                    currentFile = key
-                    break
-                elif thisLine.rstrip('\n') in eliminationList:
-                    prevFile = currentFile
-                    currentFile = 0
-            if currentFile!=0 and prevFile!=currentFile and lineCount[currentFile]==0:
-                file[0].write(thisLine)
-                file[0].write('*Include, input = ./'+file[currentFile].name+'\n')
-                lineCount[0] = lineCount[0]+1
+                file[key] = open(InpFolderName+'/'+self.couponName+'_'+val+self.version+'.inp', 'w', self.inpBufferSize)
+        splitState = {'Current':0, 'Previous':0, 'Started':len(dictFileID)*[False]}
+        lineTail = ''
+        while True:
+            thisBlock = fileTemp.read(self.inpBufferSize)
+            if thisBlock:
+                ## complete lines only, the rest is kept for the next block
+                thisBlock = lineTail+thisBlock
+                blockEnd = thisBlock.rfind('\n')+1
+                thisBlock, lineTail = thisBlock[:blockEnd], thisBlock[blockEnd:]
             else:
-                file[currentFile].write(thisLine)
+                thisBlock, lineTail = lineTail, ''
+            if not thisBlock:
+                if lineTail:
+                    continue
+                break
+            lineStart = 0
+            while lineStart<len(thisBlock):
+                ## lines up to the next '**' line ==>> current file
+                if thisBlock.startswith('**', lineStart):
+                    commentStart = lineStart
+                else:
+                    commentStart = thisBlock.find('\n**', lineStart)
+                    commentStart = len(thisBlock) if commentStart<0 else commentStart+1
+                    file[splitState['Current']].write(thisBlock[lineStart:commentStart])
+                    splitState['Started'][splitState['Current']] = True
+                    if commentStart==len(thisBlock):
+                        break
+                lineStart = thisBlock.find('\n', commentStart)+1 or len(thisBlock)
+                thisLine = thisBlock[commentStart:lineStart]
+                if self.switchInpFile(thisLine, splitState):
+                    file[0].write(thisLine)
+                    file[0].write('*Include, input = ./'+file[splitState['Current']].name+'\n')
+                else:
+                    file[splitState['Current']].write(thisLine)
         fileTemp.close()
         for i in range(len(file)):
             file[i].close()
         ## delete old temp job file
         if os.path.exists(newJobFileName):
                 os.remove(newJobFileName)
+    def switchInpFile(self, thisLine, splitState):
+        ## method to switch the current file of splitState ('Current', 'Previous', 'Started') of the inp file splitter at
+        ## a '**' line; returns True when the line starts an include file, i.e. the line and the include line belong to
+        ## the job file
+        ## a file is started when it is the current file at the start of a line
+        splitState['Started'][splitState['Current']] = True
+        titleLine = thisLine.title()
+        for key in range(len(self.inpFileID)):
+            if self.inpFileID[key] in titleLine:
+                splitState['Previous'] = splitState['Current']
+                splitState['Current'] = key
+                break
+            elif thisLine.rstrip('\n') in self.inpEliminationList:
+                splitState['Previous'] = splitState['Current']
+                splitState['Current'] = 0
+        currentFile = splitState['Current']
+        return currentFile!=0 and splitState['Previous']!=currentFile and not splitState['Started'][currentFile]
+    def inpFileSplitterMmap(self):
+        ## method to split the job inp file as inpFileSplitter without decoding it ==>> the written job inp file is
+        ## memory-mapped, the '**' lines are found by their offsets and only these lines are decoded; the ranges between
+        ## them are copied to the include files by the operating system (copyInpRange). Only the job file, which holds
+        ## the assembly, is written to a temporary file and renamed to the job inp file
+        dictFileID = self.inpFileID
+        jobFileName = self.job.name+'.inp'
+        newJobFileName = self.couponName+'_Job_Temp'+self.version+'.inp'
+        InpFolderName = self.couponName+'_InpFolder'+self.version
+        try:
+            os.mkdir(InpFolderName)
+        except:
+            pass
+        file = len(dictFileID)*[None]
+        fileNames = len(dictFileID)*[None]
+        for key, val in dictFileID.items():
+            if key==0:
+                fileNames[key] = self.couponName+'_'+val+self.version+'.inp'
+                file[key] = open(newJobFileName, 'wb', self.inpBufferSize)
+            else:
+                fileNames[key] = InpFolderName+'/'+self.couponName+'_'+val+self.version+'.inp'
+                file[key] = open(fileNames[key], 'wb', self.inpBufferSize)
+        jobFile = open(jobFileName, 'rb')
+        deckSize = os.fstat(jobFile.fileno()).st_size
+        deckMap = mmap.mmap(jobFile.fileno(), 0, access=mmap.ACCESS_READ) if deckSize>0 else b''
+        splitState = {'Current':0, 'Previous':0, 'Started':len(dictFileID)*[False]}
+        try:
+            lineStart = 0
+            while lineStart<deckSize:
+                ## lines up to the next '**' line ==>> current file
+                if deckMap[lineStart:lineStart+2]==b'**':
+                    commentStart = lineStart
+                else:
+                    commentStart = deckMap.find(b'\n**', lineStart)
+                    commentStart = deckSize if commentStart<0 else commentStart+1
+                    self.copyInpRange(jobFile, deckMap, file[splitState['Current']], lineStart, commentStart)
+                    splitState['Started'][splitState['Current']] = True
+                    if commentStart==deckSize:
+                        break
+                lineStart = deckMap.find(b'\n', commentStart)+1 or deckSize
+                thisLine = deckMap[commentStart:lineStart]
+                ## line ending of the deck ==>> compared and written as in text mode
+                lineEnd = b'\r\n' if thisLine.endswith(b'\r\n') else b'\n'
+                if self.switchInpFile(thisLine.decode('latin-1').replace('\r\n', '\n'), splitState):
+                    file[0].write(thisLine)
+                    file[0].write(b'*Include, input = ./'+fileNames[splitState['Current']].encode('latin-1')+lineEnd)
+                else:
+                    file[splitState['Current']].write(thisLine)
+        finally:
+            if deckSize>0:
+                deckMap.close()
+            jobFile.close()
+            for i in range(len(file)):
+                file[i].close()
+        os.remove(jobFileName)
+        os.rename(newJobFileName, fileNames[0])
+    def copyInpRange(self, inFile, inMap, outFile, rangeStart, rangeEnd):
+        ## method to append the bytes rangeStart:rangeEnd of inFile to outFile ==>> os.copy_file_range or os.sendfile
+        ## where available, slices of the memory map inMap of at most inpBufferSize bytes otherwise
+        outFile.flush()
+        for copyName in ['copy_file_range', 'sendfile']:
+            if not hasattr(os, copyName) or rangeStart>=rangeEnd:
+                continue
+            try:
+                while rangeStart<rangeEnd:
+                    if copyName=='copy_file_range':
+                        copySize = os.copy_file_range(inFile.fileno(), outFile.fileno(), rangeEnd-rangeStart, rangeStart)
+                    else:
+                        copySize = os.sendfile(outFile.fileno(), inFile.fileno(), rangeStart, rangeEnd-rangeStart)
+                    if copySize<=0:
+                        break
+                    rangeStart = rangeStart+copySize
+            except (OSError, ValueError):
+                continue
+        while rangeStart<rangeEnd:
+            outFile.write(inMap[rangeStart:min(rangeEnd, rangeStart+self.inpBufferSize)])
+            rangeStart = min(rangeEnd, rangeStart+self.inpBufferSize)
+    def inpPartDeduplicator(self):
+        ## method to write a part of the parts inp file only once when other parts have the same mesh up to a
+        ## translation (twin parts); the instances of a twin part refer to the first part with the translation, and the
+        ## sets and surfaces of the twin part are added to the first part; the parts are compared in one pass over the
+        ## file, and the node coordinates of twin candidates are compared pairwise
+        InpFolderName = self.couponName+'_InpFolder'+self.version
+        partFileName = InpFolderName+'/'+self.couponName+'_Parts'+self.version+'.inp'
+        jobFileName = self.couponName+'_Job'+self.version+'.inp'
+        self.partTwin = dict()
+        ## parts ==>> node section, hash of the element sections and sections, byte range of the sets and surfaces
+        partData = []
+        thisPart = None
+        thisSection = None
+        partFile = open(partFileName, 'rb')
+        offset = 0
+        for thisLine in partFile:
+            lineStart, offset = offset, offset+len(thisLine)
+            if thisLine.startswith(b'*Part, name='):
+                thisPart = {'Name':thisLine[len(b'*Part, name='):].strip(), 'Start':lineStart, 'Node_Start':None, 'Node_Number':0,
+                            'Element_Hash':hashlib.sha1(), 'Sections':[], 'Set_Hash':dict(), 'Set_Ranges':[], 'Section_Start':None, 'Is_Plain':True}
+                thisSection = None
+                partData.append(thisPart)
+            elif thisPart is None:
+                continue
+            elif thisLine.startswith(b'*End Part'):
+                thisPart['End'] = offset
+                if thisPart['Section_Start'] is None:
+                    thisPart['Section_Start'] = lineStart
+                thisPart = None
+            elif thisLine.startswith(b'*Node'):
+                thisSection = 'Node'
+                thisPart['Node_Start'] = offset
+            elif thisLine.startswith(b'*Element'):
+                thisSection = 'Element'
+                thisPart['Element_Hash'].update(thisLine)
+            elif thisLine.startswith(b'*Nset') or thisLine.startswith(b'*Elset') or thisLine.startswith(b'*Surface'):
+                thisSection = 'Set'
+                setName = re.search(br'(?:nset|elset|name)=([^,\s]+)', thisLine).group(1)
+                thisPart['Set_Hash'][setName] = hashlib.sha1(re.sub(br'(?:nset|elset|name)=[^,\s]+', b'', thisLine))
+                thisPart['Set_Ranges'].append([lineStart, offset])
+            elif thisLine.startswith(b'** Section') or thisLine.startswith(b'*Solid Section'):
+                thisSection = 'Section'
+                if thisPart['Section_Start'] is None:
+                    thisPart['Section_Start'] = lineStart
+                thisPart['Sections'].append(re.sub(br'elset=[^,\s]+', b'elset=', thisLine))
+                setName = re.search(br'elset=([^,\s]+)', thisLine)
+                if setName:
+                    thisPart['Sections'].append(setName.group(1))
+            elif thisLine.startswith(b'**'):
+                continue
+            elif thisLine.startswith(b'*'):
+                ## other keyword ==>> the part is not deduplicated
+                thisSection = None
+                thisPart['Is_Plain'] = False
+            elif thisSection=='Node':
+                thisPart['Node_Number'] = thisPart['Node_Number']+1
+            elif thisSection=='Element':
+                thisPart['Element_Hash'].update(thisLine)
+            elif thisSection=='Set':
+                thisPart['Set_Hash'][setName].update(thisLine)
+                thisPart['Set_Ranges'][-1][1] = offset
+            elif thisSection=='Section':
+                thisPart['Sections'].append(thisLine)
+        partFile.close()
+        ## instances ==>> a twin part is only instanced without translation and rotation
+        jobFile = open(jobFileName, 'rb')
+        jobLines = jobFile.readlines()
+        jobFile.close()
+        instanceParts = dict()
+        for i in range(len(jobLines)-1):
+            if jobLines[i].startswith(b'*Instance,'):
+                instancePart = re.search(br'part=([^,\s]+)', jobLines[i]).group(1)
+                instanceParts.setdefault(instancePart, []).append(jobLines[i+1].startswith(b'*End Instance'))
+        ## twin parts ==>> same elements, sections and set contents of the sections, disjoint set names, node
+        ## coordinates translated
+        for thisPart in partData:
+            thisPart['Section_Key'] = [thisPart['Set_Hash'][thisItem].hexdigest() if thisItem in thisPart['Set_Hash'] else thisItem for thisItem in thisPart['Sections']]
+        twinData = dict()
+        for j in range(len(partData)):
+            thisTwin = partData[j]
+            if not (thisTwin['Is_Plain'] and thisTwin['Node_Number']>0 and all(instanceParts.get(thisTwin['Name'], [False]))):
+                continue
+            for i in range(j):
+                thisBase = partData[i]
+                if not thisBase['Is_Plain'] or thisBase['Name'] in twinData:
+                    continue
+                if thisBase['Node_Number']!=thisTwin['Node_Number'] or thisBase['Element_Hash'].digest()!=thisTwin['Element_Hash'].digest():
+                    continue
+                if thisBase['Section_Key']!=thisTwin['Section_Key']:
+                    continue
+                setNames = set(thisBase['Set_Hash'])
+                for thisOther in partData:
+                    if twinData.get(thisOther['Name'], (None, ))[0]==thisBase['Name']:
+                        setNames.update(thisOther['Set_Hash'])
+                if setNames.intersection(thisTwin['Set_Hash']):
+                    continue
+                translation = self.getNodeTranslation(partFileName, thisBase, thisTwin)
+                if translation is not None:
+                    twinData[thisTwin['Name']] = (thisBase['Name'], translation)
+                    break
+        if len(twinData)==0:
+            return
+        ## parts inp file ==>> twin parts removed, their sets and surfaces written before the sections of the first part
+        tempFileName = partFileName+'.tmp'
+        partFile = open(partFileName, 'rb')
+        readFile = open(partFileName, 'rb')
+        tempFile = open(tempFileName, 'wb')
+        partByName = dict([(thisPart['Name'], thisPart) for thisPart in partData])
+        insertData = dict()
+        for thisTwinName, (thisBaseName, translation) in twinData.items():
+            insertData.setdefault(partByName[thisBaseName]['Section_Start'], []).append(partByName[thisTwinName])
+        skipRanges = sorted([(partByName[thisTwinName]['Start'], partByName[thisTwinName]['End']) for thisTwinName in twinData])
+        offset = 0
+        skipEnd = -1
+        for thisLine in partFile:
+            lineStart, offset = offset, offset+len(thisLine)
+            for thisTwin in sorted(insertData.get(lineStart, []), key=lambda x: x['Start']):
+                for rangeStart, rangeEnd in thisTwin['Set_Ranges']:
+                    readFile.seek(rangeStart)
+                    tempFile.write(readFile.read(rangeEnd-rangeStart))
+            if skipRanges and lineStart==skipRanges[0][0]:
+                skipEnd = skipRanges.pop(0)[1]
+            if lineStart<skipEnd or (lineStart==skipEnd and thisLine.startswith(b'**')):
+                continue
+            tempFile.write(thisLine)
+        partFile.close()
+        readFile.close()
+        tempFile.close()
+        os.remove(partFileName)
+        os.rename(tempFileName, partFileName)
+        ## job inp file ==>> instances of the twin parts
+        jobFile = open(jobFileName, 'wb')
+        for thisLine in jobLines:
+            instancePart = re.search(br'part=([^,\s]+)', thisLine) if thisLine.startswith(b'*Instance,') else None
+            if instancePart and instancePart.group(1) in twinData:
+                thisBaseName, translation = twinData[instancePart.group(1)]
+                jobFile.write(thisLine[:instancePart.start(1)]+thisBaseName+thisLine[instancePart.end(1):])
+                jobFile.write((', '.join([repr(thisValue) for thisValue in translation])+'\n').encode())
+            else:
+                jobFile.write(thisLine)
+        jobFile.close()
+        for thisTwinName, (thisBaseName, translation) in twinData.items():
+            self.partTwin[thisTwinName.decode()] = {'Part':thisBaseName.decode(), 'Translation':list(translation)}
+    def inpPartDecomposer(self):
+        ## method to move the nodes, elements, sets and surfaces of every part of the parts inp file into include files
+        ## of the part (<part>_Nodes, <part>_Elements, <part>_Sets, <part>_Surfaces in the inp folder); the parts inp
+        ## file keeps the part, section and include lines, and the index json lists file, size and number of every
+        ## include file with the byte offset, length and number of every node, element, set and surface block
+        InpFolderName = self.couponName+'_InpFolder'+self.version
+        partFileName = InpFolderName+'/'+self.couponName+'_Parts'+self.version+'.inp'
+        tempFileName = partFileName+'.tmp'
+        inpCategory = {b'*NODE':'Nodes', b'*ELEMENT':'Elements', b'*NSET':'Sets', b'*ELSET':'Sets', b'*SURFACE':'Surfaces'}
+        inpIndex = {'Parts_File':partFileName, 'Parts':dict()}
+        partFile = open(partFileName, 'rb')
+        tempFile = open(tempFileName, 'wb', self.inpBufferSize)
+        partIndex, partFiles, targetFile, thisItem = None, dict(), tempFile, None
+        for thisLine in partFile:
+            if thisLine.startswith(b'*Part, name='):
+                partName = thisLine[len(b'*Part, name='):].strip().decode('latin-1')
+                lineEnd = b'\r\n' if thisLine.endswith(b'\r\n') else b'\n'
+                partIndex, partFiles, targetFile, thisItem = dict(), dict(), tempFile, None
+                inpIndex['Parts'][partName] = partIndex
+            elif partIndex is None:
+                pass
+            elif thisLine.startswith(b'*End Part'):
+                for thisFile in partFiles.values():
+                    thisFile.close()
+                partIndex, partFiles, targetFile, thisItem = None, dict(), tempFile, None
+            elif thisLine.startswith(b'**'):
+                targetFile, thisItem = tempFile, None
+            elif thisLine.startswith(b'*'):
+                thisCategory = inpCategory.get(thisLine.split(b',')[0].strip().upper())
+                if thisCategory is None:
+                    targetFile, thisItem = tempFile, None
+                else:
+                    ## include files ==>> sets before surfaces, which refer to the internal element sets
+                    for thisNewCategory in (['Sets', 'Surfaces'] if thisCategory in ['Sets', 'Surfaces'] else [thisCategory]):
+                        if thisNewCategory in partFiles:
+                            continue
+                        thisFileName = InpFolderName+'/'+partName+'_'+thisNewCategory+self.version+'.inp'
+                        partFiles[thisNewCategory] = open(thisFileName, 'wb', self.inpBufferSize)
+                        partIndex[thisNewCategory] = {'File':thisFileName, 'Bytes':0, 'Number':0, 'Items':[]}
+                        tempFile.write(b'*Include, input = ./'+thisFileName.encode('latin-1')+lineEnd)
+                    targetFile = partFiles[thisCategory]
+                    itemName = re.search(br'(?:nset|elset|name)=([^,\s]+)', thisLine, re.IGNORECASE) or re.search(br'type=([^,\s]+)', thisLine, re.IGNORECASE)
+                    thisItem = {'Name':itemName.group(1).decode('latin-1') if itemName else '', 'Offset':partIndex[thisCategory]['Bytes'], 'Length':0, 'Number':0,
+                                'Generate':b'GENERATE' in thisLine.upper(), 'Category':thisCategory}
+                    partIndex[thisCategory]['Items'].append(thisItem)
+            elif thisItem is not None:
+                ## data line ==>> nodes, elements (without continuation lines) and set members
+                if thisItem['Category'] in ['Nodes', 'Surfaces']:
+                    thisNumber = 1
+                elif thisItem['Category']=='Elements':
+                    thisNumber = 0 if thisLine.rstrip().endswith(b',') else 1
+                elif thisItem['Generate']:
+                    thisValues = [int(thisValue) for thisValue in thisLine.split(b',') if thisValue.strip()]
+                    thisNumber = (thisValues[1]-thisValues[0])//(thisValues[2] if len(thisValues)>2 else 1)+1
+                else:
+                    thisNumber = len([thisValue for thisValue in thisLine.split(b',') if thisValue.strip()])
+                thisItem['Number'] = thisItem['Number']+thisNumber
+            if targetFile is tempFile:
+                tempFile.write(thisLine)
+            else:
+                targetFile.write(thisLine)
+                thisItem['Length'] = thisItem['Length']+len(thisLine)
+                partIndex[thisItem['Category']]['Bytes'] = partIndex[thisItem['Category']]['Bytes']+len(thisLine)
+                partIndex[thisItem['Category']]['Number'] = partIndex[thisItem['Category']]['Number']+(thisNumber if not thisLine.startswith(b'*') else 0)
+        partFile.close()
+        tempFile.close()
+        os.remove(partFileName)
+        os.rename(tempFileName, partFileName)
+        for thisPartIndex in inpIndex['Parts'].values():
+            for thisCategoryIndex in thisPartIndex.values():
+                for thisItem in thisCategoryIndex['Items']:
+                    del thisItem['Generate'], thisItem['Category']
+        indexFile = open(InpFolderName+'/'+self.couponName+'_Inp_Index'+self.version+'.json', 'w')
+        indexFile.write(json.dumps(inpIndex, indent=4, sort_keys=True))
+        indexFile.close()
+    def getNodeTranslation(self, partFileName, basePart, twinPart):
+        ## method to return the translation from the nodes of basePart to the nodes of twinPart in the parts inp file,
+        ## or None when the labels differ or the nodes are not translated by the same vector
+        baseFile = open(partFileName, 'rb')
+        twinFile = open(partFileName, 'rb')
+        baseFile.seek(basePart['Node_Start'])
+        twinFile.seek(twinPart['Node_Start'])
+        translation = None
+        try:
+            for i in range(basePart['Node_Number']):
+                baseValues = baseFile.readline().split(b',')
+                twinValues = twinFile.readline().split(b',')
+                if baseValues[0].strip()!=twinValues[0].strip() or len(baseValues)!=len(twinValues):
+                    return None
+                baseCoords = [float(thisValue) for thisValue in baseValues[1:]]
+                twinCoords = [float(thisValue) for thisValue in twinValues[1:]]
+                if translation is None:
+                    translation = [twinCoords[k]-baseCoords[k] for k in range(len(baseCoords))]
+                for k in range(len(baseCoords)):
+                    if abs(twinCoords[k]-baseCoords[k]-translation[k])>1.0e-6*(1.0+abs(baseCoords[k])+abs(twinCoords[k])):
+                        return None
+            return translation
+        finally:
+            baseFile.close()
+            twinFile.close()
+    def compressInpFiles(self):
+        ## method to replace the mesh include files of the inp folder (the parts file, or the include files of the parts
+        ## listed in the index json of inpPartDecomposer) by compressed files <file>.inp.gz or <file>.inp.zst; the include
+        ## lines keep the name of the uncompressed file, which is restored before the job is submitted, see
+        ## util/job_launcher.py
+        InpFolderName = self.couponName+'_InpFolder'+self.version
+        compression = 'GZIP' if self.inpCompression=='ZSTD' and zstandard is None else self.inpCompression
+        indexFileName = InpFolderName+'/'+self.couponName+'_Inp_Index'+self.version+'.json'
+        if os.path.exists(indexFileName):
+            indexFile = open(indexFileName, 'r')
+            inpIndex = json.load(indexFile)
+            indexFile.close()
+            fileNames = [thisCategoryIndex['File'] for thisPartIndex in inpIndex['Parts'].values() for thisCategoryIndex in thisPartIndex.values()]
+        else:
+            fileNames = [InpFolderName+'/'+self.couponName+'_Parts'+self.version+'.inp']
+        for fileName in fileNames:
+            inFile = open(fileName, 'rb')
+            outFile = open(fileName+self.inpCompressionExt[compression], 'wb')
+            if compression=='ZSTD':
+                zstandard.ZstdCompressor(level=self.inpCompressionLevel).copy_stream(inFile, outFile, read_size=self.inpBufferSize)
+            else:
+                ## no file name and time stamp in the header ==>> same content, same compressed file
+                compressedFile = gzip.GzipFile(filename='', mode='wb', compresslevel=self.inpCompressionLevel, fileobj=outFile, mtime=0)
+                shutil.copyfileobj(inFile, compressedFile, self.inpBufferSize)
+                compressedFile.close()
+            outFile.close()
+            inFile.close()
+            self.removeInpFile(fileName)
+    def removeCompressedInpFiles(self, InpFolderName):
+        ## method to remove the compressed inp files of a previous run, which would replace the new files when the job
+        ## is submitted
+        if not os.path.isdir(InpFolderName):
+            return
+        for thisName in os.listdir(InpFolderName):
+            if thisName.endswith(tuple(self.inpCompressionExt.values())):
+                self.removeInpFile(InpFolderName+'/'+thisName)
+    def storeInpFiles(self):
+        ## method to write the include files of the inp folder once into the include store inpStorePath, named by the
+        ## sha1 hash of their content (<hash>.inp, read-only), and to hardlink them back into the inp folder; where
+        ## a file cannot be hardlinked, it is removed from the inp folder and its include line refers to the store; the
+        ## file is kept when the stored file was removed meanwhile. The stored files are listed in
+        ## <Coupon>_Inp_Store.json of the inp folder
+        InpFolderName = self.couponName+'_InpFolder'+self.version
+        storePath = os.path.abspath(self.inpStorePath).replace('\\', '/')
+        if not os.path.isdir(storePath):
+            os.makedirs(storePath)
+        ## files of a previous run of this version ==>> not hashed again while still linked, kept while referred to
+        baseStore = self.getInpStore(InpFolderName, self.version) or {'Store_Path':storePath, 'Files':dict()}
+        fileHashes = dict([(fileName, thisData['Hash']) for fileName, thisData in baseStore['Files'].items()])
+        fileHashes.update(self.inpStoreHashes)
+        storeData = {'Store_Path':storePath, 'Files':dict()}
+        ## include files of the parts file first, then the parts, materials and step files of the job file
+        jobFileName = self.couponName+'_Job'+self.version+'.inp'
+        partFileName = InpFolderName+'/'+self.couponName+'_Parts'+self.version+'.inp'
+        topFileNames = [InpFolderName+'/'+self.couponName+'_'+thisID+self.version+'.inp' for thisID in self.inpFileID.values()]
+        inpFileNames = [InpFolderName+'/'+thisName for thisName in sorted(os.listdir(InpFolderName)) if thisName.endswith(('.inp',)+tuple(self.inpCompressionExt.values()))]
+        for isTopFile, includeFileName in [(False, partFileName), (True, jobFileName)]:
+            references = dict()
+            for fileName, thisData in baseStore['Files'].items():
+                if not thisData['Link'] and not os.path.exists(fileName) and (fileName in topFileNames)==isTopFile:
+                    references['./'+fileName] = self.getStoreFileName(baseStore['Store_Path'], fileName, thisData['Hash'])
+                    storeData['Files'][fileName] = thisData
+            for fileName in [thisName for thisName in inpFileNames if (thisName in topFileNames)==isTopFile]:
+                blobName = self.getStoreFileName(storePath, fileName, fileHashes.get(fileName, ''))
+                if fileName in fileHashes and os.path.exists(blobName) and os.path.samefile(fileName, blobName):
+                    storeData['Files'][fileName] = {'Hash':fileHashes[fileName], 'Link':True}
+                    continue
+                fileHash = self.getInpFileHash(fileName)
+                blobName = self.getStoreFileName(storePath, fileName, fileHash)
+                if not os.path.exists(blobName):
+                    tempName = blobName+'_'+str(os.getpid())+'.tmp'
+                    shutil.copyfile(fileName, tempName)
+                    os.chmod(tempName, stat.S_IREAD)
+                    try:
+                        os.rename(tempName, blobName)
+                    except OSError:
+                        ## blob written meanwhile by another process
+                        self.removeInpFile(tempName)
+                isLinked = False
+                if hasattr(os, 'link'):
+                    try:
+                        os.link(blobName, fileName+'.tmp')
+                        isLinked = True
+                    except OSError:
+                        pass
+                if isLinked:
+                    self.removeInpFile(fileName)
+                    os.rename(fileName+'.tmp', fileName)
+                elif not fileName.endswith('.inp') or not os.path.exists(blobName):
+                    ## compressed files are restored next to the file when the job is submitted, and a stored file may
+                    ## be removed meanwhile by inpStore.collect ==>> file kept in the inp folder
+                    continue
+                else:
+                    ## recent stored files are kept by inpStore.collect until the store json is written
+                    try:
+                        os.utime(blobName, None)
+                    except OSError:
+                        pass
+                    self.removeInpFile(fileName)
+                    references['./'+fileName] = blobName
+                storeData['Files'][fileName] = {'Hash':fileHash, 'Link':isLinked}
+            if references and os.path.exists(includeFileName):
+                self.rewriteInpFile(includeFileName, includeFileName, lambda inpLines: [self.getStoreIncludeLine(thisLine, references) for thisLine in inpLines])
+        storeFile = open(InpFolderName+'/'+self.couponName+'_Inp_Store'+self.version+'.json', 'w')
+        storeFile.write(json.dumps(storeData, indent=4, sort_keys=True))
+        storeFile.close()
+        self.inpStoreHashes = dict()
+    def getStoreFileName(self, storePath, fileName, fileHash):
+        ## method to return the name of a stored file ==>> <hash>.inp, or <hash>.inp.gz for a compressed file
+        return storePath+'/'+fileHash+fileName[fileName.rindex('.inp'):]
+    def getInpStore(self, InpFolderName, version):
+        ## method to return the include store data of an inp folder, None when its files are not stored
+        storeFileName = InpFolderName+'/'+self.couponName+'_Inp_Store'+version+'.json'
+        if not os.path.exists(storeFileName):
+            return None
+        storeFile = open(storeFileName, 'r')
+        storeData = json.load(storeFile)
+        storeFile.close()
+        return storeData
+    def removeInpStoreLinks(self, InpFolderName):
+        ## method to remove the stored files of the inp folder of this version before they are written again, so that
+        ## the stored file is never changed through its link
+        storeData = self.getInpStore(InpFolderName, self.version)
+        if storeData is None:
+            return
+        for fileName in storeData['Files']:
+            if os.path.exists(fileName):
+                self.removeInpFile(fileName)
+        os.remove(InpFolderName+'/'+self.couponName+'_Inp_Store'+self.version+'.json')
+    def removeInpFile(self, fileName):
+        ## method to remove a file which may be linked to a read-only stored file; the permission is only changed where
+        ## the file cannot be removed otherwise (windows), as it is shared with the stored file
+        try:
+            os.remove(fileName)
+        except OSError:
+            os.chmod(fileName, stat.S_IWRITE | stat.S_IREAD)
+            os.remove(fileName)
+    def getInpSourceName(self, fileName, storeData):
+        ## method to return the file to read an include file from ==>> the file in the inp folder, or the stored file
+        ## when the include lines refer to the store
+        if not os.path.exists(fileName):
+            for thisExt in self.inpCompressionExt.values():
+                if os.path.exists(fileName+thisExt):
+                    return fileName+thisExt
+        if storeData is None or os.path.exists(fileName) or fileName not in storeData['Files']:
+            return fileName
+        return self.getStoreFileName(storeData['Store_Path'], fileName, storeData['Files'][fileName]['Hash'])
+    def getStoreIncludeLine(self, thisLine, references):
+        ## method to return an include line with the input file replaced according to references
+        if thisLine.startswith('*Include') and '=' in thisLine:
+            includeName = thisLine.split('=', 1)[1].strip()
+            if includeName in references:
+                return thisLine.split('=', 1)[0]+'= '+references[includeName]+'\n'
+        return thisLine
+    def restoreIncludeLines(self, inpLines, storeData):
+        ## method to replace the include lines referring to the store with the files of the inp folder
+        if storeData is None:
+            return inpLines
+        references = dict([(self.getStoreFileName(storeData['Store_Path'], fileName, thisData['Hash']), './'+fileName) for fileName, thisData in storeData['Files'].items() if not thisData['Link']])
+        return [self.getStoreIncludeLine(thisLine, references) for thisLine in inpLines]
+    def copyInpFile(self, baseFileName, newFileName, storeData):
+        ## method to copy an include file of an existing model ==>> linked to the stored file when the store is used
+        ## compressed include file ==>> copied compressed
+        for thisExt in self.inpCompressionExt.values():
+            if not os.path.exists(baseFileName) and os.path.exists(baseFileName+thisExt):
+                baseFileName, newFileName = baseFileName+thisExt, newFileName+thisExt
+        if self.inpStorePath and storeData is not None and baseFileName in storeData['Files']:
+            fileHash = storeData['Files'][baseFileName]['Hash']
+            try:
+                os.link(self.getStoreFileName(storeData['Store_Path'], baseFileName, fileHash), newFileName)
+                self.inpStoreHashes[newFileName] = fileHash
+                return
+            except (OSError, AttributeError):
+                pass
+        shutil.copyfile(self.getInpSourceName(baseFileName, storeData), newFileName)
+    def getInpFileHash(self, fileName):
+        ## method to return the sha1 hash of a file read in blocks of inpBufferSize bytes
+        fileHash = hashlib.sha1()
+        thisFile = open(fileName, 'rb')
+        thisBlock = thisFile.read(self.inpBufferSize)
+        while thisBlock:
+            fileHash.update(thisBlock)
+            thisBlock = thisFile.read(self.inpBufferSize)
+        thisFile.close()
+        return fileHash.hexdigest()
+    def timeStage(self, stageName, stageMethod):
+        ## method to return the stage method which records its wall-clock and cpu time in stageTimes
+        def timedStage(*args, **kwargs):
+            stageTime = {'Stage':stageName, 'Status':'FAILED'}
+            self.stageTimes.append(stageTime)
+            wallStart, cpuStart = time.time(), sum(os.times()[:2])
+            try:
+                returnValue = stageMethod(*args, **kwargs)
+                stageTime['Status'] = 'SUCCESS'
+                return returnValue
+            finally:
+                stageTime['Wall_Time'] = time.time()-wallStart
+                stageTime['CPU_Time'] = sum(os.times()[:2])-cpuStart
+        return timedStage
+    def profileMethod(self, methodName, method):
+        ## method to return the method which counts its calls and adds up its wall-clock and cpu time in profileData;
+        ## times are inclusive, i.e. helper times are also part of the time of the calling stage
+        self.profileData[methodName] = {'Calls':0, 'Wall_Time':0.0, 'CPU_Time':0.0}
+        profiler = cProfile.Profile() if methodName==self.profileStage else None
+        def profiledMethod(*args, **kwargs):
+            methodData = self.profileData[methodName]
+            methodData['Calls'] = methodData['Calls']+1
+            wallStart, cpuStart = time.time(), sum(os.times()[:2])
+            try:
+                if profiler is None:
+                    return method(*args, **kwargs)
+                return profiler.runcall(method, *args, **kwargs)
+            finally:
+                methodData['Wall_Time'] = methodData['Wall_Time']+time.time()-wallStart
+                methodData['CPU_Time'] = methodData['CPU_Time']+sum(os.times()[:2])-cpuStart
+                if profiler is not None:
+                    ## statistics of all calls so far, next to the model files
+                    profiler.dump_stats(self.couponName+'_'+methodName+self.version+'.prof')
+        return profiledMethod
+    def getMeshStatus(self):
+        ## method to return element and node number of every meshed part, with the predicted numbers when available
+        meshStatus = dict()
+        for i in range(len(getattr(self, 'part', []))):
+            meshStatus['Part_'+str(i+1)] = {'Name':self.part[i].name, 'Element_Number':len(self.part[i].elements), 'Node_Number':len(self.part[i].nodes)}
+            if 'Part_'+str(i+1) in getattr(self, 'meshPrediction', dict()):
+                thisPrediction = self.meshPrediction['Part_'+str(i+1)]
+                meshStatus['Part_'+str(i+1)].update({'Predicted_Element_Number':thisPrediction['Element_Number'], 'Predicted_Node_Number':thisPrediction['Node_Number']})
+        return meshStatus
+    def getMeshPrediction(self):
+        ## method to predict element and node number of every part from the seeds, before the mesh is generated, see
+        ## getCellElementNumber
+        meshPrediction = dict()
+        predictionFactor = self.couponData.get('Mesh_Prediction_Factor', self.meshPredictionFactor)
+        for i in range(len(self.part)):
+            thisPart = self.part[i]
+            edgeCache = self.getEdgeCache(thisPart)
+            edgeSeeds = dict()
+            elemNumber, nodeNumber = 0.0, 0.0
+            for thisCell in thisPart.cells:
+                cellElements = self.getCellElementNumber(thisPart, edgeCache, edgeSeeds, thisCell, self.partSeedSize[i])
+                elemNumber += cellElements
+                nodeNumber += (cellElements**(1.0/3.0)+1.0)**3
+            ## calibration of the template, or of the part when given for the part ('Part_<n>')
+            partFactor = predictionFactor.get('Part_'+str(i+1), predictionFactor)
+            meshPrediction['Part_'+str(i+1)] = {'Element_Number':int(round(elemNumber*partFactor.get('Element_Number', 1.0))),
+                                                'Node_Number':int(round(nodeNumber*partFactor.get('Node_Number', 1.0)))}
+        return meshPrediction
+    def getCellElementNumber(self, part, edgeCache, edgeSeeds, thisCell, globalSize):
+        ## method to predict the element number of a cell ==>> the edges of the cell are grouped by their main direction
+        ## (x, y, z) and the element size along a direction is the length-weighted geometric mean of the element sizes of
+        ## its edges, so that a few finely seeded short edges weigh by their length only; edges without a direction
+        ## (closed edges) count in the mean size of the cell, used for a direction without edges; edgeSeeds keeps the
+        ## seeds of the edges shared by the cells of the part
+        directionLength, directionLogSize = [0.0, 0.0, 0.0], [0.0, 0.0, 0.0]
+        cellLength, cellLogSize = 0.0, 0.0
+        for thisEdgeID in thisCell.getEdges():
+            if thisEdgeID not in edgeSeeds:
+                edgeSeeds[thisEdgeID] = self.getEdgeSeedNumber(part, edgeCache, part.edges[thisEdgeID], globalSize)
+            edgeLength, elemNumber, edgeDirection = edgeSeeds[thisEdgeID]
+            if edgeLength <= 0:
+                continue
+            logSize = edgeLength*math.log(edgeLength/elemNumber)
+            cellLength, cellLogSize = cellLength+edgeLength, cellLogSize+logSize
+            if edgeDirection is not None:
+                directionLength[edgeDirection] += edgeLength
+                directionLogSize[edgeDirection] += logSize
+        meanSize = math.exp(cellLogSize/cellLength) if cellLength > 0 else globalSize
+        directionSize = [math.exp(directionLogSize[k]/directionLength[k]) if directionLength[k] > 0 else meanSize for k in range(3)]
+        cellVolume = part.getVolume(cells=part.cells[thisCell.index:thisCell.index+1])
+        return max(1.0, cellVolume/(directionSize[0]*directionSize[1]*directionSize[2]))
+    def seedGlobal(self):
+        ## method to seed every part with its global element size 'Global_Part_<n>' of the coupon data, or with the
+        ## largest local element size of the coupon for a part without one
+        self.maxSeedSize = 0
+        for seedKey, seedValue in self.seedSize.items():
+            if not seedKey.startswith('Global_') and seedValue>self.maxSeedSize:
+                self.maxSeedSize = seedValue
+        self.partSeedSize = [self.seedSize.get('Global_Part_'+str(i+1), self.maxSeedSize) for i in range(len(self.part))]
+        for i in range(len(self.part)):
+            self.part[i].seedPart(size=self.partSeedSize[i], deviationFactor=0.1, minSizeFactor=0.1)
+    def generatePartMesh(self):
+        ## method to generate the mesh of every part and to write its element number to the coupon data
+        self.couponData.update({'Element_Number':dict()})
+        for i in range(len(self.part)):
+            self.part[i].generateMesh()
+            self.couponData['Element_Number'].update({'Part_'+str(i+1):len(self.part[i].elements)})
+    def getMeshTargetNumber(self, meshTarget):
+        ## method to return the key of the mesh prediction and the number of meshTarget ({'Element_Number':...} or
+        ## {'DOF':...}, three per node)
+        if 'DOF' in meshTarget:
+            return 'Node_Number', meshTarget['DOF']/3.0
+        return 'Element_Number', float(meshTarget['Element_Number'])
+    def scaleSeedSize(self, meshTarget, partFactor=None):
+        ## method to scale all element sizes of the coupon by one factor until the predicted number of all parts is within
+        ## seedScaleTolerance of meshTarget; the ratios of the element sizes are kept, and the local and global seeds are
+        ## applied again after every step, before the mesh is generated ==>> every part is predicted on its own and
+        ## follows the scale with its own exponent, measured from the previous step (3 before the first step, 0 for a
+        ## part with fixed seeds), so that a part which does not follow the scale does not coarsen the other parts;
+        ## partFactor is the ratio of actual to predicted number of every part of a mesh generated before
+        targetKey, targetNumber = self.getMeshTargetNumber(meshTarget)
+        partFactor = partFactor or dict()
+        partExponent = dict()
+        lastPrediction, lastStep = None, None
+        bestScale, bestNumber = None, None
+        isConverged = False
+        for thisIteration in range(self.seedScaleIterations+1):
+            partPrediction = dict([(thisKey, thisValue[targetKey]*partFactor.get(thisKey, 1.0)) for thisKey, thisValue in self.getMeshPrediction().items()])
+            predictedNumber = sum(partPrediction.values())
+            if bestNumber is None or abs(math.log(max(predictedNumber, 1.0)/targetNumber))<abs(math.log(max(bestNumber, 1.0)/targetNumber)):
+                bestScale, bestNumber = self.seedScale, predictedNumber
+            if abs(predictedNumber/targetNumber-1.0)<=self.seedScaleTolerance:
+                isConverged = True
+                break
+            if thisIteration==self.seedScaleIterations:
+                break
+            ## exponent of every part ==>> change of its predicted number with the last step
+            if lastPrediction is not None and abs(math.log(lastStep))>1.0e-9:
+                for thisKey in partPrediction:
+                    if partPrediction[thisKey]>0 and lastPrediction.get(thisKey, 0)>0:
+                        thisExponent = -math.log(partPrediction[thisKey]/lastPrediction[thisKey])/math.log(lastStep)
+                        partExponent[thisKey] = min(3.0, max(0.0, thisExponent))
+            thisStep = self.getSeedScaleStep(partPrediction, partExponent, targetNumber)
+            if thisStep is None:
+                break
+            self.applySeedScale(thisStep)
+            lastPrediction, lastStep = partPrediction, thisStep
+        ## seeds ==>> closest prediction of all steps, the element numbers jump with the seed numbers of short edges
+        if not isConverged and bestScale!=self.seedScale:
+            self.applySeedScale(bestScale/self.seedScale)
+            predictedNumber = bestNumber
+        self.couponData.update({'Element_Size_Scale':{'Scale':self.seedScale, 'Iterations':thisIteration+1, 'Converged':isConverged,
+                                                      'Predicted_Number':int(round(predictedNumber)), 'Target_Number':int(round(targetNumber))}})
+        if not isConverged:
+            print('WARNING! Element sizes of %s not scaled to the mesh target: %d predicted against %d after %d iterations, scale %.3f.' % (self.couponName,
+                  predictedNumber, targetNumber, thisIteration+1, self.seedScale))
+    def applySeedScale(self, thisStep):
+        ## method to scale all element sizes of the coupon by thisStep and to apply the local and global seeds again
+        self.seedScale = self.seedScale*thisStep
+        for thisKey in self.seedSize:
+            self.seedSize[thisKey] = self.seedSize[thisKey]*thisStep
+        ## the templates read their element sizes from seedSize in createLocalSeed
+        type(self).createLocalSeed(self)
+        self.seedGlobal()
+    def getSeedScaleStep(self, partPrediction, partExponent, targetNumber):
+        ## method to return the scale of the element sizes for which the predicted number of all parts meets targetNumber,
+        ## limited to a factor of 10 per step, or None when the parts following the scale cannot meet it ==>> bisection of
+        ## the logarithm of the scale, the number of every part being proportional to the scale to the power of minus its
+        ## exponent
+        thisExponent = dict([(thisKey, partExponent.get(thisKey, 3.0)) for thisKey in partPrediction])
+        fixedNumber = sum([partPrediction[thisKey] for thisKey in partPrediction if thisExponent[thisKey]<=0])
+        if fixedNumber>=targetNumber*(1.0-self.seedScaleTolerance) or fixedNumber==sum(partPrediction.values()):
+            return None
+        getNumber = lambda x: sum([partPrediction[thisKey]*math.exp(-thisExponent[thisKey]*x) for thisKey in partPrediction])
+        lowerLog, upperLog = -math.log(10.0), math.log(10.0)
+        for thisIteration in range(60):
+            midLog = 0.5*(lowerLog+upperLog)
+            if getNumber(midLog)>targetNumber:
+                lowerLog = midLog
+            else:
+                upperLog = midLog
+        return math.exp(0.5*(lowerLog+upperLog))
+    def checkMeshTarget(self, meshTarget):
+        ## method to compare the generated mesh with meshTarget ==>> when the number of all parts is outside
+        ## meshTargetTolerance, the prediction of every part is corrected by the ratio of its actual to predicted number, the
+        ## element sizes are scaled again and the mesh is generated once more; a mesh still outside the tolerance is
+        ## reported
+        targetKey, targetNumber = self.getMeshTargetNumber(meshTarget)
+        getActualNumber = lambda thisPart: len(thisPart.nodes) if targetKey=='Node_Number' else len(thisPart.elements)
+        actualNumber = dict([('Part_'+str(i+1), getActualNumber(self.part[i])) for i in range(len(self.part))])
+        isRemeshed = False
+        if abs(sum(actualNumber.values())/targetNumber-1.0)>self.meshTargetTolerance:
+            partFactor = dict([(thisKey, actualNumber[thisKey]/float(max(thisValue[targetKey], 1))) for thisKey, thisValue in self.getMeshPrediction().items()])
+            for thisPart in self.part:
+                thisPart.deleteMesh()
+            self.scaleSeedSize(meshTarget, partFactor)
+            self.generatePartMesh()
+            ## prediction of the status ==>> seeds of the new mesh
+            self.meshPrediction = self.getMeshPrediction()
+            self.couponData.update({'Element_Number_Predicted':dict([(thisKey, thisValue['Element_Number']) for thisKey, thisValue in self.meshPrediction.items()])})
+            actualNumber = dict([('Part_'+str(i+1), getActualNumber(self.part[i])) for i in range(len(self.part))])
+            isRemeshed = True
+        totalNumber = sum(actualNumber.values())
+        isMet = abs(totalNumber/targetNumber-1.0)<=self.meshTargetTolerance
+        self.couponData['Element_Size_Scale'].update({'Actual_Number':totalNumber, 'Remeshed':isRemeshed, 'Met':isMet})
+        if not isMet:
+            print('WARNING! Mesh of %s misses the mesh target: %d generated against %d (tolerance %d%%).' % (self.couponName, totalNumber, targetNumber,
+                  int(round(100*self.meshTargetTolerance))))
+    def getEdgeSeedNumber(self, part, edgeCache, thisEdge, globalSize):
+        ## method to return length, element number and main direction (0, 1, 2 or None for a closed edge) of an edge from
+        ## its seeds, or from the global seed of the part
+        edgeData = self.getEdgeData(part, edgeCache, thisEdge)
+        try:
+            elemNumber = part.getEdgeSeeds(thisEdge, attribute=NUMBER)
+        except:
+            elemNumber = None
+        if not elemNumber:
+            elemNumber = max(1, int(math.ceil(edgeData['Length']/globalSize)))
+        edgeDirection = None
+        if len(edgeData['Coords']) == 2:
+            chord = [abs(edgeData['Coords'][1][k]-edgeData['Coords'][0][k]) for k in range(3)]
+            if max(chord) > 1.0e-6*edgeData['Length']:
+                edgeDirection = chord.index(max(chord))
+        return edgeData['Length'], elemNumber, edgeDirection
+    def checkMeshBudget(self):
+        ## method to predict the mesh and to check the predicted element number of all parts against meshBudget; the
+        ## prediction is written to the coupon data next to the element number of the mesh
+        self.meshPrediction = self.getMeshPrediction()
+        self.couponData.update({'Element_Number_Predicted':dict([(thisKey, thisValue['Element_Number']) for thisKey, thisValue in self.meshPrediction.items()])})
+        predictedNumber = sum([thisValue['Element_Number'] for thisValue in self.meshPrediction.values()])
+        isCalibrated = 'Mesh_Prediction_Factor' in self.couponData
+        self.meshBudgetStatus = {'Budget':self.meshBudget, 'Action':self.meshBudgetAction, 'Predicted_Element_Number':predictedNumber,
+                                 'Exceeded':self.meshBudget > 0 and predictedNumber > self.meshBudget, 'Calibrated':isCalibrated}
+        if self.meshBudgetStatus['Exceeded']:
+            message = 'Mesh budget exceeded: %d elements predicted, budget is %d elements.' % (predictedNumber, self.meshBudget)
+            if self.meshBudgetAction == 'ABORT':
+                raise Exception(message)
+            print('WARNING! '+message)
+    def getInputHash(self, couponData):
+        ## method to return hash of every input section listed in stageInputs
+        inputHash = dict()
+        for thisInputs in self.stageInputs.values():
+            for thisInput in thisInputs:
+                if thisInput=='Material.Name':
+                    inputValue = sorted([thisMatData['Name'] for thisMatData in couponData['Material'].values()])
+                elif '.' in thisInput:
+                    inputValue = couponData[thisInput.split('.')[0]][thisInput.split('.')[1]]
+                elif thisInput in couponData:
+                    inputValue = couponData[thisInput]
+                else:
+                    continue
+                inputHash[thisInput] = hashlib.sha1(json.dumps(inputValue, sort_keys=True).encode('utf-8')).hexdigest()
+        return inputHash
+    def getIncrementalBase(self):
+        ## method to return the data of an existing model in the current folder which differs from this coupon only
+        ## in inputs of the stages listed in inpStages
+        for thisFileName in sorted(os.listdir('.')):
+            if not (thisFileName.startswith(self.couponName+'_Data') and thisFileName.endswith('.json')):
+                continue
+            try:
+                thisFile = open(thisFileName, 'r')
+                baseData = json.load(thisFile)
+                thisFile.close()
+            except Exception:
+                continue
+            if 'Input_Hash' not in baseData or baseData.get('Coupon_Name')!=self.couponName:
+                continue
+            isRewritable = True
+            for thisInput, thisHash in self.couponData['Input_Hash'].items():
+                if baseData['Input_Hash'].get(thisInput)==thisHash:
+                    continue
+                for thisStage, thisInputs in self.stageInputs.items():
+                    if thisInput in thisInputs and thisStage not in self.inpStages:
+                        isRewritable = False
+                ## load magnitudes are scaled, hence a model with zero load cannot be reused
+                if thisInput=='Step.Load' and baseData['Step']['Load']==0:
+                    isRewritable = False
+            baseVersion = baseData['Version'] if baseData['Version']=='' else '_'+baseData['Version']
+            baseInpFolderName = self.couponName+'_InpFolder'+baseVersion
+            baseStore = self.getInpStore(baseInpFolderName, baseVersion)
+            for thisInpName in ['Parts', 'Materials', 'Step']:
+                if not os.path.exists(self.getInpSourceName(baseInpFolderName+'/'+self.couponName+'_'+thisInpName+baseVersion+'.inp', baseStore)):
+                    isRewritable = False
+            if isRewritable and os.path.exists(self.couponName+'_Job'+baseVersion+'.inp'):
+                return baseData
+        return None
+    def createIncrementalJob(self):
+        ## method to create the inp files from an existing model in the current folder without abaqus cae, when only
+        ## material, step or load data changed; returns False when the model has to be created in abaqus cae
+        baseData = self.getIncrementalBase()
+        if baseData is None:
+            return False
+        baseVersion = baseData['Version'] if baseData['Version']=='' else '_'+baseData['Version']
+        baseInpFolderName = self.couponName+'_InpFolder'+baseVersion
+        inpFolderName = self.couponName+'_InpFolder'+self.version
+        if not os.path.isdir(inpFolderName):
+            os.mkdir(inpFolderName)
+        baseStore = self.getInpStore(baseInpFolderName, baseVersion)
+        if inpFolderName!=baseInpFolderName:
+            self.removeInpStoreLinks(inpFolderName)
+            self.removeCompressedInpFiles(inpFolderName)
+        loadFactor = float(self.stepLoad)/baseData['Step']['Load']
+        ## job file ==>> include and job names of the new version
+        fileTemp = open(self.couponName+'_Job'+baseVersion+'.inp', 'r')
+        jobLines = self.restoreIncludeLines(fileTemp.readlines(), baseStore)
+        fileTemp.close()
+        jobFile = open(self.couponName+'_Job'+self.version+'.inp', 'w')
+        for thisLine in jobLines:
+            if thisLine.startswith('*Include') or thisLine.startswith('**'):
+                thisLine = thisLine.replace(baseInpFolderName+'/', inpFolderName+'/')
+                for thisInpName in ['Job', 'Parts', 'Materials', 'Step']:
+                    thisLine = thisLine.replace(self.couponName+'_'+thisInpName+baseVersion+'.inp', self.couponName+'_'+thisInpName+self.version+'.inp')
+                thisLine = thisLine.replace(self.couponName+'_Job'+baseVersion+' ', self.couponName+'_Job'+self.version+' ')
+            jobFile.write(thisLine)
+        jobFile.close()
+        ## parts file ==>> unchanged
+        baseFileName = baseInpFolderName+'/'+self.couponName+'_Parts'+baseVersion+'.inp'
+        newFileName = inpFolderName+'/'+self.couponName+'_Parts'+self.version+'.inp'
+        if baseFileName!=newFileName:
+            self.copyInpFile(baseFileName, newFileName, baseStore)
+            ## include files of the parts ==>> copied, include lines and index json renamed to the new version
+            baseIndexName = baseInpFolderName+'/'+self.couponName+'_Inp_Index'+baseVersion+'.json'
+            if os.path.exists(baseIndexName):
+                self.copyInpIndex(baseIndexName, inpFolderName+'/'+self.couponName+'_Inp_Index'+self.version+'.json', baseInpFolderName, baseVersion)
+        ## materials and step files
+        self.rewriteInpFile(self.getInpSourceName(baseInpFolderName+'/'+self.couponName+'_Materials'+baseVersion+'.inp', baseStore), 
+                            inpFolderName+'/'+self.couponName+'_Materials'+self.version+'.inp', self.rewriteMaterialLines)
+        self.rewriteInpFile(self.getInpSourceName(baseInpFolderName+'/'+self.couponName+'_Step'+baseVersion+'.inp', baseStore), 
+                            inpFolderName+'/'+self.couponName+'_Step'+self.version+'.inp', lambda inpLines: self.rewriteStepLines(inpLines, loadFactor))
+        ## geometry and json data of the model
+        baseFileName = self.couponName+'_Geom'+baseVersion+'.txt'
+        if os.path.exists(baseFileName) and baseFileName!=self.couponName+'_Geom'+self.version+'.txt':
+            shutil.copyfile(baseFileName, self.couponName+'_Geom'+self.version+'.txt')
+        for key, val in baseData.items():
+            if key not in self.couponData:
+                self.couponData[key] = val
+        for key, val in baseData['Step'].items():
+            if key not in self.couponData['Step']:
+                ## derived load quantities (e.g. End_Pressure) are linear in the load
+                self.couponData['Step'][key] = val*loadFactor
+        couponString = json.dumps(self.couponData, indent=4, sort_keys=True)
+        couponJson = open(self.couponName+'_Data'+self.version+'.json', 'w')
+        couponJson.write(couponString)
+        couponJson.close()
+        ## include files ==>> include store
+        if self.inpStorePath:
+            self.storeInpFiles()
+        return True
+    def copyInpIndex(self, baseIndexName, newIndexName, baseInpFolderName, baseVersion):
+        ## method to copy the include files of the parts listed in the index json of an existing model to the inp folder
+        ## of this version, and to write the parts file and the index json with the new file names
+        inpFolderName = self.couponName+'_InpFolder'+self.version
+        def getNewFileName(baseFileName):
+            fileName = baseFileName[len(baseInpFolderName+'/'):-len(baseVersion+'.inp')]
+            return inpFolderName+'/'+fileName+self.version+'.inp'
+        indexFile = open(baseIndexName, 'r')
+        inpIndex = json.load(indexFile)
+        indexFile.close()
+        baseStore = self.getInpStore(baseInpFolderName, baseVersion)
+        fileNames = dict()
+        for thisPartIndex in inpIndex['Parts'].values():
+            for thisCategoryIndex in thisPartIndex.values():
+                fileNames[thisCategoryIndex['File']] = getNewFileName(thisCategoryIndex['File'])
+                self.copyInpFile(thisCategoryIndex['File'], fileNames[thisCategoryIndex['File']], baseStore)
+                thisCategoryIndex['File'] = fileNames[thisCategoryIndex['File']]
+        def rewriteIncludeLines(inpLines):
+            inpLines = self.restoreIncludeLines(inpLines, baseStore)
+            for i in range(len(inpLines)):
+                if inpLines[i].startswith('*Include'):
+                    for baseFileName, newFileName in fileNames.items():
+                        inpLines[i] = inpLines[i].replace('./'+baseFileName, './'+newFileName)
+            return inpLines
+        inpIndex['Parts_File'] = getNewFileName(inpIndex['Parts_File'])
+        self.rewriteInpFile(inpIndex['Parts_File'], inpIndex['Parts_File'], rewriteIncludeLines)
+        indexFile = open(newIndexName, 'w')
+        indexFile.write(json.dumps(inpIndex, indent=4, sort_keys=True))
+        indexFile.close()
+    def rewriteInpFile(self, baseFileName, newFileName, rewriteLines):
+        fileTemp = open(baseFileName, 'r')
+        inpLines = fileTemp.readlines()
+        fileTemp.close()
+        ## a file linked to the include store is replaced, not written through the link
+        if os.path.exists(newFileName):
+            self.removeInpFile(newFileName)
+        inpFile = open(newFileName, 'w')
+        inpFile.writelines(rewriteLines(inpLines))
+        inpFile.close()
+    def rewriteMaterialLines(self, inpLines):
+        ## method to replace the data lines of *Density and *Elastic with the current material data
+        matData = dict()
+        for thisMatData in self.couponData['Material'].values():
+            matData[thisMatData['Name'].upper()] = thisMatData
+        thisMatName, thisKeyword = None, None
+        for i in range(len(inpLines)):
+            thisLine = inpLines[i]
+            if thisLine.startswith('**'):
+                continue
+            elif thisLine.startswith('*'):
+                thisKeyword = thisLine.split(',')[0].strip().upper()
+                if thisKeyword=='*MATERIAL':
+                    thisMatName = re.search('name=([^,\s]+)', thisLine, re.IGNORECASE).group(1).upper()
+            elif thisMatName in matData and thisKeyword=='*DENSITY':
+                inpLines[i] = ' '+self.getInpNumber(matData[thisMatName]['Density'])+',\n'
+                thisKeyword = None
+            elif thisMatName in matData and thisKeyword=='*ELASTIC':
+                inpLines[i] = ' '+self.getInpNumber(matData[thisMatName]['Youngs_Modulus'])+', '+self.getInpNumber(matData[thisMatName]['Poissons_Ratio'])+'\n'
+                thisKeyword = None
+        return inpLines
+    def rewriteStepLines(self, inpLines, loadFactor):
+        ## method to update nlgeom, initial increment and scale the load magnitudes of the step
+        nlgeom = 'YES' if self.couponData['Step']['NLGEOM']=='ON' else 'NO'
+        thisKeyword = None
+        for i in range(len(inpLines)):
+            thisLine = inpLines[i]
+            if thisLine.startswith('**'):
+                continue
+            elif thisLine.startswith('*'):
+                thisKeyword = thisLine.split(',')[0].strip().upper()
+                if thisKeyword=='*STEP':
+                    inpLines[i] = re.sub('nlgeom=\w+', 'nlgeom='+nlgeom, thisLine, flags=re.IGNORECASE)
+            elif thisKeyword=='*STATIC':
+                staticData = thisLine.split(',')
+                staticData[0] = self.getInpNumber(self.couponData['Step']['Initial_Increment'])
+                inpLines[i] = ', '.join([thisData.strip() for thisData in staticData])+'\n'
+                thisKeyword = None
+            elif thisKeyword in ['*DSLOAD', '*DLOAD', '*CLOAD'] and loadFactor!=1.0:
+                loadData = thisLine.rstrip('\n').split(',')
+                loadData[-1] = ' '+self.getInpNumber(float(loadData[-1])*loadFactor)
+                inpLines[i] = ','.join(loadData)+'\n'
+        return inpLines
+    def getInpNumber(self, value):
+        ## method to return number in the inp format of abaqus (e.g. 1. instead of 1.0)
+        numberString = repr(float(value))
+        if numberString.endswith('.0'):
+            numberString = numberString[:-1]
+        return numberString
     def createPartitionByDatumPlane(self, thisPart, thisCells, thisPlane, offsetDistance):
             self.datumPlane_ID = thisPart.DatumPlaneByPrincipalPlane(principalPlane=SymbolicConstant(thisPlane), offset=offsetDistance).id
             thisPart.PartitionCellByDatumPlane(datumPlane=thisPart.datums[self.datumPlane_ID], cells=thisCells)
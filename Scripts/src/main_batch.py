@@ -0,0 +1,57 @@
+#################################################################################################################
+###################                 ABAQUS PARAMETRIC COUPON MODEL                     ##########################
+#################################################################################################################
+#######################################    DRIVER SCRIPT : FOR BATCH    #########################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## USER MAY NEED TO MODIFY abqPath, batchFileName AND savePath; RUN THE SCRIPT OUTSIDE ABAQUS
+#################################################################################################################
+
+import os, sys
+
+abqPath = [r'C:/SIMULIA/Commands']
+abqCommand = 'abaqus'
+
+srcPath = os.getcwd()
+
+## batch file ==>> coupon database file or json file with [template, coupon] pairs under the key 'Coupons'
+batchFileName = srcPath+'/db/coupon_03_fatigue_70_73_a.json'
+savePath = os.getcwd()
+
+## number of concurrent abaqus sessions; None ==>> number of available cores
+numWorkers = None
+licenseCap = 4
+
+## failed coupons are retried up to maxAttempts times when the script is run again; delete Batch_Manifest*.jsonl
+## in the save path to create all coupons again
+maxAttempts = 3
+
+## spool folder of the persistent abaqus worker; coupons are submitted to the worker when it is running
+spoolPath = srcPath+'/spool'
+
+## model cache folder (may be on a shared drive); set to None to always call abaqus
+cachePath = srcPath+'/cache'
+
+## create coupons
+exec(open(srcPath+'/util/coupon_data.py').read())
+exec(open(srcPath+'/util/spool.py').read())
+exec(open(srcPath+'/util/cache.py').read())
+exec(open(srcPath+'/lib/coupon_generic.py').read())
+exec(open(srcPath+'/util/incremental.py').read())
+exec(open(srcPath+'/util/manifest.py').read())
+exec(open(srcPath+'/util/batch.py').read())
+batchClass = getattr(sys.modules[__name__], 'batch')
+cacheClass = getattr(sys.modules[__name__], 'cache')
+modelCache = cacheClass(cachePath, srcPath) if cachePath is not None else None
+newBatch = batchClass(srcPath, savePath, abqPath=abqPath, abqCommand=abqCommand, numWorkers=numWorkers, licenseCap=licenseCap, spoolPath=spoolPath, modelCache=modelCache, maxAttempts=maxAttempts)
+statusList = newBatch.run(getBatchList(srcPath, batchFileName))
+for thisStatus in statusList:
+    print(thisStatus['Status']+'\t'+thisStatus['Coupon']+'\t'+thisStatus['Message'])
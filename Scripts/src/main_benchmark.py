@@ -0,0 +1,241 @@
+#################################################################################################################
+###################                 ABAQUS PARAMETRIC COUPON MODEL                     ##########################
+#################################################################################################################
+#####################################    DRIVER SCRIPT : FOR HELPER BENCHMARK    ################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## MICRO-BENCHMARK OF THE GEOMETRY HELPERS OF coupon_generic ON PARTS WITH THOUSANDS OF EDGES AND FACES, RUN WITH THE
+## HEADLESS ABAQUS STAND-IN (stub FOLDER); USER MAY NEED TO MODIFY numSides AND meshSize
+## THE PART IS THE EXTRUSION OF A ZIG-ZAG RING WITH numSides SIDES (3*numSides EDGES, numSides+2 FACES)
+## THE BOUNDING BOX, CYLINDER AND SPHERE QUERIES OF THE SPATIAL INDEX ARE COMPARED WITH THE NATIVE QUERIES ON THE
+## MESHED PART WITH THE FIRST ENTRY OF numSides
+## THE INP FILE SPLITTER IS TIMED IN BLOCK AND MMAP MODE ON SYNTHETIC JOB INP FILES OF inpSizeMB MEGABYTES; THE PREVIOUS
+## LINE BY LINE SPLITTER IS RUN AND COMPARED BYTE BY BYTE FOR FILES UP TO inpSizeByLine MEGABYTES
+#################################################################################################################
+
+import os, sys, re, math, time, shutil, filecmp, tempfile
+
+srcPath = os.getcwd()
+
+## number of sides of the extruded profile for every benchmark part
+numSides = [250, 500, 1000, 2000]
+## repetitions of every timed call, the best time is reported
+numRepeat = 3
+## global seed of the meshed part and tolerance of the query windows
+meshSize = 0.5
+queryTol = 1.0e-3
+## size of the synthetic job inp files in megabytes
+inpSizeMB = [64, 2048]
+inpSizeByLine = 256
+
+sys.path.insert(0, srcPath+'/stub')
+from abaqus import *
+from abaqusConstants import *
+from caeModules import *
+exec(open(srcPath+'/lib/coupon_generic.py').read())
+
+def createBenchmarkPart(sides):
+    ## zig-zag ring between the radii 18 and 20, extruded by 5
+    thisModel = mdb.Model(name='Benchmark_'+str(sides))
+    thisSketch = thisModel.ConstrainedSketch(name='Profile', sheetSize=200.0)
+    vertices = []
+    for i in range(sides):
+        radius = 18.0 if i%2==0 else 20.0
+        vertices.append((radius*math.cos(2*math.pi*i/sides), radius*math.sin(2*math.pi*i/sides)))
+    for i in range(sides):
+        thisSketch.Line(point1=vertices[i], point2=vertices[(i+1)%sides])
+    thisPart = thisModel.Part(name='Part', dimensionality=THREE_D, type=DEFORMABLE_BODY)
+    thisPart.BaseSolidExtrude(sketch=thisSketch, depth=5.0)
+    return thisPart
+
+def getByDifferenceByItem(listA, listB):
+    ## previous implementation of coupon_generic.getByDifference, for comparison
+    differenceList = []
+    for thisItem in listA:
+        if thisItem not in listB:
+            differenceList.append(thisItem)
+    return differenceList
+
+def inpFileSplitterByLine(coupon):
+    ## previous implementation of coupon_generic.inpFileSplitter, for comparison
+    dictFileID = {0:'Job', 
+                  1:'Parts', 
+                  2:'Materials', 
+                  3:'Step'}
+    eliminationList = ['** ASSEMBLY','** INTERACTION PROPERTIES', '** INTERACTIONS']
+    oldJobFileName = coupon.job.name+'.inp'
+    newJobFileName = coupon.couponName+'_Job_Temp'+coupon.version+'.inp'
+    os.rename(oldJobFileName, newJobFileName)
+    fileTemp = open(newJobFileName, 'r')
+    InpFolderName = coupon.couponName+'_InpFolder'+coupon.version
+    try:
+        os.mkdir(InpFolderName)
+    except:
+        pass
+    file = len(dictFileID)*[None] 
+    for key, val in dictFileID.items():
+        if key==0:
+            file[key] = open(coupon.couponName+'_'+val+coupon.version+'.inp', 'w')
+        else:
+            file[key] = open(InpFolderName+'/'+coupon.couponName+'_'+val+coupon.version+'.inp', 'w')
+    prevFile = 0
+    currentFile = 0
+    lineCount = len(dictFileID)*[0]
+    for thisLine in fileTemp:
+        lineCount[currentFile] = lineCount[currentFile]+1
+        for key in range(len(file)):
+            if re.search("^\\*\\*.*"+dictFileID[key], thisLine.title()):
+                prevFile = currentFile
+                currentFile = key
+                break
+            elif thisLine.rstrip('\n') in eliminationList:
+                prevFile = currentFile
+                currentFile = 0
+        if currentFile!=0 and prevFile!=currentFile and lineCount[currentFile]==0:
+            file[0].write(thisLine)
+            file[0].write('*Include, input = ./'+file[currentFile].name+'\n')
+            lineCount[0] = lineCount[0]+1
+        else:
+            file[currentFile].write(thisLine)
+    fileTemp.close()
+    for i in range(len(file)):
+        file[i].close()
+    if os.path.exists(newJobFileName):
+            os.remove(newJobFileName)
+
+def createSyntheticInp(fileName, sizeMB):
+    ## job inp file with the layout of abaqus ==>> parts with node and element blocks filling sizeMB, assembly,
+    ## materials and step
+    inpFile = open(fileName, 'w')
+    inpFile.write('*Heading\n** Job name: Benchmark_Job Model name: Benchmark_Model\n*Preprint, echo=NO, model=NO, history=NO, contact=NO\n**\n** PARTS\n**\n')
+    blockNodes = 20000
+    nodeBlock = ''.join(['%7d, %12.7f, %12.7f, %12.7f\n' % (i+1, 0.1*(i%97), 0.2*(i%89), 0.3*(i%83)) for i in range(blockNodes)])
+    elemBlock = ''.join(['%d, %d, %d, %d, %d, %d, %d, %d, %d\n' % tuple([i+1]+[(i+k)%blockNodes+1 for k in range(8)]) for i in range(blockNodes)])
+    partSize = 0
+    partID = 0
+    while partSize<sizeMB*1024*1024:
+        partID = partID+1
+        inpFile.write('*Part, name=Benchmark_Part_%d\n*Node\n' % partID)
+        inpFile.write(nodeBlock)
+        inpFile.write('*Element, type=C3D8R\n')
+        inpFile.write(elemBlock)
+        inpFile.write('*Nset, nset=Nset_All_Part_%d, generate\n 1, %d, 1\n** Section: Benchmark_Section\n*Solid Section, elset=Elset_All_Part_%d, material=Aluminum\n,\n*End Part\n**  \n' % (partID, blockNodes, partID))
+        partSize = partSize+len(nodeBlock)+len(elemBlock)
+    inpFile.write('**\n** ASSEMBLY\n**\n*Assembly, name=Assembly\n**  \n')
+    for i in range(partID):
+        inpFile.write('*Instance, name=Benchmark_Instance_%d, part=Benchmark_Part_%d\n*End Instance\n**  \n' % (i+1, i+1))
+    inpFile.write('*End Assembly\n** \n** MATERIALS\n** \n*Material, name=Aluminum\n*Density\n 2.7e-09,\n*Elastic\n70000., 0.33\n')
+    inpFile.write('** ----------------------------------------------------------------\n** \n** STEP: Load\n** \n*Step, name=Load, nlgeom=NO\n*Static\n1., 1., 0.0001, 1.\n*End Step\n')
+    inpFile.close()
+
+def getBestTime(method, *args):
+    bestTime = None
+    for i in range(numRepeat):
+        startTime = time.time()
+        result = method(*args)
+        thisTime = time.time()-startTime
+        bestTime = thisTime if bestTime is None else min(bestTime, thisTime)
+    return bestTime, result
+
+def getQueryTime(queries):
+    ## total time of a list of queries (method, arguments) and their results
+    startTime = time.time()
+    results = [thisMethod(*thisArgs) for thisMethod, thisArgs in queries]
+    return time.time()-startTime, results
+
+def getQueryKeys(results):
+    return [sorted([getattr(thisItem, 'index', None) if hasattr(thisItem, 'index') else thisItem.label for thisItem in thisResult]) for thisResult in results]
+
+## benchmark ==>> set difference
+thisCoupon = coupon_generic.__new__(coupon_generic)
+thisCoupon.spatialIndex = dict()
+print('%-8s%-8s%-8s%-8s%14s%14s%14s' % ('Sides', 'Kind', 'A', 'B', 'By item [s]', 'By index [s]', 'Cylinder [s]'))
+for thisSides in numSides:
+    thisPart = createBenchmarkPart(thisSides)
+    for thisKind in ['edges', 'faces']:
+        thisArray = getattr(thisPart, thisKind)
+        listA = thisArray.getByBoundingBox()
+        listB = thisArray.getByBoundingBox(xMax=0.0)
+        timeByItem, resultByItem = getBestTime(getByDifferenceByItem, listA, listB)
+        timeByIndex, resultByIndex = getBestTime(thisCoupon.getByDifference, listA, listB)
+        if [thisItem.index for thisItem in resultByItem]!=[thisItem.index for thisItem in resultByIndex]:
+            raise Exception('Benchmark failed: getByDifference differs from the previous implementation.')
+        ## edges of the inner zig-zag corners ==>> inside radius 18.5, subtracted from all edges inside radius 21
+        timeCylinder, resultCylinder = getBestTime(thisCoupon.getByCylinderDifference, thisArray, (0, 0, -1.0), (0, 0, 6.0), 21.0, 18.5)
+        print('%-8d%-8s%-8d%-8d%14.4f%14.4f%14.4f' % (thisSides, thisKind, len(listA), len(listB), timeByItem, timeByIndex, timeCylinder))
+
+## benchmark ==>> spatial index against the native queries; queries of one kind share the index, which is built by the
+## first query and reported separately
+thisPart = createBenchmarkPart(numSides[0])
+thisPart.seedPart(size=meshSize, deviationFactor=0.1, minSizeFactor=0.1)
+thisPart.generateMesh()
+vertexPoints = [thisVertex.pointOn[0] for thisVertex in thisPart.vertices]
+print('')
+print('Meshed part with %d nodes, %d edges and %d faces' % (len(thisPart.nodes), len(thisPart.edges), len(thisPart.faces)))
+print('%-8s%-10s%-8s%14s%14s%14s' % ('Kind', 'Query', 'Number', 'Native [s]', 'Index [s]', 'Build [s]'))
+for thisKind in ['nodes', 'edges', 'faces']:
+    thisArray = getattr(thisPart, thisKind)
+    startTime = time.time()
+    thisCoupon.getSpatialIndex(thisPart, thisKind)
+    buildTime = time.time()-startTime
+    ## thin slabs as used for the boundary conditions, spheres at the vertices and cylinders over the end faces
+    queryBox = [dict(xMin=p[0]-queryTol, yMin=-21.0, zMin=-queryTol, xMax=p[0]+queryTol, yMax=21.0, zMax=5.0+queryTol) for p in vertexPoints]
+    querySphere = [(p, 5.0*queryTol) for p in vertexPoints]
+    queryCylinder = [((0, 0, z-queryTol), (0, 0, z+queryTol), 21.0) for z in [0.0, 5.0]]
+    for thisQuery, nativeQueries, indexQueries in [('Box', [(lambda q: thisArray.getByBoundingBox(**q), (q, )) for q in queryBox],
+                                                             [(lambda q: thisCoupon.getByBoundingBox(thisPart, thisKind, **q), (q, )) for q in queryBox]),
+                                                    ('Sphere', [(thisArray.getByBoundingSphere, q) for q in querySphere],
+                                                               [(lambda c, r: thisCoupon.getByBoundingSphere(thisPart, thisKind, c, r), q) for q in querySphere]),
+                                                    ('Cylinder', [(thisArray.getByBoundingCylinder, q) for q in queryCylinder],
+                                                                 [(lambda c1, c2, r: thisCoupon.getByBoundingCylinder(thisPart, thisKind, c1, c2, r), q) for q in queryCylinder])]:
+        nativeTime, nativeResults = getQueryTime(nativeQueries)
+        indexTime, indexResults = getQueryTime(indexQueries)
+        if getQueryKeys(nativeResults)!=getQueryKeys(indexResults):
+            raise Exception('Benchmark failed: spatial index query differs from the native query.')
+        print('%-8s%-10s%-8d%14.4f%14.4f%14.4f' % (thisKind, thisQuery, len(nativeQueries), nativeTime, indexTime, buildTime))
+
+## benchmark ==>> inp file splitter on synthetic job inp files
+print('')
+print('%-10s%16s%16s%16s%12s' % ('Size [MB]', 'By line [MB/s]', 'Block [MB/s]', 'Mmap [MB/s]', 'Identical'))
+inpPath = tempfile.mkdtemp()
+os.chdir(inpPath)
+thisCoupon.couponName = 'Benchmark'
+thisCoupon.version = ''
+thisCoupon.job = type('benchmarkJob', (object, ), {'name':'Benchmark_Job'})
+for thisSize in inpSizeMB:
+    createSyntheticInp('Benchmark_Source.inp', thisSize)
+    fileSize = os.path.getsize('Benchmark_Source.inp')/(1024.0*1024.0)
+    results = dict()
+    for thisMethod, thisFolder in [(lambda: inpFileSplitterByLine(thisCoupon), 'By_Line'), (thisCoupon.inpFileSplitter, 'Block'),
+                                   (thisCoupon.inpFileSplitterMmap, 'Mmap')]:
+        if thisFolder=='By_Line' and thisSize>inpSizeByLine:
+            continue
+        shutil.copyfile('Benchmark_Source.inp', 'Benchmark_Job.inp')
+        startTime = time.time()
+        thisMethod()
+        results[thisFolder] = fileSize/(time.time()-startTime)
+        os.mkdir(thisFolder)
+        os.rename('Benchmark_Job.inp', thisFolder+'/Benchmark_Job.inp')
+        os.rename('Benchmark_InpFolder', thisFolder+'/Benchmark_InpFolder')
+    for thisFolder in ['By_Line', 'Mmap']:
+        if thisFolder not in results:
+            continue
+        isIdentical = all([filecmp.cmp(thisFolder+'/'+thisName, 'Block/'+thisName, shallow=False) for thisName in ['Benchmark_Job.inp']+
+                           ['Benchmark_InpFolder/Benchmark_'+thisID+'.inp' for thisID in ['Parts', 'Materials', 'Step']]])
+        if not isIdentical:
+            raise Exception('Benchmark failed: inpFileSplitter differs from the '+thisFolder+' implementation.')
+    print('%-10d%16s%16.1f%16.1f%12s' % (thisSize, '%.1f' % results['By_Line'] if 'By_Line' in results else '-', results['Block'], results['Mmap'], 'yes'))
+    for thisFolder in ['By_Line', 'Block', 'Mmap']:
+        if os.path.isdir(thisFolder):
+            shutil.rmtree(thisFolder)
+    os.remove('Benchmark_Source.inp')
+os.chdir(srcPath)
+shutil.rmtree(inpPath)
@@ -21,8 +21,19 @@ abqPath = [r'C:/SIMULIA/Commands']
 
 srcPath = os.getcwd()
 
+## spool folder of the persistent abaqus worker; models are submitted to the worker when it is running
+spoolPath = srcPath+'/spool'
+
+## model cache folder (may be on a shared drive); set to None to always call abaqus
+cachePath = srcPath+'/cache'
+
 ## create gui window
+exec(open(srcPath+'/util/coupon_data.py').read())
+exec(open(srcPath+'/util/spool.py').read())
+exec(open(srcPath+'/util/cache.py').read())
+exec(open(srcPath+'/lib/coupon_generic.py').read())
+exec(open(srcPath+'/util/incremental.py').read())
 exec(open(srcPath+'/util/gui.py').read())
 guiClass = getattr(sys.modules[__name__], 'gui')
-newGUI = guiClass(abqPath, srcPath)
+newGUI = guiClass(abqPath, srcPath, spoolPath, cachePath)
 
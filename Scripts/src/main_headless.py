@@ -0,0 +1,110 @@
+#################################################################################################################
+###################                 ABAQUS PARAMETRIC COUPON MODEL                     ##########################
+#################################################################################################################
+#####################################    DRIVER SCRIPT : FOR HEADLESS RUN    ####################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## RUNS THE TEMPLATES WITH THE HEADLESS ABAQUS STAND-IN (stub FOLDER) IN THIS PYTHON PROCESS AND PRINTS THE STAGE
+## TIMES; USER MAY NEED TO MODIFY batchFileName AND savePath; GEOMETRY AND MESH ARE APPROXIMATE, SEE stub/stub_part.py
+#################################################################################################################
+
+import os, sys, json
+
+srcPath = os.getcwd()
+
+## batch file ==>> coupon database file or json file with [template, coupon] pairs under the key 'Coupons'
+batchFileName = srcPath+'/db/coupon_03_fatigue_70_73_a.json'
+savePath = srcPath+'/headless'
+
+## check of the incremental rebuild on the host ==>> every created coupon is rebuilt with twice the load as version
+## <version>Host, with coupon_generic loaded without the abaqus stand-in as in the gui, batch and sweep scripts
+checkIncremental = True
+
+## check of the mesh prediction ==>> for every part, the predicted element number of the cells with four edges along each
+## of x, y and z is compared with the element number of a structured mesh of their seeds, within a factor of
+## predictionTolerance; the mesh of the stand-in follows the seeds only below ABAQUS_STUB_MAX_ELEMENTS and is printed
+## for information
+checkPrediction = True
+predictionTolerance = 2.0
+
+def getPredictionCheck(thisCoupon):
+    ## method to return number of cells, number of structured cells, predicted and structured element number of the
+    ## structured cells for every part; the structured element number of a cell is the product of the mean element
+    ## numbers of its edges along x, y and z
+    checkList = []
+    for i in range(len(thisCoupon.part)):
+        thisPart = thisCoupon.part[i]
+        edgeCache, edgeSeeds = thisCoupon.getEdgeCache(thisPart), dict()
+        numStructured, predictedNumber, structuredNumber = 0, 0.0, 0.0
+        for thisCell in thisPart.cells:
+            cellElements = thisCoupon.getCellElementNumber(thisPart, edgeCache, edgeSeeds, thisCell, thisCoupon.partSeedSize[i])
+            directionNumbers = [[], [], []]
+            for thisEdgeID in thisCell.getEdges():
+                edgeLength, elemNumber, edgeDirection = edgeSeeds[thisEdgeID]
+                if edgeDirection is None:
+                    directionNumbers = None
+                    break
+                directionNumbers[edgeDirection].append(elemNumber)
+            if directionNumbers is None or [len(thisNumbers) for thisNumbers in directionNumbers]!=[4, 4, 4]:
+                continue
+            numStructured = numStructured+1
+            predictedNumber = predictedNumber+cellElements
+            structuredNumber = structuredNumber+(sum(directionNumbers[0])/4.0)*(sum(directionNumbers[1])/4.0)*(sum(directionNumbers[2])/4.0)
+        checkList.append((len(thisPart.cells), numStructured, predictedNumber, structuredNumber))
+    return checkList
+
+## create coupons
+sys.path.insert(0, srcPath+'/stub')
+import abaqus_cli
+abaqus_cli.installExecfile()
+exec(open(srcPath+'/util/coupon_data.py').read())
+exec(open(srcPath+'/util/coupon_runner.py').read())
+if not os.path.isdir(savePath):
+    os.mkdir(savePath)
+for thisEntry in getBatchList(srcPath, batchFileName):
+    thisCoupon, thisStatus = buildCoupon(srcPath, thisEntry['Template'], thisEntry['Coupon_Data'], savePath)
+    print(thisStatus['Status']+'\t'+thisStatus['Coupon']+'\t'+thisStatus['Message'])
+    statusFile = open(savePath+'/'+thisEntry['Coupon_Data']['Coupon_Name']+'_Status'+getVersionSuffix(thisEntry['Coupon_Data'])+'.json', 'r')
+    statusData = json.loads(statusFile.read())
+    statusFile.close()
+    for thisStage in statusData['Stages']:
+        print('\t%-20s%-10s%10.3f s' % (thisStage['Stage'], thisStage['Status'], thisStage['Wall_Time']))
+    if statusData['Traceback']:
+        print(statusData['Traceback'])
+    ## mesh prediction against the structured cells and the mesh of the stand-in
+    if checkPrediction and thisStatus['Status']=='SUCCESS':
+        checkList = getPredictionCheck(thisCoupon)
+        meshPrediction = thisCoupon.getMeshPrediction()
+        for i in range(len(checkList)):
+            numCells, numStructured, predictedNumber, structuredNumber = checkList[i]
+            meshText = 'part predicted %d elements, stand-in mesh %d elements%s' % (meshPrediction['Part_'+str(i+1)]['Element_Number'], len(thisCoupon.part[i].elements),
+                                                                                    ' (capped)' if thisCoupon.part[i].meshCapped else '')
+            if numStructured==0:
+                print('SKIPPED\t%s\tPart_%d: no structured cell, %s' % (thisStatus['Coupon'], i+1, meshText))
+                continue
+            predictionRatio = predictedNumber/structuredNumber
+            isPredicted = 1.0/predictionTolerance<=predictionRatio<=predictionTolerance
+            print('%s\t%s\tPart_%d: %d of %d cells structured, predicted %d against %d elements (ratio %.2f), %s' % ('SUCCESS' if isPredicted else 'FAILED', thisStatus['Coupon'], i+1,
+                  numStructured, numCells, predictedNumber, structuredNumber, predictionRatio, meshText))
+    resetModelDatabase()
+
+## incremental rebuild on the host
+if checkIncremental:
+    hostScope = {'__name__':'host'}
+    exec(open(srcPath+'/util/coupon_data.py').read(), hostScope)
+    exec(open(srcPath+'/lib/coupon_generic.py').read(), hostScope)
+    exec(open(srcPath+'/util/incremental.py').read(), hostScope)
+    for thisEntry in getBatchList(srcPath, batchFileName):
+        couponData = json.loads(json.dumps(thisEntry['Coupon_Data']))
+        couponData['Version'] = couponData['Version']+'Host'
+        couponData['Step']['Load'] = 2*couponData['Step']['Load']
+        isRebuilt = hostScope['rebuildIncremental'](couponData, savePath)
+        print(('SUCCESS' if isRebuilt else 'FAILED')+'\t'+couponData['Coupon_Name']+'\tIncremental rebuild on the host')
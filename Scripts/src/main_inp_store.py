@@ -0,0 +1,40 @@
+#################################################################################################################
+###################                 ABAQUS PARAMETRIC COUPON MODEL                     ##########################
+#################################################################################################################
+##############################    DRIVER SCRIPT : FOR INCLUDE STORE CLEAN-UP    #################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## REMOVES THE FILES OF THE INCLUDE STORE (COUPON_INP_STORE) WHICH NO INP FOLDER USES ANY MORE; USER MAY NEED TO
+## MODIFY storePath AND savePaths; RUN THE SCRIPT OUTSIDE ABAQUS
+#################################################################################################################
+
+import os, sys
+
+srcPath = os.getcwd()
+
+## include store folder
+storePath = os.environ.get('COUPON_INP_STORE') or srcPath+'/inp_store'
+
+## folders searched for inp folders referring to the store (including the model cache); hardlinked files are kept
+## wherever they are
+savePaths = [os.getcwd(),
+             srcPath+'/cache']
+
+## stored files written or referred to less than tempAge days ago are kept
+tempAge = 1.0
+
+## remove unreferenced files
+exec(open(srcPath+'/util/inp_store.py').read())
+inpStoreClass = getattr(sys.modules[__name__], 'inpStore')
+thisStore = inpStoreClass(storePath, tempAge)
+removedNumber, removedSize = thisStore.collect(savePaths)
+storedNumber, storedSize = thisStore.getSize()
+print('Removed %d files (%.1f MB), %d files (%.1f MB) left in %s' % (removedNumber, removedSize/1024.0**2, storedNumber, storedSize/1024.0**2, storePath))
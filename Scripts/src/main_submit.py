@@ -0,0 +1,42 @@
+#################################################################################################################
+###################                 ABAQUS PARAMETRIC COUPON MODEL                     ##########################
+#################################################################################################################
+####################################    DRIVER SCRIPT : FOR JOB SUBMISSION    ###################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## SUBMITS THE JOB INP FILES IN savePath ONE AFTER THE OTHER, COMPRESSED INCLUDE FILES ARE RESTORED BEFORE EVERY JOB;
+## USER MAY NEED TO MODIFY abqPath, savePath AND jobFileNames; RUN THE SCRIPT OUTSIDE ABAQUS
+#################################################################################################################
+
+import os, sys
+
+abqPath = [r'C:/SIMULIA/Commands']
+abqCommand = 'abaqus'
+
+srcPath = os.getcwd()
+
+## folder of the models and job inp files to submit; all job inp files of the folder when jobFileNames is None
+savePath = os.getcwd()
+jobFileNames = None
+
+## number of cpus of every job; restored include files are removed after the analysis unless keepInp is True
+numCpus = 2
+keepInp = False
+
+## submit jobs
+exec(open(srcPath+'/util/job_launcher.py').read())
+jobLauncherClass = getattr(sys.modules[__name__], 'jobLauncher')
+thisLauncher = jobLauncherClass(abqPath=abqPath, abqCommand=abqCommand, numCpus=numCpus, keepInp=keepInp)
+if jobFileNames is None:
+    jobFileNames = sorted([savePath+'/'+thisName for thisName in os.listdir(savePath) if '_Job' in thisName and thisName.endswith('.inp')])
+for thisJobFileName in jobFileNames:
+    returnCode = thisLauncher.submit(thisJobFileName)
+    print(('SUCCESS' if returnCode==0 else 'FAILED')+'\t'+os.path.basename(thisJobFileName))
@@ -0,0 +1,66 @@
+#################################################################################################################
+###################                 ABAQUS PARAMETRIC COUPON MODEL                     ##########################
+#################################################################################################################
+#######################################    DRIVER SCRIPT : FOR SWEEP    #########################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## USER MAY NEED TO MODIFY abqPath, sweepFileName AND savePath; RUN THE SCRIPT OUTSIDE ABAQUS
+#################################################################################################################
+
+import os, sys, json
+
+abqPath = [r'C:/SIMULIA/Commands']
+abqCommand = 'abaqus'
+
+srcPath = os.getcwd()
+
+## sweep file ==>> base coupon, design type and parameter ranges/distributions (see util/sweep.py)
+sweepFileName = srcPath+'/db/sweep_coupon_03_fatigue_70_73_a.json'
+savePath = os.getcwd()
+
+## number of concurrent abaqus sessions; None ==>> number of available cores
+numWorkers = None
+licenseCap = 4
+
+## failed coupons are retried up to maxAttempts times when the script is run again; delete Batch_Manifest*.jsonl
+## in the save path to create all coupons again
+maxAttempts = 3
+
+## spool folder of the persistent abaqus worker; coupons are submitted to the worker when it is running
+spoolPath = srcPath+'/spool'
+
+## model cache folder (may be on a shared drive); set to None to always call abaqus
+cachePath = srcPath+'/cache'
+
+## create coupons
+exec(open(srcPath+'/util/coupon_data.py').read())
+exec(open(srcPath+'/util/spool.py').read())
+exec(open(srcPath+'/util/cache.py').read())
+exec(open(srcPath+'/lib/coupon_generic.py').read())
+exec(open(srcPath+'/util/incremental.py').read())
+exec(open(srcPath+'/util/manifest.py').read())
+exec(open(srcPath+'/util/batch.py').read())
+exec(open(srcPath+'/util/sweep.py').read())
+batchClass = getattr(sys.modules[__name__], 'batch')
+cacheClass = getattr(sys.modules[__name__], 'cache')
+modelCache = cacheClass(cachePath, srcPath) if cachePath is not None else None
+newBatch = batchClass(srcPath, savePath, abqPath=abqPath, abqCommand=abqCommand, numWorkers=numWorkers, licenseCap=licenseCap, spoolPath=spoolPath, modelCache=modelCache, maxAttempts=maxAttempts)
+sweepList = getSweepList(srcPath, sweepFileName)
+statusList = newBatch.run(sweepList)
+## design table ==>> version, design points and status of every created coupon
+sweepTable = []
+for thisEntry, thisStatus in newBatch.matchStatus(sweepList, statusList):
+    sweepTable.append({'Version':thisEntry['Coupon_Data']['Version'], 'Design_Points':thisEntry['Design_Points'],
+                       'Status':thisStatus['Status'], 'Save_Path':thisStatus['Save_Path']})
+    print(thisStatus['Status']+'\t'+thisStatus['Coupon']+'\t'+thisEntry['Coupon_Data']['Version']+'\t'+str(thisEntry['Design_Points'][0]))
+sweepFile = open(savePath+'/Sweep_Design.json', 'w')
+sweepFile.write(json.dumps(sweepTable, indent=4, sort_keys=True))
+sweepFile.close()
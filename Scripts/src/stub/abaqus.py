@@ -0,0 +1,69 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+################################    HEADLESS ABAQUS STAND-IN : ABAQUS MODULE    #################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## MODEL DATABASE mdb AND SESSION OBJECTS; Mdb() CLEARS THE DATABASE IN PLACE SO THAT from abaqus import * KEEPS
+## WORKING ACROSS COUPONS OF ONE SESSION
+#################################################################################################################
+
+
+import os
+from abaqusConstants import *
+from stub_model import Model, Job
+from stub_part import repository
+
+class modelDatabase(object):
+    def __init__(self):
+        self.models = repository()
+        self.jobs = repository()
+        self.reset()
+    def reset(self):
+        self.models.clear()
+        self.jobs.clear()
+        self.models['Model-1'] = Model('Model-1')
+    def Model(self, name, **kwargs):
+        thisModel = Model(name, **kwargs)
+        self.models[name] = thisModel
+        return thisModel
+    def Job(self, name, model, **kwargs):
+        thisModel = self.models[model] if isinstance(model, str) else model
+        thisJob = Job(name, thisModel, **kwargs)
+        self.jobs[name] = thisJob
+        return thisJob
+    def saveAs(self, pathName):
+        ## placeholder cae and journal files, the model itself is only written to the inp file
+        pathName = pathName if pathName.endswith('.cae') else pathName+'.cae'
+        for thisFileName, thisText in [(pathName, 'headless abaqus stand-in: '+', '.join(sorted(self.models.keys()))+'\n'),
+                                       (pathName[:-4]+'.jnl', '# headless abaqus stand-in\n')]:
+            thisFile = open(thisFileName, 'w')
+            thisFile.write(thisText)
+            thisFile.close()
+
+class optionStore(object):
+    def __init__(self):
+        self.options = dict()
+    def setValues(self, **kwargs):
+        self.options.update(kwargs)
+
+class sessionObject(object):
+    def __init__(self):
+        self.currentViewportName = 'Viewport: 1'
+        self.viewports = {self.currentViewportName:optionStore()}
+        self.journalOptions = optionStore()
+
+mdb = modelDatabase()
+session = sessionObject()
+
+def Mdb():
+    mdb.reset()
+    return mdb
@@ -0,0 +1,55 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+###########################    HEADLESS ABAQUS STAND-IN : SYMBOLIC CONSTANTS    #################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## SYMBOLIC CONSTANTS COMPARE BY NAME, SO THAT SymbolicConstant('C3D8R')==C3D8R AS IN ABAQUS
+#################################################################################################################
+
+
+class SymbolicConstant(object):
+    def __init__(self, name):
+        self.name = str(name)
+    def __eq__(self, other):
+        if isinstance(other, SymbolicConstant):
+            return self.name==other.name
+        if isinstance(other, bool):
+            return self.name==('ON' if other else 'OFF')
+        return False
+    def __ne__(self, other):
+        return not self.__eq__(other)
+    def __hash__(self):
+        return hash(self.name)
+    def __bool__(self):
+        return self.name not in ['OFF', 'FALSE']
+    __nonzero__ = __bool__
+    def __str__(self):
+        return self.name
+    def __repr__(self):
+        return self.name
+
+constantNames = ['ON', 'OFF', 'TRUE', 'FALSE', 'UNSET', 'SET', 'DEFAULT', 'NONE',
+                 ## parts and sketches
+                 'THREE_D', 'TWO_D_PLANAR', 'AXISYMMETRIC', 'DEFORMABLE_BODY', 'STANDALONE', 'SUPERIMPOSE', 'CLOCKWISE', 'COUNTERCLOCKWISE',
+                 'XYPLANE', 'YZPLANE', 'XZPLANE', 'SIDE1', 'SIDE2', 'RIGHT', 'LEFT', 'TOP', 'BOTTOM', 'COPLANAR_EDGES', 'CENTER', 'MIDDLE',
+                 'FORWARD', 'REVERSE', 'CARTESIAN', 'COORDINATE', 'DELETE', 'SUPPRESS', 'GEOMETRY', 'MESH', 'BOTH',
+                 ## mesh
+                 'FINER', 'COARSER', 'FREE', 'SINGLE', 'DOUBLE', 'BIAS_RATIO', 'NUMBER', 'HEX', 'HEX_DOMINATED', 'TET', 'WEDGE', 'SWEEP',
+                 'STRUCTURED', 'ADVANCING_FRONT', 'MEDIAL_AXIS', 'STANDARD', 'EXPLICIT', 'FACE1', 'FACE2', 'FACE3', 'FACE4', 'FACE5', 'FACE6',
+                 'C3D8', 'C3D8R', 'C3D8H', 'C3D8HS', 'C3D8I', 'C3D6', 'C3D4', 'C3D10',
+                 ## properties, steps, loads and interactions
+                 'MIDDLE_SURFACE', 'FROM_SECTION', 'UNIFORM', 'HARD', 'FINITE', 'SMALL', 'OMIT', 'ANALYSIS', 'PERCENTAGE', 'ODB',
+                 'SURFACE_TO_SURFACE', 'NODE_TO_SURFACE', 'OVERCLOSED', 'NOMINAL', 'PENALTY', 'FRICTIONLESS', 'LAGRANGE', 'KINEMATIC',
+                 'COMPUTED', 'SPECIFIED', 'FULL', 'LANCZOS', 'FIXED', 'AUTOMATIC']
+
+for thisName in constantNames:
+    globals()[thisName] = SymbolicConstant(thisName)
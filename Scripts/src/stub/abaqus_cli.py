@@ -0,0 +1,75 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+#################################    HEADLESS ABAQUS STAND-IN : COMMAND LINE    #################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## COMMAND LINE OF THE STAND-IN WITH THE ARGUMENTS OF abaqus cae noGUI; USAGE:
+## python "<src>/stub/abaqus_cli.py" cae noGUI="<script>" -- <script arguments>
+## IN util/batch.py THE STAND-IN IS USED WITH abqCommand = 'python "<src>/stub/abaqus_cli.py"'
+## execfile() IS PROVIDED AS A BUILTIN FOR THE SCRIPTS WRITTEN FOR THE PYTHON 2 INTERPRETER OF ABAQUS
+#################################################################################################################
+
+
+import sys, os
+
+stubPath = os.path.dirname(os.path.abspath(__file__))
+if stubPath not in sys.path:
+    sys.path.insert(0, stubPath)
+
+try:
+    import builtins
+except ImportError:
+    import __builtin__ as builtins
+
+def execfile(fileName, globalNames=None, localNames=None):
+    ## execfile of python 2; without a namespace the file is executed in the namespace of the caller
+    if globalNames is None:
+        callerFrame = sys._getframe(1)
+        globalNames = callerFrame.f_globals
+        if localNames is None:
+            localNames = callerFrame.f_locals
+    if localNames is None:
+        localNames = globalNames
+    scriptFile = open(fileName, 'r')
+    scriptText = scriptFile.read()
+    scriptFile.close()
+    exec(compile(scriptText, fileName, 'exec'), globalNames, localNames)
+
+def getScriptArguments(argv):
+    ## method to return the script name and the script arguments of an abaqus cae command line
+    scriptName, scriptArgs = None, []
+    for i in range(len(argv)):
+        if argv[i]=='--':
+            scriptArgs = argv[i+1:]
+            break
+        for thisOption in ['noGUI=', 'script=', 'noGUI:', 'script:']:
+            if argv[i].startswith(thisOption):
+                scriptName = argv[i][len(thisOption):].strip('"')
+        if argv[i] in ['-noGUI', '-script', 'noGUI', 'script'] and i+1<len(argv):
+            scriptName = argv[i+1].strip('"')
+    return scriptName, scriptArgs
+
+def installExecfile():
+    builtins.execfile = execfile
+
+def runScript(scriptName, scriptArgs):
+    installExecfile()
+    sys.argv = ['abaqus', 'cae', 'noGUI='+scriptName, '--']+scriptArgs
+    scriptNames = {'__name__':'__main__', '__file__':scriptName}
+    execfile(scriptName, scriptNames)
+
+if __name__=='__main__':
+    scriptName, scriptArgs = getScriptArguments(sys.argv[1:])
+    if scriptName is None:
+        print('Usage: python abaqus_cli.py cae noGUI=<script> -- <script arguments>')
+        sys.exit(1)
+    runScript(scriptName, scriptArgs)
@@ -0,0 +1,150 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+##############################    HEADLESS ABAQUS STAND-IN : MESH MODULE    #####################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## MESH NODES, ELEMENTS AND ELEMENT FACES WITH THE ARRAY QUERIES USED BY THE TEMPLATES
+## CONNECTIVITY AND FACE NUMBERING FOLLOW THE C3D8 CONVENTION OF ABAQUS
+#################################################################################################################
+
+
+import math
+from abaqusConstants import SymbolicConstant
+
+## nodes of the faces FACE1 ... FACE6 of a hexahedron (0-based positions in the connectivity)
+HEX_FACES = [(0, 1, 2, 3), (4, 7, 6, 5), (0, 4, 5, 1), (1, 5, 6, 2), (2, 6, 7, 3), (3, 7, 4, 0)]
+
+class ElemType(object):
+    def __init__(self, elemCode, elemLibrary=None, **kwargs):
+        self.elemCode = elemCode
+        self.elemLibrary = elemLibrary
+        self.options = kwargs
+
+class MeshNode(object):
+    def __init__(self, label, coordinates, instanceName=None):
+        self.label = label
+        self.coordinates = coordinates
+        self.instanceName = instanceName
+    def __repr__(self):
+        return 'MeshNode('+str(self.label)+', '+str(self.coordinates)+')'
+
+class MeshElement(object):
+    def __init__(self, label, type, connectivity, part=None, cellIndex=None):
+        self.label = label
+        self.type = type
+        ## 0-based node indices of the part as in abaqus
+        self.connectivity = connectivity
+        self.part = part
+        self.cellIndex = cellIndex
+    def getNodes(self):
+        return MeshNodeArray([self.part.nodes[i] for i in self.connectivity])
+    def getCentroid(self):
+        pts = [self.part.nodes[i].coordinates for i in self.connectivity]
+        return tuple([sum([p[k] for p in pts])/len(pts) for k in range(3)])
+    def __repr__(self):
+        return 'MeshElement('+str(self.label)+')'
+
+class MeshFace(object):
+    def __init__(self, element, face):
+        self.element = element
+        self.face = face
+        self.label = element.label
+    def getElements(self):
+        return MeshElementArray([self.element])
+    def getNodes(self):
+        faceID = int(str(self.face)[4:])-1
+        return MeshNodeArray([self.element.part.nodes[self.element.connectivity[i]] for i in HEX_FACES[faceID]])
+    def __repr__(self):
+        return 'MeshFace('+str(self.element.label)+', '+str(self.face)+')'
+
+def getFaceConstant(faceID):
+    ## symbolic constant FACE1 ... FACE6 of a 0-based face index
+    return SymbolicConstant('FACE'+str(faceID+1))
+
+class meshArray(list):
+    ## common queries of the node, element and face arrays
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.__class__(list.__getitem__(self, key))
+        return list.__getitem__(self, key)
+    def __getslice__(self, i, j):
+        return self.__class__(list.__getslice__(self, i, j))
+    def __add__(self, other):
+        return self.__class__(list(self)+list(other))
+    def getPoint(self, thisItem):
+        raise NotImplementedError
+    def getByBoundingBox(self, xMin=-1.0e20, yMin=-1.0e20, zMin=-1.0e20, xMax=1.0e20, yMax=1.0e20, zMax=1.0e20):
+        found = []
+        for thisItem in self:
+            p = self.getPoint(thisItem)
+            if xMin<=p[0]<=xMax and yMin<=p[1]<=yMax and zMin<=p[2]<=zMax:
+                found.append(thisItem)
+        return self.__class__(found)
+    def getByBoundingCylinder(self, center1, center2, radius):
+        axis = [center2[k]-center1[k] for k in range(3)]
+        length = math.sqrt(sum([a*a for a in axis]))
+        axis = [a/length for a in axis]
+        found = []
+        for thisItem in self:
+            p = self.getPoint(thisItem)
+            d = [p[k]-center1[k] for k in range(3)]
+            t = sum([d[k]*axis[k] for k in range(3)])
+            if t<0.0 or t>length:
+                continue
+            r2 = sum([(d[k]-t*axis[k])**2 for k in range(3)])
+            if r2<=radius*radius:
+                found.append(thisItem)
+        return self.__class__(found)
+    def getByBoundingSphere(self, center, radius):
+        found = []
+        for thisItem in self:
+            p = self.getPoint(thisItem)
+            if (p[0]-center[0])**2+(p[1]-center[1])**2+(p[2]-center[2])**2<=radius*radius:
+                found.append(thisItem)
+        return self.__class__(found)
+    def getBoundingBox(self):
+        pts = [self.getPoint(thisItem) for thisItem in self]
+        return {'low':tuple([min([p[k] for p in pts]) for k in range(3)]), 'high':tuple([max([p[k] for p in pts]) for k in range(3)])}
+    def getSequenceFromMask(self, mask):
+        ## bit i of the mask selects the item at position i of the array
+        if isinstance(mask, (tuple, list)):
+            mask = mask[0]
+        words = [int(thisWord, 16) for thisWord in mask.strip('[] ').replace('#', ' ').split()]
+        return self.__class__([self[i] for i in range(min(len(self), 32*len(words))) if words[i//32]>>(i%32) & 1])
+
+class MeshNodeArray(meshArray):
+    def getPoint(self, thisItem):
+        return thisItem.coordinates
+    def getFromLabel(self, label):
+        for thisNode in self:
+            if thisNode.label==label:
+                return thisNode
+        raise KeyError(label)
+    def sequenceFromLabels(self, labels):
+        labelSet = set(labels)
+        return MeshNodeArray([thisNode for thisNode in self if thisNode.label in labelSet])
+
+class MeshElementArray(meshArray):
+    def getPoint(self, thisItem):
+        return thisItem.getCentroid()
+    def getFromLabel(self, label):
+        for thisElement in self:
+            if thisElement.label==label:
+                return thisElement
+        raise KeyError(label)
+    def sequenceFromLabels(self, labels):
+        labelSet = set(labels)
+        return MeshElementArray([thisElement for thisElement in self if thisElement.label in labelSet])
+
+class MeshFaceArray(meshArray):
+    def getPoint(self, thisItem):
+        return thisItem.element.getCentroid()
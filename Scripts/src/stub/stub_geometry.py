@@ -0,0 +1,831 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+###########################    HEADLESS ABAQUS STAND-IN : GEOMETRY PRIMITIVES    ################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## VECTOR ALGEBRA, EXACT 2D PRIMITIVES (LINE, ARC) AND 3D CURVES, SURFACES AND CUTTING TOOLS OF THE STAND-IN
+## EDGES ARE EXACT CURVES; FACES AND CELLS ARE DETERMINISTIC POINT CLOUDS ON EXACT CARRIER SURFACES
+#################################################################################################################
+
+
+import math
+
+EPS = 1.0e-9
+TWO_PI = 2.0*math.pi
+
+## vector algebra ###############################################################################################
+def vAdd(a, b):
+    return (a[0]+b[0], a[1]+b[1], a[2]+b[2])
+
+def vSub(a, b):
+    return (a[0]-b[0], a[1]-b[1], a[2]-b[2])
+
+def vScale(a, s):
+    return (a[0]*s, a[1]*s, a[2]*s)
+
+def vDot(a, b):
+    return a[0]*b[0]+a[1]*b[1]+a[2]*b[2]
+
+def vCross(a, b):
+    return (a[1]*b[2]-a[2]*b[1], a[2]*b[0]-a[0]*b[2], a[0]*b[1]-a[1]*b[0])
+
+def vNorm(a):
+    return math.sqrt(a[0]*a[0]+a[1]*a[1]+a[2]*a[2])
+
+def vUnit(a):
+    n = vNorm(a)
+    if n<EPS:
+        return (0.0, 0.0, 0.0)
+    return (a[0]/n, a[1]/n, a[2]/n)
+
+def vDist(a, b):
+    return math.sqrt((a[0]-b[0])**2+(a[1]-b[1])**2+(a[2]-b[2])**2)
+
+def vPoint(p):
+    ## method to return a 3D float tuple of a point given as 2D or 3D sequence
+    if len(p)==2:
+        return (float(p[0]), float(p[1]), 0.0)
+    return (float(p[0]), float(p[1]), float(p[2]))
+
+def getPerpendicular(n):
+    ## method to return a unit vector perpendicular to n
+    if abs(n[0])<0.9:
+        return vUnit(vCross(n, (1.0, 0.0, 0.0)))
+    return vUnit(vCross(n, (0.0, 1.0, 0.0)))
+
+def rotateVector(v, axis, angle):
+    ## rodrigues rotation of v about the unit axis
+    c, s = math.cos(angle), math.sin(angle)
+    k = axis
+    kv = vCross(k, v)
+    kd = vDot(k, v)*(1.0-c)
+    return (v[0]*c+kv[0]*s+k[0]*kd, v[1]*c+kv[1]*s+k[1]*kd, v[2]*c+kv[2]*s+k[2]*kd)
+
+def getPointKey(p, tol=1.0e-6):
+    return (int(round(p[0]/tol)), int(round(p[1]/tol)), int(round(p[2]/tol)))
+
+class rigidTransform(object):
+    ## rotation about an axis through a point followed by a translation
+    def __init__(self, vector=(0.0, 0.0, 0.0), axisPoint=None, axisDirection=None, angle=0.0):
+        self.vector = vPoint(vector)
+        self.axisPoint = vPoint(axisPoint) if axisPoint is not None else (0.0, 0.0, 0.0)
+        self.axisDirection = vUnit(vPoint(axisDirection)) if axisDirection is not None else (0.0, 0.0, 1.0)
+        self.angle = angle
+    def applyVector(self, v):
+        if self.angle==0.0:
+            return v
+        return rotateVector(v, self.axisDirection, self.angle)
+    def apply(self, p):
+        if self.angle!=0.0:
+            p = vAdd(self.axisPoint, rotateVector(vSub(p, self.axisPoint), self.axisDirection, self.angle))
+        return vAdd(p, self.vector)
+    def inverse(self):
+        return inverseTransform(self)
+
+class inverseTransform(object):
+    def __init__(self, transform):
+        self.transform = transform
+    def applyVector(self, v):
+        t = self.transform
+        if t.angle==0.0:
+            return v
+        return rotateVector(v, t.axisDirection, -t.angle)
+    def apply(self, p):
+        t = self.transform
+        p = vSub(p, t.vector)
+        if t.angle!=0.0:
+            p = vAdd(t.axisPoint, rotateVector(vSub(p, t.axisPoint), t.axisDirection, -t.angle))
+        return p
+
+class chainTransform(object):
+    ## transforms applied in the order given
+    def __init__(self, transforms):
+        self.transforms = list(transforms)
+    def applyVector(self, v):
+        for thisTransform in self.transforms:
+            v = thisTransform.applyVector(v)
+        return v
+    def apply(self, p):
+        for thisTransform in self.transforms:
+            p = thisTransform.apply(p)
+        return p
+    def inverse(self):
+        return chainTransform([inverseTransform(thisTransform) for thisTransform in reversed(self.transforms)])
+
+## 2D primitives ################################################################################################
+def d2Dist(a, b):
+    return math.sqrt((a[0]-b[0])**2+(a[1]-b[1])**2)
+
+def d2Cross(o, a, b):
+    return (a[0]-o[0])*(b[1]-o[1])-(a[1]-o[1])*(b[0]-o[0])
+
+class line2d(object):
+    kind = 'line'
+    def __init__(self, a, b):
+        self.a = (float(a[0]), float(a[1]))
+        self.b = (float(b[0]), float(b[1]))
+        self.closed = False
+    def getLength(self):
+        return d2Dist(self.a, self.b)
+    def pointAt(self, t):
+        return (self.a[0]+t*(self.b[0]-self.a[0]), self.a[1]+t*(self.b[1]-self.a[1]))
+    def getEnds(self):
+        return [self.a, self.b]
+    def nearest(self, p):
+        dx, dy = self.b[0]-self.a[0], self.b[1]-self.a[1]
+        dd = dx*dx+dy*dy
+        t = 0.0 if dd<EPS*EPS else ((p[0]-self.a[0])*dx+(p[1]-self.a[1])*dy)/dd
+        t = min(max(t, 0.0), 1.0)
+        q = (self.a[0]+t*dx, self.a[1]+t*dy)
+        return q, d2Dist(p, q)
+    def samples(self, spacing):
+        n = max(1, int(math.ceil(self.getLength()/spacing)))
+        return [self.pointAt(float(i)/n) for i in range(n+1)]
+    def crossesSegment(self, p, q, ext=0.0):
+        ## method to check whether the segment pq crosses the line (extended by ext at both ends)
+        a, b = self.a, self.b
+        if ext>0.0:
+            l = self.getLength()
+            if l>EPS:
+                u = ((b[0]-a[0])/l*ext, (b[1]-a[1])/l*ext)
+                a, b = (a[0]-u[0], a[1]-u[1]), (b[0]+u[0], b[1]+u[1])
+        d1, d2 = d2Cross(a, b, p), d2Cross(a, b, q)
+        d3, d4 = d2Cross(p, q, a), d2Cross(p, q, b)
+        return ((d1>0 and d2<0) or (d1<0 and d2>0)) and ((d3>0 and d4<0) or (d3<0 and d4>0))
+    def rayCrossings(self, p):
+        ## number of crossings of the ray from p in +x direction
+        a, b = self.a, self.b
+        if (a[1]>p[1])!=(b[1]>p[1]):
+            x = a[0]+(p[1]-a[1])*(b[0]-a[0])/(b[1]-a[1])
+            if x>p[0]:
+                return 1
+        return 0
+    def mapped(self, f):
+        return line2d(f(self.a), f(self.b))
+    def paramOf(self, p):
+        dx, dy = self.b[0]-self.a[0], self.b[1]-self.a[1]
+        dd = dx*dx+dy*dy
+        return 0.0 if dd<EPS*EPS else ((p[0]-self.a[0])*dx+(p[1]-self.a[1])*dy)/dd
+    def normalAt(self, p):
+        l = max(self.getLength(), EPS)
+        return ((self.b[1]-self.a[1])/l, -(self.b[0]-self.a[0])/l)
+    def subPrim(self, t0, t1):
+        return line2d(self.pointAt(t0), self.pointAt(t1))
+
+class arc2d(object):
+    kind = 'arc'
+    ## counterclockwise arc from angle a0 with sweep in (0, 2*pi]; full circle for sweep 2*pi
+    def __init__(self, center, radius, a0, sweep):
+        self.c = (float(center[0]), float(center[1]))
+        self.r = float(radius)
+        self.a0 = a0 % TWO_PI
+        self.sweep = sweep
+        self.closed = abs(sweep-TWO_PI)<1.0e-12
+    @staticmethod
+    def fromPoints(center, p0, p1, clockwise=False, pm=None):
+        ## arc from p0 to p1 about the center, direction given by clockwise or by a mid point pm
+        r = d2Dist(center, p0)
+        a0 = math.atan2(p0[1]-center[1], p0[0]-center[0])
+        a1 = math.atan2(p1[1]-center[1], p1[0]-center[0])
+        if pm is not None:
+            am = math.atan2(pm[1]-center[1], pm[0]-center[0])
+            ccwSweep = (a1-a0) % TWO_PI
+            if d2Dist(p0, p1)<1.0e-9*max(r, 1.0):
+                ccwSweep = TWO_PI
+            clockwise = not ((am-a0) % TWO_PI<=ccwSweep)
+        if clockwise:
+            a0, a1 = a1, a0
+        sweep = (a1-a0) % TWO_PI
+        if sweep<1.0e-12:
+            sweep = TWO_PI
+        return arc2d(center, r, a0, sweep)
+    def getLength(self):
+        return self.r*self.sweep
+    def pointAt(self, t):
+        a = self.a0+t*self.sweep
+        return (self.c[0]+self.r*math.cos(a), self.c[1]+self.r*math.sin(a))
+    def getEnds(self):
+        if self.closed:
+            return []
+        return [self.pointAt(0.0), self.pointAt(1.0)]
+    def inRange(self, angle, extAngle=0.0):
+        if self.closed:
+            return True
+        rel = (angle-self.a0+extAngle) % TWO_PI
+        return rel<=self.sweep+2.0*extAngle
+    def nearest(self, p):
+        dx, dy = p[0]-self.c[0], p[1]-self.c[1]
+        d = math.sqrt(dx*dx+dy*dy)
+        angle = math.atan2(dy, dx)
+        if d>EPS and self.inRange(angle):
+            q = (self.c[0]+self.r*dx/d, self.c[1]+self.r*dy/d)
+            return q, abs(d-self.r)
+        ends = [self.pointAt(0.0), self.pointAt(1.0)]
+        dists = [d2Dist(p, thisEnd) for thisEnd in ends]
+        i = 0 if dists[0]<=dists[1] else 1
+        return ends[i], dists[i]
+    def samples(self, spacing):
+        n = max(2, int(math.ceil(self.getLength()/spacing)))
+        if self.closed:
+            return [self.pointAt(float(i)/n) for i in range(n)]
+        return [self.pointAt(float(i)/n) for i in range(n+1)]
+    def crossesSegment(self, p, q, ext=0.0):
+        dx, dy = q[0]-p[0], q[1]-p[1]
+        fx, fy = p[0]-self.c[0], p[1]-self.c[1]
+        a = dx*dx+dy*dy
+        b = 2.0*(fx*dx+fy*dy)
+        c = fx*fx+fy*fy-self.r*self.r
+        disc = b*b-4.0*a*c
+        if a<EPS*EPS or disc<=0.0:
+            return False
+        extAngle = ext/self.r if self.r>EPS else 0.0
+        count = 0
+        for s in [(-b-math.sqrt(disc))/(2.0*a), (-b+math.sqrt(disc))/(2.0*a)]:
+            if 0.0<s<1.0:
+                angle = math.atan2(fy+s*dy, fx+s*dx)
+                if self.inRange(angle, extAngle):
+                    count = count+1
+        return count%2==1
+    def rayCrossings(self, p):
+        dy = p[1]-self.c[1]
+        if abs(dy)>=self.r:
+            return 0
+        dx = math.sqrt(self.r*self.r-dy*dy)
+        count = 0
+        for x in [self.c[0]-dx, self.c[0]+dx]:
+            if x>p[0] and self.inRange(math.atan2(dy, x-self.c[0])):
+                ## half-open rule at the arc ends as for the lines
+                if not self.closed:
+                    e0, e1 = self.pointAt(0.0), self.pointAt(1.0)
+                    if abs(x-e0[0])<1.0e-12 and abs(p[1]-e0[1])<1.0e-12:
+                        continue
+                    if abs(x-e1[0])<1.0e-12 and abs(p[1]-e1[1])<1.0e-12:
+                        continue
+                count = count+1
+        return count
+    def mapped(self, f):
+        ## arc mapped by an isometry f of the plane
+        if self.closed:
+            c = f(self.c)
+            p0 = f(self.pointAt(0.0))
+            return arc2d(c, d2Dist(c, p0), math.atan2(p0[1]-c[1], p0[0]-c[0]), TWO_PI)
+        return arc2d.fromPoints(f(self.c), f(self.pointAt(0.0)), f(self.pointAt(1.0)), pm=f(self.pointAt(0.5)))
+    def paramOf(self, p):
+        rel = (math.atan2(p[1]-self.c[1], p[0]-self.c[0])-self.a0) % TWO_PI
+        if not self.closed and rel>self.sweep+0.5*(TWO_PI-self.sweep):
+            rel = rel-TWO_PI
+        return rel/self.sweep
+    def normalAt(self, p):
+        d = d2Dist(p, self.c)
+        if d<EPS:
+            return (1.0, 0.0)
+        return ((p[0]-self.c[0])/d, (p[1]-self.c[1])/d)
+    def subPrim(self, t0, t1):
+        return arc2d(self.c, self.r, self.a0+t0*self.sweep, (t1-t0)*self.sweep)
+
+def intersect2d(primA, primB, tol=1.0e-9):
+    ## method to return the parameter pairs (tA, tB) of the intersection points of two primitives
+    pairs = []
+    if primA.kind=='line' and primB.kind=='line':
+        a, b, c, d = primA.a, primA.b, primB.a, primB.b
+        r = (b[0]-a[0], b[1]-a[1])
+        s = (d[0]-c[0], d[1]-c[1])
+        den = r[0]*s[1]-r[1]*s[0]
+        if abs(den)<EPS*max(1.0, primA.getLength()*primB.getLength()):
+            return pairs
+        tA = ((c[0]-a[0])*s[1]-(c[1]-a[1])*s[0])/den
+        tB = ((c[0]-a[0])*r[1]-(c[1]-a[1])*r[0])/den
+        candidates = [(tA, tB)]
+    elif primA.kind=='arc' and primB.kind=='arc':
+        d = d2Dist(primA.c, primB.c)
+        if d<EPS or d>primA.r+primB.r+tol or d<abs(primA.r-primB.r)-tol:
+            return pairs
+        a = (primA.r**2-primB.r**2+d*d)/(2.0*d)
+        h = math.sqrt(max(primA.r**2-a*a, 0.0))
+        u = ((primB.c[0]-primA.c[0])/d, (primB.c[1]-primA.c[1])/d)
+        m = (primA.c[0]+a*u[0], primA.c[1]+a*u[1])
+        pts = [(m[0]-h*u[1], m[1]+h*u[0]), (m[0]+h*u[1], m[1]-h*u[0])]
+        if h<tol:
+            pts = pts[:1]
+        candidates = [(primA.paramOf(p), primB.paramOf(p)) for p in pts]
+    else:
+        line, arc = (primA, primB) if primA.kind=='line' else (primB, primA)
+        dx, dy = line.b[0]-line.a[0], line.b[1]-line.a[1]
+        fx, fy = line.a[0]-arc.c[0], line.a[1]-arc.c[1]
+        qa, qb, qc = dx*dx+dy*dy, 2.0*(fx*dx+fy*dy), fx*fx+fy*fy-arc.r*arc.r
+        disc = qb*qb-4.0*qa*qc
+        if qa<EPS*EPS or disc<-tol*max(1.0, qa):
+            return pairs
+        disc = math.sqrt(max(disc, 0.0))
+        params = [(-qb-disc)/(2.0*qa), (-qb+disc)/(2.0*qa)]
+        if disc<tol:
+            params = params[:1]
+        candidates = []
+        for t in params:
+            tArc = arc.paramOf(line.pointAt(t))
+            candidates.append((t, tArc) if primA.kind=='line' else (tArc, t))
+    for tA, tB in candidates:
+        lA, lB = max(primA.getLength(), EPS), max(primB.getLength(), EPS)
+        if -tol/lA<=tA<=1.0+tol/lA and -tol/lB<=tB<=1.0+tol/lB:
+            pairs.append((min(max(tA, 0.0), 1.0), min(max(tB, 0.0), 1.0)))
+    return pairs
+
+def isInRegion2d(prims, p):
+    ## even-odd rule over all primitives; the ray is shifted slightly to avoid passing through primitive ends
+    q = (p[0], p[1]+1.234567e-10)
+    count = 0
+    for thisPrim in prims:
+        count = count+thisPrim.rayCrossings(q)
+    return count%2==1
+
+def getNearest2d(prims, p):
+    bestQ, bestD = None, None
+    for thisPrim in prims:
+        q, d = thisPrim.nearest(p)
+        if bestD is None or d<bestD:
+            bestQ, bestD = q, d
+    return bestQ, bestD
+
+def getPrimBounds(prims):
+    pts = []
+    for thisPrim in prims:
+        if thisPrim.kind=='arc':
+            pts.extend(thisPrim.samples(thisPrim.r*0.05+EPS))
+        else:
+            pts.extend([thisPrim.a, thisPrim.b])
+    xs, ys = [p[0] for p in pts], [p[1] for p in pts]
+    return min(xs), min(ys), max(xs), max(ys)
+
+def getRegionGrid(prims, spacing):
+    ## method to return the grid points inside the region bounded by the primitives, grid offset by half spacing
+    xMin, yMin, xMax, yMax = getPrimBounds(prims)
+    nx = max(1, int(math.ceil((xMax-xMin)/spacing)))
+    ny = max(1, int(math.ceil((yMax-yMin)/spacing)))
+    hx, hy = (xMax-xMin)/nx, (yMax-yMin)/ny
+    pts = []
+    for i in range(nx):
+        for j in range(ny):
+            p = (xMin+(i+0.5)*hx, yMin+(j+0.5)*hy)
+            if isInRegion2d(prims, p):
+                pts.append(p)
+    return pts
+
+def getRegionArea(prims, n=40, weight=None):
+    ## approximate area of the region (integral of weight(p) when given) by an n x n grid
+    xMin, yMin, xMax, yMax = getPrimBounds(prims)
+    hx, hy = (xMax-xMin)/n, (yMax-yMin)/n
+    total = 0.0
+    for i in range(n):
+        for j in range(n):
+            p = (xMin+(i+0.5)*hx, yMin+(j+0.5)*hy)
+            if isInRegion2d(prims, p):
+                total = total+(1.0 if weight is None else weight(p))
+    return total*hx*hy
+
+## 2D frames of the cutting tools and carrier surfaces ##########################################################
+class planeFrame(object):
+    ## cartesian frame; 2D coordinates in the plane spanned by e1, e2 (extrusion along the normal)
+    kind = 'plane'
+    def __init__(self, origin, e1, e2):
+        self.origin = vPoint(origin)
+        self.e1 = vUnit(e1)
+        self.e2 = vUnit(e2)
+        self.normal = vUnit(vCross(self.e1, self.e2))
+    def to2d(self, p):
+        d = vSub(p, self.origin)
+        return (vDot(d, self.e1), vDot(d, self.e2))
+    def to3d(self, q, p=None):
+        w = 0.0 if p is None else vDot(vSub(p, self.origin), self.normal)
+        return (self.origin[0]+q[0]*self.e1[0]+q[1]*self.e2[0]+w*self.normal[0],
+                self.origin[1]+q[0]*self.e1[1]+q[1]*self.e2[1]+w*self.normal[1],
+                self.origin[2]+q[0]*self.e1[2]+q[1]*self.e2[2]+w*self.normal[2])
+    def transformed(self, transform):
+        return planeFrame(transform.apply(self.origin), transform.applyVector(self.e1), transform.applyVector(self.e2))
+
+class revolveFrame(object):
+    ## meridian frame of a revolution about an axis; 2D coordinates (axial position, radius)
+    kind = 'revolve'
+    def __init__(self, origin, axis, e1=None):
+        self.origin = vPoint(origin)
+        self.axis = vUnit(axis)
+        self.e1 = vUnit(e1) if e1 is not None else getPerpendicular(self.axis)
+    def to2d(self, p):
+        d = vSub(p, self.origin)
+        t = vDot(d, self.axis)
+        return (t, vNorm(vSub(d, vScale(self.axis, t))))
+    def to3d(self, q, p=None):
+        radial = self.e1
+        if p is not None:
+            d = vSub(p, self.origin)
+            perp = vSub(d, vScale(self.axis, vDot(d, self.axis)))
+            if vNorm(perp)>EPS:
+                radial = vUnit(perp)
+        return vAdd(vAdd(self.origin, vScale(self.axis, q[0])), vScale(radial, q[1]))
+    def transformed(self, transform):
+        return revolveFrame(transform.apply(self.origin), transform.applyVector(self.axis), transform.applyVector(self.e1))
+
+## carrier surfaces #############################################################################################
+class planeSurface(object):
+    kind = 'plane'
+    def __init__(self, point, normal):
+        self.point = vPoint(point)
+        self.normal = vUnit(normal)
+    def signedDist(self, p):
+        return vDot(vSub(p, self.point), self.normal)
+    def dist(self, p):
+        return abs(self.signedDist(p))
+    def project(self, p):
+        return vSub(p, vScale(self.normal, self.signedDist(p)))
+    def normalAt(self, p):
+        return self.normal
+    def transformed(self, transform):
+        return planeSurface(transform.apply(self.point), transform.applyVector(self.normal))
+
+class sweptSurface(object):
+    ## surface swept by 2D primitives: extruded along the normal of a plane frame or revolved in a revolve frame
+    kind = 'swept'
+    def __init__(self, frame, prims):
+        self.frame = frame
+        self.prims = prims
+    def dist(self, p):
+        return getNearest2d(self.prims, self.frame.to2d(p))[1]
+    def project(self, p):
+        q = getNearest2d(self.prims, self.frame.to2d(p))[0]
+        return self.frame.to3d(q, p)
+    def normalAt(self, p):
+        ## unit normal (arbitrary sign) at the projection of p
+        p2 = self.frame.to2d(p)
+        bestPrim, bestD = None, None
+        for thisPrim in self.prims:
+            d = thisPrim.nearest(p2)[1]
+            if bestD is None or d<bestD:
+                bestPrim, bestD = thisPrim, d
+        n2 = bestPrim.normalAt(bestPrim.nearest(p2)[0])
+        if self.frame.kind=='plane':
+            return vUnit(vAdd(vScale(self.frame.e1, n2[0]), vScale(self.frame.e2, n2[1])))
+        radial = vSub(self.frame.to3d((0.0, 1.0), p), self.frame.to3d((0.0, 0.0), p))
+        return vUnit(vAdd(vScale(self.frame.axis, n2[0]), vScale(radial, n2[1])))
+    def transformed(self, transform):
+        return sweptSurface(self.frame.transformed(transform), self.prims)
+
+def getPlanarNormal(surface):
+    ## method to return the normal of a plane surface or of an extruded line, None for curved surfaces
+    if surface.kind=='plane':
+        return surface.normal
+    if surface.frame.kind=='plane' and len(surface.prims)==1 and surface.prims[0].kind=='line':
+        prim = surface.prims[0]
+        a, b = surface.frame.to3d(prim.a), surface.frame.to3d(prim.b)
+        return vUnit(vCross(vSub(b, a), surface.frame.normal))
+    if surface.frame.kind=='revolve' and len(surface.prims)==1 and surface.prims[0].kind=='line':
+        prim = surface.prims[0]
+        if abs(prim.a[0]-prim.b[0])<1.0e-12:
+            return surface.frame.axis
+    return None
+
+## cutting tools ################################################################################################
+class planeCut(object):
+    ## unbounded plane
+    def __init__(self, point, normal):
+        self.surface = planeSurface(point, normal)
+    def side(self, p):
+        s = self.surface.signedDist(p)
+        if abs(s)<1.0e-9:
+            return 0
+        return 1 if s>0 else -1
+    def crosses(self, p, q):
+        return self.side(p)*self.side(q)<0
+    def dist(self, p):
+        return self.surface.dist(p)
+    def project(self, p):
+        return self.surface.project(p)
+
+class curveCut(object):
+    ## 2D primitives swept in a frame; ext extends the primitives at their ends for the crossing test
+    def __init__(self, frame, prims, ext=0.0):
+        self.surface = sweptSurface(frame, prims)
+        self.frame = frame
+        self.prims = prims
+        self.ext = ext
+    def side(self, p):
+        q, d = getNearest2d(self.prims, self.frame.to2d(p))
+        return 0 if d<1.0e-9 else 1
+    def crosses(self, p, q):
+        p2, q2 = self.frame.to2d(p), self.frame.to2d(q)
+        for thisPrim in self.prims:
+            if thisPrim.crossesSegment(p2, q2, self.ext):
+                return True
+        return False
+    def dist(self, p):
+        return self.surface.dist(p)
+    def project(self, p):
+        return self.surface.project(p)
+
+## 3D curves ####################################################################################################
+class lineCurve(object):
+    kind = 'line'
+    closed = False
+    def __init__(self, p0, p1):
+        self.p0 = vPoint(p0)
+        self.p1 = vPoint(p1)
+    def pointAt(self, t):
+        return (self.p0[0]+t*(self.p1[0]-self.p0[0]), self.p0[1]+t*(self.p1[1]-self.p0[1]), self.p0[2]+t*(self.p1[2]-self.p0[2]))
+    def getLength(self):
+        return vDist(self.p0, self.p1)
+    def nearestParam(self, p):
+        d = vSub(self.p1, self.p0)
+        dd = vDot(d, d)
+        if dd<EPS*EPS:
+            return 0.0
+        return min(max(vDot(vSub(p, self.p0), d)/dd, 0.0), 1.0)
+    def subCurve(self, t0, t1):
+        return lineCurve(self.pointAt(t0), self.pointAt(t1))
+    def transformed(self, transform):
+        return lineCurve(transform.apply(self.p0), transform.apply(self.p1))
+    def getDirection(self):
+        return vUnit(vSub(self.p1, self.p0))
+
+class arcCurve(object):
+    kind = 'arc'
+    def __init__(self, center, axis, radius, startDir, sweep):
+        self.center = vPoint(center)
+        self.axis = vUnit(axis)
+        self.radius = float(radius)
+        self.u = vUnit(startDir)
+        self.v = vCross(self.axis, self.u)
+        self.sweep = sweep
+        self.closed = abs(sweep-TWO_PI)<1.0e-9
+    def pointAt(self, t):
+        a = t*self.sweep
+        c, s = math.cos(a)*self.radius, math.sin(a)*self.radius
+        return (self.center[0]+c*self.u[0]+s*self.v[0], self.center[1]+c*self.u[1]+s*self.v[1], self.center[2]+c*self.u[2]+s*self.v[2])
+    def getLength(self):
+        return self.radius*self.sweep
+    def nearestParam(self, p):
+        d = vSub(p, self.center)
+        a = math.atan2(vDot(d, self.v), vDot(d, self.u)) % TWO_PI
+        if a<=self.sweep:
+            return a/self.sweep
+        if self.closed:
+            return 0.0
+        return 0.0 if (a-self.sweep)>(TWO_PI-a) else 1.0
+    def subCurve(self, t0, t1):
+        p0 = self.pointAt(t0)
+        return arcCurve(self.center, self.axis, self.radius, vSub(p0, self.center), (t1-t0)*self.sweep)
+    def transformed(self, transform):
+        return arcCurve(transform.apply(self.center), transform.applyVector(self.axis), self.radius, transform.applyVector(self.u), self.sweep)
+
+class polyCurve(object):
+    kind = 'poly'
+    def __init__(self, pts, closed=False):
+        self.pts = [vPoint(p) for p in pts]
+        self.closed = closed
+        if closed and vDist(self.pts[0], self.pts[-1])>EPS:
+            self.pts.append(self.pts[0])
+        self.cumLength = [0.0]
+        for i in range(1, len(self.pts)):
+            self.cumLength.append(self.cumLength[-1]+vDist(self.pts[i-1], self.pts[i]))
+    def getLength(self):
+        return self.cumLength[-1]
+    def pointAt(self, t):
+        s = t*self.cumLength[-1]
+        for i in range(1, len(self.pts)):
+            if s<=self.cumLength[i] or i==len(self.pts)-1:
+                segLength = self.cumLength[i]-self.cumLength[i-1]
+                f = 0.0 if segLength<EPS else min(max((s-self.cumLength[i-1])/segLength, 0.0), 1.0)
+                a, b = self.pts[i-1], self.pts[i]
+                return (a[0]+f*(b[0]-a[0]), a[1]+f*(b[1]-a[1]), a[2]+f*(b[2]-a[2]))
+        return self.pts[0]
+    def nearestParam(self, p):
+        best, bestT = None, 0.0
+        total = max(self.cumLength[-1], EPS)
+        for i in range(1, len(self.pts)):
+            seg = lineCurve(self.pts[i-1], self.pts[i])
+            f = seg.nearestParam(p)
+            d = vDist(p, seg.pointAt(f))
+            if best is None or d<best:
+                best, bestT = d, (self.cumLength[i-1]+f*(self.cumLength[i]-self.cumLength[i-1]))/total
+        return bestT
+    def subCurve(self, t0, t1):
+        total = self.cumLength[-1]
+        pts = [self.pointAt(t0)]
+        for i in range(len(self.pts)):
+            if t0*total<self.cumLength[i]<t1*total:
+                pts.append(self.pts[i])
+        pts.append(self.pointAt(t1))
+        return polyCurve(pts)
+    def transformed(self, transform):
+        pts = self.pts[:-1] if self.closed else self.pts
+        return polyCurve([transform.apply(p) for p in pts], self.closed)
+
+def getCurveSamples(curve, spacing):
+    ## sample points of a curve including both ends (one end for closed curves)
+    n = max(2, int(math.ceil(curve.getLength()/max(spacing, EPS))))
+    n = min(n, 400)
+    if curve.closed:
+        return [curve.pointAt(float(i)/n) for i in range(n)]
+    return [curve.pointAt(float(i)/n) for i in range(n+1)]
+
+def getCurveDist(curve, p):
+    return vDist(p, curve.pointAt(curve.nearestParam(p)))
+
+def lift2dPrim(prim, frame):
+    ## method to return the 3D curve of a 2D primitive in a plane frame
+    if prim.kind=='line':
+        return lineCurve(frame.to3d(prim.a), frame.to3d(prim.b))
+    center = frame.to3d(prim.c)
+    start = vSub(frame.to3d(prim.pointAt(0.0)), center)
+    return arcCurve(center, frame.normal, prim.r, start, prim.sweep)
+
+def project2dCurve(curve, frame):
+    ## method to return the 2D primitives of a 3D curve in a frame
+    if curve.kind=='line':
+        return [line2d(frame.to2d(curve.p0), frame.to2d(curve.p1))]
+    if curve.kind=='arc':
+        c2 = frame.to2d(curve.center)
+        p0, pm, p1 = frame.to2d(curve.pointAt(0.0)), frame.to2d(curve.pointAt(0.5)), frame.to2d(curve.pointAt(1.0))
+        r0 = d2Dist(c2, p0)
+        if frame.kind=='plane' and abs(d2Dist(c2, pm)-r0)<1.0e-7*max(r0, 1.0):
+            if curve.closed:
+                return [arc2d(c2, r0, math.atan2(p0[1]-c2[1], p0[0]-c2[0]), TWO_PI)]
+            return [arc2d.fromPoints(c2, p0, p1, pm=pm)]
+        ## arc perpendicular to the frame or in a meridian plane ==>> polyline
+        pts = [frame.to2d(p) for p in getCurveSamples(curve, curve.getLength()/64.0)]
+        if frame.kind=='revolve':
+            circle = fitCircle2d(pts)
+            if circle is not None:
+                return [arc2d.fromPoints(circle[0], pts[0], pts[-1], pm=pts[len(pts)//2])]
+        return [line2d(pts[i], pts[i+1]) for i in range(len(pts)-1) if d2Dist(pts[i], pts[i+1])>EPS]
+    pts = [frame.to2d(p) for p in curve.pts]
+    return [line2d(pts[i], pts[i+1]) for i in range(len(pts)-1) if d2Dist(pts[i], pts[i+1])>EPS]
+
+def fitCircle2d(pts, tol=1.0e-6):
+    ## method to return (center, radius) when the 2D points lie on a circle
+    if len(pts)<3:
+        return None
+    a, b, c = pts[0], pts[len(pts)//2], pts[-1]
+    d = 2.0*(a[0]*(b[1]-c[1])+b[0]*(c[1]-a[1])+c[0]*(a[1]-b[1]))
+    if abs(d)<EPS:
+        return None
+    ux = ((a[0]**2+a[1]**2)*(b[1]-c[1])+(b[0]**2+b[1]**2)*(c[1]-a[1])+(c[0]**2+c[1]**2)*(a[1]-b[1]))/d
+    uy = ((a[0]**2+a[1]**2)*(c[0]-b[0])+(b[0]**2+b[1]**2)*(a[0]-c[0])+(c[0]**2+c[1]**2)*(b[0]-a[0]))/d
+    r = d2Dist((ux, uy), a)
+    for p in pts:
+        if abs(d2Dist((ux, uy), p)-r)>tol*max(r, 1.0):
+            return None
+    return (ux, uy), r
+
+def fitCurve(pts, closed=False, tol=1.0e-6):
+    ## method to return the exact line or arc through ordered points, a polyline otherwise
+    scale = max(1.0, max([vDist(pts[0], p) for p in pts]))
+    if not closed:
+        line = lineCurve(pts[0], pts[-1])
+        if line.getLength()>EPS and max([getCurveDist(line, p) for p in pts])<tol*scale:
+            return line
+    if len(pts)>=3:
+        n = len(pts)
+        a, b, c = (pts[0], pts[n//3], pts[(2*n)//3]) if closed else (pts[0], pts[n//2], pts[-1])
+        ab, ac = vSub(b, a), vSub(c, a)
+        normal = vCross(ab, ac)
+        if vNorm(normal)>EPS*scale*scale:
+            normal = vUnit(normal)
+            ## circumcenter of a, b, c
+            abab, acac = vDot(ab, ab), vDot(ac, ac)
+            nn = vCross(ab, ac)
+            denom = 2.0*vDot(nn, nn)
+            center = vAdd(a, vScale(vAdd(vScale(vCross(nn, ab), acac), vScale(vCross(ac, nn), abab)), 1.0/denom))
+            radius = vDist(center, a)
+            isCircle = True
+            for p in pts:
+                if abs(vDist(center, p)-radius)>tol*scale or abs(vDot(vSub(p, center), normal))>tol*scale:
+                    isCircle = False
+                    break
+            if isCircle:
+                u = vSub(a, center)
+                if closed:
+                    return arcCurve(center, normal, radius, u, TWO_PI)
+                arc = arcCurve(center, normal, radius, u, TWO_PI)
+                sweep = arc.nearestParam(pts[-1])*TWO_PI
+                if sweep<EPS:
+                    sweep = TWO_PI
+                return arcCurve(center, normal, radius, u, sweep)
+    return polyCurve(pts, closed)
+
+def isCollinear(pts, tol):
+    ## method to check whether all points lie within tol of the line through the two farthest apart points
+    a = pts[0]
+    b = max(pts, key=lambda p: vDist(p, a))
+    l = vDist(a, b)
+    if l<1.0e-12:
+        return True
+    u = vScale(vSub(b, a), 1.0/l)
+    for p in pts:
+        w = vSub(p, a)
+        if vNorm(vSub(w, vScale(u, vDot(w, u))))>tol:
+            return False
+    return True
+
+def orderChain(pts, linkDist):
+    ## method to order points into chains by nearest neighbours; returns list of (points, closed)
+    remaining = list(pts)
+    chains = []
+    while remaining:
+        ## start at the point farthest from the centroid of the remaining points
+        cx = sum([p[0] for p in remaining])/len(remaining)
+        cy = sum([p[1] for p in remaining])/len(remaining)
+        cz = sum([p[2] for p in remaining])/len(remaining)
+        start = max(range(len(remaining)), key=lambda i: vDist(remaining[i], (cx, cy, cz)))
+        chain = [remaining.pop(start)]
+        while remaining:
+            i = min(range(len(remaining)), key=lambda i: vDist(remaining[i], chain[-1]))
+            if vDist(remaining[i], chain[-1])>linkDist:
+                ## try to extend at the other end
+                j = min(range(len(remaining)), key=lambda j: vDist(remaining[j], chain[0]))
+                if vDist(remaining[j], chain[0])>linkDist:
+                    break
+                chain.insert(0, remaining.pop(j))
+                continue
+            chain.append(remaining.pop(i))
+        closed = len(chain)>3 and vDist(chain[0], chain[-1])<=linkDist and not isCollinear(chain, 0.1*linkDist)
+        chains.append((chain, closed))
+    return chains
+
+## spatial hash #################################################################################################
+class pointHash(object):
+    def __init__(self, pts, cellSize):
+        self.cellSize = max(cellSize, 1.0e-9)
+        self.buckets = dict()
+        for i in range(len(pts)):
+            self.buckets.setdefault(self.getKey(pts[i]), []).append(i)
+        self.pts = pts
+    def getKey(self, p):
+        s = self.cellSize
+        return (int(math.floor(p[0]/s)), int(math.floor(p[1]/s)), int(math.floor(p[2]/s)))
+    def getNear(self, p, radius):
+        ## indices of the points within radius of p
+        s = self.cellSize
+        n = int(math.ceil(radius/s))
+        k = self.getKey(p)
+        r2 = radius*radius
+        pts, buckets = self.pts, self.buckets
+        found = []
+        for i in range(k[0]-n, k[0]+n+1):
+            for j in range(k[1]-n, k[1]+n+1):
+                for l in range(k[2]-n, k[2]+n+1):
+                    for m in buckets.get((i, j, l), ()):
+                        q = pts[m]
+                        if (q[0]-p[0])**2+(q[1]-p[1])**2+(q[2]-p[2])**2<=r2:
+                            found.append(m)
+        return found
+    def hasNear(self, p, radius):
+        s = self.cellSize
+        n = int(math.ceil(radius/s))
+        k = self.getKey(p)
+        r2 = radius*radius
+        pts, buckets = self.pts, self.buckets
+        for i in range(k[0]-n, k[0]+n+1):
+            for j in range(k[1]-n, k[1]+n+1):
+                for l in range(k[2]-n, k[2]+n+1):
+                    for m in buckets.get((i, j, l), ()):
+                        q = pts[m]
+                        if (q[0]-p[0])**2+(q[1]-p[1])**2+(q[2]-p[2])**2<=r2:
+                            return True
+        return False
+
+def getComponents(pts, linkDist, cut=None, exclude=None, crossings=None):
+    ## method to return the connected components (lists of indices) of a point cloud, links crossing the cut removed;
+    ## the removed links are appended to crossings when given
+    hashTable = pointHash(pts, linkDist)
+    label = [-1]*len(pts)
+    ## only links of points next to the cut are tested for crossing
+    if cut is not None:
+        band = 2.0*linkDist+getattr(cut, 'ext', 0.0)
+        nearCut = [cut.dist(p)<=band for p in pts]
+    components = []
+    for i in range(len(pts)):
+        if label[i]>=0 or (exclude is not None and exclude[i]):
+            continue
+        label[i] = len(components)
+        stack, component = [i], [i]
+        while stack:
+            j = stack.pop()
+            for k in hashTable.getNear(pts[j], linkDist):
+                if label[k]>=0 or (exclude is not None and exclude[k]):
+                    continue
+                if cut is not None and nearCut[j] and cut.crosses(pts[j], pts[k]):
+                    if crossings is not None:
+                        crossings.append((j, k))
+                    continue
+                label[k] = len(components)
+                stack.append(k)
+                component.append(k)
+        components.append(component)
+    return components
@@ -0,0 +1,507 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+##########################    HEADLESS ABAQUS STAND-IN : MODEL, ASSEMBLY AND JOB    #############################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## MODEL DATABASE OBJECTS USED BY THE TEMPLATES; THE JOB WRITES AN INPUT FILE WITH THE SECTION COMMENTS OF ABAQUS
+## CAE (** PARTS, ** ASSEMBLY, ** MATERIALS, ** INTERACTION PROPERTIES, ** INTERACTIONS, ** STEP: ...), SO THAT
+## inpFileSplitter AND THE INCREMENTAL REWRITE WORK ON IT UNCHANGED
+## BOOLEAN CUT AND MERGE CREATE A NEW PART IN ASSEMBLY COORDINATES AS IN ABAQUS CAE
+#################################################################################################################
+
+
+import math
+from stub_geometry import *
+from stub_sketch import ConstrainedSketch
+from stub_part import *
+from abaqusConstants import *
+
+def getInpNumber(value):
+    ## number in the inp format of abaqus (e.g. 1. instead of 1.0)
+    numberString = repr(float(value))
+    if numberString.endswith('.0'):
+        numberString = numberString[:-1]
+    return numberString
+
+def getInpLabelLines(labels):
+    ## labels written 16 per line
+    lines = []
+    for i in range(0, len(labels), 16):
+        lines.append(', '.join([str(thisLabel) for thisLabel in labels[i:i+16]])+'\n')
+    return lines
+
+class optionObject(object):
+    ## object storing the options it is created or updated with
+    def __init__(self, name=None, **kwargs):
+        self.name = name
+        self.options = kwargs
+    def setValues(self, **kwargs):
+        self.options.update(kwargs)
+
+## properties ###################################################################################################
+class Material(optionObject):
+    def __init__(self, name, **kwargs):
+        optionObject.__init__(self, name, **kwargs)
+        self.density = None
+        self.elastic = None
+    def Density(self, table, **kwargs):
+        self.density = table
+    def Elastic(self, table, **kwargs):
+        self.elastic = table
+
+class ContactProperty(optionObject):
+    def __init__(self, name):
+        optionObject.__init__(self, name)
+        self.normalBehavior = None
+    def NormalBehavior(self, **kwargs):
+        self.normalBehavior = kwargs
+
+## assembly #####################################################################################################
+class regionRef(object):
+    ## set or surface of an instance
+    def __init__(self, instance, name):
+        self.instance = instance
+        self.name = name
+    def getInpName(self):
+        return self.instance.name+'.'+self.name
+
+class regionRepository(object):
+    def __init__(self, instance, source):
+        self.instance = instance
+        self.source = source
+    def __getitem__(self, name):
+        self.source[name]
+        return regionRef(self.instance, name)
+    def __contains__(self, name):
+        return name in self.source
+    def keys(self):
+        return self.source.keys()
+
+class Instance(object):
+    def __init__(self, name, part, dependent=ON):
+        self.name = name
+        self.part = part
+        self.partName = part.name
+        self.dependent = dependent
+        self.transforms = []
+        self.sets = regionRepository(self, part.sets)
+        self.surfaces = regionRepository(self, part.surfaces)
+    def getTransform(self):
+        return chainTransform(self.transforms)
+    def getPlacement(self):
+        ## translation and rotation (axis point, axis direction, angle in degrees) of the inp file, rotation applied
+        ## after the translation as in abaqus
+        t = self.getTransform()
+        c = t.apply((0.0, 0.0, 0.0))
+        columns = [t.applyVector(e) for e in [(1.0, 0.0, 0.0), (0.0, 1.0, 0.0), (0.0, 0.0, 1.0)]]
+        trace = columns[0][0]+columns[1][1]+columns[2][2]
+        angle = math.acos(min(max(0.5*(trace-1.0), -1.0), 1.0))
+        if angle<1.0e-12:
+            return c, None
+        if abs(angle-math.pi)<1.0e-6:
+            ## rotation by pi ==>> axis along a column of M+I
+            candidates = [vAdd(columns[k], tuple([1.0 if i==k else 0.0 for i in range(3)])) for k in range(3)]
+            axis = vUnit(max(candidates, key=vNorm))
+        else:
+            axis = vUnit((columns[1][2]-columns[2][1], columns[2][0]-columns[0][2], columns[0][1]-columns[1][0]))
+        ## x' = M (x + t) ==>> t = M^T c
+        translation = (vDot(columns[0], c), vDot(columns[1], c), vDot(columns[2], c))
+        return translation, (axis, math.degrees(angle))
+
+class featureRepository(dict):
+    ## assembly features; deleting the feature of an instance deletes the instance
+    def __init__(self, assembly):
+        dict.__init__(self)
+        self.assembly = assembly
+    def __delitem__(self, name):
+        dict.__delitem__(self, name)
+        if name in self.assembly.instances:
+            del self.assembly.instances[name]
+
+class Assembly(object):
+    def __init__(self, model):
+        self.model = model
+        self.instances = repository()
+        self.features = featureRepository(self)
+    def DatumCsysByDefault(self, coordSysType):
+        return None
+    def Instance(self, name, part, dependent=ON, **kwargs):
+        thisInstance = Instance(name, part, dependent)
+        self.instances[name] = thisInstance
+        dict.__setitem__(self.features, name, thisInstance)
+        return thisInstance
+    def translate(self, instanceList, vector):
+        for thisName in instanceList:
+            self.instances[thisName].transforms.append(rigidTransform(vector=vector))
+    def rotate(self, instanceList, axisPoint, axisDirection, angle):
+        for thisName in instanceList:
+            self.instances[thisName].transforms.append(rigidTransform(axisPoint=axisPoint, axisDirection=axisDirection, angle=math.radians(angle)))
+    def InstanceFromBooleanCut(self, name, instanceToBeCut, cuttingInstances, originalInstances=SUPPRESS):
+        return self.createBooleanInstance(name, 'CUT', [instanceToBeCut]+list(cuttingInstances), originalInstances)
+    def InstanceFromBooleanMerge(self, name, instances, originalInstances=SUPPRESS, domain=GEOMETRY, **kwargs):
+        return self.createBooleanInstance(name, 'UNION', list(instances), originalInstances)
+    def createBooleanInstance(self, name, operation, instances, originalInstances):
+        thisPart = Part(name, model=self.model)
+        buildBooleanPart(thisPart, operation, [(thisInstance.part, thisInstance.getTransform()) for thisInstance in instances])
+        thisPart.addFeature('Boolean')
+        self.model.parts[name] = thisPart
+        if originalInstances==DELETE:
+            for thisInstance in instances:
+                del self.features[thisInstance.name]
+        return self.Instance(name+'-1', thisPart)
+
+## booleans #####################################################################################################
+DIRECTIONS = [vUnit((i, j, k)) for i in [-1, 0, 1] for j in [-1, 0, 1] for k in [-1, 0, 1] if (i, j, k)!=(0, 0, 0)]
+
+def getNeighbourStates(solid, p, eps=1.0e-6):
+    return [(d, solid.classify(vAdd(p, vScale(d, eps)), 1.0e-12)) for d in DIRECTIONS]
+
+def isOnBoundary(solid, p):
+    states = [s for d, s in getNeighbourStates(solid, p)]
+    return 1 in states and -1 in states
+
+def isOnEdge(solid, p):
+    ## boundary point where the inside and outside directions are not separated by one plane
+    states = getNeighbourStates(solid, p)
+    inside = [d for d, s in states if s==1]
+    outside = [d for d, s in states if s==-1]
+    if not inside or not outside:
+        return False
+    n = vSub(vScale(vAdd((0.0, 0.0, 0.0), tuple([sum([d[k] for d in outside]) for k in range(3)])), 1.0),
+             tuple([sum([d[k] for d in inside]) for k in range(3)]))
+    if vNorm(n)<1.0e-9:
+        return True
+    n = vUnit(n)
+    for d in inside:
+        if vDot(d, n)>0.05:
+            return True
+    for d in outside:
+        if vDot(d, n)<-0.05:
+            return True
+    return False
+
+def getPlacedPart(part, transform):
+    ## world copies of the solid, edges, faces and cell points of a part
+    solid = placedSolid(part.solid, transform)
+    edges = [thisEdge.curve.transformed(transform) for thisEdge in part.edges]
+    faces = [(thisFace.carrier.transformed(transform), [transform.apply(p) for p in thisFace.pts], thisFace.spacing) for thisFace in part.faces]
+    cells = [transform.apply(p) for thisCell in part.cells for p in thisCell.pts]
+    return solid, edges, faces, cells, part.spacing
+
+def buildBooleanPart(part, operation, placedParts):
+    ## method to create the solid and the entities of a boolean of placed parts
+    placed = [getPlacedPart(thisPart, thisTransform) for thisPart, thisTransform in placedParts]
+    solids = [thisPlaced[0] for thisPlaced in placed]
+    result = booleanSolid(operation, solids)
+    part.solid = result
+    spacing = min([thisPlaced[4] for thisPlaced in placed])
+    part.spacing = spacing
+    def getOtherStates(i, p):
+        return [solids[j].classify(p) for j in range(len(solids)) if j!=i]
+    def isKept(i, p, test):
+        ## quick decision from the other solids, neighbour test at coincident boundaries
+        others = getOtherStates(i, p)
+        if operation!='UNION' and i>0 and others[0]==-1:
+            ## cutter entities outside the base solid are never kept
+            return False
+        if all([s==-1 for s in others]):
+            return True
+        if operation=='UNION':
+            if 1 in others:
+                return False
+        else:
+            if i==0 and 1 in others[0:]:
+                return False
+            if i>0:
+                if others[0]==-1 or any([s==1 for s in others[1:]]):
+                    return False
+                if others[0]==1 and all([s==-1 for s in others[1:]]):
+                    return True
+        return test(result, p)
+    ## edges ==>> kept pieces of the original edges
+    edges, splitPoints = [], []
+    for i in range(len(placed)):
+        for thisCurve in placed[i][1]:
+            n = min(400, max(32, int(math.ceil(thisCurve.getLength()/(0.25*spacing)))))
+            ts = [float(k)/n for k in range(n+1)]
+            flags = [isKept(i, thisCurve.pointAt(t), isOnEdge) for t in ts]
+            if all(flags):
+                edges.append(Edge(thisCurve))
+                continue
+            bounds, start = [], None
+            for k in range(n+1):
+                if flags[k] and start is None:
+                    start = ts[k] if k==0 else getStateChange(lambda t: isKept(i, thisCurve.pointAt(t), isOnEdge), ts[k-1], ts[k])
+                if not flags[k] and start is not None:
+                    bounds.append((start, getStateChange(lambda t: isKept(i, thisCurve.pointAt(t), isOnEdge), ts[k-1], ts[k])))
+                    start = None
+            if start is not None:
+                bounds.append((start, 1.0))
+            for t0, t1 in bounds:
+                if (t1-t0)*thisCurve.getLength()>1.0e-7:
+                    edges.append(Edge(thisCurve.subCurve(t0, t1)))
+                    splitPoints.extend([thisCurve.pointAt(t0), thisCurve.pointAt(t1)])
+    ## faces ==>> kept points of the original faces split into connected pieces
+    faces, faceData = [], []
+    for i in range(len(placed)):
+        for carrier, pts, faceSpacing in placed[i][2]:
+            kept = [p for p in pts if isKept(i, p, isOnBoundary)]
+            ## points of a later solid on the carrier of a kept face of an earlier solid are coincident faces
+            for thisCarrier, thisPts, thisSpacing, j in faceData:
+                if j<i and (thisCarrier.kind==carrier.kind=='plane') and abs(abs(vDot(thisCarrier.normal, carrier.normal))-1.0)<1.0e-9 and thisCarrier.dist(carrier.point)<1.0e-9:
+                    kept = [p for p in kept if not pointHash(thisPts, 1.75*thisSpacing).hasNear(p, 1.75*thisSpacing)]
+            if len(kept)<3:
+                continue
+            for thisComponent in getComponents(kept, 1.75*faceSpacing):
+                if len(thisComponent)>=3:
+                    faceData.append((carrier, [kept[k] for k in thisComponent], faceSpacing, i))
+    for carrier, pts, faceSpacing, i in faceData:
+        faces.append(Face(carrier, pts, faceSpacing))
+    ## intersection curves of the faces of different solids
+    keptCurves = [thisEdge.curve for thisEdge in edges]
+    for a in range(len(faceData)):
+        for b in range(a+1, len(faceData)):
+            if faceData[a][3]==faceData[b][3]:
+                continue
+            carrierA, ptsA, spacingA = faceData[a][0:3]
+            carrierB, ptsB, spacingB = faceData[b][0:3]
+            link = 1.75*max(spacingA, spacingB)
+            hashA = pointHash(ptsA, link)
+            pts = []
+            for p in ptsB:
+                if carrierA.dist(p)>link or not hashA.hasNear(p, 2.0*link):
+                    continue
+                x = p
+                for k in range(100):
+                    x = carrierB.project(carrierA.project(x))
+                    if carrierA.dist(x)<1.0e-10:
+                        break
+                if carrierA.dist(x)>1.0e-7 or carrierB.dist(x)>1.0e-7:
+                    continue
+                if min([getCurveDist(thisCurve, x) for thisCurve in keptCurves]+[1.0])<1.0e-6:
+                    continue
+                if isOnEdge(result, x):
+                    pts.append(x)
+            if len(pts)<2:
+                continue
+            for thisCurve in getInterfaceCurves(pts, 2.5*max(spacingA, spacingB), splitPoints, 1.5*link):
+                edges.append(Edge(thisCurve))
+                keptCurves.append(thisCurve)
+    ## cells ==>> kept cloud points
+    pts = []
+    for i in range(len(placed)):
+        for p in placed[i][3]:
+            if result.classify(p)!=1:
+                continue
+            if operation=='UNION' and any([solids[j].classify(p)==1 for j in range(i)]):
+                continue
+            pts.append(p)
+    cellSpacing = max([thisPlaced[4] for thisPlaced in placed])
+    cells = [Cell([pts[k] for k in thisComponent], cellSpacing) for thisComponent in getComponents(pts, 1.75*cellSpacing)]
+    part.setTopology(edges, faces, cells)
+
+def getStateChange(test, t0, t1):
+    ## bisection for the parameter where test changes between t0 and t1
+    s0 = test(t0)
+    for i in range(50):
+        mid = 0.5*(t0+t1)
+        if test(mid)==s0:
+            t0 = mid
+        else:
+            t1 = mid
+    return 0.5*(t0+t1)
+
+## steps, loads and interactions ################################################################################
+class StaticStep(optionObject):
+    pass
+
+class Model(object):
+    def __init__(self, name, **kwargs):
+        self.name = name
+        self.sketches = repository()
+        self.parts = repository()
+        self.materials = repository()
+        self.sections = repository()
+        self.steps = repository()
+        self.boundaryConditions = repository()
+        self.loads = repository()
+        self.constraints = repository()
+        self.interactionProperties = repository()
+        self.interactions = repository()
+        self.fieldOutputRequests = repository()
+        self.fieldOutputRequests['F-Output-1'] = optionObject('F-Output-1', variables=('S', 'E', 'U', 'RF'))
+        self.rootAssembly = Assembly(self)
+    def ConstrainedSketch(self, name, sheetSize=200.0, **kwargs):
+        thisSketch = ConstrainedSketch(name, sheetSize, **kwargs)
+        self.sketches[name] = thisSketch
+        return thisSketch
+    def Part(self, name, dimensionality=THREE_D, type=DEFORMABLE_BODY, **kwargs):
+        thisPart = Part(name, dimensionality, type, model=self)
+        self.parts[name] = thisPart
+        return thisPart
+    def Material(self, name, **kwargs):
+        thisMaterial = Material(name, **kwargs)
+        self.materials[name] = thisMaterial
+        return thisMaterial
+    def HomogeneousSolidSection(self, name, material, thickness=None, **kwargs):
+        thisSection = optionObject(name, material=material)
+        self.sections[name] = thisSection
+        return thisSection
+    def StaticStep(self, name, previous='Initial', **kwargs):
+        thisStep = StaticStep(name, previous=previous, **kwargs)
+        self.steps[name] = thisStep
+        return thisStep
+    def DisplacementBC(self, name, createStepName, region, **kwargs):
+        thisBC = optionObject(name, createStepName=createStepName, region=region, **kwargs)
+        self.boundaryConditions[name] = thisBC
+        return thisBC
+    def Pressure(self, name, createStepName, region, magnitude, **kwargs):
+        thisLoad = optionObject(name, createStepName=createStepName, region=region, magnitude=magnitude, **kwargs)
+        self.loads[name] = thisLoad
+        return thisLoad
+    def Tie(self, name, master, slave, **kwargs):
+        thisConstraint = optionObject(name, kind='TIE', master=master, slave=slave, **kwargs)
+        self.constraints[name] = thisConstraint
+        return thisConstraint
+    def Equation(self, name, terms):
+        thisConstraint = optionObject(name, kind='EQUATION', terms=terms)
+        self.constraints[name] = thisConstraint
+        return thisConstraint
+    def ContactProperty(self, name):
+        thisProperty = ContactProperty(name)
+        self.interactionProperties[name] = thisProperty
+        return thisProperty
+    def SurfaceToSurfaceContactStd(self, name, createStepName, master, slave, sliding, interactionProperty, **kwargs):
+        thisInteraction = optionObject(name, master=master, slave=slave, sliding=sliding, interactionProperty=interactionProperty, **kwargs)
+        self.interactions[name] = thisInteraction
+        return thisInteraction
+
+## job ##########################################################################################################
+class Job(optionObject):
+    def __init__(self, name, model, **kwargs):
+        optionObject.__init__(self, name, **kwargs)
+        self.model = model if not isinstance(model, str) else None
+    def writeInput(self, consistencyChecking=OFF):
+        inpFile = open(self.name+'.inp', 'w')
+        inpFile.writelines(getInpLines(self.name, self.model))
+        inpFile.close()
+
+def getInpLines(jobName, model):
+    lines = ['*Heading\n', '** Job name: '+jobName+' Model name: '+model.name+'\n', '** Generated by: headless abaqus stand-in\n',
+             '*Preprint, echo=NO, model=NO, history=NO, contact=NO\n', '**\n', '** PARTS\n', '**\n']
+    for thisPart in model.parts.values():
+        lines.extend(getPartLines(thisPart))
+    lines.extend(['**\n', '**\n', '** ASSEMBLY\n', '**\n', '*Assembly, name=Assembly\n', '**  \n'])
+    for thisInstance in model.rootAssembly.instances.values():
+        lines.append('*Instance, name='+thisInstance.name+', part='+thisInstance.partName+'\n')
+        translation, rotation = thisInstance.getPlacement()
+        if rotation is not None or vNorm(translation)>0.0:
+            lines.append('  '+', '.join([getInpNumber(x) for x in translation])+'\n')
+        if rotation is not None:
+            axis, angle = rotation
+            lines.append('  0., 0., 0., '+', '.join([getInpNumber(x) for x in axis])+', '+getInpNumber(angle)+'\n')
+        lines.extend(['*End Instance\n', '**  \n'])
+    for thisConstraint in model.constraints.values():
+        lines.append('** Constraint: '+thisConstraint.name+'\n')
+        if thisConstraint.options['kind']=='TIE':
+            lines.append('*Tie, name='+thisConstraint.name+', adjust=no\n')
+            lines.append(thisConstraint.options['slave'].getInpName()+', '+thisConstraint.options['master'].getInpName()+'\n')
+        else:
+            terms = thisConstraint.options['terms']
+            lines.extend(['*Equation\n', str(len(terms))+'\n'])
+            for coefficient, region, dof in terms:
+                lines.append(region+', '+str(dof)+', '+getInpNumber(coefficient)+'\n')
+    lines.extend(['*End Assembly\n', '** \n', '** MATERIALS\n', '** \n'])
+    for thisMaterial in model.materials.values():
+        lines.append('*Material, name='+thisMaterial.name+'\n')
+        if thisMaterial.density is not None:
+            lines.extend(['*Density\n', ' '+getInpNumber(thisMaterial.density[0][0])+',\n'])
+        if thisMaterial.elastic is not None:
+            lines.extend(['*Elastic\n', ' '+', '.join([getInpNumber(x) for x in thisMaterial.elastic[0]])+'\n'])
+    if model.interactionProperties:
+        lines.extend(['** \n', '** INTERACTION PROPERTIES\n', '** \n'])
+        for thisProperty in model.interactionProperties.values():
+            lines.extend(['*Surface Interaction, name='+thisProperty.name+'\n', '1.,\n'])
+            if thisProperty.normalBehavior is not None:
+                lines.append('*Surface Behavior, pressure-overclosure='+str(thisProperty.normalBehavior.get('pressureOverclosure', HARD))+'\n')
+    if model.interactions:
+        lines.extend(['** \n', '** INTERACTIONS\n', '** \n'])
+        for thisInteraction in model.interactions.values():
+            options = thisInteraction.options
+            lines.append('** Interaction: '+thisInteraction.name+'\n')
+            lines.append('*Contact Pair, interaction='+options['interactionProperty']+(', small sliding' if options['sliding']==SMALL else '')+', type=SURFACE TO SURFACE\n')
+            lines.append(options['slave'].getInpName()+', '+options['master'].getInpName()+'\n')
+    for thisStep in model.steps.values():
+        options = thisStep.options
+        lines.extend(['** ----------------------------------------------------------------\n', '** \n', '** STEP: '+thisStep.name+'\n', '** \n'])
+        lines.append('*Step, name='+thisStep.name+', nlgeom='+('YES' if options.get('nlgeom', OFF)==ON else 'NO')+'\n')
+        lines.append('*Static\n')
+        lines.append(', '.join([getInpNumber(options.get('initialInc', 1.0)), getInpNumber(options.get('timePeriod', 1.0)), getInpNumber(options.get('minInc', 1.0e-5)), getInpNumber(options.get('maxInc', 1.0))])+'\n')
+        lines.extend(['** \n', '** BOUNDARY CONDITIONS\n', '** \n'])
+        for thisBC in model.boundaryConditions.values():
+            lines.append('** Name: '+thisBC.name+' Type: Displacement/Rotation\n')
+            lines.append('*Boundary\n')
+            for dof, key in enumerate(['u1', 'u2', 'u3', 'ur1', 'ur2', 'ur3']):
+                if thisBC.options.get(key, UNSET)!=UNSET:
+                    lines.append(thisBC.options['region'].getInpName()+', '+str(dof+1)+', '+str(dof+1)+'\n')
+        lines.extend(['** \n', '** LOADS\n', '** \n'])
+        for thisLoad in model.loads.values():
+            lines.append('** Name: '+thisLoad.name+'   Type: Pressure\n')
+            lines.extend(['*Dsload\n', thisLoad.options['region'].getInpName()+', P, '+getInpNumber(thisLoad.options['magnitude'])+'\n'])
+        lines.extend(['** \n', '** OUTPUT REQUESTS\n', '** \n', '*Restart, write, frequency=0\n', '** \n', '** FIELD OUTPUT: F-Output-1\n', '** \n'])
+        lines.extend(['*Output, field\n', '*Node Output\n'])
+        variables = list(model.fieldOutputRequests['F-Output-1'].options['variables'])
+        nodeVariables = [thisVariable for thisVariable in variables if thisVariable in ['U', 'RF', 'CF', 'V', 'A']]
+        elementVariables = [thisVariable for thisVariable in variables if thisVariable not in nodeVariables and not thisVariable.startswith('C')]
+        contactVariables = [thisVariable for thisVariable in variables if thisVariable.startswith('C') and thisVariable!='CF']
+        lines.append(', '.join(nodeVariables)+'\n')
+        lines.extend(['*Element Output, directions=YES\n', ', '.join(elementVariables)+'\n'])
+        if contactVariables:
+            lines.extend(['*Contact Output\n', ', '.join(contactVariables)+'\n'])
+        lines.extend(['** \n', '** HISTORY OUTPUT: H-Output-1\n', '** \n', '*Output, history, variable=PRESELECT\n', '*End Step\n'])
+    return lines
+
+def getPartLines(part):
+    lines = ['*Part, name='+part.name+'\n', '*Node\n']
+    for thisNode in part.nodes:
+        lines.append('%7d, %s\n' % (thisNode.label, ', '.join(['%13.8g' % x for x in thisNode.coordinates])))
+    elementCodes = []
+    for thisElement in part.elements:
+        if str(thisElement.type) not in elementCodes:
+            elementCodes.append(str(thisElement.type))
+    for thisCode in elementCodes:
+        lines.append('*Element, type='+thisCode+'\n')
+        for thisElement in part.elements:
+            if str(thisElement.type)==thisCode:
+                lines.append('%d, %s\n' % (thisElement.label, ', '.join([str(part.nodes[i].label) for i in thisElement.connectivity])))
+    for thisSet in part.sets.values():
+        if len(thisSet.nodes):
+            lines.append('*Nset, nset='+thisSet.name+'\n')
+            lines.extend(getInpLabelLines(sorted([thisNode.label for thisNode in thisSet.nodes])))
+        if len(thisSet.elements):
+            lines.append('*Elset, elset='+thisSet.name+'\n')
+            lines.extend(getInpLabelLines(sorted([thisElement.label for thisElement in thisSet.elements])))
+    for thisSurface in part.surfaces.values():
+        faceIDs = sorted(set([faceID for label, faceID in thisSurface.elementFaces]))
+        for faceID in faceIDs:
+            lines.append('*Elset, elset=_'+thisSurface.name+'_S'+str(faceID)+', internal\n')
+            lines.extend(getInpLabelLines(sorted(set([label for label, thisFaceID in thisSurface.elementFaces if thisFaceID==faceID]))))
+        lines.append('*Surface, type=ELEMENT, name='+thisSurface.name+'\n')
+        for faceID in faceIDs:
+            lines.append('_'+thisSurface.name+'_S'+str(faceID)+', S'+str(faceID)+'\n')
+    for region, sectionName in part.sectionAssignments:
+        material = part.model.sections[sectionName].options['material'] if part.model is not None else ''
+        lines.append('** Section: '+sectionName+'\n')
+        lines.extend(['*Solid Section, elset='+region.name+', material='+material+'\n', ',\n'])
+    lines.append('*End Part\n')
+    lines.append('**  \n')
+    return lines
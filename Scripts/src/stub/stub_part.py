@@ -0,0 +1,1459 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+##############################    HEADLESS ABAQUS STAND-IN : PART AND MESH    ###################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## A PART IS AN EXACT SOLID (EXTRUDED, REVOLVED OR BOOLEAN) WITH VERTICES, EXACT EDGE CURVES, AND FACES AND CELLS
+## SAMPLED AS DETERMINISTIC POINT CLOUDS; PARTITIONS SPLIT THE EDGES EXACTLY AND THE CLOUDS BY CONNECTIVITY
+## THE MESH IS A VOXEL HEX MESH OF THE SOLID WITH THE BOUNDARY NODES SNAPPED ONTO VERTICES, EDGES AND FACES;
+## ITS SIZE FOLLOWS THE SEEDS BUT IS CAPPED BY ABAQUS_STUB_MAX_ELEMENTS (DEFAULT 20000) ELEMENTS PER PART
+## THE NUMBER OF CLOUD POINTS PER PART IS SET BY ABAQUS_STUB_CLOUD_POINTS (DEFAULT 3000)
+#################################################################################################################
+
+
+import math, os
+from stub_geometry import *
+from stub_sketch import sketchTransform
+from abaqusConstants import *
+import mesh
+
+def getCloudSize():
+    return int(os.environ.get('ABAQUS_STUB_CLOUD_POINTS', '3000'))
+
+def getElementBudget():
+    return int(os.environ.get('ABAQUS_STUB_MAX_ELEMENTS', '20000'))
+
+def toList(items):
+    ## method to return a list of entities given as entity, array or nested sequence
+    if items is None:
+        return []
+    if isinstance(items, partEntity):
+        return [items]
+    found = []
+    for thisItem in items:
+        found.extend(toList(thisItem))
+    return found
+
+def toMeshList(items, itemType):
+    ## method to return a list of mesh nodes or elements given as item, array or nested sequence
+    if items is None:
+        return []
+    if isinstance(items, itemType):
+        return [items]
+    found = []
+    for thisItem in items:
+        found.extend(toMeshList(thisItem, itemType))
+    return found
+
+def isPoint(p):
+    return isinstance(p, (tuple, list)) and len(p)==3 and all([isinstance(x, (int, float)) for x in p])
+
+def getBounds(pts):
+    return ([min([p[k] for p in pts]) for k in range(3)], [max([p[k] for p in pts]) for k in range(3)])
+
+## solids #######################################################################################################
+class prismSolid(object):
+    ## region of 2D primitives in a plane frame extruded along the frame normal from 0 to depth
+    def __init__(self, frame, prims, depth):
+        self.frame = frame
+        self.prims = prims
+        self.depth = depth
+    def classify(self, p, tol=1.0e-9):
+        ## 1 inside, 0 on the boundary, -1 outside
+        w = vDot(vSub(p, self.frame.origin), self.frame.normal)
+        if w<-tol or w>self.depth+tol:
+            return -1
+        q = self.frame.to2d(p)
+        onSide = getNearest2d(self.prims, q)[1]<tol
+        if not onSide and not isInRegion2d(self.prims, q):
+            return -1
+        if onSide or abs(w)<tol or abs(w-self.depth)<tol:
+            return 0
+        return 1
+
+class revolveSolid(object):
+    ## region of 2D primitives in (axial position, radius) revolved about the axis from e1 towards axis x e1
+    def __init__(self, origin, axis, e1, angle, prims):
+        self.origin = vPoint(origin)
+        self.axis = vUnit(axis)
+        self.e1 = vUnit(e1)
+        self.e2 = vCross(self.axis, self.e1)
+        self.angle = angle
+        self.prims = prims
+        self.isFull = angle>=TWO_PI-1.0e-9
+    def getCoordinates(self, p):
+        d = vSub(p, self.origin)
+        t = vDot(d, self.axis)
+        radial = vSub(d, vScale(self.axis, t))
+        r = vNorm(radial)
+        phi = math.atan2(vDot(radial, self.e2), vDot(radial, self.e1)) % TWO_PI
+        return t, r, phi
+    def classify(self, p, tol=1.0e-9):
+        t, r, phi = self.getCoordinates(p)
+        onCap = False
+        if not self.isFull and r>tol:
+            if phi>self.angle:
+                ## distance to the nearer cap along the circle
+                gap = min(phi-self.angle, TWO_PI-phi)
+                if r*math.sin(min(gap, math.pi/2.0))>tol:
+                    return -1
+            onCap = r*math.sin(min(phi, math.pi/2.0))<tol or r*math.sin(min(max(self.angle-phi, 0.0), math.pi/2.0))<tol
+        q = (t, r)
+        onSide = getNearest2d(self.prims, q)[1]<tol
+        if not onSide and not isInRegion2d(self.prims, q):
+            return -1
+        if onSide or onCap:
+            return 0
+        return 1
+    def pointAt(self, t, r, phi):
+        return vAdd(vAdd(self.origin, vScale(self.axis, t)), vAdd(vScale(self.e1, r*math.cos(phi)), vScale(self.e2, r*math.sin(phi))))
+
+class placedSolid(object):
+    ## solid of a part placed by a transform
+    def __init__(self, solid, transform):
+        self.solid = solid
+        self.transform = transform
+        self.inverse = transform.inverse()
+    def classify(self, p, tol=1.0e-9):
+        return self.solid.classify(self.inverse.apply(p), tol)
+
+class booleanSolid(object):
+    ## union of solids or first solid cut by the others
+    def __init__(self, operation, solids):
+        self.operation = operation
+        self.solids = solids
+    def classify(self, p, tol=1.0e-9):
+        states = [thisSolid.classify(p, tol) for thisSolid in self.solids]
+        if self.operation=='UNION':
+            if 1 in states:
+                return 1
+            return 0 if 0 in states else -1
+        cutter = max(states[1:]) if len(states)>1 else -1
+        if states[0]==-1 or cutter==1:
+            return -1
+        if states[0]==1 and cutter==-1:
+            return 1
+        return 0
+
+## entities #####################################################################################################
+class partEntity(object):
+    kind = 'entity'
+    def __init__(self):
+        self.part = None
+        self.index = -1
+    def __repr__(self):
+        partName = self.part.name if self.part is not None else ''
+        return "mdb.models['...'].parts['"+partName+"']."+self.kind+'s['+str(self.index)+']'
+
+class Vertex(partEntity):
+    kind = 'vertice'
+    def __init__(self, point):
+        partEntity.__init__(self)
+        self.point = vPoint(point)
+        self.featureName = ''
+    def getPointOn(self):
+        return (self.point, )
+    pointOn = property(getPointOn)
+    def getSamples(self):
+        return [self.point]
+    def getNodes(self):
+        return self.part.getNodesNear([self.point], 1.0e-6)
+
+class Edge(partEntity):
+    kind = 'edge'
+    def __init__(self, curve):
+        partEntity.__init__(self)
+        self.curve = curve
+        self.vertexIDs = ()
+        self.samples = None
+    def getVertices(self):
+        return self.vertexIDs
+    def getRadius(self):
+        if self.curve.kind!='arc':
+            raise Exception('The edge is not an arc.')
+        return self.curve.radius
+    def getSize(self, printResults=True):
+        length = self.curve.getLength()
+        if printResults:
+            print('Length = '+str(length))
+        return length
+    def getPointOn(self):
+        return (self.curve.pointAt(0.5), )
+    pointOn = property(getPointOn)
+    def getSamples(self):
+        if self.samples is None:
+            self.samples = getCurveSamples(self.curve, self.curve.getLength()/32.0)
+        return self.samples
+    def getNodes(self):
+        return self.part.getNodesOnCurve(self.curve)
+
+class Face(partEntity):
+    kind = 'face'
+    def __init__(self, carrier, pts, spacing):
+        partEntity.__init__(self)
+        self.carrier = carrier
+        self.pts = pts
+        self.spacing = spacing
+        self.link = 1.75*spacing
+        self.hash = None
+        self.bounds = None
+        self.nearHashes = dict()
+    def getPointOn(self):
+        return (self.pts[len(self.pts)//2], )
+    pointOn = property(getPointOn)
+    def getSamples(self):
+        return self.pts
+    def getHash(self):
+        if self.hash is None:
+            self.hash = pointHash(self.pts, self.link)
+        return self.hash
+    def getBounds(self):
+        if self.bounds is None:
+            self.bounds = getBounds(self.pts)
+        return self.bounds
+    def getNearest(self, q, radius):
+        ## nearest cloud point within radius, None if there is none
+        best, bestD = None, None
+        for i in self.getHash().getNear(q, radius):
+            d = vDist(self.pts[i], q)
+            if bestD is None or d<bestD:
+                best, bestD = self.pts[i], d
+        return best
+    def isNear(self, q, radius):
+        ## cloud point within radius ==>> hash with the radius as bucket size
+        if radius not in self.nearHashes:
+            self.nearHashes[radius] = pointHash(self.pts, radius)
+        return self.nearHashes[radius].hasNear(q, radius)
+    def contains(self, q, tol=1.0e-7):
+        ## point q on the face ==>> on the carrier and reachable from the nearest cloud point without crossing an edge
+        if self.carrier.dist(q)>tol:
+            return False
+        p = self.getNearest(q, 2.0*self.link)
+        if p is None:
+            return False
+        if vDist(p, q)<1.0e-12:
+            return True
+        for thisEdge in self.part.getCarrierEdges(self):
+            if segmentCrossesCurve(p, q, thisEdge.curve, self.carrier.normalAt(q)):
+                return False
+        return True
+    def getSize(self, printResults=True):
+        area = len(self.pts)*self.spacing*self.spacing
+        if printResults:
+            print('Area = '+str(area))
+        return area
+    def getNodes(self):
+        return self.part.getNodesOnFace(self)
+    def getElementFaces(self):
+        return self.part.getElementFacesOnFace(self)
+    def getElements(self):
+        elements, labels = [], set()
+        for thisFace in self.getElementFaces():
+            if thisFace.element.label not in labels:
+                labels.add(thisFace.element.label)
+                elements.append(thisFace.element)
+        return mesh.MeshElementArray(elements)
+
+class Cell(partEntity):
+    kind = 'cell'
+    def __init__(self, pts, spacing):
+        partEntity.__init__(self)
+        self.pts = pts
+        self.spacing = spacing
+        self.link = 1.75*spacing
+        self.hash = None
+    def getPointOn(self):
+        return (self.pts[len(self.pts)//2], )
+    pointOn = property(getPointOn)
+    def getSamples(self):
+        return self.pts
+    def getHash(self):
+        if self.hash is None:
+            self.hash = pointHash(self.pts, self.link)
+        return self.hash
+    def getNearest(self, q, radius):
+        best, bestD = None, None
+        for i in self.getHash().getNear(q, radius):
+            d = vDist(self.pts[i], q)
+            if bestD is None or d<bestD:
+                best, bestD = self.pts[i], d
+        return best
+    def getEdges(self):
+        ## edges on the boundary of the cell ==>> quarter points of the edge next to the cloud of the cell
+        edgeIDs = []
+        for thisEdge in self.part.edges:
+            if all([self.getNearest(thisEdge.curve.pointAt(t), 2.0*self.link) is not None for t in (0.25, 0.5, 0.75)]):
+                edgeIDs.append(thisEdge.index)
+        return tuple(edgeIDs)
+    def getVolume(self):
+        return self.part.getCellVolumes()[self.index]
+    def contains(self, q):
+        ## point q in the cell ==>> in the solid and reachable from the nearest cloud point without crossing a face
+        if self.part.solid.classify(q)<0:
+            return False
+        p = self.getNearest(q, 2.0*self.link)
+        if p is None:
+            return False
+        for thisFace in self.part.faces:
+            if segmentCrossesFace(p, q, thisFace):
+                return False
+        return True
+    def getNodes(self):
+        return mesh.MeshNodeArray([self.part.nodes[i] for i in sorted(set([j for thisElement in self.getElements() for j in thisElement.connectivity]))])
+    def getElements(self):
+        return mesh.MeshElementArray([thisElement for thisElement in self.part.elements if thisElement.cellIndex==self.index])
+
+def segmentCrossesCurve(p, q, curve, normal):
+    ## method to check whether the segment pq on a surface crosses a curve on the same surface, tested in the
+    ## tangent plane at q
+    l = vDist(p, q)
+    m = vScale(vAdd(p, q), 0.5)
+    t0 = curve.nearestParam(m)
+    if vDist(curve.pointAt(t0), m)>l:
+        return False
+    u = vUnit(vSub(q, p))
+    u = vUnit(vSub(u, vScale(normal, vDot(u, normal))))
+    v = vCross(normal, u)
+    def to2d(x):
+        d = vSub(x, p)
+        return (vDot(d, u), vDot(d, v))
+    p2, q2 = to2d(p), to2d(q)
+    dt = 1.5*l/max(curve.getLength(), EPS)
+    n = 16
+    if curve.closed:
+        params = [t0+dt*(2.0*i/n-1.0) for i in range(n+1)]
+    else:
+        params = [min(max(t0+dt*(2.0*i/n-1.0), 0.0), 1.0) for i in range(n+1)]
+    pts = [to2d(curve.pointAt(t % 1.0 if curve.closed else t)) for t in params]
+    for i in range(n):
+        if d2Dist(pts[i], pts[i+1])<EPS:
+            continue
+        if line2d(pts[i], pts[i+1]).crossesSegment(p2, q2):
+            return True
+    return False
+
+def segmentCrossesFace(p, q, face):
+    ## method to check whether the segment pq crosses the face
+    s1, s2 = getSignedDist(face.carrier, p), getSignedDist(face.carrier, q)
+    if s1*s2>0.0 or (abs(s1)<1.0e-12 and abs(s2)<1.0e-12):
+        return False
+    lo, hi = 0.0, 1.0
+    if face.carrier.kind=='plane':
+        f = s1/(s1-s2)
+    else:
+        for i in range(40):
+            mid = 0.5*(lo+hi)
+            sm = getSignedDist(face.carrier, vAdd(p, vScale(vSub(q, p), mid)))
+            if sm*s1>0.0:
+                lo = mid
+            else:
+                hi = mid
+        f = 0.5*(lo+hi)
+    x = face.carrier.project(vAdd(p, vScale(vSub(q, p), f)))
+    return face.contains(x, 1.0e-6)
+
+def getSignedDist(carrier, p):
+    if carrier.kind=='plane':
+        return carrier.signedDist(p)
+    p2 = carrier.frame.to2d(p)
+    bestPrim, bestQ, bestD = None, None, None
+    for thisPrim in carrier.prims:
+        q, d = thisPrim.nearest(p2)
+        if bestD is None or d<bestD:
+            bestPrim, bestQ, bestD = thisPrim, q, d
+    n2 = bestPrim.normalAt(bestQ)
+    return (p2[0]-bestQ[0])*n2[0]+(p2[1]-bestQ[1])*n2[1]
+
+## arrays #######################################################################################################
+class entityArray(list):
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.__class__(list.__getitem__(self, key))
+        return list.__getitem__(self, key)
+    def __getslice__(self, i, j):
+        return self.__class__(list.__getslice__(self, i, j))
+    def __add__(self, other):
+        return self.__class__(list(self)+list(other))
+    def findAt(self, *args, **kwargs):
+        ## findAt(((x, y, z),), ...) returns an array, findAt(coordinates=(x, y, z)) returns one entity
+        if 'coordinates' in kwargs:
+            coordinates = kwargs['coordinates']
+            if isPoint(coordinates):
+                return self.findPoint(coordinates)
+            args = (coordinates, )
+        found = []
+        for thisPoint in self.getPoints(args):
+            thisEntity = self.findPoint(thisPoint)
+            if thisEntity is not None and thisEntity not in found:
+                found.append(thisEntity)
+        return self.__class__(found)
+    def getPoints(self, args):
+        pts = []
+        for thisArg in args:
+            if isPoint(thisArg):
+                pts.append(thisArg)
+            else:
+                pts.extend(self.getPoints(thisArg))
+        return pts
+    def findPoint(self, point):
+        best, bestD = None, None
+        for thisEntity in self:
+            d = self.getDistance(thisEntity, vPoint(point))
+            if d is not None and (bestD is None or d<bestD-1.0e-12):
+                best, bestD = thisEntity, d
+        if bestD is None or bestD>self.getFindTolerance():
+            return None
+        return best
+    def getFindTolerance(self):
+        return 1.0e-3
+    def isInside(self, thisEntity, test):
+        for p in thisEntity.getSamples():
+            if not test(p):
+                return False
+        return True
+    def getByBoundingBox(self, xMin=-1.0e20, yMin=-1.0e20, zMin=-1.0e20, xMax=1.0e20, yMax=1.0e20, zMax=1.0e20):
+        test = lambda p: xMin<=p[0]<=xMax and yMin<=p[1]<=yMax and zMin<=p[2]<=zMax
+        return self.__class__([thisEntity for thisEntity in self if self.isInside(thisEntity, test)])
+    def getByBoundingCylinder(self, center1, center2, radius):
+        c1 = vPoint(center1)
+        axis = vSub(vPoint(center2), c1)
+        length = vNorm(axis)
+        axis = vUnit(axis)
+        def test(p):
+            d = vSub(p, c1)
+            t = vDot(d, axis)
+            return 0.0<=t<=length and vNorm(vSub(d, vScale(axis, t)))<=radius
+        return self.__class__([thisEntity for thisEntity in self if self.isInside(thisEntity, test)])
+    def getByBoundingSphere(self, center, radius):
+        c = vPoint(center)
+        test = lambda p: vDist(p, c)<=radius
+        return self.__class__([thisEntity for thisEntity in self if self.isInside(thisEntity, test)])
+    def getBoundingBox(self):
+        pts = [p for thisEntity in self for p in thisEntity.getSamples()]
+        return {'low':tuple([min([p[k] for p in pts]) for k in range(3)]), 'high':tuple([max([p[k] for p in pts]) for k in range(3)])}
+    def getMask(self):
+        ## mask string of the entity indices as written by abaqus, e.g. '[#5 ]' for the indices 0 and 2
+        words = []
+        for thisEntity in self:
+            while len(words)<=thisEntity.index//32:
+                words.append(0)
+            words[thisEntity.index//32] = words[thisEntity.index//32] | (1<<(thisEntity.index%32))
+        return ('[#'+' #'.join(['%x' % thisWord for thisWord in words])+' ]', )
+    def getSequenceFromMask(self, mask):
+        if isinstance(mask, (tuple, list)):
+            mask = mask[0]
+        words = [int(thisWord, 16) for thisWord in mask.strip('[] ').replace('#', ' ').split()]
+        found = []
+        for thisEntity in self:
+            thisWord = thisEntity.index//32
+            if thisWord<len(words) and words[thisWord]>>(thisEntity.index%32) & 1:
+                found.append(thisEntity)
+        return self.__class__(found)
+
+class VertexArray(entityArray):
+    def getDistance(self, thisEntity, p):
+        return vDist(thisEntity.point, p)
+
+class EdgeArray(entityArray):
+    def getDistance(self, thisEntity, p):
+        return getCurveDist(thisEntity.curve, p)
+
+class FaceArray(entityArray):
+    def getDistance(self, thisEntity, p):
+        bMin, bMax = thisEntity.getBounds()
+        margin = 2.0*thisEntity.link
+        for k in range(3):
+            if p[k]<bMin[k]-margin or p[k]>bMax[k]+margin:
+                return None
+        d = thisEntity.carrier.dist(p)
+        if d>1.0e-3:
+            return None
+        if thisEntity.contains(thisEntity.carrier.project(p), 1.0e-6):
+            return d
+        q = thisEntity.getNearest(p, 2.0*thisEntity.link)
+        if q is None:
+            return None
+        return d+vDist(p, q)
+
+class CellArray(entityArray):
+    def getDistance(self, thisEntity, p):
+        q = thisEntity.getNearest(p, 2.0*thisEntity.link)
+        if q is None:
+            return None
+        return 0.0 if thisEntity.contains(p) else vDist(p, q)
+
+## features, datums and regions #################################################################################
+class feature(object):
+    def __init__(self, name, id):
+        self.name = name
+        self.id = id
+
+class datumPlane(object):
+    def __init__(self, point, normal, id):
+        self.pointOn = vPoint(point)
+        self.normal = vUnit(normal)
+        self.id = id
+
+class datumAxis(object):
+    def __init__(self, point, direction, id):
+        self.pointOn = vPoint(point)
+        self.direction = vUnit(direction)
+        self.id = id
+
+class datumPoint(object):
+    def __init__(self, point, id=None):
+        self.pointOn = vPoint(point)
+        self.id = id
+
+class repository(dict):
+    def __getitem__(self, key):
+        if isinstance(key, int) and key not in self:
+            return list(self.values())[key]
+        return dict.__getitem__(self, key)
+
+class partSet(object):
+    def __init__(self, name, nodes=None, elements=None, cells=None, faces=None, edges=None, vertices=None):
+        self.name = name
+        self.nodes = mesh.MeshNodeArray(toMeshList(nodes, mesh.MeshNode))
+        self.elements = mesh.MeshElementArray(toMeshList(elements, mesh.MeshElement))
+        self.cells = CellArray(toList(cells))
+        self.faces = FaceArray(toList(faces))
+        self.edges = EdgeArray(toList(edges))
+        self.vertices = VertexArray(toList(vertices))
+
+class partSurface(object):
+    def __init__(self, name, elementFaces):
+        self.name = name
+        ## list of (element label, face number 1 ... 6)
+        self.elementFaces = elementFaces
+
+## part #########################################################################################################
+class Part(object):
+    def __init__(self, name, dimensionality=THREE_D, type=DEFORMABLE_BODY, model=None):
+        self.name = name
+        self.model = model
+        self.vertices = VertexArray()
+        self.edges = EdgeArray()
+        self.faces = FaceArray()
+        self.cells = CellArray()
+        self.features = repository()
+        self.datums = repository()
+        self.sets = repository()
+        self.surfaces = repository()
+        self.sectionAssignments = []
+        self.nodes = mesh.MeshNodeArray()
+        self.elements = mesh.MeshElementArray()
+        self.elementFaces = []
+        self.edgeSeeds = dict()
+        self.globalSeed = None
+        self.elemTypes = None
+        ## set by generateMesh when ABAQUS_STUB_MAX_ELEMENTS made the mesh coarser than the seeds
+        self.meshCapped = False
+        self.cellVolumes = None
+        self.solid = None
+        self.spacing = 1.0
+        self.version = 0
+        self.carrierEdges = dict()
+        self.featureCount = 0
+    ## features #################################################################################################
+    def addFeature(self, name):
+        self.featureCount = self.featureCount+1
+        baseName = name
+        i = 1
+        while name+'-'+str(i) in self.features:
+            i = i+1
+        thisFeature = feature(baseName+'-'+str(i), self.featureCount)
+        self.features[thisFeature.name] = thisFeature
+        return thisFeature
+    def setTopology(self, edges, faces, cells):
+        ## method to store new entities; duplicate edges are removed and the vertices are rebuilt from the edge ends
+        uniqueEdges, keys = [], set()
+        for thisEdge in edges:
+            key = (getPointKey(thisEdge.curve.pointAt(0.0)), getPointKey(thisEdge.curve.pointAt(0.5)), getPointKey(thisEdge.curve.pointAt(1.0)))
+            reverseKey = (key[2], key[1], key[0])
+            if key in keys or reverseKey in keys:
+                continue
+            keys.add(key)
+            uniqueEdges.append(thisEdge)
+        vertices, vertexKeys = [], dict()
+        for thisVertex in self.vertices:
+            vertexKeys[getPointKey(thisVertex.point)] = thisVertex
+        usedVertices = dict()
+        for thisEdge in uniqueEdges:
+            ends = [thisEdge.curve.pointAt(0.0)] if thisEdge.curve.closed else [thisEdge.curve.pointAt(0.0), thisEdge.curve.pointAt(1.0)]
+            thisEdge.endVertices = []
+            for thisEnd in ends:
+                key = getPointKey(thisEnd)
+                if key not in usedVertices:
+                    usedVertices[key] = vertexKeys[key] if key in vertexKeys else Vertex(thisEnd)
+                    vertices.append(usedVertices[key])
+                thisEdge.endVertices.append(usedVertices[key])
+        self.vertices = VertexArray(vertices)
+        self.edges = EdgeArray(uniqueEdges)
+        self.faces = FaceArray(faces)
+        self.cells = CellArray(cells)
+        for thisArray in [self.vertices, self.edges, self.faces, self.cells]:
+            for i in range(len(thisArray)):
+                thisArray[i].part = self
+                thisArray[i].index = i
+        for thisEdge in self.edges:
+            thisEdge.vertexIDs = tuple([thisVertex.index for thisVertex in thisEdge.endVertices])
+        self.version = self.version+1
+        self.carrierEdges = dict()
+    def getCarrierEdges(self, face):
+        ## edges lying on the carrier surface of a face near its cloud
+        key = id(face)
+        if key not in self.carrierEdges:
+            found = []
+            bMin, bMax = face.getBounds()
+            margin = 2.0*face.link
+            for thisEdge in self.edges:
+                samples = thisEdge.getSamples()
+                eMin, eMax = getBounds(samples)
+                if any([eMax[k]<bMin[k]-margin or eMin[k]>bMax[k]+margin for k in range(3)]):
+                    continue
+                checkPts = samples[::max(1, len(samples)//6)]+[samples[-1]]
+                if max([face.carrier.dist(p) for p in checkPts])<1.0e-7*max(1.0, self.getScale()):
+                    found.append(thisEdge)
+            self.carrierEdges[key] = found
+        return self.carrierEdges[key]
+    def getScale(self):
+        pts = [thisVertex.point for thisVertex in self.vertices]
+        if not pts:
+            return 1.0
+        bMin, bMax = getBounds(pts)
+        return max([bMax[k]-bMin[k] for k in range(3)]+[1.0])
+    def getCellSpacing(self, volume):
+        return max((volume/getCloudSize())**(1.0/3.0), 1.0e-4)
+    ## base features ############################################################################################
+    def BaseSolidExtrude(self, sketch, depth):
+        self.buildPrism(sketch.frame, sketch.getProfilePrims(), float(depth))
+        return self.addFeature('Solid extrude')
+    def BaseSolidRevolve(self, sketch, angle, flipRevolveDirection=OFF):
+        ## axis along the centreline, revolved from the profile side towards axis x e1 (reversed when flipped)
+        line = sketch.centerline.prim
+        frame = sketch.frame
+        origin = frame.to3d(line.origin)
+        axis = vUnit(vSub(frame.to3d((line.origin[0]+line.direction[0], line.origin[1]+line.direction[1])), origin))
+        if flipRevolveDirection==ON:
+            axis = vScale(axis, -1.0)
+        prims = sketch.getProfilePrims()
+        ## profile side ==>> e1 in the sketch plane, perpendicular to the axis
+        pts = []
+        for thisPrim in prims:
+            pts.extend(thisPrim.samples(thisPrim.getLength()/8.0+EPS))
+        inPlane = vCross(frame.normal, axis)
+        side = sum([vDot(vSub(frame.to3d(p), origin), inPlane) for p in pts])
+        e1 = inPlane if side>=0.0 else vScale(inPlane, -1.0)
+        toMeridian = lambda q: (vDot(vSub(frame.to3d(q), origin), axis), vDot(vSub(frame.to3d(q), origin), e1))
+        self.buildRevolve(origin, axis, e1, math.radians(float(angle)), [thisPrim.mapped(toMeridian) for thisPrim in prims])
+        ## the axis of revolution is available as datum of the revolve feature
+        thisFeature = self.addFeature('Solid revolve')
+        self.datums[thisFeature.id] = datumAxis(origin, axis, thisFeature.id)
+        return thisFeature
+    def BaseSolidSweep(self, sketch, path, **kwargs):
+        ## sweep of the profile along an arc path ==>> revolution about the arc axis, profile placed at the path start
+        pathGeometry = [thisGeometry for thisGeometry in path.geometry.values() if not thisGeometry.construction][0]
+        if pathGeometry.prim.kind=='line':
+            start, end = path.frame.to3d(pathGeometry.prim.a), path.frame.to3d(pathGeometry.prim.b)
+            frame = planeFrame(vAdd(sketch.frame.origin, start), sketch.frame.e1, sketch.frame.e2)
+            depth = vDist(start, end)
+            if vDot(frame.normal, vSub(end, start))<0.0:
+                frame = planeFrame(frame.origin, frame.e2, frame.e1)
+            self.buildPrism(frame, [thisPrim.mapped(lambda q: (q[1], q[0])) if vDot(planeFrame(frame.origin, sketch.frame.e1, sketch.frame.e2).normal, vSub(end, start))<0.0 else thisPrim
+                                    for thisPrim in sketch.getProfilePrims()], depth)
+            return self.addFeature('Solid sweep')
+        prim = pathGeometry.prim
+        center = path.frame.to3d(prim.c)
+        start = path.frame.to3d(getattr(pathGeometry, 'start', prim.pointAt(0.0)))
+        clockwise = getattr(pathGeometry, 'clockwise', False)
+        axis = vScale(path.frame.normal, -1.0 if clockwise else 1.0)
+        e1 = vUnit(vSub(start, center))
+        toMeridian = lambda q: (vDot(vSub(vAdd(start, vSub(sketch.frame.to3d(q), sketch.frame.origin)), center), axis),
+                                vDot(vSub(vAdd(start, vSub(sketch.frame.to3d(q), sketch.frame.origin)), center), e1))
+        self.buildRevolve(center, axis, e1, prim.sweep, [thisPrim.mapped(toMeridian) for thisPrim in sketch.getProfilePrims()])
+        return self.addFeature('Solid sweep')
+    def buildPrism(self, frame, prims, depth):
+        self.solid = prismSolid(frame, prims, depth)
+        xMin, yMin, xMax, yMax = getPrimBounds(prims)
+        s = self.getCellSpacing(max(getRegionArea(prims), EPS)*depth)
+        s = min(s, 0.5*depth, 0.5*max(xMax-xMin, yMax-yMin))
+        self.spacing = s
+        sf = 0.7*s
+        top = planeFrame(vAdd(frame.origin, vScale(frame.normal, depth)), frame.e1, frame.e2)
+        ## edges ==>> profile curves at both ends, straight edges at the profile vertices
+        edges = []
+        ends = dict()
+        for thisPrim in prims:
+            edges.append(Edge(lift2dPrim(thisPrim, frame)))
+            edges.append(Edge(lift2dPrim(thisPrim, top)))
+            for thisEnd in thisPrim.getEnds():
+                ends[(round(thisEnd[0]/1.0e-9), round(thisEnd[1]/1.0e-9))] = thisEnd
+        for key in sorted(ends.keys()):
+            edges.append(Edge(lineCurve(frame.to3d(ends[key]), top.to3d(ends[key]))))
+        ## faces ==>> caps and one side face per primitive
+        nz = max(2, int(math.ceil(depth/sf)))
+        zf = [(k+0.5)*depth/nz for k in range(nz)]
+        faces = []
+        capGrid = getRegionGrid(prims, sf)
+        faces.append(Face(planeSurface(frame.origin, vScale(frame.normal, -1.0)), [frame.to3d(q) for q in capGrid], sf))
+        faces.append(Face(planeSurface(top.origin, frame.normal), [top.to3d(q) for q in capGrid], sf))
+        for thisPrim in prims:
+            n = max(2, int(math.ceil(thisPrim.getLength()/sf)))
+            pts = []
+            for i in range(n):
+                q = thisPrim.pointAt((i+0.5)/n)
+                for z in zf:
+                    pts.append(vAdd(frame.to3d(q), vScale(frame.normal, z)))
+            if thisPrim.kind=='line':
+                a, b = frame.to3d(thisPrim.a), frame.to3d(thisPrim.b)
+                carrier = planeSurface(a, vCross(vSub(b, a), frame.normal))
+            else:
+                carrier = sweptSurface(frame, [thisPrim])
+            faces.append(Face(carrier, pts, sf))
+        ## cells ==>> interior grid, split into connected regions
+        nzc = max(2, int(math.ceil(depth/s)))
+        grid = getRegionGrid(prims, s)
+        pts = [vAdd(frame.to3d(q), vScale(frame.normal, (k+0.5)*depth/nzc)) for q in grid for k in range(nzc)]
+        cells = [Cell([pts[i] for i in thisComponent], s) for thisComponent in getComponents(pts, 1.75*s)]
+        self.setTopology(edges, faces, cells)
+    def buildRevolve(self, origin, axis, e1, angle, prims):
+        ## prims in (axial position, radius); primitives on the axis bound the region but create no face
+        solid = revolveSolid(origin, axis, e1, angle, prims)
+        self.solid = solid
+        tMin, rMin, tMax, rMax = getPrimBounds(prims)
+        size = max(tMax-tMin, rMax-rMin)
+        volume = getRegionArea(prims, weight=lambda q: q[1])*angle
+        s = min(self.getCellSpacing(max(volume, EPS)), 0.5*size)
+        self.spacing = s
+        sf = 0.7*s
+        isOnAxis = lambda thisPrim: thisPrim.kind=='line' and abs(thisPrim.a[1])<1.0e-9 and abs(thisPrim.b[1])<1.0e-9
+        def getArcPoints(q, spacing, offset=0.5):
+            n = max(2, int(math.ceil(q[1]*angle/spacing)))
+            return [solid.pointAt(q[0], q[1], (k+offset)*angle/n) for k in range(n)]
+        revolveAxis = vCross(e1, solid.e2)
+        edges = []
+        ends = dict()
+        for thisPrim in prims:
+            if isOnAxis(thisPrim):
+                if not solid.isFull:
+                    edges.append(Edge(lineCurve(solid.pointAt(thisPrim.a[0], 0.0, 0.0), solid.pointAt(thisPrim.b[0], 0.0, 0.0))))
+                continue
+            if not solid.isFull:
+                for phi in [0.0, angle]:
+                    frame = planeFrame(origin, axis, vAdd(vScale(e1, math.cos(phi)), vScale(solid.e2, math.sin(phi))))
+                    edges.append(Edge(lift2dPrim(thisPrim, frame)))
+            for thisEnd in thisPrim.getEnds():
+                ends[(round(thisEnd[0]/1.0e-9), round(thisEnd[1]/1.0e-9))] = thisEnd
+        for key in sorted(ends.keys()):
+            q = ends[key]
+            if q[1]>1.0e-9:
+                center = vAdd(origin, vScale(axis, q[0]))
+                edges.append(Edge(arcCurve(center, revolveAxis, q[1], e1, angle)))
+        ## faces ==>> one revolved face per primitive off the axis, caps for a partial revolution
+        faces = []
+        meridian = revolveFrame(origin, axis, e1)
+        for thisPrim in prims:
+            if isOnAxis(thisPrim):
+                continue
+            n = max(2, int(math.ceil(thisPrim.getLength()/sf)))
+            pts = []
+            for i in range(n):
+                pts.extend(getArcPoints(thisPrim.pointAt((i+0.5)/n), sf))
+            if thisPrim.kind=='line' and abs(thisPrim.a[0]-thisPrim.b[0])<1.0e-12:
+                carrier = planeSurface(vAdd(origin, vScale(axis, thisPrim.a[0])), axis)
+            else:
+                carrier = sweptSurface(meridian, [thisPrim])
+            faces.append(Face(carrier, pts, sf))
+        if not solid.isFull:
+            capGrid = getRegionGrid(prims, sf)
+            for phi, sign in [(0.0, -1.0), (angle, 1.0)]:
+                radial = vAdd(vScale(e1, math.cos(phi)), vScale(solid.e2, math.sin(phi)))
+                normal = vScale(vCross(axis, radial), sign)
+                faces.append(Face(planeSurface(origin, normal), [solid.pointAt(q[0], q[1], phi) for q in capGrid], sf))
+        ## cells
+        pts = []
+        for q in getRegionGrid(prims, s):
+            pts.extend(getArcPoints(q, s))
+        cells = [Cell([pts[i] for i in thisComponent], s) for thisComponent in getComponents(pts, 1.75*s)]
+        self.setTopology(edges, faces, cells)
+    ## datums ###################################################################################################
+    def DatumPlaneByPrincipalPlane(self, principalPlane, offset):
+        normal = {'XYPLANE':(0.0, 0.0, 1.0), 'YZPLANE':(1.0, 0.0, 0.0), 'XZPLANE':(0.0, 1.0, 0.0)}[str(principalPlane)]
+        thisFeature = self.addFeature('Datum plane')
+        self.datums[thisFeature.id] = datumPlane(vScale(normal, float(offset)), normal, thisFeature.id)
+        return thisFeature
+    def DatumAxisByTwoPoint(self, point1, point2):
+        p1, p2 = getPointOf(point1), getPointOf(point2)
+        thisFeature = self.addFeature('Datum axis')
+        self.datums[thisFeature.id] = datumAxis(p1, vSub(p2, p1), thisFeature.id)
+        return thisFeature
+    def InterestingPoint(self, edge, rule):
+        if isinstance(edge, entityArray):
+            edge = edge[0]
+        if rule==CENTER and edge.curve.kind=='arc':
+            return datumPoint(edge.curve.center)
+        return datumPoint(edge.curve.pointAt(0.5))
+    ## partitions ###############################################################################################
+    def PartitionCellByDatumPlane(self, datumPlane, cells):
+        self.partitionByCut(planeCut(datumPlane.pointOn, datumPlane.normal), cells)
+        return self.addFeature('Partition cell')
+    def PartitionCellByPlaneThreePoints(self, point1, point2, point3, cells):
+        p1, p2, p3 = getPointOf(point1), getPointOf(point2), getPointOf(point3)
+        self.partitionByCut(planeCut(p1, vCross(vSub(p2, p1), vSub(p3, p1))), cells)
+        return self.addFeature('Partition cell')
+    def PartitionCellBySweepEdge(self, sweepPath, cells, edges):
+        if isinstance(sweepPath, entityArray):
+            sweepPath = sweepPath[0]
+        curve = sweepPath.curve
+        if curve.kind=='arc':
+            frame = revolveFrame(curve.center, curve.axis, curve.u)
+        else:
+            direction = vUnit(vSub(curve.pointAt(1.0), curve.pointAt(0.0)))
+            e1 = getPerpendicular(direction)
+            frame = planeFrame(curve.pointAt(0.0), e1, vCross(direction, e1))
+        self.partitionBySweep(frame, toList(edges), cells)
+        return self.addFeature('Partition cell')
+    def PartitionCellByExtrudeEdge(self, line, cells, edges, sense=FORWARD):
+        if isinstance(line, entityArray):
+            line = line[0]
+        if isinstance(line, Edge):
+            p0, direction = line.curve.pointAt(0.0), vUnit(vSub(line.curve.pointAt(1.0), line.curve.pointAt(0.0)))
+        else:
+            p0, direction = line.pointOn, line.direction
+        e1 = getPerpendicular(direction)
+        self.partitionBySweep(planeFrame(p0, e1, vCross(direction, e1)), toList(edges), cells)
+        return self.addFeature('Partition cell')
+    def partitionBySweep(self, frame, edges, cells):
+        prims = []
+        for thisEdge in edges:
+            prims.extend(project2dCurve(thisEdge.curve, frame))
+        if not prims:
+            raise Exception('Feature creation failed: no edges to sweep.')
+        self.partitionByCut(curveCut(frame, prims, ext=1.75*self.spacing), cells)
+    def partitionByCut(self, cut, cells):
+        ## method to split the selected cells, their faces and edges by a cutting tool
+        selected = toList(cells)
+        if not selected:
+            return
+        link = max([thisCell.link for thisCell in selected])
+        def isNear(p):
+            for thisCell in selected:
+                if thisCell.getHash().hasNear(p, link):
+                    return True
+            return False
+        ## edges
+        edges, splitPoints = [], []
+        for thisEdge in self.edges:
+            if max([cut.dist(p) for p in thisEdge.getSamples()])<1.0e-7:
+                ## edges lying in the cut are kept
+                edges.append(thisEdge)
+                continue
+            params = [t for t in getCutParams(thisEdge.curve, cut, self.spacing) if isNear(thisEdge.curve.pointAt(t))]
+            if not params:
+                edges.append(thisEdge)
+                continue
+            for thisCurve in splitCurve(thisEdge.curve, params):
+                edges.append(Edge(thisCurve))
+            splitPoints.extend([thisEdge.curve.pointAt(t) for t in params])
+        ## faces
+        faces = []
+        snapPoints = splitPoints+[thisVertex.point for thisVertex in self.vertices]
+        for thisFace in self.faces:
+            isAdjacent = False
+            for p in thisFace.pts[::max(1, len(thisFace.pts)//40)]:
+                if isNear(p):
+                    isAdjacent = True
+                    break
+            checkPts = thisFace.pts[::max(1, len(thisFace.pts)//20)]
+            if not isAdjacent or max([cut.dist(p) for p in checkPts])<1.0e-9:
+                faces.append(thisFace)
+                continue
+            pieces, interface = self.splitCloud(thisFace, cut, lambda x: alternateProject(x, cut, thisFace.carrier), thisFace.contains)
+            if len(pieces)<2:
+                faces.append(thisFace)
+                continue
+            for thisPieces in pieces:
+                faces.append(Face(thisFace.carrier, thisPieces, thisFace.spacing))
+            for thisCurve in getInterfaceCurves(interface, 2.5*thisFace.spacing, snapPoints, 1.5*thisFace.link):
+                edges.append(Edge(thisCurve))
+        ## cells
+        cellList = []
+        for thisCell in self.cells:
+            if thisCell not in selected:
+                cellList.append(thisCell)
+                continue
+            pieces, interface = self.splitCloud(thisCell, cut, cut.project, thisCell.contains)
+            if len(pieces)<2:
+                cellList.append(thisCell)
+                continue
+            for thisPieces in pieces:
+                cellList.append(Cell(thisPieces, thisCell.spacing))
+            for thisComponent in getComponents(interface, 2.0*thisCell.link):
+                faces.append(Face(cut.surface, [interface[i] for i in thisComponent], thisCell.spacing))
+        self.setTopology(edges, faces, cellList)
+    def splitCloud(self, entity, cut, project, contains):
+        ## method to split the cloud of a face or cell by a cut; returns the clouds of the pieces and the interface
+        ## points; thin regions next to the cut are sampled by probe points
+        pts = list(entity.pts)
+        s = entity.spacing
+        nearCut = [p for p in pts if cut.dist(p)<=entity.link]
+        if not nearCut:
+            ## cut away from the cloud
+            return [pts], []
+        ## points lying in the cut would connect both sides
+        pts = [p for p in pts if cut.side(p)!=0]
+        probes, keys = [], set()
+        for p in nearCut:
+            x = project(p)
+            if x is None:
+                continue
+            d = vSub(p, x)
+            if vNorm(d)<1.0e-9:
+                continue
+            ## one set of probes per fraction of the spacing
+            key = getPointKey(x, 0.5*s)
+            if key in keys:
+                continue
+            keys.add(key)
+            n = vUnit(d)
+            for alpha in [-0.3, -0.06, 0.06]:
+                q = vAdd(x, vScale(n, alpha*s))
+                if contains(q):
+                    probes.append(q)
+        pts = pts+probes
+        crossings = []
+        components = getComponents(pts, entity.link, cut, crossings=crossings)
+        ## tiny components are not split off
+        components.sort(key=lambda thisComponent: -len(thisComponent))
+        large = [thisComponent for thisComponent in components if len(thisComponent)>=3]
+        if len(large)<2:
+            return [pts], []
+        label = dict()
+        for i in range(len(large)):
+            for j in large[i]:
+                label[j] = i
+        pieces = [[pts[j] for j in thisComponent] for thisComponent in large]
+        interface, keys = [], set()
+        for j, k in crossings:
+            if j not in label or k not in label or label[j]==label[k]:
+                continue
+            x = project(vScale(vAdd(pts[j], pts[k]), 0.5))
+            if x is None:
+                continue
+            ## one interface point per fraction of the spacing
+            key = getPointKey(x, 0.5*s)
+            if key in keys:
+                continue
+            keys.add(key)
+            interface.append(x)
+            pieces[label[j]].append(vAdd(x, vScale(vSub(pts[j], x), 0.1)))
+            pieces[label[k]].append(vAdd(x, vScale(vSub(pts[k], x), 0.1)))
+        return pieces, interface
+    def PartitionFaceBySketch(self, sketchUpEdge=None, faces=None, sketch=None, sketchOrientation=RIGHT):
+        frame = sketch.frame
+        prims = sketch.getProfilePrims()
+        ## sketch primitives split at their mutual intersections
+        params = [[] for thisPrim in prims]
+        for i in range(len(prims)):
+            for j in range(i+1, len(prims)):
+                for tA, tB in intersect2d(prims[i], prims[j]):
+                    params[i].append(tA)
+                    params[j].append(tB)
+        edges = list(self.edges)
+        for thisFace in toList(faces):
+            faceEdges = self.getCarrierEdges(thisFace)
+            edgePrims = [(thisEdge, project2dCurve(thisEdge.curve, frame)) for thisEdge in faceEdges]
+            facePrims, splitPoints = [], []
+            for i in range(len(prims)):
+                primParams = list(params[i])
+                for thisEdge, thisEdgePrims in edgePrims:
+                    for thisEdgePrim in thisEdgePrims:
+                        primParams.extend([tA for tA, tB in intersect2d(prims[i], thisEdgePrim)])
+                for thisPiece in splitPrim(prims[i], primParams):
+                    mid = frame.to3d(thisPiece.pointAt(0.5))
+                    if not thisFace.contains(thisFace.carrier.project(mid), 1.0e-6):
+                        continue
+                    if min([getCurveDist(thisEdge.curve, mid) for thisEdge in faceEdges]+[1.0])<1.0e-7:
+                        continue
+                    facePrims.append(thisPiece)
+                    splitPoints.extend([frame.to3d(p) for p in thisPiece.getEnds()])
+            if not facePrims:
+                continue
+            ## face edges split at the ends of the new edges
+            newEdges = []
+            for thisEdge in edges:
+                if thisEdge not in faceEdges:
+                    newEdges.append(thisEdge)
+                    continue
+                edgeParams = []
+                for p in splitPoints:
+                    t = thisEdge.curve.nearestParam(p)
+                    if vDist(thisEdge.curve.pointAt(t), p)<1.0e-7 and 1.0e-9<t<1.0-1.0e-9:
+                        edgeParams.append(t)
+                if edgeParams:
+                    newEdges.extend([Edge(thisCurve) for thisCurve in splitCurve(thisEdge.curve, edgeParams)])
+                else:
+                    newEdges.append(thisEdge)
+            ## new edges first, as numbered by abaqus cae
+            edges = [Edge(lift2dPrim(thisPrim, frame)) for thisPrim in facePrims]+newEdges
+            cut = curveCut(frame, facePrims)
+            pieces, interface = self.splitCloud(thisFace, cut, lambda x: alternateProject(x, cut, thisFace.carrier), thisFace.contains)
+            faceList = [f for f in self.faces if f is not thisFace]
+            if len(pieces)>=2:
+                faceList.extend([Face(thisFace.carrier, thisPieces, thisFace.spacing) for thisPieces in pieces])
+            else:
+                faceList.append(thisFace)
+            self.setTopology(edges, faceList, list(self.cells))
+            edges = list(self.edges)
+        self.setTopology(edges, list(self.faces), list(self.cells))
+        return self.addFeature('Partition face')
+    def MakeSketchTransform(self, sketchPlane, sketchUpEdge, sketchPlaneSide=SIDE1, origin=(0.0, 0.0, 0.0), sketchOrientation=RIGHT):
+        ## sketch frame on a planar face ==>> normal pointing out of the solid, up along the up edge; the sense of the
+        ## edge is not known, hence the sketch x axis is taken along the positive global direction
+        if isinstance(sketchPlane, entityArray):
+            sketchPlane = sketchPlane[0]
+        if isinstance(sketchUpEdge, entityArray):
+            sketchUpEdge = sketchUpEdge[0]
+        n = getPlanarNormal(sketchPlane.carrier)
+        p = sketchPlane.pts[len(sketchPlane.pts)//2]
+        if self.solid.classify(vAdd(p, vScale(n, 1.0e-5*self.getScale())))==1:
+            n = vScale(n, -1.0)
+        if sketchUpEdge.curve.closed:
+            ## closed edge ==>> tangent at the start
+            up = vSub(sketchUpEdge.curve.pointAt(1.0e-4), sketchUpEdge.curve.pointAt(0.0))
+        else:
+            up = vSub(sketchUpEdge.curve.pointAt(1.0), sketchUpEdge.curve.pointAt(0.0))
+        up = vUnit(vSub(up, vScale(n, vDot(up, n))))
+        right = vCross(up, n)
+        k = max(range(3), key=lambda i: abs(right[i]))
+        if right[k]<0.0:
+            up, right = vScale(up, -1.0), vScale(right, -1.0)
+        o = sketchPlane.carrier.project(vPoint(origin))
+        return sketchTransform(planeFrame(o, right, up))
+    def projectReferencesOntoSketch(self, sketch, filter=COPLANAR_EDGES, upToFeature=None, edges=None):
+        plane = planeSurface(sketch.frame.origin, sketch.frame.normal)
+        for thisEdge in self.edges:
+            if max([plane.dist(p) for p in thisEdge.getSamples()])<1.0e-7*max(1.0, self.getScale()):
+                sketch.addReference(thisEdge.curve)
+    ## seeds and mesh controls ##################################################################################
+    def seedPart(self, size, deviationFactor=0.1, minSizeFactor=0.1, constraint=None):
+        self.globalSeed = float(size)
+    def seedEdgeBySize(self, edges, size, deviationFactor=0.1, constraint=None, **kwargs):
+        for thisEdge in toList(edges):
+            number = max(1, int(math.ceil(thisEdge.curve.getLength()/float(size)-1.0e-9)))
+            self.edgeSeeds[thisEdge] = {'Number':number, 'Ratio':1.0}
+    def seedEdgeByNumber(self, edges, number, constraint=None, **kwargs):
+        for thisEdge in toList(edges):
+            self.edgeSeeds[thisEdge] = {'Number':int(number), 'Ratio':1.0}
+    def seedEdgeByBias(self, biasMethod=SINGLE, end1Edges=(), end2Edges=(), minSize=None, maxSize=None, ratio=None, number=None, constraint=None, **kwargs):
+        for thisEdge in toList(end1Edges)+toList(end2Edges):
+            if ratio is None:
+                thisNumber, thisRatio = getBiasSeed(thisEdge.curve.getLength(), float(minSize), float(maxSize))
+            else:
+                thisNumber, thisRatio = int(number), float(ratio)
+            self.edgeSeeds[thisEdge] = {'Number':thisNumber, 'Ratio':thisRatio}
+    def getEdgeSeeds(self, edge, attribute):
+        if isinstance(edge, entityArray):
+            edge = edge[0]
+        seed = self.edgeSeeds.get(edge)
+        if seed is None:
+            size = self.globalSeed if self.globalSeed is not None else edge.curve.getLength()
+            seed = {'Number':max(1, int(math.ceil(edge.curve.getLength()/size))), 'Ratio':1.0}
+        if attribute==BIAS_RATIO:
+            return seed['Ratio']
+        if attribute==NUMBER:
+            return seed['Number']
+        return edge.curve.getLength()/seed['Number']
+    def setMeshControls(self, regions, **kwargs):
+        pass
+    def setSweepPath(self, region, edge, sense):
+        pass
+    def setElementType(self, regions, elemTypes):
+        self.elemTypes = elemTypes
+    def getElementCode(self):
+        if not self.elemTypes:
+            return 'C3D8R'
+        for thisElemType in self.elemTypes:
+            if str(thisElemType.elemCode).startswith('C3D8'):
+                return str(thisElemType.elemCode)
+        return str(self.elemTypes[0].elemCode)
+    def generateMesh(self, regions=None, **kwargs):
+        generateVoxelMesh(self)
+    def deleteMesh(self, regions=None, **kwargs):
+        self.nodes = mesh.MeshNodeArray()
+        self.elements = mesh.MeshElementArray()
+    ## sets, surfaces and sections ##############################################################################
+    def Set(self, name, nodes=None, elements=None, cells=None, faces=None, edges=None, vertices=None, **kwargs):
+        thisSet = partSet(name, nodes, elements, cells, faces, edges, vertices)
+        self.sets[name] = thisSet
+        return thisSet
+    def getVolume(self, cells=None, relativeAccuracy=0.000001):
+        return sum([thisCell.getVolume() for thisCell in (self.cells if cells is None else toList(cells))])
+    def getCellVolumes(self):
+        ## volume of every cell ==>> voxels of the solid, each counted for the cell with the nearest cloud point; the
+        ## clouds are denser next to partitions, hence the number of cloud points does not measure the volume
+        if self.cellVolumes is not None and self.cellVolumes[0]==self.version:
+            return self.cellVolumes[1]
+        pts, owners = [], []
+        for thisCell in self.cells:
+            pts.extend(thisCell.pts)
+            owners.extend([thisCell.index]*len(thisCell.pts))
+        boundPts = list(pts)
+        for thisFace in self.faces:
+            boundPts.extend(thisFace.pts)
+        for thisEdge in self.edges:
+            boundPts.extend(thisEdge.getSamples())
+        bMin, bMax = getBounds(boundPts)
+        extent = [max(bMax[k]-bMin[k], 1.0e-6) for k in range(3)]
+        h = (extent[0]*extent[1]*extent[2]/(10.0*getCloudSize()))**(1.0/3.0)
+        n = [max(2, int(math.ceil(extent[k]/h))) for k in range(3)]
+        d = [extent[k]/n[k] for k in range(3)]
+        link = max([thisCell.link for thisCell in self.cells])
+        cloudHash = pointHash(pts, link)
+        volumes = [0.0]*len(self.cells)
+        for i in range(n[0]):
+            for j in range(n[1]):
+                for k in range(n[2]):
+                    c = (bMin[0]+(i+0.5)*d[0], bMin[1]+(j+0.5)*d[1], bMin[2]+(k+0.5)*d[2])
+                    if self.solid.classify(c)<0:
+                        continue
+                    radius = link
+                    near = cloudHash.getNear(c, radius)
+                    while not near and radius<max(extent):
+                        radius = 2.0*radius
+                        near = cloudHash.getNear(c, radius)
+                    if near:
+                        nearest = min(near, key=lambda m: vDist(pts[m], c))
+                        volumes[owners[nearest]] += d[0]*d[1]*d[2]
+        self.cellVolumes = (self.version, volumes)
+        return volumes
+    def SetFromNodeLabels(self, name, nodeLabels, unsorted=False):
+        labels = set(nodeLabels)
+        return self.Set(name, nodes=mesh.MeshNodeArray([thisNode for thisNode in self.nodes if thisNode.label in labels]))
+    def Surface(self, name, side1Faces=None, **kwargs):
+        elementFaces = []
+        for i in range(6):
+            for thisFace in kwargs.get('face'+str(i+1)+'Elements', []):
+                elementFaces.append((thisFace.element.label, i+1))
+        for thisFace in toList(side1Faces):
+            for thisElementFace in thisFace.getElementFaces():
+                elementFaces.append((thisElementFace.element.label, int(str(thisElementFace.face)[4:])))
+        thisSurface = partSurface(name, elementFaces)
+        self.surfaces[name] = thisSurface
+        return thisSurface
+    def SectionAssignment(self, region, sectionName, **kwargs):
+        self.sectionAssignments.append((region, sectionName))
+    ## mesh queries #############################################################################################
+    def getNodesNear(self, pts, tol):
+        found = []
+        for thisNode in self.nodes:
+            for p in pts:
+                if vDist(thisNode.coordinates, p)<=tol:
+                    found.append(thisNode)
+                    break
+        return mesh.MeshNodeArray(found)
+    def getNodesOnCurve(self, curve):
+        return mesh.MeshNodeArray([thisNode for thisNode in self.nodes if getCurveDist(curve, thisNode.coordinates)<1.0e-6])
+    def getNodesOnFace(self, face):
+        found = []
+        for thisNode in self.nodes:
+            p = thisNode.coordinates
+            if face.carrier.dist(p)<1.0e-6 and face.contains(face.carrier.project(p), 1.0e-6):
+                found.append(thisNode)
+        return mesh.MeshNodeArray(found)
+    def getElementFacesOnFace(self, face):
+        ## exterior element faces whose centre lies on the face and whose normal is along the face normal
+        found = []
+        bMin, bMax = face.getBounds()
+        for thisElement, faceID, center, normal, h in self.elementFaces:
+            if any([center[k]<bMin[k]-h or center[k]>bMax[k]+h for k in range(3)]):
+                continue
+            if face.carrier.dist(center)>0.3*h:
+                continue
+            if abs(vDot(normal, face.carrier.normalAt(center)))<0.5:
+                continue
+            if face.contains(face.carrier.project(center), 1.0e-6):
+                found.append(mesh.MeshFace(thisElement, mesh.getFaceConstant(faceID)))
+        return mesh.MeshFaceArray(found)
+
+def getPointOf(point):
+    ## coordinates of a vertex, datum point or coordinate tuple
+    if isinstance(point, entityArray):
+        point = point[0]
+    if isinstance(point, Vertex):
+        return point.point
+    if isinstance(point, datumPoint):
+        return point.pointOn
+    return vPoint(point)
+
+def getBiasSeed(length, minSize, maxSize):
+    ## number of elements and bias ratio of a single bias seed between minSize and maxSize
+    ratio = max(maxSize, minSize)/min(maxSize, minSize)
+    best, bestError = 1, None
+    for n in range(1, 2000):
+        if n==1:
+            total = minSize
+        else:
+            q = ratio**(1.0/(n-1))
+            total = minSize*n if abs(q-1.0)<1.0e-12 else minSize*(q**n-1.0)/(q-1.0)
+        error = abs(total-length)
+        if bestError is None or error<bestError:
+            best, bestError = n, error
+        if total>length:
+            break
+    return best, (ratio if best>1 else 1.0)
+
+def alternateProject(p, cut, carrier):
+    ## method to return the point on the intersection of the cut and a carrier surface nearest to p, None when the
+    ## alternating projection does not converge
+    x = p
+    for i in range(60):
+        x = carrier.project(cut.project(x))
+        if cut.dist(x)<1.0e-10:
+            return x
+    return x if cut.dist(x)<1.0e-7 else None
+
+def getCutParams(curve, cut, spacing):
+    ## method to return the parameters at which a curve crosses a cut
+    length = curve.getLength()
+    n = min(400, max(16, int(math.ceil(length/(0.25*spacing)))))
+    ts = [float(i)/n for i in range(n+1)]
+    pts = [curve.pointAt(t) for t in ts]
+    params = []
+    for i in range(n):
+        if cut.crosses(pts[i], pts[i+1]):
+            lo, hi = ts[i], ts[i+1]
+            for j in range(60):
+                mid = 0.5*(lo+hi)
+                if cut.side(curve.pointAt(mid))==0:
+                    ## mid point within the tolerance band of the cut
+                    lo = hi = mid
+                    break
+                if cut.crosses(curve.pointAt(lo), curve.pointAt(mid)):
+                    hi = mid
+                else:
+                    lo = mid
+            params.append(0.5*(lo+hi))
+    ## samples exactly on the cut
+    for i in range(n+1):
+        if cut.dist(pts[i])<1.0e-12:
+            if 0<i<n and cut.crosses(pts[i-1], pts[i+1]):
+                params.append(ts[i])
+            elif curve.closed and i==0 and cut.crosses(pts[n-1], pts[1]):
+                params.append(0.0)
+    params = sorted(params)
+    unique = []
+    for t in params:
+        if curve.closed or 1.0e-9<t<1.0-1.0e-9:
+            if not unique or t-unique[-1]>1.0e-9:
+                unique.append(t)
+    return unique
+
+def splitCurve(curve, params):
+    ## method to return the pieces of a curve split at the parameters
+    params = sorted(params)
+    if curve.closed:
+        if len(params)==1:
+            bounds = [(params[0], params[0]+1.0)]
+        else:
+            bounds = [(params[i], params[i+1]) for i in range(len(params)-1)]+[(params[-1], params[0]+1.0)]
+    else:
+        params = [0.0]+params+[1.0]
+        bounds = [(params[i], params[i+1]) for i in range(len(params)-1)]
+    pieces = []
+    for t0, t1 in bounds:
+        if t1-t0<1.0e-12:
+            continue
+        if curve.kind=='poly':
+            n = max(8, len(curve.pts))
+            pts = [curve.pointAt((t0+(t1-t0)*i/n) % 1.0 if curve.closed and t0+(t1-t0)*i/n>1.0 else t0+(t1-t0)*i/n) for i in range(n+1)]
+            pieces.append(fitCurve(pts))
+        else:
+            pieces.append(curve.subCurve(t0, t1))
+    return pieces
+
+def splitPrim(prim, params):
+    ## method to return the pieces of a 2D primitive split at the parameters
+    params = sorted([t for t in params if -1.0e-12<=t<=1.0+1.0e-12])
+    if prim.closed:
+        if not params:
+            return [prim]
+        if len(params)==1:
+            return [prim.subPrim(params[0], params[0]+1.0)]
+        bounds = [(params[i], params[i+1]) for i in range(len(params)-1)]+[(params[-1], params[0]+1.0)]
+    else:
+        params = [0.0]+params+[1.0]
+        bounds = [(params[i], params[i+1]) for i in range(len(params)-1)]
+    return [prim.subPrim(t0, t1) for t0, t1 in bounds if (t1-t0)*prim.getLength()>1.0e-9]
+
+def getInterfaceCurves(pts, linkDist, snapPoints, snapDist):
+    ## method to fit curves through the interface points of a cut; open chains are extended to the nearest split
+    ## points of the boundary edges
+    unique, keys = [], set()
+    for p in pts:
+        key = getPointKey(p, 1.0e-7)
+        if key not in keys:
+            keys.add(key)
+            unique.append(p)
+    curves = []
+    for chain, closed in orderChain(unique, linkDist):
+        if not closed:
+            for atStart in [True, False]:
+                end = chain[0] if atStart else chain[-1]
+                candidates = [p for p in snapPoints if vDist(p, end)<=snapDist]
+                if not candidates:
+                    continue
+                nearest = min(candidates, key=lambda p: vDist(p, end))
+                if vDist(nearest, end)<1.0e-9:
+                    continue
+                if atStart:
+                    chain.insert(0, nearest)
+                else:
+                    chain.append(nearest)
+        if len(chain)<2 or (not closed and vDist(chain[0], chain[-1])<1.0e-9):
+            continue
+        curves.append(fitCurve(chain, closed))
+    return curves
+
+## voxel mesh ###################################################################################################
+def getBucketKey(p, cellSize):
+    return (int(math.floor(p[0]/cellSize)), int(math.floor(p[1]/cellSize)), int(math.floor(p[2]/cellSize)))
+
+def getEntityRegistry(samples, cellSize, radius):
+    ## map of bucket keys to the indices of the entities with a sample point within radius of the bucket
+    n = int(math.ceil(radius/cellSize))
+    registry = dict()
+    for index in range(len(samples)):
+        keys = set([getBucketKey(p, cellSize) for p in samples[index]])
+        near = set()
+        for k in keys:
+            for i in range(k[0]-n, k[0]+n+1):
+                for j in range(k[1]-n, k[1]+n+1):
+                    for l in range(k[2]-n, k[2]+n+1):
+                        near.add((i, j, l))
+        for k in near:
+            registry.setdefault(k, []).append(index)
+    return registry
+
+def generateVoxelMesh(part):
+    ## hex mesh of the voxels with centre inside the solid; boundary nodes are snapped to the geometry
+    pts = []
+    for thisCell in part.cells:
+        pts.extend(thisCell.pts)
+    for thisFace in part.faces:
+        pts.extend(thisFace.pts)
+    for thisEdge in part.edges:
+        pts.extend(thisEdge.getSamples())
+    bMin, bMax = getBounds(pts)
+    extent = [max(bMax[k]-bMin[k], 1.0e-6) for k in range(3)]
+    sizes = [thisEdge.curve.getLength()/thisSeed['Number'] for thisEdge, thisSeed in part.edgeSeeds.items()]
+    if part.globalSeed is not None:
+        sizes.append(part.globalSeed)
+    target = math.exp(sum([math.log(max(size, 1.0e-9)) for size in sizes])/len(sizes)) if sizes else max(extent)/10.0
+    budget = (extent[0]*extent[1]*extent[2]/getElementBudget())**(1.0/3.0)
+    h = max(target, budget)
+    n = [max(1, int(math.ceil(extent[k]/h-1.0e-9))) for k in range(3)]
+    while n[0]*n[1]*n[2]>getElementBudget():
+        h = h*1.05
+        n = [max(1, int(math.ceil(extent[k]/h-1.0e-9))) for k in range(3)]
+    d = [extent[k]/n[k] for k in range(3)]
+    ## mesh coarser than the seeds ==>> the element number does not follow the seeds
+    part.meshCapped = h>target*(1.0+1.0e-9)
+    ## voxels
+    voxels = dict()
+    for i in range(n[0]):
+        for j in range(n[1]):
+            for k in range(n[2]):
+                c = (bMin[0]+(i+0.5)*d[0], bMin[1]+(j+0.5)*d[1], bMin[2]+(k+0.5)*d[2])
+                if part.solid.classify(c)==1:
+                    voxels[(i, j, k)] = len(voxels)
+    nodeIndex, nodeCoords = dict(), []
+    corners = [(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1), (1, 0, 1), (1, 1, 1), (0, 1, 1)]
+    connectivity = []
+    for key in sorted(voxels.keys(), key=lambda key: voxels[key]):
+        thisConnectivity = []
+        for thisCorner in corners:
+            nodeKey = (key[0]+thisCorner[0], key[1]+thisCorner[1], key[2]+thisCorner[2])
+            if nodeKey not in nodeIndex:
+                nodeIndex[nodeKey] = len(nodeCoords)
+                nodeCoords.append((bMin[0]+nodeKey[0]*d[0], bMin[1]+nodeKey[1]*d[1], bMin[2]+nodeKey[2]*d[2]))
+            thisConnectivity.append(nodeIndex[nodeKey])
+        connectivity.append((key, thisConnectivity))
+    ## exterior faces
+    neighbours = [(0, 0, -1), (0, 0, 1), (0, -1, 0), (1, 0, 0), (0, 1, 0), (-1, 0, 0)]
+    exterior = []
+    boundaryNodes = set()
+    for key, thisConnectivity in connectivity:
+        for faceID in range(6):
+            o = neighbours[faceID]
+            if (key[0]+o[0], key[1]+o[1], key[2]+o[2]) not in voxels:
+                exterior.append((voxels[key], faceID))
+                for i in mesh.HEX_FACES[faceID]:
+                    boundaryNodes.add(thisConnectivity[i])
+    ## snap boundary nodes ==>> vertices, edges, faces; candidate edges and faces from a bucket registry
+    hmin = min(d)
+    edgeList, faceList = list(part.edges), list(part.faces)
+    edgeRegistry = getEntityRegistry([getCurveSamples(thisEdge.curve, 0.5*hmin) for thisEdge in edgeList], hmin, 0.5*hmin)
+    faceRegistry = getEntityRegistry([thisFace.pts for thisFace in faceList], hmin, hmin+2.0*max([thisFace.link for thisFace in faceList]+[0.0]))
+    for i in sorted(boundaryNodes):
+        p = nodeCoords[i]
+        key = getBucketKey(p, hmin)
+        best = None
+        for thisVertex in part.vertices:
+            if vDist(thisVertex.point, p)<0.5*hmin:
+                best = thisVertex.point
+                break
+        if best is None:
+            bestD = 0.5*hmin
+            for j in edgeRegistry.get(key, []):
+                curve = edgeList[j].curve
+                q = curve.pointAt(curve.nearestParam(p))
+                if vDist(q, p)<bestD:
+                    best, bestD = q, vDist(q, p)
+        if best is None:
+            bestD = 0.75*hmin
+            for j in faceRegistry.get(key, []):
+                thisFace = faceList[j]
+                dist = thisFace.carrier.dist(p)
+                if dist<bestD and thisFace.isNear(p, hmin+2.0*thisFace.link):
+                    best, bestD = thisFace.carrier.project(p), dist
+        if best is not None:
+            nodeCoords[i] = best
+    ## cells of the elements by nearest cloud point
+    code = SymbolicConstant(part.getElementCode())
+    nodes = mesh.MeshNodeArray([mesh.MeshNode(i+1, nodeCoords[i]) for i in range(len(nodeCoords))])
+    cellPts, cellIndices = [], []
+    for thisCell in part.cells:
+        cellPts.extend(thisCell.pts)
+        cellIndices.extend([thisCell.index]*len(thisCell.pts))
+    cellHash = pointHash(cellPts, hmin)
+    elements = []
+    for key, thisConnectivity in connectivity:
+        c = (bMin[0]+(key[0]+0.5)*d[0], bMin[1]+(key[1]+0.5)*d[1], bMin[2]+(key[2]+0.5)*d[2])
+        cellIndex, radius = 0, hmin
+        while cellPts and radius<=64.0*hmin:
+            found = cellHash.getNear(c, radius)
+            if found:
+                cellIndex = cellIndices[min(found, key=lambda j: vDist(cellPts[j], c))]
+                break
+            radius = 2.0*radius
+        elements.append(mesh.MeshElement(len(elements)+1, code, tuple(thisConnectivity), part, cellIndex))
+    part.nodes = nodes
+    part.elements = mesh.MeshElementArray(elements)
+    part.elementFaces = []
+    for elementIndex, faceID in exterior:
+        thisElement = elements[elementIndex]
+        facePts = [nodeCoords[thisElement.connectivity[i]] for i in mesh.HEX_FACES[faceID]]
+        center = tuple([sum([p[k] for p in facePts])/4.0 for k in range(3)])
+        normal = vUnit(vCross(vSub(facePts[2], facePts[0]), vSub(facePts[3], facePts[1])))
+        part.elementFaces.append((thisElement, faceID, center, normal, hmin))
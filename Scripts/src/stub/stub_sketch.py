@@ -0,0 +1,154 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+#############################    HEADLESS ABAQUS STAND-IN : CONSTRAINED SKETCH    ###############################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## GEOMETRY IDS START AT 2 AND VERTEX IDS AT 0 AS IN ABAQUS CAE; COINCIDENT END POINTS SHARE ONE VERTEX
+## CONSTRAINTS AND DIMENSIONS ARE ACCEPTED AND IGNORED, I.E. THE SKETCH KEEPS THE COORDINATES AS DRAWN
+#################################################################################################################
+
+
+import math
+from stub_geometry import *
+from abaqusConstants import CLOCKWISE
+
+class sketchTransform(object):
+    ## placement of a sketch in 3D returned by Part.MakeSketchTransform
+    def __init__(self, frame):
+        self.frame = frame
+
+class sketchVertex(object):
+    def __init__(self, id, coords):
+        self.id = id
+        self.coords = (float(coords[0]), float(coords[1]))
+    def __repr__(self):
+        return 'mdb.models[...].sketches[...].vertices['+str(self.id)+']'
+
+class sketchGeometry(object):
+    def __init__(self, id, prim, curveType, construction=False, reference=False):
+        self.id = id
+        self.prim = prim
+        self.curveType = curveType
+        self.construction = construction
+        self.reference = reference
+    def getPointOn(self):
+        return self.prim.pointAt(0.5)
+    pointOn = property(getPointOn)
+    def __repr__(self):
+        return 'mdb.models[...].sketches[...].geometry['+str(self.id)+']'
+
+class sketchRepository(dict):
+    ## geometry and vertex repository of a sketch with findAt
+    def findAt(self, *args, **kwargs):
+        point = args[0] if args else kwargs['coordinates']
+        best, bestDist = None, None
+        for thisKey in sorted(self.keys()):
+            thisItem = self[thisKey]
+            if isinstance(thisItem, sketchVertex):
+                d = d2Dist(point, thisItem.coords)
+            else:
+                d = thisItem.prim.nearest(point)[1]
+            if bestDist is None or d<bestDist-1.0e-12:
+                best, bestDist = thisItem, d
+        return best
+
+class ConstrainedSketch(object):
+    def __init__(self, name, sheetSize=200.0, gridSpacing=None, transform=None, objectToCopy=None):
+        self.name = name
+        self.sheetSize = sheetSize
+        self.geometry = sketchRepository()
+        self.vertices = sketchRepository()
+        self.centerline = None
+        if isinstance(transform, sketchTransform):
+            self.frame = transform.frame
+        elif transform is not None:
+            ## tuple of sketch x axis, sketch y axis, normal and origin
+            self.frame = planeFrame(transform[9:12], transform[0:3], transform[3:6])
+        else:
+            self.frame = planeFrame((0.0, 0.0, 0.0), (1.0, 0.0, 0.0), (0.0, 1.0, 0.0))
+        if objectToCopy is not None:
+            for thisGeometry in objectToCopy.geometry.values():
+                self.addGeometry(thisGeometry.prim, thisGeometry.curveType, thisGeometry.construction)
+    def __getattr__(self, name):
+        ## constraints, dimensions and display options are accepted and ignored
+        if name.endswith('Constraint') or name.endswith('Dimension') or name in ['setPrimaryObject', 'unsetPrimaryObject', 'delete', 'retrieveSketch']:
+            return lambda *args, **kwargs: None
+        raise AttributeError(name)
+    def addVertex(self, point):
+        for thisVertex in self.vertices.values():
+            if d2Dist(thisVertex.coords, point)<1.0e-9*max(1.0, abs(point[0]), abs(point[1])):
+                return thisVertex
+        thisVertex = sketchVertex(len(self.vertices), point)
+        self.vertices[thisVertex.id] = thisVertex
+        return thisVertex
+    def addGeometry(self, prim, curveType, construction=False, reference=False, vertexPoints=None):
+        thisGeometry = sketchGeometry(len(self.geometry)+2, prim, curveType, construction, reference)
+        self.geometry[thisGeometry.id] = thisGeometry
+        for thisPoint in (vertexPoints if vertexPoints is not None else []):
+            self.addVertex(thisPoint)
+        return thisGeometry
+    def ConstructionLine(self, point1, point2=None, angle=None):
+        if point2 is None:
+            angleRad = math.radians(angle if angle is not None else 0.0)
+            point2 = (point1[0]+math.cos(angleRad), point1[1]+math.sin(angleRad))
+        ## construction lines are unbounded, stored as a long segment
+        a, b = (float(point1[0]), float(point1[1])), (float(point2[0]), float(point2[1]))
+        l = d2Dist(a, b)
+        u = ((b[0]-a[0])/l, (b[1]-a[1])/l)
+        big = 1.0e4
+        prim = line2d((a[0]-big*u[0], a[1]-big*u[1]), (a[0]+big*u[0], a[1]+big*u[1]))
+        prim.origin, prim.direction = a, u
+        return self.addGeometry(prim, 'LINE', construction=True)
+    def Line(self, point1, point2):
+        return self.addGeometry(line2d(point1, point2), 'LINE', vertexPoints=[point1, point2])
+    def ArcByCenterEnds(self, center, point1, point2, direction=None):
+        prim = arc2d.fromPoints(center, point1, point2, clockwise=(direction==CLOCKWISE))
+        thisGeometry = self.addGeometry(prim, 'ARC', vertexPoints=[point1, point2, center])
+        ## drawing direction is kept for sweep paths
+        thisGeometry.start, thisGeometry.end = (float(point1[0]), float(point1[1])), (float(point2[0]), float(point2[1]))
+        thisGeometry.clockwise = (direction==CLOCKWISE)
+        return thisGeometry
+    def CircleByCenterPerimeter(self, center, point1):
+        prim = arc2d(center, d2Dist(center, point1), math.atan2(point1[1]-center[1], point1[0]-center[0]), TWO_PI)
+        return self.addGeometry(prim, 'CIRCLE', vertexPoints=[center])
+    def rectangle(self, point1, point2):
+        corners = [(point1[0], point1[1]), (point1[0], point2[1]), (point2[0], point2[1]), (point2[0], point1[1])]
+        for thisCorner in corners:
+            self.addVertex(thisCorner)
+        for i in range(4):
+            self.addGeometry(line2d(corners[i], corners[(i+1)%4]), 'LINE')
+    def copyMirror(self, mirrorLine, objectList):
+        a, u = mirrorLine.prim.a, ((mirrorLine.prim.b[0]-mirrorLine.prim.a[0]), (mirrorLine.prim.b[1]-mirrorLine.prim.a[1]))
+        l = math.sqrt(u[0]**2+u[1]**2)
+        u = (u[0]/l, u[1]/l)
+        def mirror(p):
+            d = ((p[0]-a[0])*u[0]+(p[1]-a[1])*u[1])
+            f = (a[0]+d*u[0], a[1]+d*u[1])
+            return (2.0*f[0]-p[0], 2.0*f[1]-p[1])
+        for thisGeometry in objectList:
+            prim = thisGeometry.prim.mapped(mirror)
+            if prim.kind=='line':
+                self.addGeometry(prim, thisGeometry.curveType, thisGeometry.construction, vertexPoints=[prim.a, prim.b])
+            elif prim.closed:
+                self.addGeometry(prim, thisGeometry.curveType, thisGeometry.construction, vertexPoints=[prim.c])
+            else:
+                self.addGeometry(prim, thisGeometry.curveType, thisGeometry.construction, vertexPoints=[mirror(thisGeometry.prim.pointAt(0.0)), mirror(thisGeometry.prim.pointAt(1.0)), prim.c])
+    def assignCenterline(self, line):
+        self.centerline = line
+    def getProfilePrims(self):
+        ## primitives of the profile ==>> all geometry except construction and reference geometry
+        return [thisGeometry.prim for thisGeometry in [self.geometry[thisKey] for thisKey in sorted(self.geometry.keys())]
+                if not thisGeometry.construction and not thisGeometry.reference]
+    def addReference(self, curve):
+        ## method to add a part edge projected onto the sketch plane as reference geometry
+        for thisPrim in project2dCurve(curve, self.frame):
+            self.addGeometry(thisPrim, thisPrim.kind.upper(), reference=True, vertexPoints=thisPrim.getEnds())
@@ -0,0 +1,68 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+############################    UTILITY SCRIPT : PERSISTENT ABAQUS CAE WORKER   #################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## LONG-LIVED ABAQUS CAE SESSION WHICH CREATES THE COUPONS SUBMITTED TO A SPOOL FOLDER (SEE util/spool.py); USAGE:
+## abaqus cae noGUI="<src>/util/abaqus_worker.py" -- "<spool path>" "<src path>"
+## THE WORKER STOPS WHEN THE FILE Worker_Stop IS CREATED IN THE SPOOL FOLDER
+#################################################################################################################
+
+
+import sys, os, json, time
+
+srcPath = sys.argv[-1]
+spoolPath = sys.argv[-2]
+
+execfile(srcPath+'/util/coupon_data.py')
+execfile(srcPath+'/util/coupon_runner.py')
+execfile(srcPath+'/util/spool.py')
+
+pollInterval = 0.05
+heartbeatInterval = 1.0
+
+createSpool(spoolPath)
+if os.path.exists(spoolPath+'/Worker_Stop'):
+    os.remove(spoolPath+'/Worker_Stop')
+writeHeartbeat(spoolPath, 'IDLE')
+lastHeartbeat = time.time()
+while not os.path.exists(spoolPath+'/Worker_Stop'):
+    jobFileNames = sorted([thisFile for thisFile in os.listdir(spoolPath+'/queue') if thisFile.endswith('.json')])
+    if len(jobFileNames)==0:
+        if time.time()-lastHeartbeat>heartbeatInterval:
+            writeHeartbeat(spoolPath, 'IDLE')
+            lastHeartbeat = time.time()
+        time.sleep(pollInterval)
+        continue
+    ## claim the oldest job; the rename fails if another worker claimed it first
+    jobID = jobFileNames[0][:-len('.json')]
+    claimToken = claimJob(spoolPath, jobID)
+    if claimToken is None:
+        continue
+    heartbeatThread = startHeartbeat(spoolPath, jobID, heartbeatInterval)
+    try:
+        job = readJson(spoolPath+'/running/'+jobFileNames[0])
+        if 'Coupon_Data' not in job:
+            job['Coupon_Data'] = readJson(job['Save_Path']+'/'+job['Data_File'])
+        statusRecord = runCoupon(srcPath, job['Template'], job['Coupon_Data'], job['Save_Path'])
+    except Exception as err:
+        statusRecord = {'Status':'FAILED', 'Message':'Job cannot be read.\nError Message: '+str(err)}
+    statusRecord['Job_ID'] = jobID
+    stopHeartbeat(heartbeatThread)
+    ## job released by waitJob meanwhile (timeout or requeue), or queued again and claimed by another worker ==>> no
+    ## result
+    finishJob(spoolPath, jobID, claimToken, statusRecord)
+    writeHeartbeat(spoolPath, 'IDLE')
+    lastHeartbeat = time.time()
+
+removeHeartbeat(spoolPath)
+sys.exit()
@@ -0,0 +1,225 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+############################    CLASS DEFINITION : PARALLEL BATCH ORCHESTRATOR   ################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## RUNS OUTSIDE ABAQUS; util/coupon_data.py, util/spool.py, util/cache.py, lib/coupon_generic.py,
+## util/incremental.py AND util/manifest.py MUST BE LOADED BEFORE THIS SCRIPT
+#################################################################################################################
+
+
+import os, json, time, subprocess
+
+class batch():
+    def __init__(self, srcPath, savePath, abqPath=[], abqCommand='abaqus', numWorkers=None, licenseCap=None, pollInterval=0.5, spoolPath=None, modelCache=None, useIncremental=True, maxAttempts=3, jobTimeout=3600.0):
+        self.srcPath = srcPath
+        self.savePath = savePath
+        ## spool folder of the persistent abaqus worker; the batch is submitted to the worker when it is running
+        self.spoolPath = spoolPath
+        ## maximum time of a coupon on the worker in seconds; a coupon left by a stopped worker fails earlier
+        self.jobTimeout = jobTimeout
+        ## model cache (util/cache.py); cached coupons are restored into the save path without calling abaqus
+        self.modelCache = modelCache
+        ## coupons differing from a model in the save path only in material, step or load reuse its mesh
+        self.useIncremental = useIncremental
+        self.abqPath = abqPath
+        ## abaqus executable; a stub executable can be used to exercise the scheduler without an abaqus installation
+        self.abqCommand = abqCommand
+        ## number of concurrent abaqus sessions ==>> available cores, limited by the license token cap
+        self.numWorkers = numWorkers if numWorkers is not None else (os.cpu_count() or 1)
+        if licenseCap is not None:
+            self.numWorkers = min(self.numWorkers, licenseCap)
+        self.numWorkers = max(self.numWorkers, 1)
+        self.pollInterval = pollInterval
+        self.statusFileName = 'Batch_Status.json'
+        ## progress manifest ==>> completed coupons are skipped on rerun, failed coupons are retried up to maxAttempts
+        self.manifestFileName = self.savePath+'/Batch_Manifest.jsonl'
+        self.maxAttempts = maxAttempts
+    def run(self, batchList):
+        ## method to create all coupons of the batch list and return the aggregated status records
+        completedStatusList, batchList = self.filterByManifest(batchList)
+        cachedStatusList, batchList = self.fetchFromCache(batchList)
+        incrementalStatusList, batchList = self.rebuildFromExisting(batchList)
+        cachedStatusList = completedStatusList+cachedStatusList+incrementalStatusList
+        if self.spoolPath is not None and isWorkerRunning(self.spoolPath):
+            statusList = self.runOnWorker(batchList)
+            self.storeInCache(batchList, statusList)
+            statusList = cachedStatusList+statusList
+            self.writeBatchStatus(statusList)
+            return statusList
+        queuePath = self.createQueue(batchList)
+        ## a session takes coupons from the queue until it is empty; a session exiting early is replaced while coupons
+        ## are left, at most one session per coupon
+        numLaunched = 0
+        running = dict()
+        while True:
+            while len(running)<self.numWorkers and numLaunched<len(batchList) and self.getQueueSize(queuePath)>0:
+                running[numLaunched] = self.launchWorker(numLaunched, queuePath)
+                numLaunched = numLaunched+1
+            for workerID, process in list(running.items()):
+                if process.poll() is not None:
+                    del running[workerID]
+            if not running and (numLaunched>=len(batchList) or self.getQueueSize(queuePath)==0):
+                break
+            time.sleep(self.pollInterval)
+        statusList = self.readWorkerStatus(numLaunched, batchList)
+        self.storeInCache(batchList, statusList)
+        statusList = cachedStatusList+statusList
+        self.writeBatchStatus(statusList)
+        return statusList
+    def filterByManifest(self, batchList):
+        ## method to skip the coupons completed by an earlier run and the coupons failed maxAttempts times; coupons left
+        ## in running state by an interrupted run are created again
+        records = readManifest(self.savePath)
+        completedStatusList, remainingList = [], []
+        for thisEntry in batchList:
+            lastRecord, numAttempts = getManifestState(records, thisEntry['Template'], thisEntry['Coupon_Data'])
+            if lastRecord is not None and lastRecord['State']=='SUCCESS' and isStatusSuccess(lastRecord['Status_File']):
+                completedStatusList.append({'Template':thisEntry['Template'], 'Coupon':thisEntry['Coupon'], 'Version':thisEntry['Coupon_Data']['Version'],
+                                            'Status':'SUCCESS', 'Message':'Model created by an earlier run.', 'Save_Path':lastRecord['Save_Path']})
+            elif lastRecord is not None and lastRecord['State']=='FAILED' and numAttempts>=self.maxAttempts:
+                completedStatusList.append({'Template':thisEntry['Template'], 'Coupon':thisEntry['Coupon'], 'Version':thisEntry['Coupon_Data']['Version'],
+                                            'Status':'FAILED', 'Message':'Failed '+str(numAttempts)+' times: '+lastRecord['Message'], 'Save_Path':lastRecord['Save_Path']})
+            else:
+                remainingList.append(thisEntry)
+        return completedStatusList, remainingList
+    def fetchFromCache(self, batchList):
+        ## method to restore the cached coupons; returns their status records and the remaining batch entries
+        cachedStatusList, remainingList = [], []
+        for thisEntry in batchList:
+            if self.modelCache is not None and self.modelCache.fetch(thisEntry['Template'], thisEntry['Coupon_Data'], self.savePath):
+                cachedStatusList.append({'Template':thisEntry['Template'], 'Coupon':thisEntry['Coupon'], 'Version':thisEntry['Coupon_Data']['Version'],
+                                         'Status':'SUCCESS', 'Message':'Model restored from cache.', 'Save_Path':self.savePath})
+                appendManifest(self.manifestFileName, thisEntry['Template'], thisEntry['Coupon_Data'], 'SUCCESS', self.savePath, 'Model restored from cache.')
+            else:
+                remainingList.append(thisEntry)
+        return cachedStatusList, remainingList
+    def rebuildFromExisting(self, batchList):
+        ## method to rewrite the inp files of the coupons which can reuse an existing mesh in the save path
+        rebuiltStatusList, remainingList = [], []
+        for thisEntry in batchList:
+            if self.useIncremental and rebuildIncremental(thisEntry['Coupon_Data'], self.savePath):
+                rebuiltStatusList.append({'Template':thisEntry['Template'], 'Coupon':thisEntry['Coupon'], 'Version':thisEntry['Coupon_Data']['Version'],
+                                          'Status':'SUCCESS', 'Message':'Inp files rewritten from an existing mesh.', 'Save_Path':self.savePath})
+                appendManifest(self.manifestFileName, thisEntry['Template'], thisEntry['Coupon_Data'], 'SUCCESS', self.savePath, 'Inp files rewritten from an existing mesh.')
+            else:
+                remainingList.append(thisEntry)
+        return rebuiltStatusList, remainingList
+    def storeInCache(self, batchList, statusList):
+        ## method to add the successfully created coupons to the cache
+        if self.modelCache is None:
+            return
+        for thisEntry, thisStatus in self.matchStatus(batchList, statusList):
+            if thisStatus['Status']=='SUCCESS':
+                self.modelCache.store(thisEntry['Template'], thisEntry['Coupon_Data'], thisStatus['Save_Path'])
+    def matchStatus(self, batchList, statusList):
+        ## method to pair the batch entries with their status records
+        statusDict = dict()
+        for thisStatus in statusList:
+            statusDict[(thisStatus['Coupon'], thisStatus['Version'])] = thisStatus
+        pairs = []
+        for thisEntry in batchList:
+            key = (thisEntry['Coupon'], thisEntry['Coupon_Data']['Version'])
+            if key in statusDict:
+                pairs.append((thisEntry, statusDict[key]))
+        return pairs
+    def runOnWorker(self, batchList):
+        ## method to submit all coupons to the persistent abaqus worker(s) and wait for the status records
+        jobIDs = []
+        for thisEntry in batchList:
+            appendManifest(self.manifestFileName, thisEntry['Template'], thisEntry['Coupon_Data'], 'RUNNING', self.savePath)
+            jobIDs.append(submitJob(self.spoolPath, thisEntry['Template'], self.savePath, couponData=thisEntry['Coupon_Data']))
+        statusList = []
+        for thisEntry, thisJobID in zip(batchList, jobIDs):
+            thisStatus = waitJob(self.spoolPath, thisJobID, timeout=self.jobTimeout)
+            ## job failed in the spool ==>> status record without coupon data
+            if 'Coupon' not in thisStatus:
+                thisStatus.update({'Template':thisEntry['Template'], 'Coupon':thisEntry['Coupon'], 'Version':thisEntry['Coupon_Data']['Version']})
+            thisStatus['Save_Path'] = self.savePath
+            statusList.append(thisStatus)
+            appendManifest(self.manifestFileName, thisEntry['Template'], thisEntry['Coupon_Data'], thisStatus['Status'], self.savePath, thisStatus['Message'])
+        return statusList
+    def writeBatchStatus(self, statusList):
+        statusFile = open(self.savePath+'/'+self.statusFileName, 'w')
+        statusFile.write(json.dumps(statusList, indent=4, sort_keys=True))
+        statusFile.close()
+    def getQueuePath(self):
+        return self.savePath+'/Batch_Queue'
+    def createQueue(self, batchList):
+        ## method to write every batch entry into its own file of the shared queue folder; the sessions take the entries
+        ## one by one, so that a session done with its coupons takes over the coupons left by a slower session
+        queuePath = self.getQueuePath()
+        if not os.path.isdir(queuePath):
+            os.makedirs(queuePath)
+        ## entries left by an interrupted run are created again from the manifest
+        for thisName in os.listdir(queuePath):
+            os.remove(queuePath+'/'+thisName)
+        for thisEntry, i in zip(batchList, range(len(batchList))):
+            entryFile = open(queuePath+'/'+self.getEntryName(i)+'.tmp', 'w')
+            entryFile.write(json.dumps({'Coupons':[thisEntry]}, indent=4, sort_keys=True))
+            entryFile.close()
+            os.rename(queuePath+'/'+self.getEntryName(i)+'.tmp', queuePath+'/'+self.getEntryName(i))
+        return queuePath
+    def getEntryName(self, entryID):
+        return 'Coupon_%06d.json' % entryID
+    def getQueueSize(self, queuePath):
+        return len([thisName for thisName in os.listdir(queuePath) if thisName.endswith('.json')])
+    def getWorkerPath(self, workerID):
+        return self.savePath+'/Worker_'+str(workerID+1)
+    def launchWorker(self, workerID, queuePath):
+        ## method to write the batch file of one worker and start its abaqus session in its own working directory
+        workerPath = self.getWorkerPath(workerID)
+        if not os.path.isdir(workerPath):
+            os.makedirs(workerPath)
+        for thisName in os.listdir(workerPath):
+            if thisName.startswith('Batch_Entry_') or thisName==self.statusFileName:
+                os.remove(workerPath+'/'+thisName)
+        batchFile = open(workerPath+'/Batch_Input.json', 'w')
+        batchFile.write(json.dumps({'Queue_Path':queuePath, 'Manifest_File':self.savePath+'/Batch_Manifest_Worker_'+str(workerID+1)+'.jsonl'}, indent=4, sort_keys=True))
+        batchFile.close()
+        abqCall = self.abqCommand+' cae noGUI="'+self.srcPath+'/util/call_abaqus_batch.py" -- '+self.statusFileName+' Batch_Input.json "'+workerPath+'" "'+self.srcPath+'"'
+        env = os.environ.copy()
+        env['PATH'] = os.pathsep.join(self.abqPath+[env.get('PATH', '')])
+        logFile = open(workerPath+'/Batch_Worker.log', 'w')
+        process = subprocess.Popen(abqCall, shell=True, cwd=workerPath, env=env, stdout=logFile, stderr=subprocess.STDOUT)
+        logFile.close()
+        return process
+    def readWorkerStatus(self, numLaunched, batchList):
+        ## method to read the status records of all workers; coupons without record are reported as failed
+        statusList, entryPaths = [], dict()
+        for workerID in range(numLaunched):
+            workerPath = self.getWorkerPath(workerID)
+            try:
+                workerStatusList = readJson(workerPath+'/'+self.statusFileName)
+            except Exception:
+                workerStatusList = []
+            for thisStatus in workerStatusList:
+                thisStatus['Save_Path'] = workerPath
+            statusList.extend(workerStatusList)
+            for thisName in os.listdir(workerPath):
+                if thisName.startswith('Batch_Entry_'):
+                    entryPaths[thisName[len('Batch_Entry_'):]] = workerPath
+        reportedCoupons = [(thisStatus['Coupon'], thisStatus['Version']) for thisStatus in statusList]
+        for thisEntry, i in zip(batchList, range(len(batchList))):
+            if (thisEntry['Coupon'], thisEntry['Coupon_Data']['Version']) in reportedCoupons:
+                continue
+            ## coupon taken by a worker which exited without status, or left in the queue by the workers
+            workerPath = entryPaths.get(self.getEntryName(i))
+            if workerPath is not None:
+                message = 'Abaqus worker exited without status. See '+workerPath+'/Batch_Worker.log'
+            else:
+                workerPath = self.savePath
+                message = 'Coupon was not taken by any Abaqus worker. See '+self.savePath+'/Worker_*/Batch_Worker.log'
+            statusList.append({'Template':thisEntry['Template'], 'Coupon':thisEntry['Coupon'], 'Version':thisEntry['Coupon_Data']['Version'],
+                               'Status':'FAILED', 'Message':message, 'Save_Path':workerPath})
+            appendManifest(self.manifestFileName, thisEntry['Template'], thisEntry['Coupon_Data'], 'FAILED', workerPath, message)
+        return statusList
@@ -0,0 +1,182 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+###########################    CLASS DEFINITION : CONTENT-ADDRESSED MODEL CACHE   ###############################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## THE CACHE KEY IS THE HASH OF THE RESOLVED COUPON DATA, THE TEMPLATE SOURCE, lib/coupon_generic.py AND THE
+## COUPON_INP_* ENVIRONMENT VARIABLES CHANGING THE LAYOUT OF THE INP FILES
+## util/coupon_data.py MUST BE LOADED BEFORE THIS SCRIPT
+#################################################################################################################
+
+
+import os, json, time, shutil, stat, hashlib
+
+class cache():
+    def __init__(self, cachePath, srcPath, maxSize=20.0, maxAge=30.0, useHardlink=True):
+        self.cachePath = cachePath
+        self.srcPath = srcPath
+        ## eviction limits ==>> total size in GB, age since last use in days
+        self.maxSize = maxSize*1024**3
+        self.maxAge = maxAge*24*3600
+        ## cached files are read-only, so that a hardlinked file cannot be modified in place by mistake
+        self.useHardlink = useHardlink
+        self.entryFileName = 'Cache_Entry.json'
+        if not os.path.isdir(self.cachePath):
+            os.makedirs(self.cachePath)
+    def getKey(self, template, couponData):
+        ## method to return the cache key of a coupon
+        keyData = {'Template':template,
+                   'Coupon_Data':getCouponHash(couponData),
+                   'Template_Source':getFileHash(self.srcPath+'/lib/'+template.lower()+'.py'),
+                   'Generic_Source':getFileHash(self.srcPath+'/lib/coupon_generic.py'),
+                   'Inp_Layout':self.getInpLayout()}
+        return hashlib.sha1(json.dumps(keyData, sort_keys=True).encode('utf-8')).hexdigest()
+    def getInpLayout(self):
+        ## method to return the settings of coupon_generic which change the job inp file and the inp folder, read from
+        ## the environment variables passed on to abaqus with the defaults of coupon_generic; COUPON_INP_SPLIT_MODE
+        ## writes identical files and is left out
+        ## include store ==>> the inp folder hardlinks the stored files or refers to them by their absolute path
+        inpStorePath = os.environ.get('COUPON_INP_STORE') or None
+        ## compressed mesh include files ==>> the job file includes files which exist only compressed
+        inpCompression = os.environ.get('COUPON_INP_COMPRESSION', 'NONE').upper()
+        return {'Compression':inpCompression,
+                'Compression_Level':int(os.environ.get('COUPON_INP_COMPRESSION_LEVEL', '3')) if inpCompression!='NONE' else None,
+                'Part_Dedup':os.environ.get('COUPON_INP_PART_DEDUP', '1')=='1',
+                'Part_Decompose':os.environ.get('COUPON_INP_DECOMPOSE', '0')=='1',
+                'Store_Path':os.path.abspath(inpStorePath).replace('\\', '/') if inpStorePath is not None else None}
+    def getArtifactNames(self, couponData):
+        ## method to return the names of the model files and folders of a coupon
+        couponName = couponData['Coupon_Name']
+        version = getVersionSuffix(couponData)
+        return [couponName+'_Job'+version+'.inp',
+                couponName+'_InpFolder'+version,
+                couponName+'_Model'+version+'.cae',
+                couponName+'_Model'+version+'.jnl',
+                couponName+'_Data'+version+'.json',
+                couponName+'_Geom'+version+'.txt']
+    def fetch(self, template, couponData, savePath):
+        ## method to materialize the cached model files in the save path; returns False when the model is not cached
+        entryPath = self.cachePath+'/'+self.getKey(template, couponData)
+        if not os.path.isfile(entryPath+'/'+self.entryFileName):
+            ## read-only links of an older cached model would block abaqus from writing the new model files
+            for thisName in self.getArtifactNames(couponData):
+                self.removeLinks(savePath+'/'+thisName)
+            return False
+        entry = readJson(entryPath+'/'+self.entryFileName)
+        for thisName in entry['Files']:
+            self.copyArtifact(entryPath+'/'+thisName, savePath+'/'+thisName, self.useHardlink and not thisName.endswith('.cae'))
+        ## data json keeps the keys of the current request which are not part of the cache key
+        dataFileName = couponData['Coupon_Name']+'_Data'+getVersionSuffix(couponData)+'.json'
+        if dataFileName in entry['Files']:
+            modelData = readJson(entryPath+'/'+dataFileName)
+            for key in ['Coupon_Template', 'Coupon_Type', 'Save_Path']:
+                if key in couponData:
+                    modelData[key] = couponData[key]
+                elif key in modelData:
+                    del modelData[key]
+            os.remove(savePath+'/'+dataFileName)
+            dataFile = open(savePath+'/'+dataFileName, 'w')
+            dataFile.write(json.dumps(modelData, indent=4, sort_keys=True))
+            dataFile.close()
+        statusFile = open(savePath+'/'+couponData['Coupon_Name']+'_Status'+getVersionSuffix(couponData)+'.txt', 'w')
+        statusFile.write('SUCCESS! Model created successfully.\nModel restored from cache.')
+        statusFile.close()
+        entry['Last_Used'] = time.time()
+        self.writeEntry(entryPath, entry)
+        return True
+    def store(self, template, couponData, savePath):
+        ## method to add the model files of a successfully created coupon to the cache
+        key = self.getKey(template, couponData)
+        entryPath = self.cachePath+'/'+key
+        if os.path.isfile(entryPath+'/'+self.entryFileName):
+            return
+        tempPath = entryPath+'_'+str(os.getpid())+'.tmp'
+        if os.path.isdir(tempPath):
+            self.removeTree(tempPath)
+        os.makedirs(tempPath)
+        files = []
+        for thisName in self.getArtifactNames(couponData):
+            if os.path.exists(savePath+'/'+thisName):
+                self.copyArtifact(savePath+'/'+thisName, tempPath+'/'+thisName, False)
+                self.setReadOnly(tempPath+'/'+thisName)
+                files.append(thisName)
+        entry = {'Key':key, 'Template':template, 'Coupon':couponData['Coupon_Name'], 'Version':couponData['Version'],
+                 'Files':files, 'Size':self.getSize(tempPath), 'Created':time.time(), 'Last_Used':time.time()}
+        self.writeEntry(tempPath, entry)
+        try:
+            os.rename(tempPath, entryPath)
+        except OSError:
+            ## entry stored meanwhile by another process
+            self.removeTree(tempPath)
+        self.evict()
+    def evict(self):
+        ## method to remove the entries unused for longer than the maximum age, then the least recently used entries
+        ## until the total size is within the maximum size
+        entries = []
+        for thisKey in os.listdir(self.cachePath):
+            try:
+                entries.append(readJson(self.cachePath+'/'+thisKey+'/'+self.entryFileName))
+            except Exception:
+                continue
+        entries.sort(key=lambda thisEntry: thisEntry['Last_Used'])
+        totalSize = sum([thisEntry['Size'] for thisEntry in entries])
+        for thisEntry in entries:
+            if time.time()-thisEntry['Last_Used']<=self.maxAge and totalSize<=self.maxSize:
+                break
+            self.removeTree(self.cachePath+'/'+thisEntry['Key'])
+            totalSize = totalSize-thisEntry['Size']
+    def writeEntry(self, entryPath, entry):
+        entryFile = open(entryPath+'/'+self.entryFileName, 'w')
+        entryFile.write(json.dumps(entry, indent=4, sort_keys=True))
+        entryFile.close()
+    def copyArtifact(self, source, destination, useHardlink):
+        ## method to hardlink or copy a file or a folder
+        if os.path.isdir(source):
+            if not os.path.isdir(destination):
+                os.makedirs(destination)
+            for thisName in os.listdir(source):
+                self.copyArtifact(source+'/'+thisName, destination+'/'+thisName, useHardlink)
+            return
+        if os.path.exists(destination):
+            os.chmod(destination, stat.S_IWRITE | stat.S_IREAD)
+            os.remove(destination)
+        if useHardlink and hasattr(os, 'link'):
+            try:
+                os.link(source, destination)
+                return
+            except OSError:
+                pass
+        shutil.copyfile(source, destination)
+    def removeLinks(self, pathName):
+        ## method to remove the read-only hardlinks materialized from the cache
+        if os.path.isdir(pathName):
+            for thisName in os.listdir(pathName):
+                self.removeLinks(pathName+'/'+thisName)
+        elif os.path.isfile(pathName) and os.stat(pathName).st_nlink>1 and not os.access(pathName, os.W_OK):
+            os.chmod(pathName, stat.S_IWRITE | stat.S_IREAD)
+            os.remove(pathName)
+    def setReadOnly(self, pathName):
+        if os.path.isdir(pathName):
+            for thisName in os.listdir(pathName):
+                self.setReadOnly(pathName+'/'+thisName)
+        else:
+            os.chmod(pathName, stat.S_IREAD)
+    def getSize(self, pathName):
+        if os.path.isdir(pathName):
+            return sum([self.getSize(pathName+'/'+thisName) for thisName in os.listdir(pathName)])
+        return os.path.getsize(pathName)
+    def removeTree(self, pathName):
+        ## read-only files are made writable before removal
+        def onError(function, thisPath, excInfo):
+            os.chmod(thisPath, stat.S_IWRITE | stat.S_IREAD)
+            function(thisPath)
+        shutil.rmtree(pathName, onerror=onError)
@@ -14,7 +14,7 @@
 #################################################################################################################
 
 
-import sys, os, json, ast
+import sys
 
 srcPath = sys.argv[-1]
 savePath = sys.argv[-2]
@@ -22,24 +22,16 @@ template = sys.argv[-3]
 tempDataFileName = sys.argv[-4]
 statusFileName = sys.argv[-5]
 
-statusFile = open(savePath+'/'+statusFileName, 'w')
+execfile(srcPath+'/util/coupon_data.py')
+execfile(srcPath+'/util/coupon_runner.py')
 
 try:
-    fileJson = open(savePath+'/'+tempDataFileName, 'r')
-    couponDataUnicode = json.load(fileJson)
-    fileJson.close()
-    couponData = ast.literal_eval(json.dumps(couponDataUnicode))
-
-    execfile(srcPath+'/lib/coupon_generic.py')
-    execfile(srcPath+'/lib/'+template.lower()+'.py')
-    couponClass = getattr(sys.modules[__name__], template.lower())
-    os.chdir(savePath)
-    couponClass(couponData)
-
-    statusFile.write('SUCCESS! Model created successfully.')
+    couponData = readJson(savePath+'/'+tempDataFileName)
+    ## status text and status json files are written by the runner
+    runCoupon(srcPath, template, couponData, savePath)
 except Exception as err:
+    statusFile = open(savePath+'/'+statusFileName, 'w')
     statusFile.write('FAILED! Model cannot be created.\nError Message: '+str(err))
+    statusFile.close()
 
-statusFile.close()
 sys.exit()
-
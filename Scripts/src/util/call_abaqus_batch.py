@@ -0,0 +1,88 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+##############################    UTILITY SCRIPT : FOR CALLING ABAQUS IN BATCH   ################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## CREATES ALL COUPONS OF A BATCH FILE INSIDE ONE ABAQUS CAE SESSION; USAGE:
+## abaqus cae noGUI="<src>/util/call_abaqus_batch.py" -- <status json> <batch json> "<save path>" "<src path>"
+#################################################################################################################
+
+
+import sys, os, json
+
+srcPath = sys.argv[-1]
+savePath = sys.argv[-2]
+batchFileName = sys.argv[-3]
+statusFileName = sys.argv[-4]
+
+execfile(srcPath+'/util/coupon_data.py')
+execfile(srcPath+'/util/coupon_runner.py')
+execfile(srcPath+'/util/manifest.py')
+
+def writeBatchStatus(statusList):
+    statusFile = open(savePath+'/'+statusFileName, 'w')
+    statusFile.write(json.dumps(statusList, indent=4, sort_keys=True))
+    statusFile.close()
+
+def claimEntry(queuePath):
+    ## method to move the next batch file of the shared queue folder into the save path; the rename succeeds for one
+    ## session only, hence every queued coupon is created once
+    for thisName in sorted(os.listdir(queuePath)):
+        if not thisName.endswith('.json'):
+            continue
+        entryFileName = os.path.join(savePath, 'Batch_Entry_'+thisName)
+        try:
+            os.rename(os.path.join(queuePath, thisName), entryFileName)
+        except OSError:
+            continue
+        return entryFileName
+    return None
+
+def runEntry(thisEntry):
+    if manifestFileName is not None:
+        appendManifest(manifestFileName, thisEntry['Template'], thisEntry['Coupon_Data'], 'RUNNING', savePath)
+    statusList.append(runCoupon(srcPath, thisEntry['Template'], thisEntry['Coupon_Data'], savePath))
+    writeBatchStatus(statusList)
+    if manifestFileName is not None:
+        appendManifest(manifestFileName, thisEntry['Template'], thisEntry['Coupon_Data'], statusList[-1]['Status'], savePath, statusList[-1]['Message'])
+
+statusList = []
+try:
+    batchData = readJson(os.path.join(savePath, batchFileName))
+    ## progress manifest of this session and shared queue folder of the batch orchestrator (optional keys of the
+    ## batch file); with a queue folder the coupons are taken from the queue one by one until it is empty
+    manifestFileName = batchData.get('Manifest_File')
+    queuePath = batchData.get('Queue_Path')
+    batchList = getBatchList(srcPath, os.path.join(savePath, batchFileName)) if queuePath is None else []
+except Exception as err:
+    batchList = []
+    manifestFileName = None
+    queuePath = None
+    statusList.append({'Template':'', 'Coupon':'', 'Version':'', 'Status':'FAILED', 'Message':'Batch file cannot be read.\nError Message: '+str(err)})
+
+for thisEntry in batchList:
+    runEntry(thisEntry)
+
+while queuePath is not None:
+    entryFileName = claimEntry(queuePath)
+    if entryFileName is None:
+        break
+    try:
+        entryList = getBatchList(srcPath, entryFileName)
+    except Exception as err:
+        statusList.append({'Template':'', 'Coupon':'', 'Version':'', 'Status':'FAILED', 'Message':'Batch file '+entryFileName+' cannot be read.\nError Message: '+str(err)})
+        continue
+    for thisEntry in entryList:
+        runEntry(thisEntry)
+
+writeBatchStatus(statusList)
+sys.exit()
@@ -0,0 +1,90 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+###############################    UTILITY SCRIPT : FOR READING COUPON DATA   ###################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## SCRIPT IS LOADED WITH execfile() INSIDE ABAQUS AND WITH exec() OUTSIDE ABAQUS, HENCE KEEP IT PYTHON 2/3 NEUTRAL
+#################################################################################################################
+
+
+import json, ast, copy, hashlib
+
+def readJson(fileName):
+    ## method to read json file with unicode strings converted to plain strings
+    fileJson = open(fileName, 'r')
+    dataUnicode = json.load(fileJson)
+    fileJson.close()
+    return ast.literal_eval(json.dumps(dataUnicode))
+
+def getCouponData(srcPath, template, coupon, masterDatabase=None, couponDatabase=None):
+    ## method to create input coupon data from the template database and master database
+    if masterDatabase is None:
+        masterDatabase = readJson(srcPath+'/db/coupon_master.json')
+    if couponDatabase is None:
+        couponDatabase = readJson(srcPath+'/db/'+template.lower()+'.json')
+    ## deep copies keep coupons of one batch from sharing nested dicts (e.g. 'Step' is updated by the templates)
+    couponData = copy.deepcopy(couponDatabase[template][coupon])
+    couponData.update(copy.deepcopy(masterDatabase['Coupon_Data'][template]))
+    couponData.update({'Coupon_Name':coupon})
+    couponData.update(copy.deepcopy(masterDatabase['Constant_Data']))
+    tempMaterial = dict()
+    for thisMaterial, i in zip(couponData['Material'], range(len(couponData['Material']))):
+        tempMaterial['Material_'+str(i+1)] = masterDatabase['Material_Data'][thisMaterial].copy()
+    couponData.update({'Material':tempMaterial})
+    return couponData
+
+def getBatchList(srcPath, batchFileName):
+    ## method to return list of batch entries [{'Template':..., 'Coupon':..., 'Coupon_Data':...}, ...]
+    ## the batch file is either a coupon database file (db/coupon_XX_*.json) or a json with key 'Coupons'
+    ## containing [template, coupon] pairs and/or dicts with keys 'Template' and 'Coupon' or 'Coupon_Data'
+    batchData = readJson(batchFileName)
+    masterDatabase = readJson(srcPath+'/db/coupon_master.json')
+    batchList = []
+    if isinstance(batchData, dict) and 'Coupons' in batchData:
+        couponDatabase = dict()
+        for thisEntry in batchData['Coupons']:
+            if isinstance(thisEntry, dict):
+                thisEntry = thisEntry.copy()
+            else:
+                thisEntry = {'Template':thisEntry[0], 'Coupon':thisEntry[1]}
+            if 'Coupon_Data' not in thisEntry:
+                if thisEntry['Template'] not in couponDatabase:
+                    couponDatabase[thisEntry['Template']] = readJson(srcPath+'/db/'+thisEntry['Template'].lower()+'.json')
+                thisEntry['Coupon_Data'] = getCouponData(srcPath, thisEntry['Template'], thisEntry['Coupon'], masterDatabase, couponDatabase[thisEntry['Template']])
+            thisEntry['Coupon'] = thisEntry['Coupon_Data']['Coupon_Name']
+            batchList.append(thisEntry)
+    else:
+        for template in sorted(batchData.keys()):
+            for coupon in sorted(batchData[template].keys()):
+                couponData = getCouponData(srcPath, template, coupon, masterDatabase, batchData)
+                batchList.append({'Template':template, 'Coupon':coupon, 'Coupon_Data':couponData})
+    return batchList
+
+def getVersionSuffix(couponData):
+    ## method to return the version suffix used in output file names
+    return couponData['Version'] if couponData['Version']=='' else '_'+couponData['Version']
+
+def getCouponHash(couponData, ignoredKeys=('Coupon_Template', 'Coupon_Type', 'Save_Path')):
+    ## method to return hash of the resolved coupon data; keys which do not change the model are ignored
+    hashData = dict()
+    for key, val in couponData.items():
+        if key not in ignoredKeys:
+            hashData[key] = val
+    return hashlib.sha1(json.dumps(hashData, sort_keys=True).encode('utf-8')).hexdigest()
+
+def getFileHash(fileName):
+    ## method to return hash of the file content
+    thisHash = hashlib.sha1()
+    thisFile = open(fileName, 'rb')
+    thisHash.update(thisFile.read())
+    thisFile.close()
+    return thisHash.hexdigest()
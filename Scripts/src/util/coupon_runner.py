@@ -0,0 +1,105 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+##########################    UTILITY SCRIPT : FOR RUNNING COUPONS IN ONE SESSION   #############################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## SCRIPT IS LOADED WITH execfile() INSIDE ABAQUS CAE AFTER util/coupon_data.py
+#################################################################################################################
+
+
+import os, copy, json, time, traceback
+from abaqus import *
+
+templateTimes = dict()
+
+def loadTemplate(srcPath, template):
+    ## method to return the coupon class of a template; the class files are executed only once per session
+    ## unless modified on disk, so that a long-lived session picks up edited templates
+    genericFileName = srcPath+'/lib/coupon_generic.py'
+    templateFileName = srcPath+'/lib/'+template.lower()+'.py'
+    if templateTimes.get(genericFileName)!=os.path.getmtime(genericFileName):
+        execfile(genericFileName, globals())
+        templateTimes.clear()
+        templateTimes[genericFileName] = os.path.getmtime(genericFileName)
+    if templateTimes.get(templateFileName)!=os.path.getmtime(templateFileName):
+        execfile(templateFileName, globals())
+        templateTimes[templateFileName] = os.path.getmtime(templateFileName)
+    return globals()[template.lower()]
+
+def resetModelDatabase():
+    ## method to clear the model database so that the next coupon starts from an empty session
+    Mdb()
+
+def buildCoupon(srcPath, template, couponData, savePath):
+    ## method to create one coupon model in the current session; writes the status text and status json files
+    ## and returns the coupon object (None when the template cannot be loaded) and the status record
+    version = getVersionSuffix(couponData)
+    statusRecord = {'Template':template, 'Coupon':couponData['Coupon_Name'], 'Version':couponData['Version']}
+    currentPath = os.getcwd()
+    thisCoupon, tracebackText = None, ''
+    wallStart, cpuStart = time.time(), sum(os.times()[:2])
+    try:
+        couponClass = loadTemplate(srcPath, template)
+        os.chdir(savePath)
+        ## object created before __init__ so that the stage times of a failed coupon are kept;
+        ## templates add derived keys to the coupon data, the caller keeps the data as requested
+        thisCoupon = couponClass.__new__(couponClass)
+        thisCoupon.__init__(copy.deepcopy(couponData))
+        statusRecord.update({'Status':'SUCCESS', 'Message':'Model created successfully.'})
+    except Exception as err:
+        statusRecord.update({'Status':'FAILED', 'Message':str(err)})
+        tracebackText = traceback.format_exc()
+    os.chdir(currentPath)
+    statusFile = open(savePath+'/'+couponData['Coupon_Name']+'_Status'+version+'.txt', 'w')
+    if statusRecord['Status']=='SUCCESS':
+        statusFile.write('SUCCESS! Model created successfully.')
+    else:
+        statusFile.write('FAILED! Model cannot be created.\nError Message: '+statusRecord['Message'])
+    statusFile.close()
+    statusData = statusRecord.copy()
+    statusData.update({'Wall_Time':time.time()-wallStart, 'CPU_Time':sum(os.times()[:2])-cpuStart, 'Traceback':tracebackText,
+                       'Stages':getattr(thisCoupon, 'stageTimes', []), 'Mesh':dict(), 'Files':dict()})
+    try:
+        statusData['Mesh'] = thisCoupon.getMeshStatus()
+    except Exception:
+        pass
+    if getattr(thisCoupon, 'meshBudgetStatus', None):
+        statusData['Mesh_Budget'] = thisCoupon.meshBudgetStatus
+    if getattr(thisCoupon, 'partTwin', None):
+        statusData['Part_Twin'] = thisCoupon.partTwin
+    if getattr(thisCoupon, 'profileData', None):
+        statusData['Profile'] = thisCoupon.profileData
+    statusData['Files'] = getFileSizes(savePath, couponData)
+    statusFile = open(savePath+'/'+couponData['Coupon_Name']+'_Status'+version+'.json', 'w')
+    statusFile.write(json.dumps(statusData, indent=4, sort_keys=True))
+    statusFile.close()
+    return thisCoupon, statusRecord
+
+def getFileSizes(savePath, couponData):
+    ## method to return size in bytes of every output file of a coupon
+    couponName, version = couponData['Coupon_Name'], getVersionSuffix(couponData)
+    fileSizes = dict()
+    for thisName in [couponName+'_Job'+version+'.inp', couponName+'_Model'+version+'.cae', couponName+'_Model'+version+'.jnl',
+                     couponName+'_Data'+version+'.json', couponName+'_Geom'+version+'.txt']:
+        if os.path.isfile(savePath+'/'+thisName):
+            fileSizes[thisName] = os.path.getsize(savePath+'/'+thisName)
+    inpFolderName = couponName+'_InpFolder'+version
+    if os.path.isdir(savePath+'/'+inpFolderName):
+        for thisName in sorted(os.listdir(savePath+'/'+inpFolderName)):
+            fileSizes[inpFolderName+'/'+thisName] = os.path.getsize(savePath+'/'+inpFolderName+'/'+thisName)
+    return fileSizes
+
+def runCoupon(srcPath, template, couponData, savePath):
+    ## method to create one coupon model in the current session and return its status record
+    thisCoupon, statusRecord = buildCoupon(srcPath, template, couponData, savePath)
+    resetModelDatabase()
+    return statusRecord
@@ -14,40 +14,21 @@
 #################################################################################################################
 
 
-import json, ast, sys
+import os
 
 def debug(srcPath, template, coupon):
-    statusFile = open(coupon+'_Status.txt', 'w')
+    ## create the coupon in the current folder and keep the model open for debugging
+    execfile(srcPath+'/util/coupon_data.py', globals())
+    execfile(srcPath+'/util/coupon_runner.py', globals())
     try:
-        masterDatabaseJson = open(srcPath+'/db/coupon_master.json', 'r')
-        masterDatabaseUnicode = json.load(masterDatabaseJson)
-        masterDatabaseJson.close()
-        masterDatabase = ast.literal_eval(json.dumps(masterDatabaseUnicode))
-        
-        couponDatabaseJson = open(srcPath+'/db/'+template.lower()+'.json', 'r')
-        couponDatabaseUnicode = json.load(couponDatabaseJson)
-        couponDatabaseJson.close()
-        couponDatabase = ast.literal_eval(json.dumps(couponDatabaseUnicode))
-        
-        ## create input coupon data
-        couponData = couponDatabase[template][coupon]
-        couponData.update(masterDatabase['Coupon_Data'][template])
-        couponData.update({'Coupon_Name':coupon})
-        couponData.update(masterDatabase['Constant_Data'])
-        tempMaterial = dict()
-        for thisMaterial, i in zip(couponData['Material'], range(len(couponData['Material']))):
-            tempMaterial['Material_'+str(i+1)] = masterDatabase['Material_Data'][thisMaterial].copy()
-        couponData.update({'Material':tempMaterial})
-
-        execfile(srcPath+'/lib/coupon_generic.py', globals())
-        execfile(srcPath+'/lib/'+template.lower()+'.py', globals())
-        couponClass = getattr(sys.modules[__name__], template.lower())
-        self = couponClass(couponData)
-        statusFile.write('SUCCESS! Model created successfully.')
+        couponData = getCouponData(srcPath, template, coupon)
     except Exception as err:
         print(str(err))
+        statusFile = open(coupon+'_Status.txt', 'w')
         statusFile.write('FAILED! Model cannot be created.\nError Message: '+str(err))
-        self = None
-    statusFile.close()
+        statusFile.close()
+        return None
+    self, statusRecord = buildCoupon(srcPath, template, couponData, os.getcwd())
+    if statusRecord['Status']=='FAILED':
+        print(statusRecord['Message'])
     return self
-
@@ -21,9 +21,15 @@ from tkinter.filedialog import askdirectory
 from PIL import ImageTk, Image
 
 class gui():
-    def __init__(self, abqPath, srcPath):
+    def __init__(self, abqPath, srcPath, spoolPath=None, cachePath=None):
         self.abqPath = abqPath
         self.srcPath = srcPath
+        ## spool folder of the persistent abaqus worker (util/abaqus_worker.py)
+        self.spoolPath = spoolPath if spoolPath is not None else self.srcPath+'/spool'
+        ## maximum time of a coupon on the worker in seconds; a coupon left by a stopped worker fails earlier
+        self.jobTimeout = 3600.0
+        ## model cache (util/cache.py); no cache when the path is not given
+        self.modelCache = cache(cachePath, self.srcPath) if cachePath is not None else None
         ## set window sizes
         self.windowSize = 'custom'
         self.initialYSpacing = 0.01
@@ -242,16 +248,34 @@ class gui():
     def callAbaqus(self):
         ## call Abaqus
         statusFileName = self.couponName+'_Status'+self.version+'.txt'
-        abqCall = 'abaqus cae noGUI="'+self.srcPath+'/util/call_abaqus.py" -- '+statusFileName+' '+self.jsonFileName+' '+self.templateDropDown.get()+' "'+self.pathEntry.get()+'" "'+self.srcPath+'"'
-        for j in range(len(self.abqPath)):
-            try:
-                sys.path.append(self.abqPath[j])
-            except:
-                pass
-        os.system(abqCall)
+        if self.modelCache is not None and self.modelCache.fetch(self.templateDropDown.get(), self.couponOutput, self.pathEntry.get()):
+            ## identical model created before ==>> model files restored from the cache without calling abaqus
+            pass
+        elif rebuildIncremental(self.couponOutput, self.pathEntry.get()):
+            ## only material, step or load changed ==>> inp files rewritten from the existing mesh without calling abaqus
+            pass
+        elif isWorkerRunning(self.spoolPath):
+            ## submit to the running abaqus worker instead of starting a new abaqus session
+            jobID = submitJob(self.spoolPath, self.templateDropDown.get(), self.pathEntry.get(), dataFile=self.jsonFileName)
+            statusRecord = waitJob(self.spoolPath, jobID, timeout=self.jobTimeout)
+            if 'Coupon' not in statusRecord:
+                ## job failed in the spool ==>> no status file written by the worker
+                statusFile = open(self.pathEntry.get()+'/'+statusFileName, 'w')
+                statusFile.write('FAILED! Model cannot be created.\n'+statusRecord['Message'])
+                statusFile.close()
+        else:
+            abqCall = 'abaqus cae noGUI="'+self.srcPath+'/util/call_abaqus.py" -- '+statusFileName+' '+self.jsonFileName+' '+self.templateDropDown.get()+' "'+self.pathEntry.get()+'" "'+self.srcPath+'"'
+            for j in range(len(self.abqPath)):
+                try:
+                    sys.path.append(self.abqPath[j])
+                except:
+                    pass
+            os.system(abqCall)
         statusFile = open(self.pathEntry.get()+'/'+statusFileName, 'r')
         msgText = statusFile.read()
         statusFile.close()
+        if self.modelCache is not None and msgText.startswith('SUCCESS') and 'model cae file not created' not in msgText:
+            self.modelCache.store(self.templateDropDown.get(), self.couponOutput, self.pathEntry.get())
         if os.path.exists(self.srcPath+'/abaqus.rpy'):
             os.remove(self.srcPath+'/abaqus.rpy')
         if os.path.exists(self.srcPath+'/abaqus_acis.log'):
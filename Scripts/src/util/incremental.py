@@ -0,0 +1,37 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+##########################    UTILITY SCRIPT : INCREMENTAL REBUILD WITHOUT ABAQUS CAE   #########################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## WHEN ONLY MATERIAL, STEP OR LOAD DATA DIFFER FROM A MODEL IN THE SAVE PATH, THE MESH IS REUSED AND ONLY THE
+## MATERIALS AND STEP INCLUDE FILES ARE REWRITTEN (SEE stageInputs IN lib/coupon_generic.py); NO .cae IS WRITTEN
+## lib/coupon_generic.py AND util/coupon_data.py MUST BE LOADED BEFORE THIS SCRIPT
+#################################################################################################################
+
+
+import os, copy
+
+def rebuildIncremental(couponData, savePath):
+    ## method to create the inp files of a coupon from an existing model; returns False when abaqus cae is needed
+    currentPath = os.getcwd()
+    os.chdir(savePath)
+    try:
+        thisCoupon = coupon_generic(copy.deepcopy(couponData))
+        isRebuilt = thisCoupon.createIncrementalJob()
+    except Exception:
+        isRebuilt = False
+    os.chdir(currentPath)
+    if isRebuilt:
+        statusFile = open(savePath+'/'+couponData['Coupon_Name']+'_Status'+getVersionSuffix(couponData)+'.txt', 'w')
+        statusFile.write('SUCCESS! Model created successfully.\nInp files rewritten from an existing mesh; model cae file not created.')
+        statusFile.close()
+    return isRebuilt
@@ -0,0 +1,70 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+##########################    CLASS DEFINITION : CONTENT-ADDRESSED INCLUDE STORE   ##############################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## THE STORE HOLDS THE INCLUDE FILES OF THE INP FOLDERS AS READ-ONLY FILES <sha1 hash>.inp (.inp.gz, .inp.zst WHEN
+## COMPRESSED), WRITTEN BY coupon_generic.storeInpFiles; AN INP FOLDER EITHER HARDLINKS A STORED FILE OR REFERS TO
+## IT FROM THE INCLUDE LINE, AS LISTED IN <Coupon>_Inp_Store<version>.json OF THE INP FOLDER
+## SCRIPT IS LOADED WITH execfile() INSIDE ABAQUS AND WITH exec() OUTSIDE ABAQUS, HENCE KEEP IT PYTHON 2/3 NEUTRAL
+#################################################################################################################
+
+
+import os, json, time, stat
+
+class inpStore():
+    def __init__(self, storePath, tempAge=1.0):
+        self.storePath = os.path.abspath(storePath).replace('\\', '/')
+        ## stored files written or referred to less than tempAge days ago are kept, as the inp folder using them may not
+        ## be listed yet; temporary files of an interrupted write are removed after tempAge days
+        self.tempAge = tempAge*24*3600
+    def getReferences(self, savePaths):
+        ## method to return the stored files referred to by the include lines of the inp folders in the save paths
+        references = set()
+        for thisPath in savePaths:
+            for rootPath, folderNames, fileNames in os.walk(thisPath):
+                for thisName in fileNames:
+                    if not ('_Inp_Store' in thisName and thisName.endswith('.json')):
+                        continue
+                    try:
+                        storeFile = open(os.path.join(rootPath, thisName), 'r')
+                        storeData = json.load(storeFile)
+                        storeFile.close()
+                    except Exception:
+                        continue
+                    if os.path.abspath(storeData.get('Store_Path', '')).replace('\\', '/')!=self.storePath:
+                        continue
+                    for thisData in storeData['Files'].values():
+                        if not thisData['Link']:
+                            references.add(thisData['Hash']+'.inp')
+        return references
+    def collect(self, savePaths):
+        ## method to remove the stored files which are neither hardlinked into an inp folder nor referred to by an
+        ## include line in the save paths; returns the number and size in bytes of the removed files
+        references = self.getReferences(savePaths)
+        removedNumber, removedSize = 0, 0
+        for thisName in os.listdir(self.storePath):
+            thisFileName = self.storePath+'/'+thisName
+            thisStat = os.stat(thisFileName)
+            if time.time()-thisStat.st_mtime<=self.tempAge:
+                continue
+            if not thisName.endswith('.tmp') and ('.inp' not in thisName or thisStat.st_nlink>1 or thisName in references):
+                continue
+            os.chmod(thisFileName, stat.S_IWRITE | stat.S_IREAD)
+            os.remove(thisFileName)
+            removedNumber = removedNumber+1
+            removedSize = removedSize+thisStat.st_size
+        return removedNumber, removedSize
+    def getSize(self):
+        ## method to return the number and size in bytes of the stored files
+        fileSizes = [os.path.getsize(self.storePath+'/'+thisName) for thisName in os.listdir(self.storePath) if '.inp' in thisName and not thisName.endswith('.tmp')]
+        return len(fileSizes), sum(fileSizes)
@@ -0,0 +1,99 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+#################################    CLASS DEFINITION : ABAQUS JOB LAUNCHER    ##################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## SUBMITS THE JOB INP FILES OF THE COUPONS TO THE ABAQUS SOLVER; INCLUDE FILES WRITTEN COMPRESSED BY
+## coupon_generic.compressInpFiles (<file>.inp.gz, <file>.inp.zst) ARE RESTORED NEXT TO THE COMPRESSED FILE BEFORE
+## THE JOB IS SUBMITTED AND REMOVED AFTER THE ANALYSIS
+## RUNS OUTSIDE ABAQUS; SCRIPT IS LOADED WITH exec(), KEEP IT PYTHON 2/3 NEUTRAL
+#################################################################################################################
+
+
+import os, gzip, shutil, subprocess
+## zstandard is optional ==>> needed only for the .inp.zst include files
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+class jobLauncher():
+    def __init__(self, abqPath=[], abqCommand='abaqus', numCpus=2, keepInp=False, bufferSize=16*1024*1024):
+        self.abqPath = abqPath
+        self.abqCommand = abqCommand
+        self.numCpus = numCpus
+        ## restored include files are kept after the analysis when keepInp is True
+        self.keepInp = keepInp
+        self.bufferSize = bufferSize
+        self.compressionExt = ['.gz', '.zst']
+    def submit(self, jobFileName):
+        ## method to restore the compressed include files of a job, run the analysis and wait for it to finish;
+        ## returns the exit code of abaqus
+        jobPath = os.path.dirname(os.path.abspath(jobFileName))
+        jobName = os.path.splitext(os.path.basename(jobFileName))[0]
+        restoredFileNames = self.restoreInpFiles(jobFileName)
+        abqCall = self.abqCommand+' job='+jobName+' input="'+os.path.basename(jobFileName)+'" cpus='+str(self.numCpus)+' interactive'
+        env = dict(os.environ)
+        env['PATH'] = os.pathsep.join(self.abqPath+[env.get('PATH', '')])
+        logFile = open(jobPath+'/'+jobName+'_Submit.log', 'w')
+        try:
+            returnCode = subprocess.call(abqCall, shell=True, cwd=jobPath, env=env, stdout=logFile, stderr=subprocess.STDOUT)
+        finally:
+            logFile.close()
+            if not self.keepInp:
+                for thisFileName in restoredFileNames:
+                    os.remove(thisFileName)
+        return returnCode
+    def restoreInpFiles(self, jobFileName):
+        ## method to decompress the include files of a job which exist only compressed, following the include lines of
+        ## the job file and of the uncompressed include files; returns the restored files
+        jobPath = os.path.dirname(os.path.abspath(jobFileName))
+        restoredFileNames = []
+        inpFileNames = [jobFileName]
+        while inpFileNames:
+            for includeName in self.getIncludeNames(inpFileNames.pop()):
+                fileName = includeName if os.path.isabs(includeName) else os.path.join(jobPath, includeName)
+                if os.path.exists(fileName):
+                    inpFileNames.append(fileName)
+                    continue
+                ## compressed files hold the mesh tables only, without include lines
+                for thisExt in self.compressionExt:
+                    if os.path.exists(fileName+thisExt):
+                        self.decompressFile(fileName+thisExt, fileName)
+                        restoredFileNames.append(fileName)
+                        break
+        return restoredFileNames
+    def getIncludeNames(self, inpFileName):
+        ## method to return the input files of the include lines of an inp file
+        includeNames = []
+        inpFile = open(inpFileName, 'rb')
+        for thisLine in inpFile:
+            if thisLine[:8].lower()==b'*include':
+                includeNames.append(thisLine.decode('latin-1').split('=', 1)[1].strip())
+        inpFile.close()
+        return includeNames
+    def decompressFile(self, compressedFileName, fileName):
+        ## method to decompress a file in blocks; written to a temporary file first, so that an interrupted restore
+        ## does not leave an incomplete include file
+        inFile = open(compressedFileName, 'rb')
+        outFile = open(fileName+'.tmp', 'wb')
+        if compressedFileName.endswith('.zst'):
+            if zstandard is None:
+                raise ImportError('zstandard module is required to restore '+compressedFileName)
+            zstandard.ZstdDecompressor().copy_stream(inFile, outFile, write_size=self.bufferSize)
+        else:
+            decompressedFile = gzip.GzipFile(fileobj=inFile, mode='rb')
+            shutil.copyfileobj(decompressedFile, outFile, self.bufferSize)
+            decompressedFile.close()
+        outFile.close()
+        inFile.close()
+        os.rename(fileName+'.tmp', fileName)
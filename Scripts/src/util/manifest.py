@@ -0,0 +1,76 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+############################    UTILITY SCRIPT : BATCH PROGRESS MANIFEST   ######################################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## APPEND-ONLY JSON LINES FILES Batch_Manifest*.jsonl IN THE SAVE PATH, ONE RECORD PER STATE CHANGE OF A COUPON:
+##   {'Key':<template>/<coupon>/<version>, 'Input_Hash':..., 'State':RUNNING|SUCCESS|FAILED, 'Save_Path':..., ...}
+## THE HOST AND EVERY ABAQUS SESSION WRITE THEIR OWN FILE, SO THAT NO FILE HAS CONCURRENT WRITERS
+## SCRIPT IS LOADED WITH execfile() INSIDE ABAQUS AND WITH exec() OUTSIDE ABAQUS, HENCE KEEP IT PYTHON 2/3 NEUTRAL
+## util/coupon_data.py MUST BE LOADED BEFORE THIS SCRIPT
+#################################################################################################################
+
+
+import os, json, time
+
+def getManifestKey(template, couponData):
+    return template+'/'+couponData['Coupon_Name']+'/'+couponData['Version']
+
+def appendManifest(manifestFileName, template, couponData, state, savePath, message=''):
+    ## method to append one record; the record is flushed to disk before the coupon continues
+    record = {'Key':getManifestKey(template, couponData), 'Input_Hash':getCouponHash(couponData), 'State':state,
+              'Template':template, 'Coupon':couponData['Coupon_Name'], 'Version':couponData['Version'], 'Save_Path':savePath,
+              'Job_File':savePath+'/'+couponData['Coupon_Name']+'_Job'+getVersionSuffix(couponData)+'.inp',
+              'Status_File':savePath+'/'+couponData['Coupon_Name']+'_Status'+getVersionSuffix(couponData)+'.txt',
+              'Message':message, 'Time':time.time()}
+    manifestFile = open(manifestFileName, 'a')
+    manifestFile.write(json.dumps(record, sort_keys=True)+'\n')
+    manifestFile.flush()
+    os.fsync(manifestFile.fileno())
+    manifestFile.close()
+
+def readManifest(savePath):
+    ## method to return the records of all manifest files in the save path sorted by time;
+    ## a partially written last line of an interrupted session is skipped
+    records = []
+    for thisFileName in sorted(os.listdir(savePath)):
+        if not (thisFileName.startswith('Batch_Manifest') and thisFileName.endswith('.jsonl')):
+            continue
+        manifestFile = open(savePath+'/'+thisFileName, 'r')
+        for thisLine in manifestFile:
+            try:
+                records.append(json.loads(thisLine))
+            except ValueError:
+                continue
+        manifestFile.close()
+    records.sort(key=lambda thisRecord: thisRecord['Time'])
+    return records
+
+def getManifestState(records, template, couponData):
+    ## method to return the last state of a coupon with the current input hash and the number of attempts made
+    key, inputHash = getManifestKey(template, couponData), getCouponHash(couponData)
+    lastRecord, numAttempts = None, 0
+    for thisRecord in records:
+        if thisRecord['Key']==key and thisRecord['Input_Hash']==inputHash:
+            lastRecord = thisRecord
+            if thisRecord['State']=='RUNNING':
+                numAttempts = numAttempts+1
+    return lastRecord, numAttempts
+
+def isStatusSuccess(statusFileName):
+    ## method to check the _Status.txt file of a coupon
+    if not os.path.isfile(statusFileName):
+        return False
+    statusFile = open(statusFileName, 'r')
+    msgText = statusFile.read()
+    statusFile.close()
+    return msgText.startswith('SUCCESS')
@@ -0,0 +1,208 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+##########################    UTILITY SCRIPT : JOB SPOOL FOR PERSISTENT ABAQUS WORKER   #########################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## SPOOL FOLDER LAYOUT: queue/<job id>.json ==>> running/<job id>.json ==>> done/<job id>.json
+## EVERY WORKER KEEPS heartbeat/<process id>.json UP TO DATE WHILE IT IS ALIVE, ALSO WHILE IT RUNS A JOB; A JOB LEFT IN
+## running/ BY A WORKER WHOSE HEARTBEAT STOPPED IS QUEUED AGAIN OR FAILED BY waitJob
+## SCRIPT IS LOADED WITH execfile() INSIDE ABAQUS AND WITH exec() OUTSIDE ABAQUS, HENCE KEEP IT PYTHON 2/3 NEUTRAL
+#################################################################################################################
+
+
+import os, json, time, socket, threading
+
+def createSpool(spoolPath):
+    ## method to create the spool sub-folders
+    for thisFolder in ['queue', 'running', 'done', 'heartbeat']:
+        if not os.path.isdir(spoolPath+'/'+thisFolder):
+            os.makedirs(spoolPath+'/'+thisFolder)
+
+def writeJsonFile(fileName, data):
+    ## method to write json file through a temporary file so that readers never see a partial file
+    tempFile = open(fileName+'.tmp', 'w')
+    tempFile.write(json.dumps(data, indent=4, sort_keys=True))
+    tempFile.close()
+    if os.path.exists(fileName):
+        os.remove(fileName)
+    os.rename(fileName+'.tmp', fileName)
+
+def writeHeartbeat(spoolPath, state, jobID=''):
+    writeJsonFile(spoolPath+'/heartbeat/'+str(os.getpid())+'.json', {'State':state, 'Job_ID':jobID, 'Time':time.time()})
+
+def startHeartbeat(spoolPath, jobID, heartbeatInterval=1.0):
+    ## method to refresh the BUSY heartbeat of the worker from a background thread while it runs a job
+    stopEvent = threading.Event()
+    def refreshHeartbeat():
+        while not stopEvent.wait(heartbeatInterval):
+            writeHeartbeat(spoolPath, 'BUSY', jobID)
+    heartbeatThread = threading.Thread(target=refreshHeartbeat)
+    heartbeatThread.daemon = True
+    heartbeatThread.stopEvent = stopEvent
+    writeHeartbeat(spoolPath, 'BUSY', jobID)
+    heartbeatThread.start()
+    return heartbeatThread
+
+def stopHeartbeat(heartbeatThread):
+    heartbeatThread.stopEvent.set()
+    heartbeatThread.join()
+
+def removeHeartbeat(spoolPath):
+    if os.path.exists(spoolPath+'/heartbeat/'+str(os.getpid())+'.json'):
+        os.remove(spoolPath+'/heartbeat/'+str(os.getpid())+'.json')
+
+def writeJobResult(spoolPath, jobID, statusRecord):
+    writeJsonFile(spoolPath+'/done/'+jobID+'.json', statusRecord)
+
+def claimJob(spoolPath, jobID):
+    ## method to move a queued job to the running folder and to write the claim token of this worker into the job file;
+    ## returns the claim token, or None when another worker claimed the job first
+    runningFileName = spoolPath+'/running/'+jobID+'.json'
+    try:
+        os.rename(spoolPath+'/queue/'+jobID+'.json', runningFileName)
+    except OSError:
+        return None
+    try:
+        job = readJson(runningFileName)
+    except Exception:
+        ## unreadable job ==>> failed by the worker
+        job = dict()
+    claimToken = '%s_%d_%.6f' % (socket.gethostname(), os.getpid(), time.time())
+    job['Claim'] = claimToken
+    writeJsonFile(runningFileName, job)
+    return claimToken
+
+def isJobClaimed(spoolPath, jobID, claimToken):
+    ## method to check that the running job file still holds the claim token of the worker; a job queued again by
+    ## waitJob and claimed by another worker holds the token of that worker
+    try:
+        return readJson(spoolPath+'/running/'+jobID+'.json').get('Claim')==claimToken
+    except Exception:
+        return False
+
+def finishJob(spoolPath, jobID, claimToken, statusRecord):
+    ## method to write the status record of a job and to remove its running file, only while the worker holds the job
+    if not isJobClaimed(spoolPath, jobID, claimToken):
+        return False
+    writeJobResult(spoolPath, jobID, statusRecord)
+    os.remove(spoolPath+'/running/'+jobID+'.json')
+    return True
+
+def readHeartbeats(spoolPath):
+    ## method to return the heartbeats of the workers with their age
+    heartbeats = []
+    if not os.path.isdir(spoolPath+'/heartbeat'):
+        return heartbeats
+    for thisFile in os.listdir(spoolPath+'/heartbeat'):
+        if not thisFile.endswith('.json'):
+            continue
+        try:
+            heartbeat = readJson(spoolPath+'/heartbeat/'+thisFile)
+        except Exception:
+            continue
+        heartbeat['Age'] = time.time()-heartbeat['Time']
+        heartbeats.append(heartbeat)
+    return heartbeats
+
+def isWorkerRunning(spoolPath, maxIdleAge=5.0, maxBusyAge=60.0):
+    ## method to check for a live worker; an idle worker refreshes its heartbeat every second, a busy worker from a
+    ## background thread which may be held up by long abaqus calls, hence the longer allowance
+    for heartbeat in readHeartbeats(spoolPath):
+        if (heartbeat['State']=='IDLE' and heartbeat['Age']<maxIdleAge) or (heartbeat['State']=='BUSY' and heartbeat['Age']<maxBusyAge):
+            return True
+    return False
+
+def isJobRunning(spoolPath, jobID, maxBusyAge=60.0):
+    ## method to check that a live worker runs the job
+    for heartbeat in readHeartbeats(spoolPath):
+        if heartbeat['State']=='BUSY' and heartbeat['Job_ID']==jobID and heartbeat['Age']<maxBusyAge:
+            return True
+    return False
+
+def submitJob(spoolPath, template, savePath, couponData=None, dataFile=None):
+    ## method to add a job to the queue, either with the coupon data or with the coupon data json file in the save path
+    createSpool(spoolPath)
+    jobID = '%.6f' %time.time()
+    jobID = jobID.replace('.', '_')+'_'+str(os.getpid())
+    job = {'Template':template, 'Save_Path':savePath}
+    if couponData is not None:
+        job['Coupon_Data'] = couponData
+    else:
+        job['Data_File'] = dataFile
+    ## the worker only picks up *.json files, hence the file is complete once it is visible
+    writeJsonFile(spoolPath+'/queue/'+jobID+'.json', job)
+    return jobID
+
+def waitJob(spoolPath, jobID, timeout=3600.0, maxBusyAge=60.0, maxRequeue=1, pollInterval=0.05):
+    ## method to wait for the status record of a submitted job; a job whose worker stopped refreshing its heartbeat for
+    ## maxBusyAge seconds is queued again up to maxRequeue times, and a job running longer than timeout seconds or
+    ## queued without any live worker fails with a FAILED status record
+    resultFileName = spoolPath+'/done/'+jobID+'.json'
+    queueFileName = spoolPath+'/queue/'+jobID+'.json'
+    runningFileName = spoolPath+'/running/'+jobID+'.json'
+    jobState, startTime, lastAlive = 'QUEUED', time.time(), time.time()
+    while not os.path.exists(resultFileName):
+        time.sleep(pollInterval)
+        if os.path.exists(runningFileName):
+            if jobState!='RUNNING':
+                jobState, startTime = 'RUNNING', time.time()
+            if isJobRunning(spoolPath, jobID, maxBusyAge):
+                lastAlive = time.time()
+        elif os.path.exists(queueFileName):
+            jobState = 'QUEUED'
+            if isWorkerRunning(spoolPath, maxBusyAge=maxBusyAge):
+                lastAlive = time.time()
+        else:
+            ## moved between the spool folders
+            continue
+        statusRecord = None
+        if timeout is not None and jobState=='RUNNING' and time.time()-startTime>timeout:
+            statusRecord = releaseJob(spoolPath, jobID, runningFileName, 'Job running for more than '+str(timeout)+' s.')
+        elif time.time()-lastAlive<=maxBusyAge:
+            continue
+        elif jobState=='QUEUED':
+            statusRecord = releaseJob(spoolPath, jobID, queueFileName, 'No Abaqus worker running.')
+        else:
+            try:
+                job = readJson(runningFileName)
+            except Exception:
+                continue
+            job['Requeued'] = job.get('Requeued', 0)+1
+            ## the stalled worker must not take the job back
+            job.pop('Claim', None)
+            if job['Requeued']>maxRequeue:
+                statusRecord = releaseJob(spoolPath, jobID, runningFileName, 'Abaqus worker stopped while running the job.')
+            else:
+                writeJsonFile(queueFileName, job)
+                os.remove(runningFileName)
+                jobState, lastAlive = 'QUEUED', time.time()
+                continue
+        ## job file moved by a worker meanwhile ==>> wait again
+        if statusRecord is not None:
+            return statusRecord
+    statusRecord = readJson(resultFileName)
+    os.remove(resultFileName)
+    return statusRecord
+
+def releaseJob(spoolPath, jobID, jobFileName, message):
+    ## method to remove a job which cannot be completed from the spool; returns its FAILED status record, or None when
+    ## the job file was moved by a worker meanwhile
+    try:
+        os.remove(jobFileName)
+    except OSError:
+        return None
+    return {'Status':'FAILED', 'Message':'Job cannot be completed by the Abaqus worker.\nError Message: '+message, 'Job_ID':jobID}
+
+def stopWorker(spoolPath):
+    ## method to request all workers of the spool to stop after the current job
+    stopFile = open(spoolPath+'/Worker_Stop', 'w')
+    stopFile.close()
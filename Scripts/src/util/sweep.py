@@ -0,0 +1,119 @@
+#################################################################################################################
+######################                 ABAQUS PARAMETRIC COUPON MODEL                     #######################
+#################################################################################################################
+##########################    UTILITY SCRIPT : DESIGN OF EXPERIMENTS PARAMETER SWEEP    #########################
+#################################################################################################################
+## +------------------------------------------------------------------------------------------------------------+
+## |            PROGRAMMER          |  VERSION  |    DATE     |                     COMMENTS                    |
+## +------------------------------------------------------------------------------------------------------------+
+## |        Rupsagar Chatterjee     |   v1.0    | 21-Mar-2023 |                                                 |
+## |        Rupsagar Chatterjee     |   v2.0    | 08-Aug-2023 |                                                 |
+## |                                |           |             |                                                 |
+## |                                |           |             |                                                 |
+## +------------------------------------------------------------------------------------------------------------+
+#################################################################################################################
+## SWEEP FILE KEYS:
+##   'Template', 'Coupon'  ==>> base coupon of the sweep
+##   'Design'              ==>> 'Full_Factorial', 'Latin_Hypercube' OR 'One_At_A_Time'
+##   'Samples', 'Seed'     ==>> number of samples and random seed of the latin hypercube design
+##   'Parameters'          ==>> {'<section>.<key>':{...}}, e.g. 'Geometry.phi1', 'Element_Size.arcOuter', with
+##                              {'Values':[...]}, {'Range':[min, max], 'Levels':n} OR
+##                              {'Distribution':'Uniform', 'Range':[min, max]}, {'Distribution':'Normal', 'Mean':m, 'Std':s}
+## util/coupon_data.py MUST BE LOADED BEFORE THIS SCRIPT
+#################################################################################################################
+
+
+import copy, random, itertools, statistics
+
+def getParameterLevels(paramData):
+    ## method to return the discrete levels of a parameter for the full factorial and one-at-a-time designs
+    if 'Values' in paramData:
+        return list(paramData['Values'])
+    if 'Range' in paramData:
+        numLevels = int(paramData.get('Levels', 2))
+        lowerValue, upperValue = float(paramData['Range'][0]), float(paramData['Range'][1])
+        if numLevels==1:
+            return [0.5*(lowerValue+upperValue)]
+        return [lowerValue+(upperValue-lowerValue)*i/(numLevels-1) for i in range(numLevels)]
+    if paramData.get('Distribution')=='Normal':
+        return [paramData['Mean']-paramData['Std'], paramData['Mean'], paramData['Mean']+paramData['Std']]
+    raise ValueError('Sweep parameter needs Values, Range or Distribution: '+str(paramData))
+
+def getParameterSample(paramData, quantile):
+    ## method to return the parameter value at a quantile in (0, 1) for the latin hypercube design
+    if 'Values' in paramData:
+        return paramData['Values'][min(int(quantile*len(paramData['Values'])), len(paramData['Values'])-1)]
+    if paramData.get('Distribution')=='Normal':
+        return statistics.NormalDist(paramData['Mean'], paramData['Std']).inv_cdf(quantile)
+    if 'Range' in paramData:
+        return paramData['Range'][0]+(paramData['Range'][1]-paramData['Range'][0])*quantile
+    raise ValueError('Sweep parameter needs Values, Range or Distribution: '+str(paramData))
+
+def getDesign(sweepData, baseData):
+    ## method to return the design points as list of {parameter key:value}
+    paramKeys = sorted(sweepData['Parameters'].keys())
+    designType = sweepData.get('Design', 'Full_Factorial')
+    if designType=='Full_Factorial':
+        levels = [getParameterLevels(sweepData['Parameters'][thisKey]) for thisKey in paramKeys]
+        return [dict(zip(paramKeys, thisPoint)) for thisPoint in itertools.product(*levels)]
+    if designType=='Latin_Hypercube':
+        numSamples = int(sweepData['Samples'])
+        thisRandom = random.Random(sweepData.get('Seed', 0))
+        design = [dict() for i in range(numSamples)]
+        for thisKey in paramKeys:
+            ## one sample in each of the equal probability strata, strata shuffled independently per parameter
+            strata = list(range(numSamples))
+            thisRandom.shuffle(strata)
+            for thisPoint, thisStratum in zip(design, strata):
+                thisPoint[thisKey] = getParameterSample(sweepData['Parameters'][thisKey], (thisStratum+thisRandom.random())/numSamples)
+        return design
+    if designType=='One_At_A_Time':
+        basePoint = dict([(thisKey, getDataValue(baseData, thisKey)) for thisKey in paramKeys])
+        design = [basePoint]
+        for thisKey in paramKeys:
+            for thisValue in getParameterLevels(sweepData['Parameters'][thisKey]):
+                thisPoint = basePoint.copy()
+                thisPoint[thisKey] = thisValue
+                design.append(thisPoint)
+        return design
+    raise ValueError('Unknown sweep design: '+designType)
+
+def getDataValue(couponData, paramKey):
+    ## method to return value of dotted parameter key, e.g. 'Geometry.phi1'
+    thisData = couponData
+    for thisKey in paramKey.split('.'):
+        if not isinstance(thisData, dict) or thisKey not in thisData:
+            raise ValueError('Sweep parameter '+paramKey+' not found in coupon data')
+        thisData = thisData[thisKey]
+    return thisData
+
+def setDataValue(couponData, paramKey, value):
+    ## method to set value of dotted parameter key; the key must exist in the coupon data
+    getDataValue(couponData, paramKey)
+    thisData = couponData
+    for thisKey in paramKey.split('.')[:-1]:
+        thisData = thisData[thisKey]
+    thisData[paramKey.split('.')[-1]] = value
+
+def getSweepList(srcPath, sweepFileName):
+    ## method to return the batch entries of a sweep file; each design point is a coupon with its own version
+    ## suffix, design points resolving to identical coupon data are created only once
+    sweepData = readJson(sweepFileName)
+    baseData = getCouponData(srcPath, sweepData['Template'], sweepData['Coupon'])
+    versionPrefix = baseData['Version']+'_' if baseData['Version']!='' else ''
+    design = getDesign(sweepData, baseData)
+    numDigits = len(str(len(design)))
+    batchList, couponHashes = [], dict()
+    for thisPoint, i in zip(design, range(len(design))):
+        couponData = copy.deepcopy(baseData)
+        for thisKey, thisValue in thisPoint.items():
+            setDataValue(couponData, thisKey, thisValue)
+        couponHash = getCouponHash(couponData, ignoredKeys=('Coupon_Template', 'Coupon_Type', 'Save_Path', 'Version'))
+        couponData['Version'] = versionPrefix+'S'+str(i+1).zfill(numDigits)
+        if couponHash in couponHashes:
+            couponHashes[couponHash]['Design_Points'].append(thisPoint)
+            continue
+        thisEntry = {'Template':sweepData['Template'], 'Coupon':sweepData['Coupon'], 'Coupon_Data':couponData, 'Design_Points':[thisPoint]}
+        couponHashes[couponHash] = thisEntry
+        batchList.append(thisEntry)
+    return batchList